@@ -9961,12 +9961,8 @@ Return ONLY the JSON, no other text."""
             registry_path = Path(self.config.registry_path)
             if registry_path.exists():
                 try:
-                    shutil.rmtree(registry_path)
-                    registry_path.mkdir(parents=True, exist_ok=True)
-                    # Recreate index
-                    index_path = registry_path / "index.json"
-                    with open(index_path, 'w') as f:
-                        json.dump({"nodes": []}, f, indent=2)
+                    # Through the open Registry so its index connection follows
+                    self.registry.reset()
                     console.print(f"[green]OK Cleared registry: {registry_path}[/green]")
                 except Exception as e:
                     console.print(f"[red]Error clearing registry: {e}[/red]")
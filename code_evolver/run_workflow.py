@@ -15,6 +15,7 @@ import argparse
 import json
 import logging
 import sys
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -31,6 +32,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.ollama_client import OllamaClient
 from src.interactive_input_collector import InteractiveInputCollector
 from src.docker_workflow_builder import DockerWorkflowBuilder
+from src.workflow_dag import WorkflowDAG, DAGExecutor, step_kind
 
 logging.basicConfig(
     level=logging.INFO,
@@ -44,12 +46,22 @@ class WorkflowRunner:
     Interactive workflow runner with LLM-powered input collection.
     """
 
-    def __init__(self, code_evolver_root: Path = None):
+    def __init__(
+        self,
+        code_evolver_root: Path = None,
+        max_parallel_steps: int = 4,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        fail_fast: bool = False
+    ):
         """
         Initialize the workflow runner.
 
         Args:
             code_evolver_root: Root directory of code_evolver (auto-detected if None)
+            max_parallel_steps: Maximum independent steps running at once
+            concurrency_limits: Maximum concurrent steps per kind
+                ('llm', 'python', 'other'); defaults to 2 LLM and 4 Python steps
+            fail_fast: Cancel all remaining steps after the first failure
         """
         if code_evolver_root is None:
             code_evolver_root = Path(__file__).parent
@@ -58,12 +70,24 @@ class WorkflowRunner:
         self.console = Console()
         self.client = None
         self.input_collector = None
+        self._client_lock = threading.Lock()
+
+        self.max_parallel_steps = max_parallel_steps
+        self.concurrency_limits = concurrency_limits
+        self.fail_fast = fail_fast
+        self.executor: Optional[DAGExecutor] = None
 
     def _init_client(self):
         """Lazily initialize the Ollama client."""
-        if self.client is None:
-            self.client = OllamaClient()
-            self.input_collector = InteractiveInputCollector(self.client)
+        with self._client_lock:
+            if self.client is None:
+                self.client = OllamaClient()
+                self.input_collector = InteractiveInputCollector(self.client)
+
+    def cancel(self):
+        """Cancel the running workflow (steps already started finish)."""
+        if self.executor is not None:
+            self.executor.cancel()
 
     def load_workflow(self, workflow_path: Path) -> Dict[str, Any]:
         """
@@ -151,48 +175,76 @@ class WorkflowRunner:
         table.add_column("Type", style="yellow")
         table.add_column("Status", style="green")
         table.add_column("Tool", style="magenta")
+        table.add_column("Time", style="dim", justify="right")
 
         results = {
             "inputs": inputs,
             "steps": {}
         }
+        results_lock = threading.Lock()
+
+        # Independent steps (per input_mapping/template references) run concurrently
+        dag = WorkflowDAG(steps)
+        self.executor = DAGExecutor(
+            dag,
+            max_workers=self.max_parallel_steps,
+            concurrency_limits=self.concurrency_limits,
+            fail_fast=self.fail_fast
+        )
+
+        if any(step_kind(step) == "llm" for step in dag.steps.values()):
+            self._init_client()
+
+        def execute(step_id: str, step: Dict[str, Any]) -> Dict[str, Any]:
+            with results_lock:
+                step_outputs = dict(results["steps"])
+            step_result = self._execute_step(step, inputs, step_outputs)
+            with results_lock:
+                results["steps"][step_id] = step_result
+            return step_result
+
+        def on_start(step_id: str):
+            self.console.print(f"[bold]Step {dag.order.index(step_id) + 1}/{len(steps)}:[/bold] {step_id}")
+
+        records = self.executor.run(execute, on_start=on_start)
+        timing = self.executor.timing_report()
 
-        # Execute each step
-        for i, step in enumerate(steps, 1):
-            step_id = step.get("step_id", f"step_{i}")
+        for i, step_id in enumerate(dag.order, 1):
+            step = dag.steps[step_id]
             step_type = step.get("type", step.get("step_type", "unknown"))
             tool_name = step.get("tool", step.get("tool_name", "N/A"))
+            record = records[step_id]
+            status = record["status"]
+            error = record["result"].get("error") if isinstance(record["result"], dict) else None
 
-            self.console.print(f"[bold]Step {i}/{len(steps)}:[/bold] {step_id}")
+            results["steps"][step_id] = record["result"]
 
-            try:
-                # Execute the step
-                step_result = self._execute_step(step, inputs, results["steps"])
-                results["steps"][step_id] = step_result
+            if status == "completed":
+                status_text = "[green]✓ Complete[/green]"
+            elif status == "failed":
+                status_text = f"[red]✗ Failed: {error}[/red]"
+            else:
+                status_text = f"[yellow]- {status.capitalize()}: {error}[/yellow]"
+
+            duration = timing["steps"][step_id].get("duration_ms")
+            table.add_row(
+                f"{i}. {step_id}",
+                step_type,
+                status_text,
+                tool_name,
+                f"{duration / 1000:.2f}s" if duration is not None else ""
+            )
 
-                table.add_row(
-                    f"{i}. {step_id}",
-                    step_type,
-                    "[green]✓ Complete[/green]",
-                    tool_name
-                )
-
-            except Exception as e:
-                logger.error(f"Step {step_id} failed: {e}")
-                results["steps"][step_id] = {
-                    "success": False,
-                    "error": str(e)
-                }
-
-                table.add_row(
-                    f"{i}. {step_id}",
-                    step_type,
-                    f"[red]✗ Failed: {e}[/red]",
-                    tool_name
-                )
+        results["timing"] = timing
 
         self.console.print()
         self.console.print(table)
+        self.console.print(
+            f"[dim]Wall time {timing['wall_time_ms'] / 1000:.2f}s, "
+            f"critical path {timing['critical_path_ms'] / 1000:.2f}s "
+            f"({' → '.join(timing['critical_path'])}), "
+            f"parallelism {timing['parallelism']}x[/dim]"
+        )
         self.console.print()
 
         # Collect workflow outputs
@@ -486,6 +538,17 @@ def main():
         type=Path,
         help="Save results to JSON file"
     )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=4,
+        help="Maximum independent steps running at once (default: 4, 1 = sequential)"
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Cancel remaining steps after the first failure"
+    )
 
     args = parser.parse_args()
 
@@ -505,7 +568,7 @@ def main():
 
     # Run workflow
     try:
-        runner = WorkflowRunner()
+        runner = WorkflowRunner(max_parallel_steps=args.max_parallel, fail_fast=args.fail_fast)
         results = runner.run(
             workflow_path=args.workflow,
             provided_inputs=provided_inputs,
@@ -403,10 +403,8 @@ Return ONLY the improved Python code."""
         max_versions = self.config.get("auto_evolution.max_versions_per_node", 10)
         keep_best = self.config.get("auto_evolution.keep_best_n_versions", 3)
 
-        nodes = self.registry.list_nodes()
-
         # Find all versions of this node
-        versions = [n for n in nodes if n.get("node_id", "").startswith(node_id_prefix)]
+        versions = self.registry.list_nodes(prefix=node_id_prefix)
 
         if len(versions) <= max_versions:
             logger.info(f"No pruning needed for {node_id_prefix}: {len(versions)}/{max_versions} versions")
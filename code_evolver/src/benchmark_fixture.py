@@ -393,17 +393,17 @@ class BenchmarkFixture:
         peak_memory = 0
 
         if self.collector:
-            self.collector.store.sync_to_duckdb()
-
-            memory_stats = self.collector.store.query_analytics("""
-                SELECT AVG(memory_mb), MAX(memory_mb)
-                FROM records
-                WHERE context_id = ?
-            """, [f"{impl_name}_{scenario.name}"]).fetchone()
+            # Read straight from LMDB (one read transaction) instead of forcing
+            # a DuckDB sync between implementations; the store's background
+            # sync moves the records to DuckDB off the measurement loop
+            records = self.collector.store.get_records_by_context(
+                layer, f"{impl_name}_{scenario.name}", limit=None
+            )
+            memory_values = [r.memory_mb for r in records]
 
-            if memory_stats:
-                avg_memory = float(memory_stats[0] or 0)
-                peak_memory = float(memory_stats[1] or 0)
+            if memory_values:
+                avg_memory = float(sum(memory_values) / len(memory_values))
+                peak_memory = float(max(memory_values))
 
         # Calculate success rate
         total_executions = success_count + error_count
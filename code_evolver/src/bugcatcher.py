@@ -8,14 +8,19 @@ This tool sits at the front of every workflow and watches for:
 
 It maintains an LRU cache of recent requests and logs exceptions to Loki.
 """
+import atexit
+import gzip
 import logging
+import os
+import random
 import time
 import threading
 import traceback
 import sys
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from enum import Enum
 import json
 import requests
@@ -106,6 +111,14 @@ class LokiBackend:
     Backend for sending logs to Grafana Loki.
 
     Loki is a log aggregation system designed for efficiency and cost.
+
+    push() only appends to an in-memory queue and never blocks on the
+    network. A background shipper thread:
+    - groups queued entries into one stream per label set
+    - sends them as gzip-compressed JSON
+    - retries failures with jittered exponential backoff
+    - spills entries to a size-capped on-disk spool while Loki is down,
+      and replays the spool (oldest first) once it is back
     """
 
     def __init__(
@@ -113,7 +126,14 @@ class LokiBackend:
         url: str = "http://localhost:3100",
         enabled: bool = True,
         timeout: int = 5,
-        batch_size: int = 10
+        batch_size: int = 10,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+        spool_dir: Optional[str] = None,
+        spool_max_mb: float = 50,
+        backoff_base: float = 0.5,
+        backoff_max: float = 60.0,
+        compress: bool = True
     ):
         """
         Initialize Loki backend.
@@ -123,13 +143,50 @@ class LokiBackend:
             enabled: Whether logging to Loki is enabled
             timeout: Request timeout in seconds
             batch_size: Number of logs to batch before sending
+            flush_interval: Seconds between sends of a partial batch
+            max_queue_size: Maximum queued entries in memory (oldest are
+                dropped beyond this)
+            spool_dir: Directory to spool entries to while Loki is down
+                (None keeps them in memory only)
+            spool_max_mb: Maximum spool size (oldest segments are dropped)
+            backoff_base: First retry delay in seconds
+            backoff_max: Maximum retry delay in seconds
+            compress: Gzip request bodies
         """
         self.url = url.rstrip('/') + '/loki/api/v1/push'
         self.enabled = enabled
         self.timeout = timeout
-        self.batch_size = batch_size
-        self._batch: List[Dict[str, Any]] = []
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_queue_size = max(self.batch_size, max_queue_size)
+        self.spool_dir = Path(spool_dir) if spool_dir else None
+        self.spool_max_bytes = int(spool_max_mb * 1024 * 1024)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.compress = compress
+
+        # Queued entries: (labels, timestamp ns, message)
+        self._batch: deque = deque()
         self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._cycle = threading.Condition()
+        self._cycles_started = 0
+        self._cycles_done = 0
+        self._thread: Optional[threading.Thread] = None
+        self._session: Optional[requests.Session] = None
+
+        self._failures = 0
+        self._retry_at = 0.0
+        self._spool_seq = 0
+        self._stats = {
+            'sent_entries': 0,
+            'sent_requests': 0,
+            'failed_requests': 0,
+            'dropped_entries': 0,
+            'spooled_entries': 0,
+            'replayed_entries': 0
+        }
 
     def push(
         self,
@@ -138,7 +195,7 @@ class LokiBackend:
         timestamp: Optional[datetime] = None
     ):
         """
-        Push a log entry to Loki.
+        Queue a log entry for Loki (never blocks on the network).
 
         Args:
             message: Log message
@@ -154,44 +211,249 @@ class LokiBackend:
         # Convert to nanoseconds since epoch (Loki format)
         ts_ns = str(int(timestamp.timestamp() * 1e9))
 
-        log_entry = {
-            'stream': labels,
-            'values': [[ts_ns, message]]
-        }
-
         with self._lock:
-            self._batch.append(log_entry)
+            self._batch.append((dict(labels), ts_ns, message))
+            if len(self._batch) > self.max_queue_size:
+                self._batch.popleft()
+                self._stats['dropped_entries'] += 1
+            batch_full = len(self._batch) >= self.batch_size
+
+        self._ensure_shipper()
+        if batch_full:
+            self._wakeup.set()
+
+    def _ensure_shipper(self):
+        """Start the shipper thread on first use."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="loki-shipper",
+                    daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self):
+        """Shipper loop."""
+        while not self._stop.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._ship_cycle()
+
+        # Final attempt; anything unsent ends up in the spool
+        self._ship_cycle()
+
+    def _ship_cycle(self):
+        with self._cycle:
+            self._cycles_started += 1
+        try:
+            self._ship()
+        except Exception as e:
+            logger.warning(f"Loki shipper error: {e}")
+        finally:
+            with self._cycle:
+                self._cycles_done += 1
+                self._cycle.notify_all()
+
+    def _drain(self, limit: Optional[int] = None) -> List[tuple]:
+        with self._lock:
+            count = len(self._batch) if limit is None else min(limit, len(self._batch))
+            return [self._batch.popleft() for _ in range(count)]
+
+    def _ship(self):
+        """Send spooled, then queued entries until sent or Loki fails."""
+        if time.monotonic() < self._retry_at:
+            # Loki is down: move the queue to disk instead of holding it
+            if self.spool_dir is not None:
+                self._spill(self._drain())
+            return
 
-            # Send batch if full
-            if len(self._batch) >= self.batch_size:
-                self._send_batch()
+        for segment in self._spool_segments():
+            entries = self._read_segment(segment)
+            if entries and not self._send(entries):
+                self._on_failure()
+                return
+            self._stats['replayed_entries'] += len(entries)
+            segment.unlink(missing_ok=True)
 
-    def _send_batch(self):
-        """Send batched logs to Loki."""
-        if not self._batch:
-            return
+        while True:
+            entries = self._drain(self.batch_size)
+            if not entries:
+                break
+            if not self._send(entries):
+                self._on_failure()
+                self._spill(entries)
+                return
 
-        payload = {'streams': self._batch}
+        self._failures = 0
 
-        try:
-            response = requests.post(
-                self.url,
-                json=payload,
-                timeout=self.timeout,
-                headers={'Content-Type': 'application/json'}
-            )
-            response.raise_for_status()
-            self._batch.clear()
+    def _on_failure(self):
+        """Schedule the next attempt with jittered exponential backoff."""
+        self._failures += 1
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (self._failures - 1)))
+        self._retry_at = time.monotonic() + delay * random.uniform(0.5, 1.0)
+
+    def build_payload(self, entries: List[tuple]) -> Dict[str, Any]:
+        """
+        Group entries into one stream per label set.
+
+        Args:
+            entries: (labels, timestamp ns, message) tuples
+
+        Returns:
+            Loki push payload
+        """
+        streams: Dict[tuple, Dict[str, Any]] = {}
+        for labels, ts_ns, message in entries:
+            key = tuple(sorted(labels.items()))
+            stream = streams.get(key)
+            if stream is None:
+                stream = streams[key] = {'stream': labels, 'values': []}
+            stream['values'].append([ts_ns, message])
+
+        for stream in streams.values():
+            stream['values'].sort(key=lambda value: int(value[0]))
+
+        return {'streams': list(streams.values())}
+
+    def _send(self, entries: List[tuple]) -> bool:
+        """
+        Send entries to Loki.
+
+        Returns:
+            True when the entries are done with (sent, or rejected by Loki
+            as invalid), False when they should be retried
+        """
+        body = json.dumps(self.build_payload(entries)).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+        if self.compress:
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+
+        if self._session is None:
+            self._session = requests.Session()
 
+        try:
+            response = self._session.post(self.url, data=body, timeout=self.timeout, headers=headers)
         except requests.exceptions.RequestException as e:
+            self._stats['failed_requests'] += 1
             logger.warning(f"Failed to send logs to Loki: {e}")
-            # Don't clear batch - will try again next time
+            return False
+
+        if response.status_code == 429 or response.status_code >= 500:
+            self._stats['failed_requests'] += 1
+            logger.warning(f"Failed to send logs to Loki: HTTP {response.status_code}")
+            return False
+
+        if response.status_code >= 400:
+            # Retrying a rejected payload would fail forever
+            with self._lock:
+                self._stats['dropped_entries'] += len(entries)
+            logger.warning(f"Loki rejected {len(entries)} log entries: HTTP {response.status_code} {response.text[:200]}")
+            return True
+
+        self._stats['sent_entries'] += len(entries)
+        self._stats['sent_requests'] += 1
+        return True
+
+    def _spool_segments(self) -> List[Path]:
+        if self.spool_dir is None or not self.spool_dir.exists():
+            return []
+        return sorted(self.spool_dir.glob('*.json.gz'))
+
+    def _read_segment(self, segment: Path) -> List[tuple]:
+        try:
+            with gzip.open(segment, 'rt', encoding='utf-8') as f:
+                return [tuple(entry) for entry in json.load(f)]
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable Loki spool segment {segment.name}: {e}")
+            return []
+
+    def _spill(self, entries: List[tuple]):
+        """Spool entries to disk (or requeue them without a spool)."""
+        if not entries:
+            return
 
-    def flush(self):
-        """Flush any remaining batched logs."""
+        if self.spool_dir is None:
+            with self._lock:
+                self._batch.extendleft(reversed(entries))
+                while len(self._batch) > self.max_queue_size:
+                    self._batch.popleft()
+                    self._stats['dropped_entries'] += 1
+            return
+
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self._spool_seq += 1
+        segment = self.spool_dir / f"{time.time_ns():020d}-{self._spool_seq:06d}-{len(entries)}.json.gz"
+        tmp_path = segment.with_suffix('.tmp')
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, segment)
+        self._stats['spooled_entries'] += len(entries)
+
+        # Enforce the size cap by dropping the oldest segments
+        segments = self._spool_segments()
+        total = sum(s.stat().st_size for s in segments)
+        while total > self.spool_max_bytes and len(segments) > 1:
+            oldest = segments.pop(0)
+            total -= oldest.stat().st_size
+            with self._lock:
+                self._stats['dropped_entries'] += int(oldest.name.split('-')[-1].split('.')[0])
+            oldest.unlink(missing_ok=True)
+
+    def flush(self, timeout: Optional[float] = None):
+        """
+        Ship queued logs now and wait for the attempt to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (default: twice the request timeout)
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return
+
+        with self._cycle:
+            target = self._cycles_started + 1
+            self._wakeup.set()
+            self._cycle.wait_for(
+                lambda: self._cycles_done >= target,
+                timeout=self.timeout * 2 if timeout is None else timeout
+            )
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Stop the shipper after a final send (unsent entries are spooled).
+
+        Args:
+            timeout: Maximum seconds to wait (default: twice the request timeout)
+        """
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._stop.set()
+        self._wakeup.set()
+        thread.join(self.timeout * 2 if timeout is None else timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get shipper statistics.
+
+        Returns:
+            Dict with queued, sent, failed, dropped and spooled counts
+        """
         with self._lock:
-            if self._batch:
-                self._send_batch()
+            queued = len(self._batch)
+            stats = dict(self._stats)
+        segments = self._spool_segments()
+        return {
+            **stats,
+            'queued_entries': queued,
+            'spool_segments': len(segments),
+            'spool_bytes': sum(s.stat().st_size for s in segments),
+            'backing_off': time.monotonic() < self._retry_at
+        }
 
 
 class BugCatcher:
@@ -212,7 +474,8 @@ class BugCatcher:
         cache_size: int = 100,
         log_to_file: bool = True,
         log_file: str = "bugcatcher.log",
-        track_outputs: bool = False
+        track_outputs: bool = False,
+        loki_options: Optional[Dict[str, Any]] = None
     ):
         """
         Initialize BugCatcher.
@@ -224,8 +487,9 @@ class BugCatcher:
             log_to_file: Whether to also log to file
             log_file: Path to log file
             track_outputs: Whether to log all outputs to Loki (not just exceptions)
+            loki_options: Extra LokiBackend options (batch_size, spool_dir, ...)
         """
-        self.loki = LokiBackend(url=loki_url, enabled=loki_enabled)
+        self.loki = LokiBackend(url=loki_url, enabled=loki_enabled, **(loki_options or {}))
         self.request_cache = LRUCache(max_size=cache_size)
         self.log_to_file = log_to_file
         self.log_file = log_file
@@ -505,6 +769,7 @@ class BugCatcher:
             'cache_size': self.request_cache.size(),
             'cache_max_size': self.request_cache.max_size,
             'loki_enabled': self.loki.enabled,
+            'loki': self.loki.get_stats(),
             'enabled': self.enabled
         }
 
@@ -551,7 +816,8 @@ def setup_bugcatcher_logging(
     cache_size: int = 100,
     log_to_file: bool = True,
     log_file: str = "bugcatcher.log",
-    track_outputs: bool = False
+    track_outputs: bool = False,
+    loki_options: Optional[Dict[str, Any]] = None
 ) -> BugCatcher:
     """
     Set up BugCatcher with logging integration.
@@ -567,6 +833,7 @@ def setup_bugcatcher_logging(
         log_to_file: Whether to log to file
         log_file: Path to log file
         track_outputs: Whether to log all outputs (disabled by default)
+        loki_options: Extra LokiBackend options (batch_size, spool_dir, ...)
 
     Returns:
         Configured BugCatcher instance
@@ -578,7 +845,8 @@ def setup_bugcatcher_logging(
         cache_size=cache_size,
         log_to_file=log_to_file,
         log_file=log_file,
-        track_outputs=track_outputs
+        track_outputs=track_outputs,
+        loki_options=loki_options
     )
 
     # Install logging handler
@@ -43,7 +43,15 @@ def initialize_bugcatcher_from_config(config: Dict[str, Any]) -> Optional[object
             cache_size=cache_config.get('max_size', 100),
             log_to_file=file_logging_config.get('enabled', True),
             log_file=file_logging_config.get('file', 'bugcatcher.log'),
-            track_outputs=tracking_config.get('outputs', False)
+            track_outputs=tracking_config.get('outputs', False),
+            loki_options={
+                key: loki_config[key]
+                for key in (
+                    'batch_size', 'timeout', 'flush_interval', 'max_queue_size',
+                    'spool_dir', 'spool_max_mb', 'backoff_max', 'compress'
+                )
+                if key in loki_config
+            }
         )
 
         logger.info("BugCatcher initialized successfully")
@@ -0,0 +1,268 @@
+"""
+In-process client for the bulk_data_store tool.
+
+DatabaseStorage used to start a Python subprocess (and open a fresh Postgres
+connection) for every record. This client imports tools/executable/
+bulk_data_store.py into the current process, so its PostgresClient
+connection pool stays open, and writes go through a write-behind queue:
+
+- submit() enqueues a record and returns immediately
+- a background thread drains the queue in batches; each batch is written
+  with one multi-row INSERT per operation (BulkDataStore.store_batch)
+- the queue is bounded: when it is full, submit() blocks for up to
+  put_timeout seconds (backpressure) before dropping the record
+- pending records are flushed at interpreter shutdown
+
+If the tool cannot be imported (e.g. psycopg2 is missing from this
+interpreter), calls fall back to running the tool as a subprocess, one per
+call or per batch.
+"""
+import atexit
+import importlib.util
+import json
+import logging
+import queue
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BulkDataClient:
+    """Pooled, batching client for bulk data storage."""
+
+    def __init__(
+        self,
+        tools_path: Path,
+        batch_size: int = 500,
+        max_queue: int = 10000,
+        flush_interval: float = 0.5,
+        put_timeout: float = 5.0
+    ):
+        """
+        Initialize bulk data client.
+
+        Args:
+            tools_path: Path to tools directory (contains executable/bulk_data_store.py)
+            batch_size: Maximum records written per batch
+            max_queue: Maximum records waiting to be written
+            flush_interval: Seconds the writer waits to fill a batch
+            put_timeout: Seconds submit() blocks on a full queue before dropping
+        """
+        self.tool_path = Path(tools_path) / "executable" / "bulk_data_store.py"
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+
+        self.store = self._load_store()
+
+        self._queue: "queue.Queue[Tuple[str, Dict[str, Any]]]" = queue.Queue(maxsize=max_queue)
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
+
+        # Counters
+        self.submitted = 0
+        self.written = 0
+        self.failed = 0
+        self.dropped = 0
+        self.batches = 0
+
+        atexit.register(self.close)
+
+    def _load_store(self) -> Optional[Any]:
+        """Import BulkDataStore in-process (None if unavailable)."""
+        if not self.tool_path.exists():
+            logger.warning(f"bulk_data_store.py not found at {self.tool_path}")
+            return None
+
+        try:
+            # The tool imports its sibling postgres_client module
+            tool_dir = str(self.tool_path.parent.absolute())
+            if tool_dir not in sys.path:
+                sys.path.append(tool_dir)
+
+            spec = importlib.util.spec_from_file_location("bulk_data_store", self.tool_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module.BulkDataStore
+        except Exception as e:
+            logger.info(f"bulk_data_store not importable in-process, using subprocess: {e}")
+            return None
+
+    def call(self, operation: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        Run a bulk_data_store operation synchronously.
+
+        Args:
+            operation: Operation name (e.g. store_tool, query_logs)
+            **kwargs: Operation parameters
+
+        Returns:
+            Result dict from the tool or None if the call failed
+        """
+        if self.store is not None:
+            try:
+                return getattr(self.store, operation)(**kwargs)
+            except Exception as e:
+                logger.error(f"bulk_data_store {operation} failed: {e}")
+                return None
+
+        return self._call_subprocess(operation, **kwargs)
+
+    def _call_subprocess(self, operation: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """Run the tool as a subprocess (fallback when it cannot be imported)."""
+        try:
+            if not self.tool_path.exists():
+                return None
+
+            input_data = json.dumps({"operation": operation, **kwargs})
+
+            result = subprocess.run(
+                ["python", str(self.tool_path)],
+                input=input_data,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+
+            if result.returncode == 0:
+                return json.loads(result.stdout)
+            else:
+                logger.error(f"bulk_data_store error: {result.stderr}")
+                return None
+
+        except Exception as e:
+            logger.error(f"Error calling bulk_data_store: {e}")
+            return None
+
+    def submit(self, operation: str, **record) -> bool:
+        """
+        Queue a write for the background writer.
+
+        Args:
+            operation: store_log, store_bug, store_ancestry or store_perf_data
+            **record: Parameters of the matching store_* call
+
+        Returns:
+            True if queued, False if dropped (queue full or client closed)
+        """
+        if self._closed:
+            return False
+
+        # Keep the event time, not the time the batch is written
+        record.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+
+        self._ensure_writer()
+        try:
+            self._queue.put((operation, record), timeout=self.put_timeout)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(f"Bulk data queue full, dropped {operation} record")
+            return False
+
+        self.submitted += 1
+        return True
+
+    def _ensure_writer(self):
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    name="bulk-data-writer",
+                    daemon=True
+                )
+                self._writer.start()
+
+    def _writer_loop(self):
+        """Drain the queue in batches."""
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if self._closed:
+                    return
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                logger.error(f"Error writing bulk data batch: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: List[Tuple[str, Dict[str, Any]]]):
+        """Write one batch: one store_batch call per operation."""
+        by_operation: Dict[str, List[Dict[str, Any]]] = {}
+        for operation, record in batch:
+            by_operation.setdefault(operation, []).append(record)
+
+        for operation, records in by_operation.items():
+            response = self.call("store_batch", batch_operation=operation, records=records)
+            self.batches += 1
+            if response is None:
+                self.failed += len(records)
+                continue
+            failed = response.get("failed", 0)
+            self.failed += failed
+            self.written += len(records) - failed
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued record has been written.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue drained in time
+        """
+        if self._writer is None:
+            return True
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 10.0):
+        """Flush pending records and stop accepting new ones."""
+        if self._closed:
+            return
+        if not self.flush(timeout):
+            logger.warning(f"Bulk data flush timed out, {self._queue.unfinished_tasks} record(s) not written")
+        self._closed = True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue and write counters."""
+        return {
+            "in_process": self.store is not None,
+            "queued": self._queue.qsize(),
+            "submitted": self.submitted,
+            "written": self.written,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "batches": self.batches
+        }
@@ -10,7 +10,7 @@ A comprehensive conversation management system with:
 - Parallel task execution with CPU/GPU load awareness
 """
 
-from .conversation_storage import ConversationStorage
+from .conversation_storage import ConversationStorage, ConversationTail
 from .context_manager import ContextMemoryManager
 from .summarizer import ConversationSummarizer
 from .intent_detector import ConversationIntentDetector
@@ -20,6 +20,7 @@ from .conversation_tool import ConversationTool
 
 __all__ = [
     "ConversationStorage",
+    "ConversationTail",
     "ContextMemoryManager",
     "ConversationSummarizer",
     "ConversationIntentDetector",
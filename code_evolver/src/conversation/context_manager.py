@@ -11,6 +11,41 @@ from dataclasses import dataclass
 logger = logging.getLogger(__name__)
 
 
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate token count for text.
+
+    Uses simple heuristic: ~4 characters per token (conservative estimate).
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count
+    """
+    # Conservative estimate: 4 chars per token
+    # This ensures we don't exceed limits
+    return len(text) // 4
+
+
+def estimate_message_tokens(message: Dict[str, Any]) -> int:
+    """
+    Estimate tokens for a message.
+
+    Args:
+        message: Message dict with 'role' and 'content'
+
+    Returns:
+        Estimated token count
+    """
+    content = message.get("content", "")
+    role = message.get("role", "")
+
+    # Add overhead for role and formatting
+    overhead = 10
+    return estimate_tokens(content) + estimate_tokens(role) + overhead
+
+
 @dataclass
 class ContextWindow:
     """Model context window configuration."""
@@ -87,43 +122,19 @@ class ContextMemoryManager:
         return ContextWindow(model_name, 8192, 2048, 512)
 
     def estimate_tokens(self, text: str) -> int:
-        """
-        Estimate token count for text.
-
-        Uses simple heuristic: ~4 characters per token (conservative estimate).
-
-        Args:
-            text: Text to estimate
-
-        Returns:
-            Estimated token count
-        """
-        # Conservative estimate: 4 chars per token
-        # This ensures we don't exceed limits
-        return len(text) // 4
+        """Estimate token count for text (see estimate_tokens)."""
+        return estimate_tokens(text)
 
     def estimate_message_tokens(self, message: Dict[str, Any]) -> int:
-        """
-        Estimate tokens for a message.
-
-        Args:
-            message: Message dict with 'role' and 'content'
-
-        Returns:
-            Estimated token count
-        """
-        content = message.get("content", "")
-        role = message.get("role", "")
-
-        # Add overhead for role and formatting
-        overhead = 10
-        return self.estimate_tokens(content) + self.estimate_tokens(role) + overhead
+        """Estimate tokens for a message (see estimate_message_tokens)."""
+        return estimate_message_tokens(message)
 
     def optimize_context(
         self,
         messages: List[Dict[str, Any]],
         summary: Optional[str] = None,
-        related_context: Optional[List[str]] = None
+        related_context: Optional[List[str]] = None,
+        message_tokens: Optional[List[int]] = None
     ) -> Dict[str, Any]:
         """
         Optimize context to fit within model's context window.
@@ -138,6 +149,8 @@ class ContextMemoryManager:
             messages: List of conversation messages
             summary: Optional conversation summary
             related_context: Optional related conversation snippets
+            message_tokens: Precomputed token count per message (e.g. from
+                a ConversationTail), so messages are not re-estimated
 
         Returns:
             Optimized context dict with:
@@ -172,17 +185,23 @@ class ContextMemoryManager:
         truncated = False
 
         # Start from most recent and work backwards
-        for message in reversed(messages):
-            message_tokens = self.estimate_message_tokens(message)
-
-            if messages_tokens + message_tokens <= available_for_messages:
-                optimized_messages.insert(0, message)
-                messages_tokens += message_tokens
+        for index in range(len(messages) - 1, -1, -1):
+            message = messages[index]
+            tokens = (
+                message_tokens[index] if message_tokens is not None
+                else self.estimate_message_tokens(message)
+            )
+
+            if messages_tokens + tokens <= available_for_messages:
+                optimized_messages.append(message)
+                messages_tokens += tokens
             else:
                 # Can't fit more messages
                 truncated = True
                 break
 
+        optimized_messages.reverse()
+
         # If we couldn't fit any messages but have room, try to fit at least one
         if not optimized_messages and messages and available_for_messages > 100:
             # Truncate the most recent message to fit
@@ -221,7 +240,8 @@ class ContextMemoryManager:
     def should_summarize(
         self,
         messages: List[Dict[str, Any]],
-        threshold_ratio: float = 0.7
+        threshold_ratio: float = 0.7,
+        total_tokens: Optional[int] = None
     ) -> bool:
         """
         Determine if conversation should be summarized.
@@ -229,11 +249,14 @@ class ContextMemoryManager:
         Args:
             messages: List of messages
             threshold_ratio: Ratio of context window to trigger summarization
+            total_tokens: Precomputed token total of messages (e.g. a
+                ConversationTail's running total)
 
         Returns:
             True if summarization is recommended
         """
-        total_tokens = sum(self.estimate_message_tokens(msg) for msg in messages)
+        if total_tokens is None:
+            total_tokens = sum(self.estimate_message_tokens(msg) for msg in messages)
         threshold = self.context_window.available_for_context * threshold_ratio
 
         return total_tokens >= threshold
@@ -3,12 +3,18 @@ Conversation Storage Manager
 
 Manages volatile Qdrant collections for conversations.
 Collections are created per conversation and can be deleted when conversation ends.
+
+Recent messages of each conversation are also kept in memory (a
+ConversationTail with cached token counts), so building the context for a
+turn does not read Qdrant. Qdrant is read for semantic recall and to warm
+the tail of a conversation this process has not seen yet.
 """
 import logging
+import threading
 import uuid
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
-import requests
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 try:
     from qdrant_client import QdrantClient
@@ -20,9 +26,135 @@ try:
 except ImportError:
     QDRANT_AVAILABLE = False
 
+from ..embedding_client import get_embedding_client
+from .context_manager import estimate_message_tokens
+
 logger = logging.getLogger(__name__)
 
 
+class ConversationTail:
+    """
+    Ring of a conversation's most recent messages.
+
+    Each message's token estimate is computed once, on append, and a
+    running total is kept, so context sizing is O(1) per new message
+    instead of re-estimating the whole history every turn.
+
+    Messages pushed out by max_messages are not lost: they wait in an
+    overflow list until take_overflow() hands them to the summarizer.
+    """
+
+    def __init__(
+        self,
+        max_messages: int = 200,
+        token_estimator: Callable[[Dict[str, Any]], int] = estimate_message_tokens
+    ):
+        """
+        Initialize tail.
+
+        Args:
+            max_messages: Maximum messages kept (oldest are evicted)
+            token_estimator: Token estimate for a message
+        """
+        self.max_messages = max(1, max_messages)
+        self.token_estimator = token_estimator
+        self._messages: deque = deque()  # (message, tokens)
+        self._overflow: List[Dict[str, Any]] = []  # Evicted, not yet summarized
+        self._lock = threading.Lock()
+
+        self.total_tokens = 0
+        self.evicted = 0  # Older messages no longer in the tail
+
+    def append(self, message: Dict[str, Any]) -> int:
+        """
+        Add the newest message.
+
+        Args:
+            message: Message payload
+
+        Returns:
+            Token estimate of the message
+        """
+        tokens = self.token_estimator(message)
+        with self._lock:
+            self._messages.append((message, tokens))
+            self.total_tokens += tokens
+            while len(self._messages) > self.max_messages:
+                self._pop_oldest()
+        return tokens
+
+    def _pop_oldest(self, summarized: bool = False):
+        message, tokens = self._messages.popleft()
+        self.total_tokens -= tokens
+        self.evicted += 1
+        if not summarized:
+            self._overflow.append(message)
+
+    def drop_oldest(self, count: int):
+        """
+        Remove the oldest messages (e.g. once they have been summarized).
+
+        Args:
+            count: Number of messages to remove
+        """
+        with self._lock:
+            for _ in range(min(count, len(self._messages))):
+                self._pop_oldest(summarized=True)
+
+    def add_overflow(self, messages: List[Dict[str, Any]]):
+        """
+        Record older messages that are not in the tail and not yet summarized.
+
+        Args:
+            messages: Messages, oldest first (older than everything in the tail)
+        """
+        with self._lock:
+            self._overflow[:0] = messages
+            self.evicted += len(messages)
+
+    def take_overflow(self) -> List[Dict[str, Any]]:
+        """
+        Take the messages evicted since the last call (oldest first).
+
+        The caller is responsible for summarizing them.
+
+        Returns:
+            Evicted messages
+        """
+        with self._lock:
+            overflow, self._overflow = self._overflow, []
+        return overflow
+
+    def snapshot(self, limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """
+        Get messages (oldest first) with their token estimates.
+
+        Args:
+            limit: Only the most recent N messages
+
+        Returns:
+            (messages, token counts)
+        """
+        with self._lock:
+            entries = list(self._messages)
+        if limit is not None:
+            entries = entries[-limit:] if limit > 0 else []
+        return [message for message, _ in entries], [tokens for _, tokens in entries]
+
+    @property
+    def complete(self) -> bool:
+        """True if the tail holds the conversation's entire history."""
+        return self.evicted == 0
+
+    @property
+    def total_messages(self) -> int:
+        """Messages in the conversation (including evicted ones)."""
+        return self.evicted + len(self._messages)
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+
 class ConversationStorage:
     """
     Manages volatile Qdrant storage for conversations.
@@ -40,7 +172,8 @@ class ConversationStorage:
         qdrant_url: str = "http://localhost:6333",
         embedding_model: str = "nomic-embed-text",
         embedding_endpoint: str = "http://localhost:11434",
-        vector_size: int = 768
+        vector_size: int = 768,
+        tail_size: int = 200
     ):
         """
         Initialize conversation storage.
@@ -50,6 +183,7 @@ class ConversationStorage:
             embedding_model: Model to use for embeddings
             embedding_endpoint: Endpoint for embedding generation
             vector_size: Dimension of embedding vectors
+            tail_size: Recent messages kept in memory per conversation
         """
         if not QDRANT_AVAILABLE:
             raise ImportError("qdrant-client required. Install with: pip install qdrant-client")
@@ -58,6 +192,7 @@ class ConversationStorage:
         self.embedding_model = embedding_model
         self.embedding_endpoint = embedding_endpoint
         self.vector_size = vector_size
+        self.tail_size = tail_size
 
         # Connect to Qdrant
         self.qdrant = QdrantClient(url=qdrant_url)
@@ -66,6 +201,7 @@ class ConversationStorage:
         # Track active conversations
         self.active_conversations: Dict[str, str] = {}  # topic -> conversation_id
         self.conversation_metadata: Dict[str, Dict[str, Any]] = {}  # conversation_id -> metadata
+        self._tails: Dict[str, ConversationTail] = {}  # conversation_id -> recent messages
 
     def _generate_embedding(self, text: str) -> List[float]:
         """
@@ -77,28 +213,19 @@ class ConversationStorage:
         Returns:
             Embedding vector
         """
-        try:
-            response = requests.post(
-                f"{self.embedding_endpoint}/api/embed",
-                json={
-                    "model": self.embedding_model,
-                    "prompt": text
-                },
-                timeout=90
-            )
-            response.raise_for_status()
-            embedding = response.json()["embedding"]
-
+        # Shared pooled client backed by the persistent embedding cache
+        embedding = get_embedding_client(self.embedding_endpoint, self.embedding_model).embed(text)
+        if embedding is not None:
             if len(embedding) != self.vector_size:
                 logger.warning(
                     f"Embedding size mismatch: expected {self.vector_size}, got {len(embedding)}"
                 )
 
             return embedding
-        except Exception as e:
-            logger.error(f"Failed to generate embedding: {e}")
-            # Return zero vector as fallback
-            return [0.0] * self.vector_size
+
+        logger.error("Failed to generate embedding")
+        # Return zero vector as fallback
+        return [0.0] * self.vector_size
 
     def _get_collection_name(self, conversation_id: str) -> str:
         """Get Qdrant collection name for conversation."""
@@ -146,6 +273,7 @@ class ConversationStorage:
             "collection_name": collection_name,
             "preferred_tools": preferred_tools or []
         }
+        self._tails[conversation_id] = ConversationTail(self.tail_size)
 
         logger.info(f"Created conversation '{topic}' with ID {conversation_id}")
         if preferred_tools:
@@ -212,6 +340,12 @@ class ConversationStorage:
             if conversation_id in self.conversation_metadata:
                 self.conversation_metadata[conversation_id]["message_count"] += 1
 
+            # A conversation without a tail is warmed from Qdrant on first
+            # read, which will include this message
+            tail = self._tails.get(conversation_id)
+            if tail is not None:
+                tail.append(payload)
+
             logger.debug(f"Added {role} message to conversation {conversation_id}")
             return message_id
         except Exception as e:
@@ -226,13 +360,51 @@ class ConversationStorage:
         """
         Retrieve all messages from a conversation.
 
+        Served from the in-memory tail when it holds the requested range.
+
         Args:
             conversation_id: Conversation ID
-            limit: Optional limit on number of messages
+            limit: Optional limit on number of messages (most recent)
 
         Returns:
             List of messages
         """
+        tail = self._tails.get(conversation_id)
+        if tail is not None and (tail.complete or (limit and limit <= len(tail))):
+            return tail.snapshot(limit)[0]
+
+        return self._load_messages(conversation_id, limit)
+
+    def get_tail(self, conversation_id: str) -> ConversationTail:
+        """
+        Get the in-memory tail of a conversation.
+
+        On cold start (a conversation created by another process), the tail
+        is loaded from Qdrant once.
+
+        Args:
+            conversation_id: Conversation ID
+
+        Returns:
+            ConversationTail
+        """
+        tail = self._tails.get(conversation_id)
+        if tail is None:
+            messages = self._load_messages(conversation_id)
+            tail = ConversationTail(self.tail_size)
+            # Older history this process has not summarized yet
+            tail.add_overflow(messages[:-self.tail_size])
+            for message in messages[-self.tail_size:]:
+                tail.append(message)
+            self._tails[conversation_id] = tail
+        return tail
+
+    def _load_messages(
+        self,
+        conversation_id: str,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Read a conversation's messages from Qdrant, oldest first."""
         collection_name = self._get_collection_name(conversation_id)
 
         try:
@@ -254,7 +426,9 @@ class ConversationStorage:
                 for point in points:
                     messages.append(point.payload)
 
-                if next_offset is None or (limit and len(messages) >= limit):
+                # Points come back in ID order, so the most recent messages
+                # may be on any page
+                if next_offset is None:
                     break
 
                 offset = next_offset
@@ -341,6 +515,7 @@ class ConversationStorage:
         # Remove metadata
         if conversation_id in self.conversation_metadata:
             del self.conversation_metadata[conversation_id]
+        self._tails.pop(conversation_id, None)
 
         logger.info(f"Ended conversation {conversation_id}")
         return True
@@ -196,20 +196,24 @@ class ConversationTool:
         if response_model:
             self.context_manager = ContextMemoryManager(model_name=response_model)
 
-        # Get conversation messages
-        messages = self.storage.get_conversation_messages(self.current_conversation_id)
+        # Recent (not yet summarized) messages with cached token counts
+        tail = self.storage.get_tail(self.current_conversation_id)
+        overflow = tail.take_overflow()
+        messages, message_tokens = tail.snapshot()
 
         # Check if we should summarize
-        if self.context_manager.should_summarize(messages):
+        to_summarize: List[Dict[str, Any]] = []
+        if self.context_manager.should_summarize(messages, total_tokens=tail.total_tokens):
             logger.info("Conversation length threshold reached, summarizing...")
 
             # Get messages to summarize and keep
-            to_summarize, to_keep = self.context_manager.get_messages_for_summary(messages)
+            to_summarize, _ = self.context_manager.get_messages_for_summary(messages)
 
-            # Summarize
-            summary_result = self.summarizer.summarize_with_context(
-                messages=to_summarize,
-                keep_recent=len(to_keep),
+        # Messages the tail evicted are always folded into the summary, so
+        # nothing in the history is lost
+        if overflow or to_summarize:
+            summary_result = self.summarizer.summarize_messages(
+                overflow + to_summarize,
                 previous_summary=self.current_summary,
                 topic=self.storage.conversation_metadata.get(
                     self.current_conversation_id, {}
@@ -217,10 +221,12 @@ class ConversationTool:
             )
 
             self.current_summary = summary_result["summary"]
-            messages = to_keep  # Use only recent messages
-        else:
-            # No summarization needed
-            pass
+
+            # Summarized messages now live on in current_summary, so later
+            # turns only summarize what was added since
+            tail.drop_oldest(len(to_summarize))
+            messages = messages[len(to_summarize):]  # Use only recent messages
+            message_tokens = message_tokens[len(to_summarize):]
 
         # Get related context from past conversations
         related_context = self.embedder.get_related_context(
@@ -233,7 +239,8 @@ class ConversationTool:
         optimized = self.context_manager.optimize_context(
             messages=messages,
             summary=self.current_summary,
-            related_context=related_context
+            related_context=related_context,
+            message_tokens=message_tokens
         )
 
         elapsed = time.time() - start_time
@@ -390,13 +397,13 @@ class ConversationTool:
             }
 
         metadata = self.storage.get_conversation_metadata(self.current_conversation_id)
-        messages = self.storage.get_conversation_messages(self.current_conversation_id)
+        tail = self.storage.get_tail(self.current_conversation_id)
 
         return {
             "active": True,
             "conversation_id": self.current_conversation_id,
             "topic": metadata.get("topic") if metadata else "Unknown",
-            "message_count": len(messages),
+            "message_count": tail.total_messages,
             "has_summary": self.current_summary is not None,
             "metadata": metadata
         }
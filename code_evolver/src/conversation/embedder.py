@@ -6,7 +6,6 @@ Uses semantic search to find relevant conversation snippets.
 """
 import logging
 from typing import List, Dict, Any, Optional, Tuple
-import requests
 
 try:
     from qdrant_client import QdrantClient
@@ -18,6 +17,8 @@ try:
 except ImportError:
     QDRANT_AVAILABLE = False
 
+from ..embedding_client import get_embedding_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,27 +96,18 @@ class ConversationEmbedder:
         Returns:
             Embedding vector
         """
-        try:
-            response = requests.post(
-                f"{self.embedding_endpoint}/api/embed",
-                json={
-                    "model": self.embedding_model,
-                    "prompt": text
-                },
-                timeout=90
-            )
-            response.raise_for_status()
-            embedding = response.json()["embedding"]
-
+        # Shared pooled client backed by the persistent embedding cache
+        embedding = get_embedding_client(self.embedding_endpoint, self.embedding_model).embed(text)
+        if embedding is not None:
             if len(embedding) != self.vector_size:
                 logger.warning(
                     f"Embedding size mismatch: expected {self.vector_size}, got {len(embedding)}"
                 )
 
             return embedding
-        except Exception as e:
-            logger.error(f"Failed to generate embedding: {e}")
-            return [0.0] * self.vector_size
+
+        logger.error("Failed to generate embedding")
+        return [0.0] * self.vector_size
 
     def store_conversation_metadata(
         self,
@@ -3,13 +3,12 @@ Database Storage Module
 Integrates Postgres bulk data storage with the DiSE system.
 Complements RAG by storing detailed bulk data while RAG handles semantic search.
 """
-import json
 import logging
 import os
-import subprocess
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+
+from .bulk_data_client import BulkDataClient
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +37,7 @@ class DatabaseStorage:
         self.tools_path = tools_path or Path("./tools")
         self.enabled = False
         self.store_generated_tools = True
+        self.client: Optional[BulkDataClient] = None
 
         # Load configuration
         if config_manager:
@@ -58,6 +58,17 @@ class DatabaseStorage:
 
                     logger.info("Database storage enabled")
 
+                    # In-process client with write-behind batching for logs, bugs,
+                    # ancestry and perf data
+                    write_behind = db_config.get("write_behind", {})
+                    self.client = BulkDataClient(
+                        self.tools_path,
+                        batch_size=write_behind.get("batch_size", 500),
+                        max_queue=write_behind.get("max_queue", 10000),
+                        flush_interval=write_behind.get("flush_interval_ms", 500) / 1000.0,
+                        put_timeout=write_behind.get("put_timeout_ms", 5000) / 1000.0
+                    )
+
                     # Initialize schema on first run
                     self._initialize_schema()
             except Exception as e:
@@ -69,39 +80,15 @@ class DatabaseStorage:
         if not self.enabled:
             return
 
-        try:
-            # Call the bulk_data_store tool to initialize schema
-            tool_path = self.tools_path / "executable" / "bulk_data_store.py"
-
-            if not tool_path.exists():
-                logger.warning(f"bulk_data_store.py not found at {tool_path}")
-                return
-
-            input_data = json.dumps({"operation": "initialize_schema"})
-
-            result = subprocess.run(
-                ["python", str(tool_path)],
-                input=input_data,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode == 0:
-                response = json.loads(result.stdout)
-                if response.get("success"):
-                    logger.info("Database schema initialized successfully")
-                else:
-                    logger.error(f"Schema initialization failed: {response.get('error')}")
-            else:
-                logger.error(f"Schema initialization error: {result.stderr}")
-
-        except Exception as e:
-            logger.warning(f"Could not initialize database schema: {e}")
+        response = self._call_bulk_data_store("initialize_schema")
+        if response and response.get("success"):
+            logger.info("Database schema initialized successfully")
+        else:
+            logger.warning(f"Could not initialize database schema: {response}")
 
     def _call_bulk_data_store(self, operation: str, **kwargs) -> Optional[Dict[str, Any]]:
         """
-        Call the bulk_data_store tool.
+        Call the bulk_data_store tool synchronously.
 
         Args:
             operation: Operation to perform
@@ -110,34 +97,41 @@ class DatabaseStorage:
         Returns:
             Response from the tool or None if failed
         """
-        if not self.enabled:
+        if not self.enabled or not self.client:
             return None
 
-        try:
-            tool_path = self.tools_path / "executable" / "bulk_data_store.py"
+        return self.client.call(operation, **kwargs)
+
+    def _submit(self, operation: str, **record) -> bool:
+        """
+        Queue a write on the write-behind queue.
+
+        Returns:
+            True if the record was queued (it is written in the background)
+        """
+        if not self.enabled or not self.client:
+            return False
 
-            if not tool_path.exists():
-                return None
+        return self.client.submit(operation, **record)
 
-            input_data = json.dumps({"operation": operation, **kwargs})
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued writes to reach the database.
 
-            result = subprocess.run(
-                ["python", str(tool_path)],
-                input=input_data,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
 
-            if result.returncode == 0:
-                return json.loads(result.stdout)
-            else:
-                logger.error(f"bulk_data_store error: {result.stderr}")
-                return None
+        Returns:
+            True if all queued writes were processed
+        """
+        if not self.client:
+            return True
+        return self.client.flush(timeout)
 
-        except Exception as e:
-            logger.error(f"Error calling bulk_data_store: {e}")
-            return None
+    def close(self):
+        """Flush queued writes and stop the writer."""
+        if self.client:
+            self.client.close()
 
     def store_generated_tool(
         self,
@@ -205,11 +199,11 @@ class DatabaseStorage:
         message: str,
         details: Optional[Dict] = None
     ) -> bool:
-        """Store a detailed log message."""
+        """Store a detailed log message (queued, written in the background)."""
         if not self.enabled:
             return False
 
-        response = self._call_bulk_data_store(
+        return self._submit(
             "store_log",
             tool_id=tool_id,
             log_level=log_level,
@@ -217,8 +211,6 @@ class DatabaseStorage:
             details=details
         )
 
-        return response and response.get("success", False)
-
     def store_bug(
         self,
         bug_id: str,
@@ -228,11 +220,11 @@ class DatabaseStorage:
         stack_trace: Optional[str] = None,
         details: Optional[Dict] = None
     ) -> bool:
-        """Store a bug report."""
+        """Store a bug report (queued, written in the background)."""
         if not self.enabled:
             return False
 
-        response = self._call_bulk_data_store(
+        return self._submit(
             "store_bug",
             bug_id=bug_id,
             tool_id=tool_id,
@@ -242,8 +234,6 @@ class DatabaseStorage:
             details=details
         )
 
-        return response and response.get("success", False)
-
     def store_ancestry(
         self,
         parent_tool_id: str,
@@ -251,11 +241,11 @@ class DatabaseStorage:
         relationship_type: str,
         details: Optional[Dict] = None
     ) -> bool:
-        """Store tool ancestry/lineage."""
+        """Store tool ancestry/lineage (queued, written in the background)."""
         if not self.enabled:
             return False
 
-        response = self._call_bulk_data_store(
+        return self._submit(
             "store_ancestry",
             parent_tool_id=parent_tool_id,
             child_tool_id=child_tool_id,
@@ -263,8 +253,6 @@ class DatabaseStorage:
             details=details
         )
 
-        return response and response.get("success", False)
-
     def store_performance_data(
         self,
         tool_id: str,
@@ -273,11 +261,11 @@ class DatabaseStorage:
         unit: str = "",
         details: Optional[Dict] = None
     ) -> bool:
-        """Store performance metrics."""
+        """Store performance metrics (queued, written in the background)."""
         if not self.enabled:
             return False
 
-        response = self._call_bulk_data_store(
+        return self._submit(
             "store_perf_data",
             tool_id=tool_id,
             metric_name=metric_name,
@@ -286,8 +274,6 @@ class DatabaseStorage:
             details=details
         )
 
-        return response and response.get("success", False)
-
     def query_logs(
         self,
         filters: Optional[Dict] = None,
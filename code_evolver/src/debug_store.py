@@ -7,7 +7,9 @@ rich analytics capabilities for optimization and analysis.
 Architecture:
 - LMDB: Write-optimized layer for raw request/response data
 - DuckDB: Analytics-optimized layer for queries and aggregations
-- Background sync: Periodically transfers LMDB data to DuckDB
+- Background sync: Periodically transfers LMDB data to DuckDB in
+  columnar batches (Arrow record batches when pyarrow is installed)
+- Compaction: Optionally prunes synced LMDB records past a retention age
 """
 
 import json
@@ -17,11 +19,17 @@ import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
-from datetime import datetime
-from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from dataclasses import dataclass, asdict, fields
 import uuid
 import msgpack  # More efficient than JSON for binary storage
 
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 @dataclass
 class DebugRecord:
@@ -51,6 +59,12 @@ class DebugRecord:
     variant_id: Optional[str] = None  # Links to code variants
 
 
+# Column order of the DuckDB records table (matches DebugRecord)
+RECORD_COLUMNS = [f.name for f in fields(DebugRecord)]
+JSON_COLUMNS = ('request_data', 'response_data', 'metadata')
+FLOAT_COLUMNS = ('duration_ms', 'memory_mb', 'cpu_percent')
+
+
 class DebugStore:
     """
     Hybrid debug store with LMDB for fast writes and DuckDB for analytics.
@@ -81,7 +95,8 @@ class DebugStore:
         session_id: str,
         base_path: str = "debug_data",
         auto_sync_interval: int = 30,  # seconds
-        enable_auto_sync: bool = True
+        enable_auto_sync: bool = True,
+        retention_seconds: Optional[float] = None
     ):
         """
         Initialize hybrid debug store.
@@ -91,6 +106,8 @@ class DebugStore:
             base_path: Base directory for storing debug data
             auto_sync_interval: How often to sync LMDB to DuckDB (seconds)
             enable_auto_sync: Whether to automatically sync in background
+            retention_seconds: If set, the background sync also prunes LMDB
+                records that were synced to DuckDB and are older than this
         """
         self.session_id = session_id
         self.base_path = Path(base_path)
@@ -111,6 +128,8 @@ class DebugStore:
         self.records_db = self.lmdb_env.open_db(b'records')
         self.index_db = self.lmdb_env.open_db(b'index')  # For quick lookups
         self.pending_db = self.lmdb_env.open_db(b'pending_sync')  # Tracks what needs sync
+        self.synced_db = self.lmdb_env.open_db(b'synced')  # "timestamp|id" -> index key, for compaction
+        self.retention_seconds = retention_seconds
 
         # DuckDB setup (analytics)
         self.duckdb_path = self.base_path / f"{session_id}.duckdb"
@@ -258,108 +277,179 @@ class DebugStore:
                 return DebugRecord(**record_dict)
         return None
 
+    def get_records(self, record_ids: List[str]) -> List[DebugRecord]:
+        """
+        Retrieve several records in a single LMDB read transaction.
+
+        Args:
+            record_ids: Record IDs to fetch
+
+        Returns:
+            Records in the order requested (missing IDs are skipped)
+        """
+        with self.lmdb_env.begin() as txn:
+            return self._get_records_in_txn(txn, [rid.encode() for rid in record_ids])
+
+    def _get_records_in_txn(self, txn, keys: List[bytes]) -> List[DebugRecord]:
+        """Multi-get records inside an open transaction"""
+        if not keys:
+            return []
+        cursor = txn.cursor(db=self.records_db)
+        return [
+            DebugRecord(**msgpack.unpackb(record_bytes, raw=False))
+            for _, record_bytes in cursor.getmulti(keys)
+        ]
+
     def get_records_by_context(
         self,
         context_type: str,
         context_id: str,
-        limit: int = 100
+        limit: Optional[int] = 100
     ) -> List[DebugRecord]:
-        """Get records for a specific context (fast LMDB lookup)"""
-        records = []
+        """Get records for a specific context (fast LMDB lookup, limit=None for all)"""
+        keys = []
         prefix = f"{context_type}:{context_id}:".encode()
 
-        with self.lmdb_env.begin(db=self.index_db) as txn:
-            cursor = txn.cursor()
+        with self.lmdb_env.begin() as txn:
+            cursor = txn.cursor(db=self.index_db)
             if cursor.set_range(prefix):
-                count = 0
                 for key, value in cursor:
-                    if not key.startswith(prefix) or count >= limit:
+                    if not key.startswith(prefix) or (limit is not None and len(keys) >= limit):
                         break
+                    keys.append(value)
 
-                    record_id = value.decode()
-                    record = self.get_record(record_id)
-                    if record:
-                        records.append(record)
-                    count += 1
-
-        return records
+            return self._get_records_in_txn(txn, keys)
 
     def sync_to_duckdb(self, batch_size: int = 1000) -> int:
         """
         Sync pending LMDB records to DuckDB.
 
+        Pending records are streamed off an LMDB cursor in batches of
+        ``batch_size``. Each batch is read in a read-only transaction,
+        inserted into DuckDB as one columnar batch, and then cleared from
+        the pending set in a short write transaction, so concurrent
+        write_record() calls are never blocked for the whole sync.
+
         Returns:
             Number of records synced
         """
         with self._sync_lock:
             synced_count = 0
-            batch = []
-
-            with self.lmdb_env.begin(write=True) as txn:
-                cursor = txn.cursor(db=self.pending_db)
-
-                for record_id_bytes, _ in cursor:
-                    record_id = record_id_bytes.decode()
-
-                    # Get the full record
-                    record_bytes = txn.get(record_id.encode(), db=self.records_db)
-                    if not record_bytes:
-                        continue
 
-                    record_dict = msgpack.unpackb(record_bytes, raw=False)
-                    batch.append(record_dict)
+            while True:
+                pending_keys, columns, synced_keys = self._read_pending_batch(batch_size)
+                if not pending_keys:
+                    break
 
-                    # Remove from pending
-                    cursor.delete()
+                self._insert_batch_to_duckdb(columns)
+                self._mark_synced(pending_keys, synced_keys)
+                synced_count += len(synced_keys)
 
-                    # Insert batch when full
-                    if len(batch) >= batch_size:
-                        self._insert_batch_to_duckdb(batch)
-                        synced_count += len(batch)
-                        batch = []
+            return synced_count
 
-                # Insert remaining
-                if batch:
-                    self._insert_batch_to_duckdb(batch)
-                    synced_count += len(batch)
+    def _read_pending_batch(
+        self,
+        batch_size: int
+    ) -> Tuple[List[bytes], Dict[str, List[Any]], List[Tuple[bytes, bytes]]]:
+        """
+        Read up to batch_size pending records as columns.
 
-            return synced_count
+        Returns:
+            (pending keys read, column name -> values, [(synced key, index key)])
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in RECORD_COLUMNS}
+        synced_keys = []
+
+        with self.lmdb_env.begin() as txn:
+            cursor = txn.cursor(db=self.pending_db)
+            pending_keys = []
+            for key in cursor.iternext(keys=True, values=False):
+                pending_keys.append(key)
+                if len(pending_keys) >= batch_size:
+                    break
+
+            records_cursor = txn.cursor(db=self.records_db)
+            for record_id_bytes, record_bytes in records_cursor.getmulti(pending_keys):
+                record = msgpack.unpackb(record_bytes, raw=False)
+                for name in RECORD_COLUMNS:
+                    value = record.get(name)
+                    columns[name].append(json.dumps(value) if name in JSON_COLUMNS else value)
+
+                timestamp = record['timestamp']
+                synced_keys.append((
+                    f"{timestamp}|".encode() + record_id_bytes,
+                    f"{record['context_type']}:{record['context_id']}:".encode() + record_id_bytes
+                ))
+
+        return pending_keys, columns, synced_keys
+
+    def _mark_synced(self, pending_keys: List[bytes], synced_keys: List[Tuple[bytes, bytes]]):
+        """Clear a synced batch from the pending set and register it for compaction"""
+        with self.lmdb_env.begin(write=True) as txn:
+            for key in pending_keys:
+                txn.delete(key, db=self.pending_db)
+            for synced_key, index_key in synced_keys:
+                txn.put(synced_key, index_key, db=self.synced_db)
+
+    def _insert_batch_to_duckdb(self, columns: Dict[str, List[Any]]):
+        """Insert a batch of records (column name -> values) into DuckDB"""
+        if not columns['id']:
+            return
 
-    def _insert_batch_to_duckdb(self, records: List[Dict[str, Any]]):
-        """Insert a batch of records into DuckDB"""
-        if not records:
+        if PYARROW_AVAILABLE:
+            batch = pa.RecordBatch.from_pydict(columns, schema=_arrow_schema())
+            self.duckdb_conn.register('_sync_batch', batch)
+            try:
+                self.duckdb_conn.execute(
+                    "INSERT OR REPLACE INTO records SELECT * FROM _sync_batch"
+                )
+            finally:
+                self.duckdb_conn.unregister('_sync_batch')
             return
 
-        # Convert to format DuckDB can insert efficiently
-        placeholders = ", ".join(["?" for _ in range(17)])  # 17 columns
-
-        values = []
-        for record in records:
-            values.append((
-                record['id'],
-                record['timestamp'],
-                record['context_type'],
-                record['context_id'],
-                record['context_name'],
-                record['parent_context'],
-                json.dumps(record['request_data']),
-                json.dumps(record['response_data']),
-                json.dumps(record['metadata']),
-                record['duration_ms'],
-                record['memory_mb'],
-                record['cpu_percent'],
-                record['status'],
-                record['error'],
-                record['code_snapshot'],
-                record['code_hash'],
-                record['variant_id']
-            ))
-
-        # Use executemany for batch insert
+        placeholders = ", ".join(["?" for _ in RECORD_COLUMNS])
+        values = list(zip(*(columns[name] for name in RECORD_COLUMNS)))
         self.duckdb_conn.executemany(f"""
             INSERT OR REPLACE INTO records VALUES ({placeholders})
         """, values)
 
+    def compact_synced(self, max_age_seconds: float, batch_size: int = 1000) -> int:
+        """
+        Prune LMDB records that are already in DuckDB and older than max_age_seconds.
+
+        Synced records are keyed by timestamp, so this walks only the expired
+        prefix. Each batch is deleted in its own write transaction.
+
+        Args:
+            max_age_seconds: Minimum record age to prune
+            batch_size: Records deleted per write transaction
+
+        Returns:
+            Number of records pruned
+        """
+        cutoff = (datetime.utcnow() - timedelta(seconds=max_age_seconds)).isoformat().encode()
+        pruned = 0
+
+        while True:
+            deleted = 0
+            with self.lmdb_env.begin(write=True) as txn:
+                cursor = txn.cursor(db=self.synced_db)
+                cursor.first()
+                while deleted < batch_size:
+                    key = cursor.key()
+                    if not key or key.split(b'|', 1)[0] >= cutoff:
+                        break
+
+                    record_id = key.split(b'|', 1)[1]
+                    txn.delete(record_id, db=self.records_db)
+                    txn.delete(cursor.value(), db=self.index_db)
+                    cursor.delete()
+                    deleted += 1
+
+            pruned += deleted
+            if deleted < batch_size:
+                return pruned
+
     def query_analytics(self, sql: str, params: Optional[List] = None):
         """
         Execute SQL query on DuckDB analytics layer.
@@ -404,6 +494,10 @@ class DebugStore:
                     synced = self.sync_to_duckdb()
                     if synced > 0:
                         print(f"[DebugStore] Synced {synced} records to DuckDB")
+                    if self.retention_seconds is not None:
+                        pruned = self.compact_synced(self.retention_seconds)
+                        if pruned > 0:
+                            print(f"[DebugStore] Pruned {pruned} synced records from LMDB")
                 except Exception as e:
                     print(f"[DebugStore] Sync error: {e}")
 
@@ -443,20 +537,30 @@ class DebugStore:
             "SELECT COUNT(*) FROM records"
         ).fetchone()[0]
 
-        # Pending sync count
-        with self.lmdb_env.begin(db=self.pending_db) as txn:
-            pending_count = txn.stat()['entries']
+        # Pending sync / retained record counts
+        with self.lmdb_env.begin() as txn:
+            pending_count = txn.stat(self.pending_db)['entries']
+            record_count = txn.stat(self.records_db)['entries']
 
         return {
             'session_id': self.session_id,
             'lmdb_entries': lmdb_stat['entries'],
             'duckdb_entries': duckdb_count,
+            'lmdb_records': record_count,
             'pending_sync': pending_count,
             'lmdb_size_mb': self.lmdb_path.stat().st_size / (1024 * 1024) if self.lmdb_path.exists() else 0,
             'duckdb_size_mb': self.duckdb_path.stat().st_size / (1024 * 1024) if self.duckdb_path.exists() else 0
         }
 
 
+def _arrow_schema():
+    """Arrow schema for a sync batch (JSON columns travel as strings)"""
+    return pa.schema([
+        (name, pa.float64() if name in FLOAT_COLUMNS else pa.string())
+        for name in RECORD_COLUMNS
+    ])
+
+
 # Context manager for easy scoped recording
 class DebugContext:
     """
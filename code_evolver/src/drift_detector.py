@@ -22,6 +22,11 @@ from collections import defaultdict, deque
 
 from pattern_clusterer import PatternClusterer, OperationCluster
 
+try:
+    from .streaming_stats import WindowedStats
+except ImportError:
+    from streaming_stats import WindowedStats
+
 
 @dataclass
 class DriftEvent:
@@ -52,30 +57,69 @@ class DriftEvent:
 
 @dataclass
 class PerformanceBaseline:
-    """Statistical baseline for a tool's performance"""
+    """
+    Statistical baseline for a tool's performance.
+
+    Covers roughly the last 1000 samples via mergeable streaming statistics;
+    updates are O(1) and percentiles are read from a quantile sketch.
+    """
     tool_name: str
     sample_count: int
     mean_duration_ms: float
     std_duration_ms: float
-    p50_duration_ms: float
-    p95_duration_ms: float
-    p99_duration_ms: float
     last_updated: datetime
-    samples: deque = field(default_factory=lambda: deque(maxlen=1000))
+    stats: WindowedStats = field(default_factory=lambda: WindowedStats(window=1000))
 
     def update(self, duration_ms: float):
         """Update baseline with new sample"""
-        self.samples.append(duration_ms)
-        self.sample_count = len(self.samples)
+        self.stats.add(duration_ms)
+        self._refresh()
 
+    def merge(self, other: 'PerformanceBaseline'):
+        """Fold in a baseline recorded elsewhere (another process or run)"""
+        self.stats.merge(other.stats)
+        self._refresh()
+
+    def _refresh(self):
+        self.sample_count = self.stats.count
         if self.sample_count > 0:
-            self.mean_duration_ms = np.mean(self.samples)
-            self.std_duration_ms = np.std(self.samples)
-            self.p50_duration_ms = np.percentile(self.samples, 50)
-            self.p95_duration_ms = np.percentile(self.samples, 95)
-            self.p99_duration_ms = np.percentile(self.samples, 99)
+            self.mean_duration_ms = self.stats.mean
+            self.std_duration_ms = self.stats.std()
             self.last_updated = datetime.now()
 
+    @property
+    def p50_duration_ms(self) -> float:
+        return self.stats.quantile(0.50) or 0.0
+
+    @property
+    def p95_duration_ms(self) -> float:
+        return self.stats.quantile(0.95) or 0.0
+
+    @property
+    def p99_duration_ms(self) -> float:
+        return self.stats.quantile(0.99) or 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tool_name": self.tool_name,
+            "last_updated": self.last_updated.isoformat(),
+            "stats": self.stats.to_dict()
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'PerformanceBaseline':
+        baseline = PerformanceBaseline(
+            tool_name=data["tool_name"],
+            sample_count=0,
+            mean_duration_ms=0.0,
+            std_duration_ms=0.0,
+            last_updated=datetime.fromisoformat(data["last_updated"]),
+            stats=WindowedStats.from_dict(data["stats"])
+        )
+        baseline._refresh()
+        baseline.last_updated = datetime.fromisoformat(data["last_updated"])
+        return baseline
+
     def is_anomalous(self, duration_ms: float, threshold_std: float = 3.0) -> bool:
         """Check if duration is anomalous using z-score"""
         if self.sample_count < 10 or self.std_duration_ms == 0:
@@ -112,7 +156,8 @@ class DriftDetector:
         rag_memory=None,
         drift_threshold: float = 0.15,
         anomaly_threshold_std: float = 3.0,
-        window_size: int = 50
+        window_size: int = 50,
+        baseline_path: Optional[Path] = None
     ):
         """
         Initialize drift detector.
@@ -123,6 +168,8 @@ class DriftDetector:
             drift_threshold: Threshold for drift detection (0.15 = 15%)
             anomaly_threshold_std: Standard deviations for anomaly detection
             window_size: Number of recent samples for drift calculation
+            baseline_path: Optional JSON file baselines are loaded from and
+                saved to, so they survive restarts
         """
         self.tracker = telemetry_tracker
         self.rag = rag_memory
@@ -132,6 +179,9 @@ class DriftDetector:
 
         # Performance baselines per tool
         self.baselines: Dict[str, PerformanceBaseline] = {}
+        self.baseline_path = Path(baseline_path) if baseline_path else None
+        if self.baseline_path and self.baseline_path.exists():
+            self.load_baselines(self.baseline_path)
 
         # Recent samples for drift calculation
         self.recent_samples: Dict[str, deque] = defaultdict(lambda: deque(maxlen=window_size))
@@ -166,9 +216,6 @@ class DriftDetector:
                 sample_count=0,
                 mean_duration_ms=0.0,
                 std_duration_ms=0.0,
-                p50_duration_ms=0.0,
-                p95_duration_ms=0.0,
-                p99_duration_ms=0.0,
                 last_updated=datetime.now()
             )
 
@@ -374,6 +421,53 @@ class DriftDetector:
         else:
             self.drift_events.clear()
 
+    def save_baselines(self, path: Optional[Path] = None):
+        """
+        Save baselines (mergeable sketches, not raw samples) to JSON.
+
+        Args:
+            path: Output file (defaults to baseline_path)
+        """
+        path = Path(path) if path else self.baseline_path
+        if path is None:
+            raise ValueError("No baseline path configured")
+
+        data = {name: b.to_dict() for name, b in self.baselines.items()}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        tmp_path.replace(path)
+
+    def load_baselines(self, path: Path):
+        """
+        Load baselines saved by save_baselines(), merging them into current ones.
+
+        Files from several workers can be loaded one after another to combine
+        their baselines.
+
+        Args:
+            path: JSON file written by save_baselines()
+        """
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            logging.warning(f"Could not load drift baselines from {path}: {e}")
+            return
+
+        for name, entry in data.items():
+            try:
+                loaded = PerformanceBaseline.from_dict(entry)
+            except Exception as e:
+                logging.warning(f"Skipping unreadable baseline for {name}: {e}")
+                continue
+
+            if name in self.baselines:
+                self.baselines[name].merge(loaded)
+            else:
+                self.baselines[name] = loaded
+
     def reset_baseline(self, tool_name: str):
         """Reset baseline for a specific tool"""
         if tool_name in self.baselines:
@@ -0,0 +1,407 @@
+"""
+Content-addressed persistent embedding cache.
+
+Embeddings are keyed by (model name, SHA-256 of the normalized text), so the
+same tool description, prompt or query is only sent to the embedding endpoint
+once across process restarts.
+
+- In-memory LRU front for hot entries
+- One append-only store per model on disk, read through a memory map:
+    rag_memory/embedding_cache/<model>-<hash>/vectors.f32   raw float32 rows
+    rag_memory/embedding_cache/<model>-<hash>/keys.txt      one text hash per row
+    rag_memory/embedding_cache/<model>-<hash>/meta.json     model name and dimension
+
+A row's vector is written before its key, so a key on disk always has a
+complete vector behind it. Appends take a file lock so processes sharing a
+store agree on row numbers; a torn tail from a crash is trimmed by the next
+writer while it holds that lock.
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are only serialized per process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+KEY_LENGTH = 64  # hex sha256
+DEFAULT_CACHE_PATH = "./rag_memory/embedding_cache"
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text before hashing (unicode NFC, collapsed whitespace)."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def text_key(text: str) -> str:
+    """Content hash used as the cache key for a text."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class _ModelStore:
+    """
+    Append-only vector store for a single embedding model.
+
+    Several processes (node-pool workers, NodeRuntime subprocesses) may share
+    one store. Appends and trimming happen under an exclusive file lock, and a
+    new row's index is taken from the files themselves, not from this
+    process's view of them. Rows appended by other processes are picked up by
+    re-reading keys.txt from the last offset read.
+    """
+
+    def __init__(self, path: Path, model: str):
+        self.path = path
+        self.model = model
+        self.vectors_path = path / "vectors.f32"
+        self.keys_path = path / "keys.txt"
+        self.meta_path = path / "meta.json"
+        self.lock_path = path / "append.lock"
+
+        self.dim: Optional[int] = None
+        self.rows: Dict[str, int] = {}
+        self.size = 0
+        self._keys_offset = 0  # bytes of keys.txt already read into rows
+
+        self._mmap: Optional[np.memmap] = None
+        self._mapped_rows = 0
+        self._vectors_file = None
+        self._keys_file = None
+        self._lock_file = None
+
+        self._sync()
+
+    def _read_meta(self):
+        """Read the vector dimension, if the store has been created."""
+        if not self.meta_path.exists():
+            return
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                self.dim = int(json.load(f)["dim"])
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable embedding cache for {self.model}: {e}")
+            self.dim = None
+
+    def _sync(self, trim: bool = False):
+        """
+        Read keys appended since the last sync.
+
+        Only complete key lines with a complete vector behind them are taken.
+        With trim (append lock held) a torn tail left by a crashed writer is
+        cut off so the next append lands on the right row.
+        """
+        if self.dim is None:
+            self._read_meta()
+            if self.dim is None:
+                return
+
+        row_bytes = self.dim * 4
+        vector_rows = self.vectors_path.stat().st_size // row_bytes if self.vectors_path.exists() else 0
+
+        keys_size = self._keys_offset
+        if self.keys_path.exists():
+            with open(self.keys_path, "rb") as f:
+                f.seek(self._keys_offset)
+                data = f.read()
+            keys_size += len(data)
+
+            # The last piece is either empty or an incomplete line
+            for line in data.split(b"\n")[:-1]:
+                if len(line) != KEY_LENGTH or self.size >= vector_rows:
+                    break
+                self.rows.setdefault(line.decode("ascii", errors="replace"), self.size)
+                self.size += 1
+                self._keys_offset += KEY_LENGTH + 1
+
+        if trim:
+            if keys_size != self._keys_offset:
+                with open(self.keys_path, "r+b") as f:
+                    f.truncate(self._keys_offset)
+            if self.vectors_path.exists() and self.vectors_path.stat().st_size != self.size * row_bytes:
+                with open(self.vectors_path, "r+b") as f:
+                    f.truncate(self.size * row_bytes)
+
+    def _grown(self) -> bool:
+        """Whether another process has appended keys since the last sync."""
+        try:
+            return self.keys_path.stat().st_size > self._keys_offset
+        except FileNotFoundError:
+            return False
+
+    @contextmanager
+    def _append_lock(self):
+        """Exclusive append access across processes."""
+        if self._lock_file is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._lock_file = open(self.lock_path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Read a vector from the memory-mapped file."""
+        row = self.rows.get(key)
+        if row is None and self._grown():
+            self._sync()
+            row = self.rows.get(key)
+        if row is None:
+            return None
+
+        if row >= self._mapped_rows:
+            self._remap()
+        return self._mmap[row].tolist()
+
+    def _remap(self):
+        """Map the vector file again after it has grown."""
+        if self._vectors_file is not None:
+            self._vectors_file.flush()
+        self._mmap = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(self.size, self.dim))
+        self._mapped_rows = self.size
+
+    def put(self, key: str, embedding: List[float]) -> bool:
+        """Append a vector; returns False if it does not fit this store."""
+        if key in self.rows:
+            return True
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.ndim != 1 or vector.size == 0:
+            return False
+
+        with self._append_lock():
+            if self.dim is None:
+                self._read_meta()
+            if self.dim is None:
+                self.dim = int(vector.size)
+                with open(self.meta_path, "w", encoding="utf-8") as f:
+                    json.dump({"model": self.model, "dim": self.dim}, f)
+            elif vector.size != self.dim:
+                logger.warning(
+                    f"Not caching embedding of dimension {vector.size} for {self.model} (cache holds {self.dim})"
+                )
+                return False
+
+            self._sync(trim=True)
+            if key in self.rows:
+                return True
+
+            if self._vectors_file is None:
+                self._vectors_file = open(self.vectors_path, "ab")
+                self._keys_file = open(self.keys_path, "ab")
+
+            # Vector first: a key on disk must always have its row behind it
+            self._vectors_file.write(vector.tobytes())
+            self._vectors_file.flush()
+            self._keys_file.write(f"{key}\n".encode("ascii"))
+            self._keys_file.flush()
+
+            self.rows[key] = self.size
+            self.size += 1
+            self._keys_offset += KEY_LENGTH + 1
+        return True
+
+    def close(self):
+        """Close open file handles and drop the memory map."""
+        for handle in (self._vectors_file, self._keys_file, self._lock_file):
+            if handle is not None:
+                handle.close()
+        self._vectors_file = None
+        self._keys_file = None
+        self._lock_file = None
+        self._mmap = None
+        self._mapped_rows = 0
+
+
+class EmbeddingCache:
+    """
+    Persistent embedding cache shared by all embedding clients.
+
+    Thread-safe. Entries are never evicted from disk; the LRU only bounds how
+    many vectors are kept as Python lists.
+    """
+
+    def __init__(self, cache_path: str = DEFAULT_CACHE_PATH, lru_size: int = 4096):
+        """
+        Initialize embedding cache.
+
+        Args:
+            cache_path: Directory holding one sub-directory per model
+            lru_size: Number of vectors kept in the in-memory LRU
+        """
+        self.cache_path = Path(cache_path)
+        self.lru_size = lru_size
+
+        self._lock = threading.Lock()
+        self._lru: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._stores: Dict[str, _ModelStore] = {}
+
+        # Counters
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def _store_for(self, model: str) -> _ModelStore:
+        """Get (or open) the on-disk store for a model (lock must be held)."""
+        store = self._stores.get(model)
+        if store is None:
+            safe_name = re.sub(r"[^A-Za-z0-9._-]", "_", model)
+            digest = hashlib.sha1(model.encode("utf-8")).hexdigest()[:8]
+            store = _ModelStore(self.cache_path / f"{safe_name}-{digest}", model)
+            self._stores[model] = store
+        return store
+
+    def _remember(self, lru_key: Tuple[str, str], embedding: List[float]):
+        """Insert into the LRU, evicting the oldest entry (lock must be held)."""
+        self._lru[lru_key] = embedding
+        self._lru.move_to_end(lru_key)
+        if len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """
+        Look up the embedding of a text.
+
+        Args:
+            model: Embedding model name
+            text: Text that was embedded
+
+        Returns:
+            Cached embedding or None
+        """
+        return self.get_many(model, [text])[0]
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Look up embeddings for several texts.
+
+        Args:
+            model: Embedding model name
+            texts: Texts to look up
+
+        Returns:
+            One cached embedding (or None on a miss) per text
+        """
+        results: List[Optional[List[float]]] = []
+        with self._lock:
+            store = None
+            for text in texts:
+                key = text_key(text)
+                lru_key = (model, key)
+
+                embedding = self._lru.get(lru_key)
+                if embedding is not None:
+                    self._lru.move_to_end(lru_key)
+                    self.memory_hits += 1
+                    results.append(embedding)
+                    continue
+
+                if store is None:
+                    store = self._store_for(model)
+                try:
+                    embedding = store.get(key)
+                except Exception as e:
+                    logger.warning(f"Embedding cache read failed for {model}: {e}")
+                    embedding = None
+
+                if embedding is not None:
+                    self.disk_hits += 1
+                    self._remember(lru_key, embedding)
+                else:
+                    self.misses += 1
+                results.append(embedding)
+        return results
+
+    def put(self, model: str, text: str, embedding: Optional[List[float]]):
+        """
+        Store the embedding of a text.
+
+        Args:
+            model: Embedding model name
+            text: Text that was embedded
+            embedding: Embedding vector (None is ignored)
+        """
+        self.put_many(model, [text], [embedding])
+
+    def put_many(self, model: str, texts: List[str], embeddings: List[Optional[List[float]]]):
+        """
+        Store embeddings for several texts.
+
+        Args:
+            model: Embedding model name
+            texts: Texts that were embedded
+            embeddings: One embedding (or None, which is skipped) per text
+        """
+        with self._lock:
+            store = self._store_for(model)
+            for text, embedding in zip(texts, embeddings):
+                if not embedding:
+                    continue
+                key = text_key(text)
+                try:
+                    if store.put(key, embedding):
+                        self.stores += 1
+                        self._remember((model, key), list(embedding))
+                except Exception as e:
+                    logger.warning(f"Embedding cache write failed for {model}: {e}")
+                    return
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get hit/miss counters."""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "lru_entries": len(self._lru),
+                "disk_entries": sum(store.size for store in self._stores.values())
+            }
+
+    def close(self):
+        """Close all per-model stores."""
+        with self._lock:
+            for store in self._stores.values():
+                store.close()
+            self._stores.clear()
+            self._lru.clear()
+
+
+# Shared instances, one per cache directory
+_caches: Dict[str, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(cache_path: Optional[str] = None) -> EmbeddingCache:
+    """
+    Get the shared embedding cache for a directory.
+
+    Args:
+        cache_path: Cache directory (defaults to ./rag_memory/embedding_cache)
+
+    Returns:
+        EmbeddingCache shared by every caller using the same directory
+    """
+    key = str(Path(cache_path or DEFAULT_CACHE_PATH).resolve())
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = EmbeddingCache(cache_path=key)
+            _caches[key] = cache
+        return cache
@@ -0,0 +1,242 @@
+"""
+Batched embedding client for Ollama's /api/embed endpoint.
+
+- embed_many() sends arrays of inputs per request over a pooled keep-alive
+  session instead of one request (and one TCP connection) per text.
+- embed() coalesces concurrent single-text callers: requests arriving within
+  a short linger window are sent together as one micro-batch.
+- Texts already embedded by the same model are served from the persistent
+  EmbeddingCache and never sent.
+
+Clients are shared per (endpoint, model) via get_embedding_client() so every
+RAG store in the process uses the same connection pool and batcher.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from .embedding_cache import EmbeddingCache, get_embedding_cache
+except ImportError:
+    from embedding_cache import EmbeddingCache, get_embedding_cache
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingClient:
+    """Pooled, batching embedding client for a single endpoint and model."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        model: str,
+        timeout: float = 90,
+        max_batch_size: int = 64,
+        linger_ms: float = 5.0,
+        pool_maxsize: int = 8,
+        cache: Optional[EmbeddingCache] = None
+    ):
+        """
+        Initialize embedding client.
+
+        Args:
+            endpoint: Ollama base URL (e.g. http://localhost:11434)
+            model: Embedding model name
+            timeout: Request timeout in seconds
+            max_batch_size: Maximum number of texts per request
+            linger_ms: How long embed() waits for other callers to join a
+                batch; 0 sends every embed() call immediately
+            pool_maxsize: Keep-alive connections kept per host
+            cache: Optional persistent cache consulted before sending texts
+        """
+        self.endpoint = endpoint.rstrip("/")
+        self.model = model
+        self.timeout = timeout
+        self.max_batch_size = max(1, max_batch_size)
+        self.linger_ms = linger_ms
+        self.cache = cache
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Micro-batching state for embed()
+        self._pending: List[Tuple[str, Future]] = []
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+        # Counters
+        self.requests_sent = 0
+        self.texts_embedded = 0
+
+    def embed_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Embed a list of texts using as few requests as possible.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding per input text (None where generation failed)
+        """
+        if self.cache is not None:
+            results = self.cache.get_many(self.model, texts)
+        else:
+            results = [None] * len(texts)
+
+        # Send each distinct uncached text once
+        missing: Dict[str, List[int]] = {}
+        for i, (text, embedding) in enumerate(zip(texts, results)):
+            if embedding is None:
+                missing.setdefault(text, []).append(i)
+
+        pending = list(missing)
+        for start in range(0, len(pending), self.max_batch_size):
+            chunk = pending[start:start + self.max_batch_size]
+            for text, embedding in zip(chunk, self._post_batch(chunk)):
+                for i in missing[text]:
+                    results[i] = embedding
+        return results
+
+    def _post_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Send a single /api/embed request for up to max_batch_size texts."""
+        if not texts:
+            return []
+
+        try:
+            response = self.session.post(
+                f"{self.endpoint}/api/embed",
+                json={"model": self.model, "input": texts},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            data = response.json()
+            self.requests_sent += 1
+
+            embeddings = data.get("embeddings")
+            if embeddings is None and data.get("embedding") and len(texts) == 1:
+                embeddings = [data["embedding"]]
+
+            if not embeddings or len(embeddings) != len(texts):
+                logger.error(
+                    f"Embedding response returned {len(embeddings or [])} vectors for {len(texts)} inputs"
+                )
+                return [None] * len(texts)
+
+            self.texts_embedded += len(texts)
+            if self.cache is not None:
+                self.cache.put_many(self.model, texts, embeddings)
+            logger.debug(f"✓ Generated {len(texts)} embeddings of dimension {len(embeddings[0])}")
+            return embeddings
+
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {e}")
+            logger.error(f"  Endpoint: {self.endpoint}")
+            logger.error(f"  Model: {self.model}")
+            return [None] * len(texts)
+
+    def embed(self, text: str) -> Optional[List[float]]:
+        """
+        Embed a single text, coalescing with concurrent callers.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector or None if generation failed
+        """
+        if self.cache is not None:
+            cached = self.cache.get(self.model, text)
+            if cached is not None:
+                return cached
+
+        if self.linger_ms <= 0:
+            return self._post_batch([text])[0]
+
+        future: Future = Future()
+        with self._cond:
+            self._pending.append((text, future))
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._batch_worker,
+                    name="embedding-batcher",
+                    daemon=True
+                )
+                self._worker.start()
+            self._cond.notify()
+
+        try:
+            return future.result(timeout=self.timeout * 2)
+        except Exception as e:
+            logger.error(f"Error waiting for embedding: {e}")
+            return None
+
+    def _batch_worker(self):
+        """Collect pending embed() calls into micro-batches and send them."""
+        linger = self.linger_ms / 1000.0
+
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+
+                # Give other callers a short window to join this batch
+                deadline = time.monotonic() + linger
+                while len(self._pending) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch = self._pending[:self.max_batch_size]
+                del self._pending[:self.max_batch_size]
+
+            embeddings = self._post_batch([text for text, _ in batch])
+            for (_, future), embedding in zip(batch, embeddings):
+                future.set_result(embedding)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request/batching counters (and cache counters if cached)."""
+        stats: Dict[str, Any] = {
+            "requests_sent": self.requests_sent,
+            "texts_embedded": self.texts_embedded
+        }
+        if self.cache is not None:
+            stats["cache"] = self.cache.get_stats()
+        return stats
+
+
+# Shared clients, one per (endpoint, model, cache directory)
+_clients: Dict[Tuple[str, str, Optional[str]], EmbeddingClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_embedding_client(endpoint: str, model: str, cache_path: Optional[str] = None) -> EmbeddingClient:
+    """
+    Get the shared EmbeddingClient for an endpoint and model.
+
+    Shared clients use the persistent EmbeddingCache for cache_path.
+
+    Args:
+        endpoint: Ollama base URL
+        model: Embedding model name
+        cache_path: Embedding cache directory (defaults to
+            ./rag_memory/embedding_cache)
+
+    Returns:
+        EmbeddingClient instance
+    """
+    key = (endpoint.rstrip("/"), model, str(Path(cache_path).resolve()) if cache_path else None)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = EmbeddingClient(endpoint, model, cache=get_embedding_cache(key[2]))
+            _clients[key] = client
+        return client
@@ -37,7 +37,9 @@ class SystemGuardrails:
         "rag_memory/",
         "rag_memory/index.json",
         "rag_memory/embeddings.npy",
+        "rag_memory/embedding_rows.json",
         "rag_memory/tags_index.json",
+        "rag_memory/journal/",
         "tools/",
         "tools/index.json",
         "src/",
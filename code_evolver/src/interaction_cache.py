@@ -0,0 +1,235 @@
+"""
+Interaction Cache
+
+In-process index of logged interactions, partitioned by tool_id:
+
+- Exact layer: dict keyed on (tool_id, input_hash), where input_hash is the
+  hash of the canonical input text (dicts are serialized with sorted keys).
+  A hit needs no embedding and no semantic comparison.
+- Vector layer: one normalized embedding matrix per tool, so a similarity
+  lookup only scores that tool's own interactions instead of the whole RAG
+  memory.
+
+Partitions are filled from RAG memory the first time a tool is used and
+kept up to date as interactions are logged.
+"""
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+def canonical_input_text(input_data: Any) -> str:
+    """
+    Convert tool input to the canonical text that is hashed and embedded.
+
+    Args:
+        input_data: Tool input (dict, string or any other value)
+
+    Returns:
+        Canonical input text
+    """
+    if isinstance(input_data, dict):
+        return json.dumps(input_data, sort_keys=True)
+    elif isinstance(input_data, str):
+        return input_data
+    else:
+        return str(input_data)
+
+
+def input_hash(input_text: str) -> str:
+    """Hash of canonical input text (matches the stored 'input_hash' metadata)."""
+    return hashlib.md5(input_text.encode()).hexdigest()
+
+
+class _ToolPartition:
+    """Exact-match table and embedding matrix for a single tool."""
+
+    def __init__(self):
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.by_hash: Dict[str, List[str]] = {}
+
+        # Vector rows (grown by doubling)
+        self.row_ids: List[str] = []
+        self.vectors: Optional[np.ndarray] = None
+        self.dim: Optional[int] = None
+
+    def add(self, entry: Dict[str, Any], embedding: Optional[List[float]]):
+        interaction_id = entry['interaction_id']
+        if interaction_id in self.entries:
+            self.entries[interaction_id].update(entry)
+            return
+
+        self.entries[interaction_id] = entry
+        self.by_hash.setdefault(entry['input_hash'], []).append(interaction_id)
+
+        if embedding:
+            self._add_vector(interaction_id, embedding)
+
+    def _add_vector(self, interaction_id: str, embedding: List[float]):
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if vector.ndim != 1 or norm == 0:
+            return
+
+        if self.dim is None:
+            self.dim = vector.size
+            self.vectors = np.zeros((16, self.dim), dtype=np.float32)
+        elif vector.size != self.dim:
+            return
+
+        row = len(self.row_ids)
+        if row == len(self.vectors):
+            grown = np.zeros((2 * len(self.vectors), self.dim), dtype=np.float32)
+            grown[:row] = self.vectors
+            self.vectors = grown
+
+        self.vectors[row] = vector / norm
+        self.row_ids.append(interaction_id)
+
+    def search(self, embedding: List[float], min_similarity: float) -> List[Tuple[str, float]]:
+        if not self.row_ids:
+            return []
+
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if query.size != self.dim or norm == 0:
+            return []
+
+        scores = self.vectors[:len(self.row_ids)] @ (query / norm)
+        rows = np.nonzero(scores >= min_similarity)[0]
+        rows = rows[np.argsort(-scores[rows], kind="stable")]
+        return [(self.row_ids[row], float(scores[row])) for row in rows]
+
+
+class InteractionCache:
+    """
+    Per-tool interaction index with an exact-hash fast path.
+
+    Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._partitions: Dict[str, _ToolPartition] = {}
+
+        # Counters
+        self.exact_hits = 0
+        self.vector_searches = 0
+
+    def has_partition(self, tool_id: str) -> bool:
+        """Check whether a tool's partition has been created."""
+        with self._lock:
+            return tool_id in self._partitions
+
+    def add(self, entry: Dict[str, Any], embedding: Optional[List[float]] = None):
+        """
+        Add (or refresh) an interaction.
+
+        Args:
+            entry: Interaction summary with at least interaction_id, tool_id
+                and input_hash
+            embedding: Optional embedding of the stored interaction
+        """
+        with self._lock:
+            partition = self._partitions.setdefault(entry['tool_id'], _ToolPartition())
+            partition.add(dict(entry), embedding)
+
+    def ensure_partition(self, tool_id: str):
+        """Create an empty partition for a tool (marks it as loaded)."""
+        with self._lock:
+            self._partitions.setdefault(tool_id, _ToolPartition())
+
+    def exact(self, tool_id: str, input_hash: str) -> List[Dict[str, Any]]:
+        """
+        Get interactions whose canonical input hash matches exactly.
+
+        Args:
+            tool_id: Tool the interactions belong to
+            input_hash: Hash of the canonical input text
+
+        Returns:
+            Matching interaction entries, highest quality_score first (an
+            unscored entry counts as 0.5, as in the vector layer's ranking),
+            newest first among equal scores
+        """
+        with self._lock:
+            partition = self._partitions.get(tool_id)
+            if partition is None:
+                return []
+            ids = partition.by_hash.get(input_hash, [])
+            if ids:
+                self.exact_hits += 1
+            entries = [dict(partition.entries[i]) for i in ids]
+
+        # Partitions loaded from RAG are in RAG's order, not insertion time
+        entries.sort(
+            key=lambda e: (
+                e['quality_score'] if e.get('quality_score') is not None else 0.5,
+                e.get('timestamp') or ''
+            ),
+            reverse=True
+        )
+        return entries
+
+    def search(
+        self,
+        tool_id: str,
+        embedding: List[float],
+        min_similarity: float = 0.0
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Rank a tool's interactions by cosine similarity to an embedding.
+
+        Args:
+            tool_id: Tool to search
+            embedding: Query embedding
+            min_similarity: Minimum cosine similarity
+
+        Returns:
+            List of (entry, similarity) tuples, most similar first
+        """
+        with self._lock:
+            partition = self._partitions.get(tool_id)
+            if partition is None:
+                return []
+            self.vector_searches += 1
+            return [
+                (dict(partition.entries[i]), similarity)
+                for i, similarity in partition.search(embedding, min_similarity)
+            ]
+
+    def size(self, tool_id: str) -> int:
+        """Number of interactions in a tool's partition."""
+        with self._lock:
+            partition = self._partitions.get(tool_id)
+            return len(partition.entries) if partition else 0
+
+    def vector_count(self, tool_id: str) -> int:
+        """Number of embedded interactions in a tool's partition."""
+        with self._lock:
+            partition = self._partitions.get(tool_id)
+            return len(partition.row_ids) if partition else 0
+
+    def update(self, interaction_id: str, **fields):
+        """Update fields (e.g. quality_score) of a cached interaction."""
+        with self._lock:
+            for partition in self._partitions.values():
+                entry = partition.entries.get(interaction_id)
+                if entry is not None:
+                    entry.update(fields)
+                    return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get partition sizes and counters."""
+        with self._lock:
+            return {
+                'tools': len(self._partitions),
+                'interactions': sum(len(p.entries) for p in self._partitions.values()),
+                'vectors': sum(len(p.row_ids) for p in self._partitions.values()),
+                'exact_hits': self.exact_hits,
+                'vector_searches': self.vector_searches
+            }
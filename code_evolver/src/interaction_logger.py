@@ -17,14 +17,19 @@ Every interaction (tool call, LLM query, command check) is logged with:
 - timestamp: When did it happen?
 
 This builds an intelligent system that learns from every interaction.
+
+Lookups go through an InteractionCache partitioned by tool_id: an exact match
+on the canonical input hash skips both the embedding call and the semantic
+comparator, and similarity search only scores the tool's own interactions.
 """
 
-import json
 import time
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import hashlib
 
+from src.interaction_cache import InteractionCache, canonical_input_text, input_hash
+
 
 class InteractionLogger:
     """
@@ -42,6 +47,9 @@ class InteractionLogger:
         self.rag = rag_memory
         self.client = ollama_client
 
+        # Per-tool exact/vector index over logged interactions
+        self.cache = InteractionCache()
+
         # Lazy initialization
         if self.rag is None:
             self._init_rag()
@@ -97,12 +105,7 @@ class InteractionLogger:
             Logged interaction info
         """
         # Convert input to string for embedding
-        if isinstance(input_data, dict):
-            input_text = json.dumps(input_data, sort_keys=True)
-        elif isinstance(input_data, str):
-            input_text = input_data
-        else:
-            input_text = str(input_data)
+        input_text = canonical_input_text(input_data)
 
         # Generate interaction ID
         timestamp = datetime.utcnow()
@@ -117,7 +120,7 @@ class InteractionLogger:
             'tool_id': tool_id,
             'interaction_type': interaction_type,
             'input_text': input_text,
-            'input_hash': hashlib.md5(input_text.encode()).hexdigest(),
+            'input_hash': input_hash(input_text),
             'output': output_data,
             'success': success,
             'quality_score': quality_score,
@@ -128,7 +131,11 @@ class InteractionLogger:
             'metadata': metadata or {}
         }
 
+        # Load the tool's partition before adding, so older interactions are kept
+        self._ensure_partition(tool_id)
+
         # Store in RAG for semantic search
+        embedding = None
         if self.rag is not None:
             try:
                 # Create content summary
@@ -150,7 +157,7 @@ Latency: {latency_ms}ms
                 # Store as artifact
                 from src.rag_memory import ArtifactType
 
-                self.rag.store_artifact(
+                artifact = self.rag.store_artifact(
                     artifact_id=interaction_id,
                     artifact_type=ArtifactType.PATTERN,  # Use PATTERN for interactions
                     name=f"{interaction_type}: {tool_id}",
@@ -168,6 +175,7 @@ Latency: {latency_ms}ms
                         'tool_id': tool_id,
                         'interaction_type': interaction_type,
                         'input_hash': interaction['input_hash'],
+                        'input_text': input_text,
                         'success': success,
                         'quality_score': quality_score,
                         'latency_ms': latency_ms,
@@ -177,12 +185,87 @@ Latency: {latency_ms}ms
                     },
                     auto_embed=auto_embed
                 )
+                embedding = getattr(artifact, 'embedding', None)
 
             except Exception as e:
                 print(f"Warning: Could not store interaction in RAG: {e}")
 
+        self.cache.add(self._cache_entry(interaction), embedding)
+
         return interaction
 
+    @staticmethod
+    def _cache_entry(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the InteractionCache entry from an interaction record or artifact metadata."""
+        return {
+            'interaction_id': record.get('interaction_id'),
+            'tool_id': record.get('tool_id'),
+            'input_text': record.get('input_text', ''),
+            'input_hash': record.get('input_hash', ''),
+            'success': record.get('success', False),
+            'quality_score': record.get('quality_score'),
+            'latency_ms': record.get('latency_ms'),
+            'timestamp': record.get('timestamp'),
+            'cacheable_output': record.get('cacheable_output', True)
+        }
+
+    def _ensure_partition(self, tool_id: str):
+        """Fill a tool's cache partition from RAG memory on first use."""
+        if self.cache.has_partition(tool_id):
+            return
+        self.cache.ensure_partition(tool_id)
+
+        if self.rag is None:
+            return
+
+        try:
+            artifacts = self.rag.find_by_tags(['interaction', tool_id], match_all=True)
+        except Exception as e:
+            print(f"Warning: Could not load interactions for {tool_id}: {e}")
+            return
+
+        for artifact in artifacts:
+            metadata = artifact.metadata or {}
+            if metadata.get('tool_id') != tool_id or not metadata.get('input_hash'):
+                continue
+            entry = self._cache_entry({**metadata, 'interaction_id': artifact.artifact_id})
+            if artifact.quality_score is not None and 'quality_score' not in metadata:
+                entry['quality_score'] = artifact.quality_score
+            self.cache.add(entry, artifact.embedding)
+
+    @staticmethod
+    def _passes_filters(
+        entry: Dict[str, Any],
+        min_quality: Optional[float],
+        require_success: bool
+    ) -> bool:
+        """Apply the success/quality/cacheability filters to a cached interaction."""
+        if require_success and not entry.get('success', False):
+            return False
+
+        if min_quality is not None:
+            quality = entry.get('quality_score')
+            if quality is None or quality < min_quality:
+                return False
+
+        # CRITICAL: Skip non-cacheable outputs (creative/non-deterministic tasks)
+        return entry.get('cacheable_output', True)
+
+    def _result(self, entry: Dict[str, Any], similarity: float, exact_match: bool = False) -> Dict[str, Any]:
+        """Format a cached interaction as a find_similar_interactions result."""
+        return {
+            'interaction_id': entry['interaction_id'],
+            'tool_id': entry['tool_id'],
+            'similarity': similarity,
+            'quality_score': entry.get('quality_score'),
+            'latency_ms': entry.get('latency_ms'),
+            'success': entry.get('success'),
+            'timestamp': entry.get('timestamp'),
+            'input_text': entry.get('input_text', ''),
+            'exact_match': exact_match,
+            'artifact': self.rag.get_artifact(entry['interaction_id']) if self.rag is not None else None
+        }
+
     def find_similar_interactions(
         self,
         tool_id: str,
@@ -204,68 +287,41 @@ Latency: {latency_ms}ms
             require_success: Only return successful interactions
 
         Returns:
-            List of similar interactions with similarity scores
+            List of similar interactions with similarity scores. An exact
+            match on the canonical input is returned on its own (similarity
+            1.0, exact_match=True) without computing an embedding.
         """
-        if self.rag is None:
-            return []
+        input_text = canonical_input_text(input_data)
+        self._ensure_partition(tool_id)
 
-        # Convert input to text
-        if isinstance(input_data, dict):
-            input_text = json.dumps(input_data, sort_keys=True)
-        elif isinstance(input_data, str):
-            input_text = input_data
-        else:
-            input_text = str(input_data)
+        # Exact layer: identical canonical input, no embedding needed
+        for entry in self.cache.exact(tool_id, input_hash(input_text)):
+            if self._passes_filters(entry, min_quality, require_success):
+                return [self._result(entry, 1.0, exact_match=True)]
+
+        # Nothing logged for this tool: no embedding call needed either
+        if self.rag is None or not self.cache.size(tool_id):
+            return []
 
         try:
             # Search for similar interactions
             search_query = f"{tool_id}: {input_text}"
 
-            results = self.rag.find_similar(
-                search_query,
-                artifact_type=None,  # Search all types
-                top_k=top_k * 2  # Get more, filter later
-            )
+            if not self.cache.vector_count(tool_id):
+                return self._find_similar_in_rag(
+                    tool_id, search_query, similarity_threshold, top_k, min_quality, require_success
+                )
+
+            query_embedding = self.rag._generate_embedding(search_query)
+            if not query_embedding:
+                return []
 
-            # Filter and format results
-            similar = []
-            for artifact, similarity in results:
-                # Check if this is an interaction artifact
-                metadata = artifact.metadata or {}
-
-                if metadata.get('tool_id') != tool_id:
-                    continue  # Different tool
-
-                if 'interaction' not in artifact.tags:
-                    continue  # Not an interaction
-
-                # Apply filters
-                if require_success and not metadata.get('success', False):
-                    continue
-
-                if min_quality is not None:
-                    quality = metadata.get('quality_score')
-                    if quality is None or quality < min_quality:
-                        continue
-
-                if similarity < similarity_threshold:
-                    continue
-
-                # CRITICAL: Skip non-cacheable outputs (creative/non-deterministic tasks)
-                if not metadata.get('cacheable_output', True):
-                    continue
-
-                # Include this result
-                similar.append({
-                    'interaction_id': artifact.artifact_id,
-                    'tool_id': metadata.get('tool_id'),
-                    'similarity': similarity,
-                    'quality_score': metadata.get('quality_score'),
-                    'latency_ms': metadata.get('latency_ms'),
-                    'success': metadata.get('success'),
-                    'timestamp': metadata.get('timestamp'),
-                    'artifact': artifact
-                })
+            # Vector layer: only this tool's interactions are scored
+            similar = [
+                self._result(entry, similarity)
+                for entry, similarity in self.cache.search(tool_id, query_embedding, similarity_threshold)
+                if self._passes_filters(entry, min_quality, require_success)
+            ]
 
             # Sort by quality * similarity
             similar.sort(
@@ -279,6 +335,41 @@ Latency: {latency_ms}ms
             print(f"Warning: Error searching for similar interactions: {e}")
             return []
 
+    def _find_similar_in_rag(
+        self,
+        tool_id: str,
+        search_query: str,
+        similarity_threshold: float,
+        top_k: int,
+        min_quality: Optional[float],
+        require_success: bool
+    ) -> List[Dict[str, Any]]:
+        """Similarity search through RAG memory, for stores whose artifacts carry no embeddings."""
+        results = self.rag.find_similar(
+            search_query,
+            tags=[tool_id],
+            top_k=top_k * 2,  # Get more, filter later
+            min_similarity=similarity_threshold
+        )
+
+        similar = []
+        for artifact, similarity in results:
+            metadata = artifact.metadata or {}
+            if metadata.get('tool_id') != tool_id or 'interaction' not in artifact.tags:
+                continue
+            if similarity < similarity_threshold:
+                continue
+
+            entry = self._cache_entry({**metadata, 'interaction_id': artifact.artifact_id})
+            if self._passes_filters(entry, min_quality, require_success):
+                similar.append(self._result(entry, similarity))
+
+        similar.sort(
+            key=lambda x: (x['quality_score'] or 0.5) * x['similarity'],
+            reverse=True
+        )
+        return similar[:top_k]
+
     def compare_prompts_semantically(
         self,
         prompt1: str,
@@ -339,10 +430,12 @@ Latency: {latency_ms}ms
     ) -> Optional[Dict[str, Any]]:
         """
         Try to get a cached result using SMART two-stage comparison:
+        0. Exact canonical input match - reused directly (no embedding, no LLM)
         1. Embedding similarity (fast) - must be >= 90% to proceed
         2. Semantic comparator LLM (precise) - returns final decision
 
         DECISION LOGIC:
+        - Exact input match → IDENTICAL - Full reuse
         - Embedding < 90% → Generate new (too different)
         - Embedding >= 90% → Call semantic comparator:
           - Score = 100 → IDENTICAL - Full reuse (or fresh content if creative)
@@ -395,14 +488,21 @@ Latency: {latency_ms}ms
             except:
                 pass  # If timestamp parsing fails, allow cache
 
+        # Identical input: nothing for the comparator to decide
+        if cached.get('exact_match'):
+            return {
+                'cached': cached,
+                'similarity_score': 100,
+                'decision': 'reuse',
+                'embedding_similarity': 1.0,
+                'reason': 'Exact input match'
+            }
+
         # If semantic comparator is enabled, use it for final decision
         semantic_score = None
         if use_semantic_comparator:
             # Convert input_data to string for comparison
-            if isinstance(input_data, dict):
-                current_prompt = json.dumps(input_data, sort_keys=True)
-            else:
-                current_prompt = str(input_data)
+            current_prompt = canonical_input_text(input_data)
 
             # Get cached input
             cached_artifact = cached.get('artifact')
@@ -491,6 +591,7 @@ Latency: {latency_ms}ms
         try:
             # Update quality score in RAG
             self.rag.update_quality_score(interaction_id, quality_score)
+            self.cache.update(interaction_id, quality_score=quality_score)
 
             # Update metadata if provided
             if additional_metadata:
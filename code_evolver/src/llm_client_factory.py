@@ -87,6 +87,7 @@ class LLMClientFactory:
 
               ollama:
                 base_url: "http://localhost:11434"
+                pool_maxsize: 16  # keep-alive connections per endpoint
 
               openai:
                 api_key: "${OPENAI_API_KEY}"  # or actual key
@@ -120,7 +121,9 @@ class LLMClientFactory:
         if backend_lower == "ollama":
             return OllamaClient(
                 base_url=backend_config.get("base_url", "http://localhost:11434"),
-                config_manager=config_manager
+                config_manager=config_manager,
+                pool_connections=backend_config.get("pool_connections", 4),
+                pool_maxsize=backend_config.get("pool_maxsize", 16)
             )
 
         elif backend_lower == "openai":
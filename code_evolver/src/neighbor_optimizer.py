@@ -48,6 +48,25 @@ from .tool_split_detector import ToolSplitDetector, ToolSplit, DeprecationPointe
 
 logger = logging.getLogger(__name__)
 
+# Output types that are interchangeable when matching interfaces
+COMPATIBLE_OUTPUT_TYPES = [
+    ('str', 'text'),
+    ('int', 'number'),
+    ('float', 'number'),
+    ('dict', 'object'),
+    ('list', 'array')
+]
+
+
+def outputs_compatible(output_type: str, other_output_type: str) -> bool:
+    """Check whether two output types are equal or interchangeable."""
+    if output_type == other_output_type:
+        return True
+    return any(
+        (output_type in pair and other_output_type in pair)
+        for pair in COMPATIBLE_OUTPUT_TYPES
+    )
+
 
 @dataclass
 class ToolInterface:
@@ -93,22 +112,7 @@ class ToolInterface:
             return False
 
         # Output types should match (or be compatible)
-        if self.output_type != other.output_type:
-            # Allow some compatible types
-            compatible_pairs = [
-                ('str', 'text'),
-                ('int', 'number'),
-                ('float', 'number'),
-                ('dict', 'object'),
-                ('list', 'array')
-            ]
-            if not any(
-                (self.output_type in pair and other.output_type in pair)
-                for pair in compatible_pairs
-            ):
-                return False
-
-        return True
+        return outputs_compatible(self.output_type, other.output_type)
 
     def similarity_score(self, other: 'ToolInterface') -> float:
         """
@@ -175,6 +179,174 @@ class NeighborTestResult:
     insights: List[str] = field(default_factory=list)
 
 
+class NeighborIndex:
+    """
+    Precomputed neighbor search structures for one cluster.
+
+    - Stacked, L2-normalized embedding matrix (rows without an embedding are
+      zero, so their cosine similarity is 0 as in ArtifactVariant.similarity_to)
+    - Fitness vector, computed once per variant
+    - Interface signature buckets: parameter name -> rows, constraint -> rows
+      and output type -> rows
+
+    A query counts parameter/constraint overlaps from the buckets, applies the
+    same compatibility rule and scoring as ToolInterface.matches and
+    ToolInterface.similarity_score as array operations, and ranks candidates
+    with one matrix-vector product and a top-k.
+    """
+
+    def __init__(self, variants: List[ArtifactVariant], interfaces: List[ToolInterface]):
+        """
+        Build the index.
+
+        Args:
+            variants: Cluster variants
+            interfaces: Interface of each variant (same order)
+        """
+        self.variants = variants
+        self.signature = self.signature_of(variants)
+        self.row_of: Dict[str, int] = {v.variant_id: row for row, v in enumerate(variants)}
+        n = len(variants)
+
+        self.fitness = np.array([v.performance.fitness_score() for v in variants], dtype=np.float64)
+
+        # Embedding matrix
+        dim = next((np.asarray(v.embedding).size for v in variants if v.embedding is not None), 0)
+        self.embeddings = np.zeros((n, dim), dtype=np.float64)
+        for row, v in enumerate(variants):
+            if v.embedding is not None and np.asarray(v.embedding).size == dim:
+                self.embeddings[row] = np.asarray(v.embedding, dtype=np.float64)
+        norms = np.linalg.norm(self.embeddings, axis=1)
+        nonzero = norms > 0
+        self.embeddings[nonzero] /= norms[nonzero][:, None]
+
+        # Interface buckets
+        self.param_counts = np.array([len(i.input_parameters) for i in interfaces], dtype=np.int64)
+        self.constraint_counts = np.array([len(i.constraints) for i in interfaces], dtype=np.int64)
+        self.param_rows = self._bucket(set(i.input_parameters) for i in interfaces)
+        self.constraint_rows = self._bucket(i.constraints for i in interfaces)
+        self.output_rows = self._bucket({i.output_type} for i in interfaces)
+
+    @staticmethod
+    def signature_of(variants: List[ArtifactVariant]) -> Tuple[str, ...]:
+        """Identity of a cluster's membership (used to detect stale indexes)."""
+        return tuple(v.variant_id for v in variants)
+
+    @staticmethod
+    def _bucket(keys_per_row) -> Dict[str, np.ndarray]:
+        buckets: Dict[str, List[int]] = defaultdict(list)
+        for row, keys in enumerate(keys_per_row):
+            for key in keys:
+                buckets[key].append(row)
+        return {key: np.array(rows, dtype=np.int64) for key, rows in buckets.items()}
+
+    def _overlap(self, buckets: Dict[str, np.ndarray], keys) -> np.ndarray:
+        """Number of keys each row shares with the query."""
+        hits = [buckets[key] for key in keys if key in buckets]
+        if not hits:
+            return np.zeros(len(self.variants), dtype=np.int64)
+        return np.bincount(np.concatenate(hits), minlength=len(self.variants))
+
+    def query(
+        self,
+        variant: ArtifactVariant,
+        interface: ToolInterface,
+        k: int,
+        min_performance: float,
+        current_fitness: float
+    ) -> List[Neighbor]:
+        """
+        Find the k nearest compatible neighbors of a variant.
+
+        Args:
+            variant: Query variant (need not be a member of the cluster)
+            interface: Interface of the query variant
+            k: Number of neighbors
+            min_performance: Minimum candidate fitness
+            current_fitness: Fitness of the query variant
+
+        Returns:
+            Neighbors sorted by distance (ties keep cluster order)
+        """
+        n = len(self.variants)
+        query_params = set(interface.input_parameters)
+        if n == 0 or not query_params:
+            return []
+
+        # Interface compatibility (ToolInterface.matches)
+        param_overlap = self._overlap(self.param_rows, query_params)
+        min_size = np.minimum(self.param_counts, len(query_params))
+        mask = (min_size > 0) & (param_overlap / np.maximum(min_size, 1) >= 0.8)
+
+        same_output = np.zeros(n, dtype=bool)
+        if interface.output_type in self.output_rows:
+            same_output[self.output_rows[interface.output_type]] = True
+        compatible_output = same_output.copy()
+        for output_type, rows in self.output_rows.items():
+            if output_type != interface.output_type and outputs_compatible(interface.output_type, output_type):
+                compatible_output[rows] = True
+        mask &= compatible_output
+
+        mask &= self.fitness >= min_performance
+        row = self.row_of.get(variant.variant_id)
+        if row is not None:
+            mask[row] = False
+
+        candidates = np.nonzero(mask)[0]
+        if candidates.size == 0:
+            return []
+
+        # Interface similarity (ToolInterface.similarity_score)
+        overlap = param_overlap[candidates]
+        union = self.param_counts[candidates] + len(query_params) - overlap
+        param_sim = overlap / union
+        output_sim = np.where(same_output[candidates], 1.0, 0.7)
+
+        constraint_sim = np.ones(candidates.size)
+        constraint_counts = self.constraint_counts[candidates]
+        shared = self._overlap(self.constraint_rows, interface.constraints)[candidates]
+        c_union = constraint_counts + len(interface.constraints) - shared
+        has_constraints = c_union > 0
+        constraint_sim[has_constraints] = shared[has_constraints] / c_union[has_constraints]
+
+        interface_sim = 0.5 * param_sim + 0.3 * output_sim + 0.2 * constraint_sim
+
+        # Embedding similarity: one matrix-vector product
+        embedding_sim = np.zeros(candidates.size)
+        if variant.embedding is not None and self.embeddings.shape[1]:
+            query = np.asarray(variant.embedding, dtype=np.float64)
+            norm = np.linalg.norm(query)
+            if query.size == self.embeddings.shape[1] and norm > 0:
+                embedding_sim = (self.embeddings @ (query / norm))[candidates]
+
+        performance = self.fitness[candidates]
+        combined = (
+            0.4 * embedding_sim +
+            0.4 * interface_sim +
+            0.2 * (performance / (current_fitness + 1e-6))
+        )
+        distance = 1.0 - combined
+
+        # Top-k by distance, ties in cluster order
+        if candidates.size > k:
+            cutoff = np.partition(distance, k - 1)[k - 1]
+            keep = np.nonzero(distance <= cutoff)[0]
+        else:
+            keep = np.arange(candidates.size)
+        order = keep[np.lexsort((candidates[keep], distance[keep]))][:k]
+
+        return [
+            Neighbor(
+                variant=self.variants[candidates[i]],
+                similarity=float(embedding_sim[i]),
+                interface_match=float(interface_sim[i]),
+                performance_score=float(performance[i]),
+                distance=float(distance[i])
+            )
+            for i in order
+        ]
+
+
 class NeighborOptimizer(SystemOptimizer):
     """
     Enhanced optimizer with neighbor-based testing and mutation.
@@ -209,6 +381,9 @@ class NeighborOptimizer(SystemOptimizer):
         # Track interface signatures for all tools
         self.tool_interfaces: Dict[str, ToolInterface] = {}
 
+        # Neighbor search index per cluster (rebuilt when membership changes)
+        self.neighbor_indexes: Dict[str, NeighborIndex] = {}
+
         # Version-based clustering
         self.version_clusters: Dict[str, List[ArtifactVariant]] = defaultdict(list)
 
@@ -322,49 +497,43 @@ class NeighborOptimizer(SystemOptimizer):
         if min_performance is None:
             min_performance = current_fitness  # Only consider equal or better
 
-        neighbors = []
-
-        for candidate in cluster.variants:
-            if candidate.variant_id == variant.variant_id:
-                continue
-
-            # Check performance threshold
-            candidate_fitness = candidate.performance.fitness_score()
-            if candidate_fitness < min_performance:
-                continue
-
-            # Check interface compatibility
-            candidate_interface = self.extract_interface(candidate)
-            if not current_interface.matches(candidate_interface):
-                continue
-
-            # Calculate similarity scores
-            interface_sim = current_interface.similarity_score(candidate_interface)
-            embedding_sim = variant.similarity_to(candidate)
-            performance_score = candidate_fitness
+        index = self.get_neighbor_index(cluster)
+        return index.query(variant, current_interface, k, min_performance, current_fitness)
 
-            # Combined score (weighted)
-            combined_sim = (
-                0.4 * embedding_sim +
-                0.4 * interface_sim +
-                0.2 * (performance_score / (current_fitness + 1e-6))
-            )
+    def get_neighbor_index(self, cluster: ClusterInfo) -> NeighborIndex:
+        """
+        Get the neighbor index of a cluster, building it if needed.
 
-            distance = 1.0 - combined_sim
+        The index is rebuilt when the cluster's variants change. Call
+        invalidate_neighbor_index() after changing variants' embeddings,
+        metadata or performance in place.
 
-            neighbor = Neighbor(
-                variant=candidate,
-                similarity=embedding_sim,
-                interface_match=interface_sim,
-                performance_score=performance_score,
-                distance=distance
-            )
+        Args:
+            cluster: Cluster to index
 
-            neighbors.append(neighbor)
+        Returns:
+            NeighborIndex for the cluster
+        """
+        index = self.neighbor_indexes.get(cluster.cluster_id)
+        if index is None or index.signature != NeighborIndex.signature_of(cluster.variants):
+            interfaces = [self.extract_interface(v) for v in cluster.variants]
+            index = NeighborIndex(list(cluster.variants), interfaces)
+            self.neighbor_indexes[cluster.cluster_id] = index
+        return index
+
+    def invalidate_neighbor_index(self, cluster_id: Optional[str] = None):
+        """
+        Drop cached neighbor indexes (and interfaces of their variants).
 
-        # Sort by distance (ascending) and take top k
-        neighbors.sort(key=lambda n: n.distance)
-        return neighbors[:k]
+        Args:
+            cluster_id: Cluster to invalidate (None invalidates all)
+        """
+        cluster_ids = [cluster_id] if cluster_id else list(self.neighbor_indexes)
+        for cid in cluster_ids:
+            index = self.neighbor_indexes.pop(cid, None)
+            if index:
+                for variant in index.variants:
+                    self.tool_interfaces.pop(variant.variant_id, None)
 
     def test_against_neighbor(
         self,
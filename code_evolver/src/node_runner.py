@@ -1,6 +1,7 @@
 """
 Node execution with sandboxing, metrics collection, and safety constraints.
 """
+import os
 import subprocess
 import time
 import json
@@ -12,6 +13,7 @@ from datetime import datetime
 
 # Import profiling utilities
 from .profiling import ProfileContext, get_global_registry
+from .node_worker_pool import get_node_worker_pool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,16 +22,22 @@ logger = logging.getLogger(__name__)
 class NodeRunner:
     """Executes nodes in sandboxed environment and collects metrics."""
 
-    def __init__(self, nodes_dir: str = "./nodes"):
+    def __init__(self, nodes_dir: str = "./nodes", use_worker_pool: Optional[bool] = None):
         """
         Initialize node runner.
 
         Args:
             nodes_dir: Directory where node code is stored
+            use_worker_pool: Run nodes on warm pool workers instead of a fresh
+                subprocess each time (default: on unless CODE_EVOLVER_NODE_POOL=0)
         """
         self.nodes_dir = Path(nodes_dir)
         self.nodes_dir.mkdir(parents=True, exist_ok=True)
 
+        if use_worker_pool is None:
+            use_worker_pool = os.getenv("CODE_EVOLVER_NODE_POOL", "1") != "0"
+        self.use_worker_pool = use_worker_pool
+
     def save_code(self, node_id: str, code: str, filename: str = "main.py") -> Path:
         """
         Save generated code to node directory.
@@ -96,58 +104,20 @@ class NodeRunner:
             start_time = time.time()
             cpu_start = time.process_time()
 
-            # Track memory usage
-            process = None
-            peak_memory_mb = 0.0
-            profile_data = None
-
             try:
-                # Execute the node code
-                # Add code_evolver directory to PYTHONPATH so node_runtime can be imported
-                import os
-                env = os.environ.copy()
-                code_evolver_dir = str(Path(__file__).parent.parent.absolute())
-                env['PYTHONPATH'] = code_evolver_dir + os.pathsep + env.get('PYTHONPATH', '')
-
-                process = subprocess.Popen(
-                    ["python", str(code_path)],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    env=env  # Pass modified environment
-                )
-
-                # Monitor process for memory usage
-                try:
-                    ps_process = psutil.Process(process.pid)
-                    initial_memory = ps_process.memory_info().rss / (1024 * 1024)
-                    peak_memory_mb = initial_memory
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-
-                # Communicate with timeout
-                timeout_sec = timeout_ms / 1000.0
-                try:
-                    stdout, stderr = process.communicate(
-                        input=input_json,
-                        timeout=timeout_sec
+                result = None
+                if self.use_worker_pool:
+                    # Warm worker: NodeRuntime, RAG and tools are already loaded
+                    result = get_node_worker_pool().run(code_path, input_json, timeout_ms)
+
+                if result is not None:
+                    stdout, stderr = result["stdout"], result["stderr"]
+                    exit_code = result["exit_code"]
+                    peak_memory_mb = result["memory_mb_peak"]
+                else:
+                    stdout, stderr, exit_code, peak_memory_mb = self._run_subprocess(
+                        code_path, input_json, timeout_ms
                     )
-                    exit_code = process.returncode
-                except subprocess.TimeoutExpired:
-                    process.kill()
-                    stdout, stderr = process.communicate()
-                    stderr += f"\n[ERROR] Process timed out after {timeout_ms}ms"
-                    exit_code = -1
-
-                # Check memory usage after execution
-                try:
-                    if process.pid and psutil.pid_exists(process.pid):
-                        ps_process = psutil.Process(process.pid)
-                        current_memory = ps_process.memory_info().rss / (1024 * 1024)
-                        peak_memory_mb = max(peak_memory_mb, current_memory)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
 
             except Exception as e:
                 error_msg = f"Execution error: {str(e)}"
@@ -179,6 +149,73 @@ class NodeRunner:
 
             return stdout, stderr, metrics
 
+    def _run_subprocess(
+        self,
+        code_path: Path,
+        input_json: str,
+        timeout_ms: int
+    ) -> Tuple[str, str, int, float]:
+        """
+        Execute node code in a fresh Python subprocess.
+
+        Args:
+            code_path: Path to the node's code
+            input_json: Input passed on stdin
+            timeout_ms: Execution timeout in milliseconds
+
+        Returns:
+            Tuple of (stdout, stderr, exit_code, peak_memory_mb)
+        """
+        peak_memory_mb = 0.0
+
+        # Execute the node code
+        # Add code_evolver directory to PYTHONPATH so node_runtime can be imported
+        env = os.environ.copy()
+        code_evolver_dir = str(Path(__file__).parent.parent.absolute())
+        env['PYTHONPATH'] = code_evolver_dir + os.pathsep + env.get('PYTHONPATH', '')
+
+        process = subprocess.Popen(
+            ["python", str(code_path)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=env  # Pass modified environment
+        )
+
+        # Monitor process for memory usage
+        try:
+            ps_process = psutil.Process(process.pid)
+            initial_memory = ps_process.memory_info().rss / (1024 * 1024)
+            peak_memory_mb = initial_memory
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+        # Communicate with timeout
+        timeout_sec = timeout_ms / 1000.0
+        try:
+            stdout, stderr = process.communicate(
+                input=input_json,
+                timeout=timeout_sec
+            )
+            exit_code = process.returncode
+        except subprocess.TimeoutExpired:
+            process.kill()
+            stdout, stderr = process.communicate()
+            stderr += f"\n[ERROR] Process timed out after {timeout_ms}ms"
+            exit_code = -1
+
+        # Check memory usage after execution
+        try:
+            if process.pid and psutil.pid_exists(process.pid):
+                ps_process = psutil.Process(process.pid)
+                current_memory = ps_process.memory_info().rss / (1024 * 1024)
+                peak_memory_mb = max(peak_memory_mb, current_memory)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+        return stdout, stderr, exit_code, peak_memory_mb
+
     def _create_error_metrics(self, error_msg: str) -> Dict[str, Any]:
         """Create metrics object for error cases."""
         return {
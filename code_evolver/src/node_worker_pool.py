@@ -0,0 +1,453 @@
+"""
+Warm worker pool for node execution.
+
+Running every node in a fresh interpreter means each node that uses
+node_runtime rebuilds NodeRuntime: config.yaml, OllamaClient, the whole RAG
+memory and a ToolsManager YAML scan. Pool workers are long-lived Python
+processes that build those once and then execute node scripts on request.
+
+Protocol (one JSON object per line over the worker's stdin/stdout pipes):
+    request:  {"code_path": "...", "input": "<stdin text>"}
+    response: {"exit_code": 0, "stdout": "...", "stderr": "..."}
+
+Inside the worker, a node runs via runpy as __main__ with sys.stdin set to
+the payload. File descriptors 1/2 are redirected to temp files, so output
+from the node and from any subprocess it starts is captured just like with
+a plain subprocess. SystemExit gives the exit code; an uncaught exception
+prints a traceback and exits with 1.
+
+Timeouts kill the worker (it is replaced), and workers are recycled after
+max_runs_per_worker runs or once their RSS passes max_rss_mb.
+"""
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+CODE_EVOLVER_DIR = Path(__file__).parent.parent.absolute()
+
+
+class WorkerTimeout(Exception):
+    """Raised when a node does not finish within its timeout."""
+
+
+class NodeWorker:
+    """Parent-side handle for one warm worker process."""
+
+    def __init__(self, warm_runtime: bool = True):
+        """
+        Start a worker process.
+
+        Args:
+            warm_runtime: Build NodeRuntime in the worker before the first run
+        """
+        env = os.environ.copy()
+        env['PYTHONPATH'] = str(CODE_EVOLVER_DIR) + os.pathsep + env.get('PYTHONPATH', '')
+        env['PYTHONUNBUFFERED'] = '1'
+
+        args = [sys.executable, "-m", "src.node_worker_pool"]
+        if warm_runtime:
+            args.append("--warm")
+
+        self.process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env
+        )
+        self.runs = 0
+        self._response: Optional[bytes] = None
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def rss_mb(self) -> float:
+        """Resident memory of the worker in MB (0 if unavailable)."""
+        try:
+            return psutil.Process(self.process.pid).memory_info().rss / (1024 * 1024)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return 0.0
+
+    def run(self, code_path: str, input_text: str, timeout_sec: float) -> Dict[str, Any]:
+        """
+        Execute a node script in this worker.
+
+        Args:
+            code_path: Path to the node's script
+            input_text: Text passed to the node on stdin
+            timeout_sec: Seconds to wait before killing the worker
+
+        Returns:
+            Response dict with exit_code, stdout and stderr
+
+        Raises:
+            WorkerTimeout: If the node did not finish in time (worker is killed)
+            RuntimeError: If the worker died or sent an invalid response
+        """
+        request = json.dumps({"code_path": code_path, "input": input_text}) + "\n"
+        self.process.stdin.write(request.encode("utf-8"))
+        self.process.stdin.flush()
+        self.runs += 1
+
+        # Read on a helper thread so the wait can time out
+        self._response = None
+        reader = threading.Thread(target=self._read_response, daemon=True)
+        reader.start()
+        reader.join(timeout_sec)
+
+        if reader.is_alive():
+            self.kill()
+            raise WorkerTimeout()
+
+        if not self._response:
+            raise RuntimeError(f"Worker {self.pid} exited unexpectedly")
+
+        return json.loads(self._response.decode("utf-8"))
+
+    def _read_response(self):
+        try:
+            self._response = self.process.stdout.readline()
+        except Exception:
+            self._response = None
+
+    def kill(self):
+        """Terminate the worker process."""
+        try:
+            self.process.kill()
+            self.process.wait(timeout=5)
+        except Exception:
+            pass
+
+    def close(self):
+        """Ask the worker to exit (closing stdin ends its request loop)."""
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except Exception:
+            self.kill()
+
+
+class NodeWorkerPool:
+    """
+    Pool of warm node workers.
+
+    Thread-safe: concurrent run() calls each check out their own worker.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_runs_per_worker: int = 100,
+        max_rss_mb: float = 1024,
+        warm_runtime: bool = True,
+        prefork: bool = True
+    ):
+        """
+        Initialize worker pool.
+
+        Args:
+            size: Maximum number of workers
+            max_runs_per_worker: Recycle a worker after this many runs
+            max_rss_mb: Recycle a worker once its RSS exceeds this (MB)
+            warm_runtime: Build NodeRuntime in workers at startup
+            prefork: Start all workers now (in the background) instead of on demand
+        """
+        self.size = max(1, size)
+        self.max_runs_per_worker = max_runs_per_worker
+        self.max_rss_mb = max_rss_mb
+        self.warm_runtime = warm_runtime
+
+        self._idle: List[NodeWorker] = []
+        self._total = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        # Counters
+        self.runs = 0
+        self.workers_started = 0
+        self.workers_recycled = 0
+
+        if prefork:
+            threading.Thread(target=self._prefork, daemon=True).start()
+
+    def _prefork(self):
+        """Start workers up to the pool size."""
+        while True:
+            with self._cond:
+                if self._closed or self._total >= self.size:
+                    return
+                self._total += 1
+            worker = self._spawn()
+            if worker is None:
+                return
+            self._checkin(worker)
+
+    def _spawn(self) -> Optional[NodeWorker]:
+        """Start a new worker (the caller has already reserved its slot)."""
+        try:
+            worker = NodeWorker(warm_runtime=self.warm_runtime)
+            self.workers_started += 1
+            return worker
+        except Exception as e:
+            logger.warning(f"Could not start node worker: {e}")
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            return None
+
+    def _checkout(self) -> Optional[NodeWorker]:
+        """Get an idle worker, starting one if the pool has room."""
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.is_alive():
+                        return worker
+                    self._total -= 1
+                if self._total < self.size:
+                    self._total += 1
+                    break
+                self._cond.wait()
+        return self._spawn()
+
+    def _checkin(self, worker: NodeWorker):
+        """Return a worker to the pool, recycling it if it is worn out."""
+        recycle = (
+            not worker.is_alive()
+            or worker.runs >= self.max_runs_per_worker
+            or worker.rss_mb() > self.max_rss_mb
+        )
+
+        with self._cond:
+            if recycle or self._closed:
+                self._total -= 1
+            else:
+                self._idle.append(worker)
+            self._cond.notify()
+
+        if recycle:
+            if worker.is_alive():
+                self.workers_recycled += 1
+                logger.debug(f"Recycling node worker {worker.pid} after {worker.runs} runs")
+            worker.close()
+        elif self._closed:
+            worker.close()
+
+    def run(self, code_path: str, input_text: str, timeout_ms: int) -> Optional[Dict[str, Any]]:
+        """
+        Run a node script on a warm worker.
+
+        Args:
+            code_path: Path to the node's script
+            input_text: Text passed to the node on stdin
+            timeout_ms: Execution timeout in milliseconds
+
+        Returns:
+            Dict with stdout, stderr, exit_code and memory_mb_peak (memory the
+            node added to the worker, not the warm worker's own footprint), or
+            None if no worker could be started (callers fall back to a
+            subprocess)
+        """
+        worker = self._checkout()
+        if worker is None:
+            return None
+
+        try:
+            response = worker.run(str(Path(code_path).absolute()), input_text, timeout_ms / 1000.0)
+        except WorkerTimeout:
+            self._checkin(worker)
+            return {
+                "stdout": "",
+                "stderr": f"\n[ERROR] Process timed out after {timeout_ms}ms",
+                "exit_code": -1,
+                "memory_mb_peak": 0.0
+            }
+        except Exception as e:
+            worker.kill()
+            self._checkin(worker)
+            return {
+                "stdout": "",
+                "stderr": f"[ERROR] Node worker failed: {e}",
+                "exit_code": -1,
+                "memory_mb_peak": 0.0
+            }
+
+        self.runs += 1
+        self._checkin(worker)
+        return response
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get pool counters."""
+        with self._cond:
+            return {
+                "size": self.size,
+                "workers": self._total,
+                "idle": len(self._idle),
+                "runs": self.runs,
+                "workers_started": self.workers_started,
+                "workers_recycled": self.workers_recycled
+            }
+
+    def close(self):
+        """Stop all workers."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.close()
+
+
+# Global instance
+_global_pool: Optional[NodeWorkerPool] = None
+_global_pool_lock = threading.Lock()
+
+
+def get_node_worker_pool() -> NodeWorkerPool:
+    """
+    Get the global node worker pool.
+
+    Returns:
+        NodeWorkerPool singleton
+    """
+    global _global_pool
+
+    with _global_pool_lock:
+        if _global_pool is None:
+            _global_pool = NodeWorkerPool()
+        return _global_pool
+
+
+# ---------------------------------------------------------------------------
+# Worker process side
+# ---------------------------------------------------------------------------
+
+def _run_node_script(code_path: str, input_text: str) -> Dict[str, Any]:
+    """
+    Execute one node script as __main__, capturing fds 1/2 and the exit code.
+
+    memory_mb_peak is the memory the node added to the worker, measured
+    inside the worker once it is idle; the warm worker's own RSS (runtime,
+    RAG, tools) is not charged to the node.
+    """
+    import runpy
+
+    worker_process = psutil.Process()
+    rss_before = worker_process.memory_info().rss
+
+    node_dir = str(Path(code_path).parent.absolute())
+    modules_before = set(sys.modules)
+    saved_argv, saved_path, saved_stdin = sys.argv, list(sys.path), sys.stdin
+    saved_cwd, saved_environ = os.getcwd(), dict(os.environ)
+
+    out_file = tempfile.TemporaryFile()
+    err_file = tempfile.TemporaryFile()
+    saved_out, saved_err = os.dup(1), os.dup(2)
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(out_file.fileno(), 1)
+    os.dup2(err_file.fileno(), 2)
+
+    exit_code = 0
+    try:
+        sys.argv = [code_path]
+        sys.path.insert(0, node_dir)
+        # Text stdin with a binary .buffer, like a subprocess pipe
+        sys.stdin = io.TextIOWrapper(io.BytesIO(input_text.encode("utf-8")), encoding="utf-8")
+        runpy.run_path(code_path, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved_out, 1)
+        os.dup2(saved_err, 2)
+        os.close(saved_out)
+        os.close(saved_err)
+        sys.argv, sys.path, sys.stdin = saved_argv, saved_path, saved_stdin
+
+        # A node's chdir/environment changes must not reach the next node
+        os.chdir(saved_cwd)
+        if os.environ != saved_environ:
+            os.environ.clear()
+            os.environ.update(saved_environ)
+
+        # Drop modules the node imported from its own directory so another
+        # node's same-named helper modules are not shadowed
+        for name in set(sys.modules) - modules_before:
+            module_file = getattr(sys.modules.get(name), "__file__", None) or ""
+            if module_file.startswith(node_dir):
+                sys.modules.pop(name, None)
+
+    def _read(f) -> str:
+        f.seek(0)
+        data = f.read().decode("utf-8", errors="replace")
+        f.close()
+        return data
+
+    memory_mb = max(0, worker_process.memory_info().rss - rss_before) / (1024 * 1024)
+    return {
+        "exit_code": exit_code,
+        "stdout": _read(out_file),
+        "stderr": _read(err_file),
+        "memory_mb_peak": memory_mb
+    }
+
+
+def _worker_main(warm_runtime: bool):
+    """Request loop of a worker process."""
+    # Keep private handles on the protocol pipes; fds 0/1 are then pointed
+    # away so node code (and its subprocesses) cannot touch them
+    requests_in = os.fdopen(os.dup(0), "rb")
+    responses_out = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(2, 1)
+
+    if warm_runtime:
+        try:
+            import node_runtime
+            node_runtime.NodeRuntime.get_instance()
+        except Exception as e:
+            print(f"Node worker warm-up failed: {e}", file=sys.stderr)
+
+    for line in requests_in:
+        if not line.strip():
+            continue
+        request = json.loads(line.decode("utf-8"))
+        response = _run_node_script(request["code_path"], request.get("input", ""))
+        responses_out.write((json.dumps(response) + "\n").encode("utf-8"))
+        responses_out.flush()
+
+
+if __name__ == "__main__":
+    _worker_main(warm_runtime="--warm" in sys.argv)
@@ -2,12 +2,19 @@
 Ollama client for interacting with local Ollama models.
 Supports code generation, evaluation, and triage tasks.
 Supports multi-endpoint configuration for distributed inference.
+
+Requests go through one pooled keep-alive session per endpoint, so chained
+LLM calls reuse connections instead of opening a new one each time.
+generate_stream() yields tokens as Ollama's NDJSON chunks arrive.
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import logging
 import os
-from typing import Optional, Dict, Any, TYPE_CHECKING
+import threading
+import time
+from typing import Optional, Dict, Any, Iterator, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .config_manager import ConfigManager
@@ -29,13 +36,46 @@ logging.basicConfig(level=log_level)
 logger = logging.getLogger(__name__)
 
 
+# Shared sessions, one per endpoint
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_ollama_session(endpoint: str, pool_connections: int = 4, pool_maxsize: int = 16) -> requests.Session:
+    """
+    Get the shared keep-alive session for an Ollama endpoint.
+
+    Pool sizes only apply when the endpoint's session is first created.
+
+    Args:
+        endpoint: Ollama base URL
+        pool_connections: Number of host pools kept by the adapter
+        pool_maxsize: Keep-alive connections kept per host
+
+    Returns:
+        requests.Session instance
+    """
+    key = endpoint.rstrip("/")
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+        return session
+
+
 class OllamaClient:
     """Client for communicating with Ollama servers (single or multiple endpoints)."""
 
     def __init__(
         self,
         base_url: str = "http://localhost:11434",
-        config_manager: Optional['ConfigManager'] = None
+        config_manager: Optional['ConfigManager'] = None,
+        pool_connections: int = 4,
+        pool_maxsize: int = 16
     ):
         """
         Initialize Ollama client.
@@ -43,9 +83,13 @@ class OllamaClient:
         Args:
             base_url: Default base URL for Ollama API
             config_manager: Optional ConfigManager for per-model endpoint routing
+            pool_connections: Number of host pools per endpoint session
+            pool_maxsize: Keep-alive connections kept per endpoint
         """
         self.base_url = base_url
         self.config_manager = config_manager
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
         self.backend_type = "ollama"  # Add backend_type for multi-backend compatibility
 
         # Round-robin endpoint tracking per model_key
@@ -63,7 +107,7 @@ class OllamaClient:
         """
         url = endpoint or self.base_url
         try:
-            response = requests.get(f"{url}/api/tags", timeout=5)
+            response = self._session(url).get(f"{url}/api/tags", timeout=5)
             response.raise_for_status()
             logger.info(f"✓ Connected to Ollama server at {url}")
             return True
@@ -83,7 +127,7 @@ class OllamaClient:
         """
         url = endpoint or self.base_url
         try:
-            response = requests.get(f"{url}/api/tags", timeout=5)
+            response = self._session(url).get(f"{url}/api/tags", timeout=5)
             response.raise_for_status()
             data = response.json()
             models = [model['name'] for model in data.get('models', [])]
@@ -125,6 +169,10 @@ class OllamaClient:
 
         return prompt
 
+    def _session(self, endpoint: str) -> requests.Session:
+        """Get the pooled session for an endpoint."""
+        return get_ollama_session(endpoint, self.pool_connections, self.pool_maxsize)
+
     def _get_next_endpoint(self, model_key: str, endpoints: list) -> str:
         """
         Get next endpoint using round-robin for load balancing.
@@ -240,7 +288,8 @@ class OllamaClient:
             prompt: User prompt
             system: Optional system prompt
             temperature: Sampling temperature (0.0 to 1.0)
-            stream: Whether to stream response (default: False)
+            stream: Stream the response and join the tokens (records
+                time-to-first-token in the profile metadata)
             endpoint: Optional specific endpoint URL (overrides config and round-robin)
             model_key: Optional model key for config lookup (e.g., "overseer", "generator")
             speed_tier: Optional speed tier for timeout calculation
@@ -256,100 +305,232 @@ class OllamaClient:
             "model": model,
             "model_key": model_key,
             "prompt_length": len(prompt),
-            "temperature": temperature
+            "temperature": temperature,
+            "stream": stream
         }
 
         with ProfileContext(profile_name, metadata=profile_metadata):
-            # Determine endpoint to use
-            target_endpoint = endpoint
-
-            # If no endpoint specified but we have a config_manager and model_key
-            if not target_endpoint and self.config_manager and model_key:
-                # Get endpoints (can be single or multiple)
-                endpoints = self.config_manager.get_model_endpoints(model_key)
-                if endpoints:
-                    target_endpoint = self._get_next_endpoint(model_key, endpoints)
-                else:
-                    target_endpoint = self.base_url
-
-            # Fall back to base_url
-            if not target_endpoint:
-                target_endpoint = self.base_url
-
-            # Truncate prompt if necessary based on model's context window
-            truncated_prompt = self.truncate_prompt(prompt, model)
-
-            generate_url = f"{target_endpoint}/api/generate"
-
-            payload = {
-                "model": model,
-                "prompt": truncated_prompt,
-                "stream": stream,
-                "options": {
-                    "temperature": temperature
-                }
-            }
-
-            # Add max_tokens if provided (Ollama uses 'num_predict')
-            if max_tokens:
-                payload["options"]["num_predict"] = max_tokens
-
-            if system:
-                payload["system"] = system
+            target_endpoint, payload, timeout = self._prepare_request(
+                model, prompt, system, temperature, stream, endpoint, model_key, speed_tier, max_tokens
+            )
 
             try:
-                # Calculate dynamic timeout based on model and speed tier
-                timeout = self.calculate_timeout(model, model_key, speed_tier)
+                self._log_request(target_endpoint, payload, timeout)
 
-                logger.info(f"Generating with model '{model}' at {target_endpoint} (timeout: {timeout}s)...")
-
-                # Debug logging: Log the request (full content, not truncated)
-                logger.debug(f"Request to {target_endpoint}:")
-                logger.debug(f"  Model: {model}")
-                logger.debug(f"  Prompt: {truncated_prompt}")
-                logger.debug(f"  Temperature: {temperature}")
-                if system:
-                    logger.debug(f"  System prompt: {system}")
-
-                # Show live status update
-                if STATUS_MANAGER_AVAILABLE:
-                    status_mgr = get_status_manager()
-                    status_mgr.llm_call(model, "ollama", "generate")
-
-                response = requests.post(
-                    generate_url,
-                    json=payload,
-                    timeout=timeout
-                )
-                response.raise_for_status()
-                data = response.json()
+                if stream:
+                    result = "".join(self._stream_tokens(target_endpoint, payload, timeout, profile_metadata))
+                else:
+                    response = self._session(target_endpoint).post(
+                        f"{target_endpoint}/api/generate",
+                        json=payload,
+                        timeout=timeout
+                    )
+                    response.raise_for_status()
+                    data = response.json()
 
-                result = data.get("response", "")
+                    result = data.get("response", "")
 
                 # Debug logging: Log the response (full content, not truncated)
                 logger.debug(f"Response from {target_endpoint}:")
                 logger.debug(f"  Length: {len(result)} characters")
                 logger.debug(f"  Full response: {result}")
 
-                # Clear status after success
-                if STATUS_MANAGER_AVAILABLE:
-                    get_status_manager().clear()
-
                 logger.info(f"✓ Generated {len(result)} characters from {target_endpoint}")
                 return result
 
             except requests.exceptions.Timeout:
-                # Clear status on error
+                logger.error(f"Request timed out for {target_endpoint}")
+                return ""
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Error generating response from {target_endpoint}: {e}")
+                return ""
+            finally:
+                # Clear status after success or error
                 if STATUS_MANAGER_AVAILABLE:
                     get_status_manager().clear()
+
+    def generate_stream(
+        self,
+        model: str,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        endpoint: Optional[str] = None,
+        model_key: Optional[str] = None,
+        speed_tier: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Generate text, yielding tokens as they arrive.
+
+        Takes the same arguments as generate(). On a request error the
+        generator logs it and stops early.
+
+        Args:
+            model: Model name
+            prompt: User prompt
+            system: Optional system prompt
+            temperature: Sampling temperature (0.0 to 1.0)
+            endpoint: Optional specific endpoint URL
+            model_key: Optional model key for config lookup
+            speed_tier: Optional speed tier for timeout calculation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters (ignored for compatibility)
+
+        Yields:
+            Response text chunks
+        """
+        profile_name = f"LLM.generate.{model_key or model}"
+        profile_metadata = {
+            "model": model,
+            "model_key": model_key,
+            "prompt_length": len(prompt),
+            "temperature": temperature,
+            "stream": True
+        }
+
+        with ProfileContext(profile_name, metadata=profile_metadata):
+            target_endpoint, payload, timeout = self._prepare_request(
+                model, prompt, system, temperature, True, endpoint, model_key, speed_tier, max_tokens
+            )
+
+            try:
+                self._log_request(target_endpoint, payload, timeout)
+                yield from self._stream_tokens(target_endpoint, payload, timeout, profile_metadata)
+            except requests.exceptions.Timeout:
                 logger.error(f"Request timed out for {target_endpoint}")
-                return ""
             except requests.exceptions.RequestException as e:
-                # Clear status on error
+                logger.error(f"Error streaming response from {target_endpoint}: {e}")
+            finally:
                 if STATUS_MANAGER_AVAILABLE:
                     get_status_manager().clear()
-                logger.error(f"Error generating response from {target_endpoint}: {e}")
-                return ""
+
+    def _prepare_request(
+        self,
+        model: str,
+        prompt: str,
+        system: Optional[str],
+        temperature: float,
+        stream: bool,
+        endpoint: Optional[str],
+        model_key: Optional[str],
+        speed_tier: Optional[str],
+        max_tokens: Optional[int]
+    ) -> Tuple[str, Dict[str, Any], int]:
+        """
+        Pick the endpoint and build the /api/generate payload.
+
+        Returns:
+            Tuple of (endpoint, payload, timeout in seconds)
+        """
+        # Determine endpoint to use
+        target_endpoint = endpoint
+
+        # If no endpoint specified but we have a config_manager and model_key
+        if not target_endpoint and self.config_manager and model_key:
+            # Get endpoints (can be single or multiple)
+            endpoints = self.config_manager.get_model_endpoints(model_key)
+            if endpoints:
+                target_endpoint = self._get_next_endpoint(model_key, endpoints)
+            else:
+                target_endpoint = self.base_url
+
+        # Fall back to base_url
+        if not target_endpoint:
+            target_endpoint = self.base_url
+
+        # Truncate prompt if necessary based on model's context window
+        truncated_prompt = self.truncate_prompt(prompt, model)
+
+        payload = {
+            "model": model,
+            "prompt": truncated_prompt,
+            "stream": stream,
+            "options": {
+                "temperature": temperature
+            }
+        }
+
+        # Add max_tokens if provided (Ollama uses 'num_predict')
+        if max_tokens:
+            payload["options"]["num_predict"] = max_tokens
+
+        if system:
+            payload["system"] = system
+
+        # Calculate dynamic timeout based on model and speed tier
+        timeout = self.calculate_timeout(model, model_key, speed_tier)
+
+        return target_endpoint, payload, timeout
+
+    def _log_request(self, target_endpoint: str, payload: Dict[str, Any], timeout: int):
+        """Log an outgoing request and show the live status line."""
+        model = payload["model"]
+        logger.info(f"Generating with model '{model}' at {target_endpoint} (timeout: {timeout}s)...")
+
+        # Debug logging: Log the request (full content, not truncated)
+        logger.debug(f"Request to {target_endpoint}:")
+        logger.debug(f"  Model: {model}")
+        logger.debug(f"  Prompt: {payload['prompt']}")
+        logger.debug(f"  Temperature: {payload['options']['temperature']}")
+        if payload.get("system"):
+            logger.debug(f"  System prompt: {payload['system']}")
+
+        # Show live status update
+        if STATUS_MANAGER_AVAILABLE:
+            status_mgr = get_status_manager()
+            status_mgr.llm_call(model, "ollama", "generate")
+
+    def _stream_tokens(
+        self,
+        target_endpoint: str,
+        payload: Dict[str, Any],
+        timeout: int,
+        metrics: Dict[str, Any]
+    ) -> Iterator[str]:
+        """
+        Send a streaming /api/generate request and yield its response chunks.
+
+        Timing is written into metrics (the ProfileContext metadata):
+        time_to_first_token_ms, and eval_count / total_duration_ms from the
+        final chunk.
+        """
+        payload = {**payload, "stream": True}
+        start = time.perf_counter()
+
+        with self._session(target_endpoint).post(
+            f"{target_endpoint}/api/generate",
+            json=payload,
+            timeout=timeout,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                try:
+                    chunk = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping malformed stream chunk from {target_endpoint}")
+                    continue
+
+                if chunk.get("error"):
+                    raise requests.exceptions.RequestException(chunk["error"])
+
+                token = chunk.get("response", "")
+                if token:
+                    if "time_to_first_token_ms" not in metrics:
+                        metrics["time_to_first_token_ms"] = (time.perf_counter() - start) * 1000
+                    yield token
+
+                if chunk.get("done"):
+                    if "eval_count" in chunk:
+                        metrics["eval_count"] = chunk["eval_count"]
+                    if "total_duration" in chunk:
+                        metrics["total_duration_ms"] = chunk["total_duration"] / 1e6
+                    break
 
     def generate_code(self, prompt: str, constraints: Optional[str] = None) -> str:
         """
@@ -42,7 +42,13 @@ class PatternClusterer:
     - Hierarchical clustering for operation taxonomy
     """
 
-    def __init__(self, rag_memory, min_cluster_size: int = 3, similarity_threshold: float = 0.75):
+    def __init__(
+        self,
+        rag_memory,
+        min_cluster_size: int = 3,
+        similarity_threshold: float = 0.75,
+        max_bucket_size: int = 2000
+    ):
         """
         Initialize pattern clusterer.
 
@@ -50,10 +56,14 @@ class PatternClusterer:
             rag_memory: RAG memory instance to analyze
             min_cluster_size: Minimum artifacts to form a cluster
             similarity_threshold: Minimum similarity to consider clustering
+            max_bucket_size: Above this many artifacts, embeddings are first
+                split into random-projection buckets that are clustered
+                separately (bounds the similarity matrix size)
         """
         self.rag = rag_memory
         self.min_cluster_size = min_cluster_size
         self.similarity_threshold = similarity_threshold
+        self.max_bucket_size = max_bucket_size
 
     def analyze_patterns(self, target_filter: Optional[str] = None) -> List[OperationCluster]:
         """
@@ -138,12 +148,11 @@ class PatternClusterer:
         artifacts: List[Any]
     ) -> List[OperationCluster]:
         """
-        Simple similarity-based clustering without sklearn.
+        Similarity-based agglomerative clustering without sklearn.
 
-        Uses greedy algorithm:
-        1. Find most similar pairs
-        2. Merge them into clusters
-        3. Continue until no more merges possible
+        Average linkage over cosine similarity: clusters keep merging with
+        their most similar neighbour while the average pairwise similarity
+        between the two exceeds similarity_threshold.
 
         Args:
             embeddings: Array of embeddings
@@ -152,80 +161,42 @@ class PatternClusterer:
         Returns:
             List of operation clusters
         """
-        n = len(embeddings)
-        clusters_map = {i: [i] for i in range(n)}  # Each item starts in its own cluster
-        cluster_centers = {i: embeddings[i].copy() for i in range(n)}
-
-        # Greedy clustering: merge similar clusters
-        merged = True
-        while merged:
-            merged = False
-            best_similarity = self.similarity_threshold
-            best_pair = None
-
-            # Find best pair to merge
-            cluster_ids = list(clusters_map.keys())
-            for i in range(len(cluster_ids)):
-                for j in range(i + 1, len(cluster_ids)):
-                    id_i = cluster_ids[i]
-                    id_j = cluster_ids[j]
-
-                    # Calculate similarity between cluster centers
-                    sim = self._cosine_similarity(cluster_centers[id_i], cluster_centers[id_j])
-
-                    if sim > best_similarity:
-                        best_similarity = sim
-                        best_pair = (id_i, id_j)
-
-            # Merge best pair
-            if best_pair:
-                id_i, id_j = best_pair
-                # Merge j into i
-                clusters_map[id_i].extend(clusters_map[id_j])
-
-                # Update center (average of all embeddings in cluster)
-                cluster_embeddings = embeddings[clusters_map[id_i]]
-                cluster_centers[id_i] = cluster_embeddings.mean(axis=0)
-
-                # Remove j
-                del clusters_map[id_j]
-                del cluster_centers[id_j]
-
-                merged = True
+        embeddings = np.asarray(embeddings, dtype=np.float64)
+        unit = self._normalize_rows(embeddings)
+
+        clusters: List[List[int]] = []
+        for bucket in self._bucket_indices(unit):
+            for members in self._average_linkage(unit[bucket]):
+                clusters.append([int(bucket[m]) for m in members])
 
         # Convert to OperationCluster objects
         operation_clusters = []
 
-        for cluster_id, indices in clusters_map.items():
+        for indices in sorted(clusters, key=min):
             if len(indices) < self.min_cluster_size:
                 continue
 
+            indices = sorted(indices)
             cluster_artifacts = [artifacts[i] for i in indices]
-            cluster_embeddings = embeddings[indices]
-
-            # Calculate average intra-cluster similarity
-            avg_similarity = 0.0
-            count = 0
-            for i in range(len(cluster_embeddings)):
-                for j in range(i + 1, len(cluster_embeddings)):
-                    avg_similarity += self._cosine_similarity(
-                        cluster_embeddings[i],
-                        cluster_embeddings[j]
-                    )
-                    count += 1
-
-            if count > 0:
-                avg_similarity /= count
+
+            # Average intra-cluster cosine similarity from the sum of unit
+            # vectors: sum_{i<j} u_i.u_j = (|sum u|^2 - sum |u|^2) / 2
+            cluster_unit = unit[indices]
+            k = len(indices)
+            if k > 1:
+                total = cluster_unit.sum(axis=0)
+                pair_sum = (total @ total - np.einsum('ij,ij->', cluster_unit, cluster_unit)) / 2
+                avg_similarity = pair_sum / (k * (k - 1) / 2)
             else:
                 avg_similarity = 1.0
 
             operation_type = self._infer_operation_type(cluster_artifacts)
 
             operation_clusters.append(OperationCluster(
-                cluster_id=cluster_id,
+                cluster_id=indices[0],
                 operation_type=operation_type,
                 artifacts=cluster_artifacts,
-                centroid=cluster_centers[cluster_id],
+                centroid=embeddings[indices].mean(axis=0),
                 similarity_score=float(avg_similarity),
                 suggested_tool_name="",
                 suggested_parameters=[],
@@ -234,6 +205,114 @@ class PatternClusterer:
 
         return operation_clusters
 
+    @staticmethod
+    def _normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+        """L2-normalize rows (zero vectors stay zero, i.e. similarity 0)."""
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return np.divide(embeddings, norms, out=np.zeros_like(embeddings), where=norms > 0)
+
+    def _bucket_indices(
+        self,
+        unit: np.ndarray,
+        rows: Optional[np.ndarray] = None,
+        depth: int = 0
+    ) -> List[np.ndarray]:
+        """
+        Split rows into buckets of at most max_bucket_size by random projection.
+
+        Rows on the same side of a few random hyperplanes through the
+        bucket's centroid share a bucket, so highly similar embeddings almost
+        always end up together. Buckets that are still too large (e.g. most
+        embeddings pointing the same way) are split again with new
+        hyperplanes. Small inputs are a single bucket (exact clustering).
+        """
+        if rows is None:
+            rows = np.arange(len(unit))
+        n = len(rows)
+        if n <= self.max_bucket_size:
+            return [rows]
+
+        bits = max(1, int(np.ceil(np.log2(n / self.max_bucket_size))))
+        rng = np.random.default_rng(depth)  # deterministic, new hyperplanes per level
+        points = unit[rows].astype(np.float32)
+        points -= points.mean(axis=0)
+        planes = rng.standard_normal((unit.shape[1], bits)).astype(np.float32)
+        codes = (points @ planes > 0).astype(np.int64) @ (1 << np.arange(bits))
+
+        buckets = [rows[codes == code] for code in np.unique(codes)]
+        if len(buckets) == 1:
+            # Identical rows: no hyperplane separates them
+            buckets = np.array_split(rows, int(np.ceil(n / self.max_bucket_size)))
+
+        return [
+            sub_bucket
+            for bucket in buckets
+            for sub_bucket in self._bucket_indices(unit, bucket, depth + 1)
+        ]
+
+    def _average_linkage(self, unit: np.ndarray) -> List[List[int]]:
+        """
+        Average-linkage agglomerative clustering on unit vectors.
+
+        The similarity matrix is computed once; after a merge, the merged
+        row is updated with the Lance-Williams formula
+        S(k, a+b) = (|a| S(k, a) + |b| S(k, b)) / (|a| + |b|).
+        Each row caches its nearest neighbour, so only rows that pointed at
+        a merged cluster are rescanned.
+
+        Args:
+            unit: L2-normalized embeddings
+
+        Returns:
+            Member index lists, one per cluster
+        """
+        n = len(unit)
+        members: Dict[int, List[int]] = {i: [i] for i in range(n)}
+        if n < 2:
+            return list(members.values())
+
+        # float32 before the product, so no float64 n x n matrix is built
+        unit = unit.astype(np.float32, copy=False)
+        sim = unit @ unit.T
+        np.fill_diagonal(sim, -np.inf)
+
+        sizes = np.ones(n)
+        active = np.ones(n, dtype=bool)
+        best_j = sim.argmax(axis=1)
+        best_sim = sim[np.arange(n), best_j]
+
+        while True:
+            i = int(best_sim.argmax())
+            if not best_sim[i] > self.similarity_threshold:
+                break
+
+            # Merge the higher id into the lower one
+            a, b = sorted((i, int(best_j[i])))
+            row = (sizes[a] * sim[a] + sizes[b] * sim[b]) / (sizes[a] + sizes[b])
+            sim[a, :] = row
+            sim[:, a] = row
+            sim[a, a] = -np.inf
+            sim[b, :] = -np.inf
+            sim[:, b] = -np.inf
+
+            sizes[a] += sizes[b]
+            active[b] = False
+            best_sim[b] = -np.inf
+            members[a].extend(members.pop(b))
+
+            # Rescan rows whose nearest neighbour was merged away
+            stale = np.flatnonzero(active & ((best_j == a) | (best_j == b)))
+            stale = np.union1d(stale, [a])
+            best_j[stale] = sim[stale].argmax(axis=1)
+            best_sim[stale] = sim[stale, best_j[stale]]
+
+            # Rows whose nearest neighbour is now the merged cluster
+            closer = active & (sim[:, a] > best_sim)
+            best_j[closer] = a
+            best_sim[closer] = sim[closer, a]
+
+        return list(members.values())
+
     def _infer_operation_type(self, artifacts: List[Any]) -> str:
         """
         Infer the operation type from artifact descriptions.
@@ -21,6 +21,7 @@ except ImportError:
     logger.warning("qdrant-client not installed. Install with: pip install qdrant-client")
 
 from .rag_memory import Artifact, ArtifactType
+from .embedding_client import get_embedding_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -251,40 +252,38 @@ class QdrantRAGMemory:
         Returns:
             Embedding vector or None if generation fails
         """
-        try:
-            import requests
-
-            # Use explicit embedding endpoint (not ollama_client.base_url)
-            # This ensures embeddings always use local Ollama even when LLM uses cloud API
-            response = requests.post(
-                f"{self.embedding_endpoint}/api/embed",
-                json={
-                    "model": self.embedding_model,
-                    "prompt": text
-                },
-                timeout=90  # Increased from 30s to allow for busy Ollama instances
-            )
+        # Concurrent callers are coalesced into micro-batches by the shared client
+        return self._check_embedding(self._embedding_client().embed(text))
 
-            response.raise_for_status()
-            data = response.json()
+    def _generate_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Generate embeddings for many texts in batched requests.
 
-            embedding = data.get("embedding")
-            if embedding:
-                logger.debug(f"✓ Generated embedding of dimension {len(embedding)}")
+        Args:
+            texts: Texts to embed
 
-                # Update vector size if different
-                if len(embedding) != self.vector_size:
-                    logger.warning(f"Embedding size {len(embedding)} differs from configured {self.vector_size}")
-                    self.vector_size = len(embedding)
+        Returns:
+            One embedding (or None) per text
+        """
+        return [self._check_embedding(e) for e in self._embedding_client().embed_many(texts)]
 
-                return embedding
+    def _embedding_client(self):
+        """
+        Shared pooled client for the embedding endpoint.
 
-        except Exception as e:
-            logger.error(f"Error generating embedding: {e}")
-            logger.error(f"  Endpoint: {self.embedding_endpoint}")
-            logger.error(f"  Model: {self.embedding_model}")
+        Uses the explicit embedding endpoint (not ollama_client.base_url) so
+        embeddings always use local Ollama even when the LLM uses a cloud API.
+        """
+        return get_embedding_client(
+            self.embedding_endpoint, self.embedding_model, str(self.memory_path / "embedding_cache")
+        )
 
-        return None
+    def _check_embedding(self, embedding: Optional[List[float]]) -> Optional[List[float]]:
+        """Track the actual vector size returned by the embedding model."""
+        if embedding and len(embedding) != self.vector_size:
+            logger.warning(f"Embedding size {len(embedding)} differs from configured {self.vector_size}")
+            self.vector_size = len(embedding)
+        return embedding
 
     def store_artifact(
         self,
@@ -316,8 +315,7 @@ class QdrantRAGMemory:
         # Generate embedding if requested
         embedding = None
         if auto_embed:
-            embed_text = f"{name}\n{description}\n{content[:500]}"
-            embedding = self._generate_embedding(embed_text)
+            embedding = self._generate_embedding(self._embed_text(name, description, content))
 
         # Create artifact
         artifact = Artifact(
@@ -340,44 +338,9 @@ class QdrantRAGMemory:
         # Store vector in Qdrant
         if embedding:
             try:
-                # Extract fitness dimensions from metadata for indexing
-                meta = metadata or {}
-
-                point = PointStruct(
-                    id=hash(artifact_id) & 0x7FFFFFFFFFFFFFFF,  # Convert to positive int
-                    vector=embedding,
-                    payload={
-                        "artifact_id": artifact_id,
-                        "artifact_type": artifact_type.value,
-                        "name": name,
-                        "description": description,
-                        "content": content,  # Store actual content in Qdrant
-                        "tags": tags,
-                        "quality_score": artifact.quality_score,
-                        "created_at": artifact.created_at,
-                        "metadata": meta,
-
-                        # FITNESS DIMENSIONS (indexed for fast filtering/search)
-                        # These enable queries like "find fast, cheap tools for this task"
-                        "speed_tier": meta.get("speed_tier", "medium"),
-                        "cost_tier": meta.get("cost_tier", "medium"),
-                        "quality_tier": meta.get("quality_tier", "good"),
-                        "latency_ms": float(meta.get("latency_ms", 0)),
-                        "memory_mb_peak": float(meta.get("memory_mb_peak", 0)),
-                        "success_count": int(meta.get("success_count", 0)),
-                        "total_runs": int(meta.get("total_runs", 0)),
-                        "success_rate": float(meta.get("success_count", 0)) / max(float(meta.get("total_runs", 1)), 1.0),
-
-                        # Tool characteristics for filtering
-                        "is_tool": bool(meta.get("is_tool", False)),
-                        "tool_id": str(meta.get("tool_id", "")),
-                        "max_output_length": meta.get("max_output_length", "medium"),
-                    }
-                )
-
                 self.qdrant.upsert(
                     collection_name=self.collection_name,
-                    points=[point]
+                    points=[self._build_point(artifact)]
                 )
 
                 logger.info(f"✓ Stored {artifact_type.value} in Qdrant: {artifact_id}")
@@ -387,6 +350,103 @@ class QdrantRAGMemory:
 
         return artifact
 
+    def store_artifacts_bulk(
+        self,
+        artifacts: List[Dict[str, Any]],
+        auto_embed: bool = True
+    ) -> List[Artifact]:
+        """
+        Store many artifacts with batched embedding requests and one upsert.
+
+        Args:
+            artifacts: List of dicts with the store_artifact() arguments
+                (artifact_id, artifact_type, name, description, content,
+                tags and optional metadata)
+            auto_embed: Whether to automatically generate embeddings
+
+        Returns:
+            Created Artifact objects, in input order
+        """
+        embeddings: List[Optional[List[float]]] = [None] * len(artifacts)
+        if auto_embed and artifacts:
+            embeddings = self._generate_embeddings([
+                self._embed_text(spec["name"], spec["description"], spec["content"])
+                for spec in artifacts
+            ])
+
+        stored = []
+        points = []
+        for spec, embedding in zip(artifacts, embeddings):
+            artifact = Artifact(
+                artifact_id=spec["artifact_id"],
+                artifact_type=spec["artifact_type"],
+                name=spec["name"],
+                description=spec["description"],
+                content=spec["content"],
+                tags=spec["tags"],
+                metadata=spec.get("metadata"),
+                embedding=embedding
+            )
+            self.artifacts[artifact.artifact_id] = artifact
+            self._update_tags_index(artifact.artifact_id, artifact.tags)
+            stored.append(artifact)
+            if embedding:
+                points.append(self._build_point(artifact))
+
+        # Metadata is written once for the whole batch
+        self._save_metadata()
+        self._save_tags_index()
+
+        if points:
+            try:
+                self.qdrant.upsert(collection_name=self.collection_name, points=points)
+                logger.info(f"✓ Stored {len(points)} vectors in Qdrant")
+            except Exception as e:
+                logger.error(f"Error storing vectors in Qdrant: {e}")
+
+        return stored
+
+    def _embed_text(self, name: str, description: str, content: str) -> str:
+        """Build the text embedded for an artifact."""
+        return f"{name}\n{description}\n{content[:500]}"
+
+    def _build_point(self, artifact: Artifact) -> "PointStruct":
+        """Build the Qdrant point (vector + payload) for an embedded artifact."""
+        # Extract fitness dimensions from metadata for indexing
+        meta = artifact.metadata or {}
+
+        return PointStruct(
+            id=hash(artifact.artifact_id) & 0x7FFFFFFFFFFFFFFF,  # Convert to positive int
+            vector=artifact.embedding,
+            payload={
+                "artifact_id": artifact.artifact_id,
+                "artifact_type": artifact.artifact_type.value,
+                "name": artifact.name,
+                "description": artifact.description,
+                "content": artifact.content,  # Store actual content in Qdrant
+                "tags": artifact.tags,
+                "quality_score": artifact.quality_score,
+                "created_at": artifact.created_at,
+                "metadata": meta,
+
+                # FITNESS DIMENSIONS (indexed for fast filtering/search)
+                # These enable queries like "find fast, cheap tools for this task"
+                "speed_tier": meta.get("speed_tier", "medium"),
+                "cost_tier": meta.get("cost_tier", "medium"),
+                "quality_tier": meta.get("quality_tier", "good"),
+                "latency_ms": float(meta.get("latency_ms", 0)),
+                "memory_mb_peak": float(meta.get("memory_mb_peak", 0)),
+                "success_count": int(meta.get("success_count", 0)),
+                "total_runs": int(meta.get("total_runs", 0)),
+                "success_rate": float(meta.get("success_count", 0)) / max(float(meta.get("total_runs", 1)), 1.0),
+
+                # Tool characteristics for filtering
+                "is_tool": bool(meta.get("is_tool", False)),
+                "tool_id": str(meta.get("tool_id", "")),
+                "max_output_length": meta.get("max_output_length", "medium"),
+            }
+        )
+
     def find_similar(
         self,
         query: str,
@@ -0,0 +1,184 @@
+"""
+Segmented append-only journal for RAG memory.
+
+Each mutation of RAGMemory (store, usage/quality update, delete) is written as a
+single JSON line to the active journal segment instead of re-serializing the
+whole index and embeddings matrix. At load time the journal is replayed on top
+of the last snapshot; a compaction folds it back into a fresh snapshot and
+drops the segments it covered.
+
+Layout:
+    rag_memory/journal/segment-00000001.jsonl
+    rag_memory/journal/segment-00000002.jsonl   <- active segment
+
+Records must be idempotent (full artifact state, absolute field values) so a
+crash between writing a snapshot and dropping its segments only causes the
+same records to be applied twice.
+"""
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+
+class RAGJournal:
+    """
+    Append-only, segmented JSON-lines journal.
+
+    Segments are rotated once they pass segment_max_bytes. Sealed segments are
+    only removed by drop_through() after the caller has persisted a snapshot
+    that covers them.
+    """
+
+    SEGMENT_PREFIX = "segment-"
+    SEGMENT_SUFFIX = ".jsonl"
+
+    def __init__(self, journal_path: Path, segment_max_bytes: int = 4 * 1024 * 1024):
+        """
+        Initialize journal.
+
+        Args:
+            journal_path: Directory holding the journal segments
+            segment_max_bytes: Size after which the active segment is sealed
+        """
+        self.journal_path = Path(journal_path)
+        self.journal_path.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+
+        self._lock = threading.Lock()
+        self._active_file = None
+
+        # Always start a fresh segment: the previous one may end in a torn line
+        segments = self._list_segments()
+        self._active_seq = segments[-1] + 1 if segments else 1
+        self._active_size = 0
+        self._pending_bytes = sum(self._segment_path(seq).stat().st_size for seq in segments)
+
+    def _segment_path(self, seq: int) -> Path:
+        return self.journal_path / f"{self.SEGMENT_PREFIX}{seq:08d}{self.SEGMENT_SUFFIX}"
+
+    def _list_segments(self) -> List[int]:
+        """Return sequence numbers of all segments on disk, oldest first."""
+        seqs = []
+        for path in self.journal_path.glob(f"{self.SEGMENT_PREFIX}*{self.SEGMENT_SUFFIX}"):
+            try:
+                seqs.append(int(path.name[len(self.SEGMENT_PREFIX):-len(self.SEGMENT_SUFFIX)]))
+            except ValueError:
+                logger.warning(f"Ignoring unexpected journal file: {path.name}")
+        return sorted(seqs)
+
+    @property
+    def pending_bytes(self) -> int:
+        """Bytes written to the journal that are not yet covered by a snapshot."""
+        return self._pending_bytes
+
+    def append(self, record: Dict[str, Any]):
+        """
+        Append a record to the active segment.
+
+        Args:
+            record: JSON-serializable record (must contain an "op" key)
+        """
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        data = line.encode("utf-8")
+
+        with self._lock:
+            if self._active_file is None:
+                self._active_file = open(self._segment_path(self._active_seq), "ab")
+
+            self._active_file.write(data)
+            self._active_file.flush()
+            self._active_size += len(data)
+            self._pending_bytes += len(data)
+
+            if self._active_size >= self.segment_max_bytes:
+                self._seal_active()
+
+    def _seal_active(self):
+        """Close the active segment and start a new one (lock must be held)."""
+        if self._active_file is not None:
+            self._active_file.close()
+            self._active_file = None
+        self._active_seq += 1
+        self._active_size = 0
+
+    def rotate(self) -> int:
+        """
+        Seal the active segment so a snapshot can be taken.
+
+        Returns:
+            Sequence number of the last sealed segment; everything up to and
+            including it is covered by a snapshot taken right now.
+        """
+        with self._lock:
+            sealed = self._active_seq
+            self._seal_active()
+            return sealed
+
+    def drop_through(self, seq: int):
+        """
+        Remove all segments with a sequence number <= seq.
+
+        Args:
+            seq: Value returned by rotate() once the snapshot is persisted
+        """
+        with self._lock:
+            for segment_seq in self._list_segments():
+                if segment_seq > seq:
+                    continue
+                path = self._segment_path(segment_seq)
+                try:
+                    size = path.stat().st_size
+                    path.unlink()
+                    self._pending_bytes = max(0, self._pending_bytes - size)
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.warning(f"Could not remove journal segment {path.name}: {e}")
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield all journal records in write order.
+
+        A torn or corrupt line (e.g. from a crash mid-append) is skipped with a
+        warning; everything after it is still applied.
+        """
+        for seq in self._list_segments():
+            path = self._segment_path(seq)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    for line_no, line in enumerate(f, 1):
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            yield json.loads(line)
+                        except json.JSONDecodeError:
+                            logger.warning(f"Skipping corrupt journal record {path.name}:{line_no}")
+            except FileNotFoundError:
+                continue
+
+    def reset(self):
+        """Remove every segment (used when the store is cleared)."""
+        with self._lock:
+            if self._active_file is not None:
+                self._active_file.close()
+                self._active_file = None
+            for seq in self._list_segments():
+                try:
+                    self._segment_path(seq).unlink()
+                except FileNotFoundError:
+                    pass
+            self._active_seq = 1
+            self._active_size = 0
+            self._pending_bytes = 0
+
+    def close(self):
+        """Close the active segment file handle."""
+        with self._lock:
+            if self._active_file is not None:
+                self._active_file.close()
+                self._active_file = None
@@ -4,6 +4,7 @@ Stores and retrieves plans, functions, sub-workflows, and workflows using embedd
 """
 import json
 import logging
+import threading
 import numpy as np
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
@@ -11,6 +12,15 @@ from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass, field, asdict
 
+try:
+    from .rag_journal import RAGJournal
+    from .rag_vector_index import VectorIndex
+    from .embedding_client import get_embedding_client
+except ImportError:
+    from rag_journal import RAGJournal
+    from rag_vector_index import VectorIndex
+    from embedding_client import get_embedding_client
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -329,7 +339,9 @@ class RAGMemory:
         memory_path: str = "./rag_memory",
         ollama_client: Optional[Any] = None,
         embedding_model: str = "nomic-embed-text",
-        max_content_length: int = 1000
+        max_content_length: int = 1000,
+        compact_threshold_bytes: int = 16 * 1024 * 1024,
+        fragmentation_threshold: float = 0.25
     ):
         """
         Initialize RAG memory.
@@ -339,6 +351,10 @@ class RAGMemory:
             ollama_client: OllamaClient for generating embeddings
             embedding_model: Model to use for embeddings
             max_content_length: Max content length for embedding generation
+            compact_threshold_bytes: Journal size that triggers a background
+                compaction into index.json/embeddings.npy/tags_index.json
+            fragmentation_threshold: Fraction of tombstoned embedding rows at
+                which compaction repacks (and fully rewrites) embeddings.npy
         """
         self.memory_path = Path(memory_path)
         self.memory_path.mkdir(parents=True, exist_ok=True)
@@ -353,16 +369,35 @@ class RAGMemory:
 
         self.index_path = self.memory_path / "index.json"
         self.embeddings_path = self.memory_path / "embeddings.npy"
+        self.embedding_rows_path = self.memory_path / "embedding_rows.json"  # row -> artifact_id
         self.tags_index_path = self.memory_path / "tags_index.json"
 
         # In-memory storage
         self.artifacts: Dict[str, Artifact] = {}
-        self.embeddings_matrix: Optional[np.ndarray] = None
-        self.artifact_id_to_index: Dict[str, int] = {}
+        self.vector_index = VectorIndex()  # normalized embeddings + type/tag masks
         self.tags_index: Dict[str, List[str]] = {}  # tag -> [artifact_ids]
 
+        # Append-only journal: mutations are logged here and folded into the
+        # snapshot files above by compact()
+        self.compact_threshold_bytes = compact_threshold_bytes
+        self.fragmentation_threshold = fragmentation_threshold
+        self.journal = RAGJournal(self.memory_path / "journal")
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._compact_thread: Optional[threading.Thread] = None
+
         self._load_memory()
 
+    @property
+    def embeddings_matrix(self) -> Optional[np.ndarray]:
+        """L2-normalized embedding rows (see vector_index for the row mapping)."""
+        return self.vector_index.matrix
+
+    @property
+    def artifact_id_to_index(self) -> Dict[str, int]:
+        """Mapping of artifact ID to row in embeddings_matrix."""
+        return self.vector_index.id_to_row
+
     def _load_memory(self):
         """Load artifacts and embeddings from disk with auto-recovery."""
         # Load index
@@ -430,19 +465,8 @@ class RAGMemory:
                 self.artifacts = {}
                 self._save_index()
 
-        # Load embeddings matrix
-        if self.embeddings_path.exists():
-            try:
-                self.embeddings_matrix = np.load(self.embeddings_path)
-
-                # Rebuild artifact_id_to_index mapping
-                artifact_ids = sorted(self.artifacts.keys())
-                self.artifact_id_to_index = {aid: i for i, aid in enumerate(artifact_ids)}
-
-                logger.info(f"✓ Loaded embeddings matrix: {self.embeddings_matrix.shape}")
-
-            except Exception as e:
-                logger.error(f"Error loading embeddings: {e}")
+        # Load embeddings matrix and its persisted row -> artifact_id map
+        self._load_vectors()
 
         # Load tags index
         if self.tags_index_path.exists():
@@ -476,70 +500,235 @@ class RAGMemory:
                 logger.error(f"Error loading tags index: {e}")
                 self.tags_index = {}
 
-    def _save_index(self):
-        """Save artifacts index to disk with retry logic for file locking."""
-        import time
-        max_retries = 5
-        retry_delay = 0.1  # 100ms
+        # Replay journal on top of the snapshot
+        self._replay_journal()
 
-        for attempt in range(max_retries):
-            try:
-                index = {aid: artifact.to_dict() for aid, artifact in self.artifacts.items()}
+    def _load_vectors(self):
+        """
+        Restore the vector index from embeddings.npy + embedding_rows.json.
 
-                # Write to temp file first, then atomic rename
-                temp_path = self.index_path.with_suffix('.json.tmp')
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    json.dump(index, f, indent=2)
+        Rows are only trusted for artifacts that still exist with an embedding;
+        anything else is tombstoned, and artifacts missing from the row map
+        (or a legacy embeddings.npy without one) are indexed from the
+        embedding stored on the artifact.
+        """
+        restored = False
+        if self.embeddings_path.exists() and self.embedding_rows_path.exists():
+            try:
+                with open(self.embedding_rows_path, 'r', encoding='utf-8') as f:
+                    layout = json.load(f)
 
-                # Atomic rename (Windows handles this better than direct write)
-                temp_path.replace(self.index_path)
-                return  # Success!
+                if layout.get("row_ids"):
+                    self.vector_index.restore(np.load(self.embeddings_path), layout["row_ids"])
+                    restored = True
 
-            except PermissionError as e:
-                # File is locked by another process
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (attempt + 1))  # Exponential backoff
-                else:
-                    logger.warning(f"Could not save index after {max_retries} attempts (file locked)")
             except Exception as e:
-                logger.error(f"Error saving index: {e}")
-                break
+                logger.warning(f"Could not restore embeddings ({e}); rebuilding from artifacts")
+                self.vector_index.clear()
 
-    def _save_embeddings(self):
-        """Save embeddings matrix to disk."""
-        if self.embeddings_matrix is not None:
+        if restored:
+            for artifact_id in list(self.vector_index.id_to_row):
+                artifact = self.artifacts.get(artifact_id)
+                if artifact is None or not artifact.embedding:
+                    self.vector_index.remove(artifact_id)
+
+        for artifact in self.artifacts.values():
+            if artifact.artifact_id in self.vector_index:
+                self.vector_index.set_filters(artifact.artifact_id, artifact.artifact_type.value, artifact.tags)
+            else:
+                self._index_embedding(artifact)
+
+        if len(self.vector_index):
+            logger.info(f"✓ Loaded embeddings: {len(self.vector_index)} rows (dim {self.vector_index.dim})")
+
+    def _replay_journal(self):
+        """Apply journal records written since the last compaction."""
+        replayed = 0
+        for record in self.journal.replay():
             try:
-                np.save(self.embeddings_path, self.embeddings_matrix)
+                self._apply_record(record)
+                replayed += 1
             except Exception as e:
-                logger.error(f"Error saving embeddings: {e}")
+                logger.warning(f"Skipping unreadable journal record: {e}")
 
-    def _save_tags_index(self):
-        """Save tags index to disk with retry logic for file locking."""
+        if replayed:
+            logger.info(f"✓ Replayed {replayed} journal records")
+
+    def _apply_record(self, record: Dict[str, Any]):
+        """
+        Apply a single journal record to in-memory state.
+
+        Records are idempotent so replaying one that is already part of the
+        snapshot is harmless.
+        """
+        op = record.get("op")
+
+        if op == "put":
+            artifact = Artifact.from_dict(record["artifact"])
+            self.artifacts[artifact.artifact_id] = artifact
+            self._update_tags_index(artifact.artifact_id, artifact.tags)
+            self._index_embedding(artifact)
+
+        elif op == "set":
+            artifact = self.artifacts.get(record["artifact_id"])
+            if artifact is not None:
+                for key, value in record.get("fields", {}).items():
+                    setattr(artifact, key, value)
+
+        elif op == "delete":
+            self._remove_artifact(record["artifact_id"])
+
+        else:
+            raise ValueError(f"unknown journal op: {op!r}")
+
+    def _log_record(self, record: Dict[str, Any]):
+        """Append a record to the journal and compact if it has grown too large."""
+        self.journal.append(record)
+        if self.journal.pending_bytes >= self.compact_threshold_bytes:
+            self._schedule_compaction()
+
+    def _schedule_compaction(self):
+        """Start a background compaction unless one is already running."""
+        if self._compact_thread is not None and self._compact_thread.is_alive():
+            return
+
+        self._compact_thread = threading.Thread(
+            target=self.compact,
+            name="rag-journal-compaction",
+            daemon=True
+        )
+        self._compact_thread.start()
+
+    def compact(self):
+        """
+        Fold the journal into the snapshot files and drop covered segments.
+
+        State is captured under the memory lock together with a journal
+        rotation, so the snapshot contains exactly the records in the sealed
+        segments. Files are then written outside the lock; segments are only
+        removed once all snapshot files are in place.
+
+        embeddings.npy is only rewritten when the row layout changed (growth,
+        or a repack once fragmentation passes fragmentation_threshold);
+        otherwise just the rows touched since the last compaction are
+        written in place.
+        """
+        with self._compact_lock:
+            with self._lock:
+                sealed_seq = self.journal.rotate()
+                if self.vector_index.needs_repack(self.fragmentation_threshold):
+                    self.vector_index.repack()
+                vector_state = self.vector_index.persistable_state()
+                index = {aid: artifact.to_dict() for aid, artifact in self.artifacts.items()}
+                index_json = json.dumps(index, indent=2)
+                tags_json = json.dumps(self.tags_index, indent=2)
+
+            # Vectors first: index.json must never reference rows newer than the map
+            vectors_saved = self._save_embeddings(vector_state)
+            if not vectors_saved:
+                with self._lock:
+                    self.vector_index.layout_changed = True  # force a full rewrite next time
+
+            saved = (
+                vectors_saved
+                and self._write_atomic(self.tags_index_path, tags_json)
+                and self._write_atomic(self.index_path, index_json)
+            )
+
+            if saved:
+                self.journal.drop_through(sealed_seq)
+                logger.debug(f"✓ Compacted RAG journal through segment {sealed_seq}")
+            else:
+                logger.warning("RAG journal compaction incomplete; journal kept for replay")
+
+    def close(self):
+        """Wait for background compaction, compact remaining journal, release files."""
+        if self._compact_thread is not None:
+            self._compact_thread.join()
+        if self.journal.pending_bytes:
+            self.compact()
+        self.journal.close()
+
+    def _write_atomic(self, path: Path, text: str) -> bool:
+        """Write text to a temp file and atomically rename it, retrying on file locks."""
         import time
         max_retries = 5
         retry_delay = 0.1  # 100ms
 
         for attempt in range(max_retries):
             try:
-                # Write to temp file first, then atomic rename
-                temp_path = self.tags_index_path.with_suffix('.json.tmp')
+                temp_path = path.with_suffix(path.suffix + '.tmp')
                 with open(temp_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.tags_index, f, indent=2)
+                    f.write(text)
 
-                # Atomic rename
-                temp_path.replace(self.tags_index_path)
-                return  # Success!
+                # Atomic rename (Windows handles this better than direct write)
+                temp_path.replace(path)
+                return True
 
-            except PermissionError as e:
+            except PermissionError:
                 # File is locked by another process
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay * (attempt + 1))  # Exponential backoff
                 else:
-                    logger.warning(f"Could not save tags_index after {max_retries} attempts (file locked)")
+                    logger.warning(f"Could not save {path.name} after {max_retries} attempts (file locked)")
             except Exception as e:
-                logger.error(f"Error saving tags index: {e}")
+                logger.error(f"Error saving {path.name}: {e}")
                 break
 
+        return False
+
+    def _save_index(self):
+        """Save artifacts index to disk (temp file + atomic rename)."""
+        index = {aid: artifact.to_dict() for aid, artifact in self.artifacts.items()}
+        self._write_atomic(self.index_path, json.dumps(index, indent=2))
+
+    def _save_embeddings(self, vector_state: Dict[str, Any]) -> bool:
+        """
+        Persist vector index changes to embeddings.npy + embedding_rows.json.
+
+        Args:
+            vector_state: Result of VectorIndex.persistable_state()
+
+        Returns:
+            True if both files were written
+        """
+        try:
+            if vector_state["dim"] is not None:
+                if vector_state["full"]:
+                    # Full rewrite: temp file + atomic rename
+                    temp_path = self.embeddings_path.with_suffix('.npy.tmp')
+                    with open(temp_path, 'wb') as f:
+                        np.save(f, vector_state["vectors"])
+                    temp_path.replace(self.embeddings_path)
+
+                elif vector_state["vectors"]:
+                    # Same layout: update touched rows in place
+                    expected_shape = (vector_state["capacity"], vector_state["dim"])
+                    matrix = np.lib.format.open_memmap(self.embeddings_path, mode='r+')
+                    try:
+                        if matrix.shape != expected_shape or matrix.dtype != np.float32:
+                            raise ValueError(f"on-disk shape {matrix.shape} != {expected_shape}")
+                        for row, vector in vector_state["vectors"].items():
+                            matrix[row] = vector
+                        matrix.flush()
+                    finally:
+                        del matrix
+
+        except Exception as e:
+            logger.error(f"Error saving embeddings: {e}")
+            return False
+
+        layout = {
+            "dim": vector_state["dim"],
+            "capacity": vector_state["capacity"],
+            "row_ids": vector_state["row_ids"]
+        }
+        return self._write_atomic(self.embedding_rows_path, json.dumps(layout))
+
+    def _save_tags_index(self):
+        """Save tags index to disk (temp file + atomic rename)."""
+        self._write_atomic(self.tags_index_path, json.dumps(self.tags_index, indent=2))
+
     def _update_tags_index(self, artifact_id: str, tags: List[str]):
         """Update tags index with artifact."""
         for tag in tags:
@@ -563,32 +752,36 @@ class RAGMemory:
             logger.warning("OllamaClient not configured, cannot generate embeddings")
             return None
 
-        try:
-            # Use Ollama's embeddings API
-            import requests
-
-            endpoint = self.ollama_client.base_url
-            response = requests.post(
-                f"{endpoint}/api/embed",
-                json={
-                    "model": self.embedding_model,
-                    "prompt": text
-                },
-                timeout=30
-            )
+        # Shared pooled client; concurrent callers are coalesced into micro-batches
+        client = get_embedding_client(
+            self.ollama_client.base_url, self.embedding_model, str(self.memory_path / "embedding_cache")
+        )
+        return client.embed(text)
 
-            response.raise_for_status()
-            data = response.json()
+    def _generate_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Generate embeddings for many texts in batched requests.
 
-            embedding = data.get("embedding")
-            if embedding:
-                logger.debug(f"✓ Generated embedding of dimension {len(embedding)}")
-                return embedding
+        Args:
+            texts: Texts to embed
 
-        except Exception as e:
-            logger.error(f"Error generating embedding: {e}")
+        Returns:
+            One embedding (or None) per text
+        """
+        if not self.ollama_client:
+            logger.warning("OllamaClient not configured, cannot generate embeddings")
+            return [None] * len(texts)
 
-        return None
+        client = get_embedding_client(
+            self.ollama_client.base_url, self.embedding_model, str(self.memory_path / "embedding_cache")
+        )
+        return client.embed_many(texts)
+
+    def _embed_text(self, name: str, description: str, content: str) -> str:
+        """Build the text embedded for an artifact."""
+        # Truncate content to configured max length
+        truncated_content = content[:self.max_content_length] if len(content) > self.max_content_length else content
+        return f"{name}\n{description}\n{truncated_content}"
 
     def store_artifact(
         self,
@@ -620,10 +813,7 @@ class RAGMemory:
         # Generate embedding if requested
         embedding = None
         if auto_embed:
-            # Truncate content to configured max length
-            truncated_content = content[:self.max_content_length] if len(content) > self.max_content_length else content
-            embed_text = f"{name}\n{description}\n{truncated_content}"
-            embedding = self._generate_embedding(embed_text)
+            embedding = self._generate_embedding(self._embed_text(name, description, content))
 
         # Create artifact
         artifact = Artifact(
@@ -637,37 +827,80 @@ class RAGMemory:
             embedding=embedding
         )
 
-        # Store in memory
-        self.artifacts[artifact_id] = artifact
-
-        # Update tags index
-        self._update_tags_index(artifact_id, tags)
-
-        # Update embeddings matrix
-        if embedding:
-            self._add_embedding(artifact_id, embedding)
-
-        # Save to disk
-        self._save_index()
-        self._save_embeddings()
-        self._save_tags_index()
+        self._put_artifact(artifact)
 
         logger.info(f"✓ Stored {artifact_type.value}: {artifact_id}")
 
         return artifact
 
-    def _add_embedding(self, artifact_id: str, embedding: List[float]):
-        """Add embedding to the matrix."""
-        embedding_array = np.array(embedding, dtype=np.float32)
+    def store_artifacts_bulk(
+        self,
+        artifacts: List[Dict[str, Any]],
+        auto_embed: bool = True
+    ) -> List[Artifact]:
+        """
+        Store many artifacts, embedding them in batched requests.
+
+        Args:
+            artifacts: List of dicts with the store_artifact() arguments
+                (artifact_id, artifact_type, name, description, content,
+                tags and optional metadata)
+            auto_embed: Whether to automatically generate embeddings
 
-        if self.embeddings_matrix is None:
-            # Initialize matrix
-            self.embeddings_matrix = embedding_array.reshape(1, -1)
-            self.artifact_id_to_index = {artifact_id: 0}
+        Returns:
+            Created Artifact objects, in input order
+        """
+        embeddings: List[Optional[List[float]]] = [None] * len(artifacts)
+        if auto_embed and artifacts:
+            embeddings = self._generate_embeddings([
+                self._embed_text(spec["name"], spec["description"], spec["content"])
+                for spec in artifacts
+            ])
+
+        stored = []
+        for spec, embedding in zip(artifacts, embeddings):
+            artifact = Artifact(
+                artifact_id=spec["artifact_id"],
+                artifact_type=spec["artifact_type"],
+                name=spec["name"],
+                description=spec["description"],
+                content=spec["content"],
+                tags=spec["tags"],
+                metadata=spec.get("metadata"),
+                embedding=embedding
+            )
+            self._put_artifact(artifact)
+            stored.append(artifact)
+
+        logger.info(f"✓ Stored {len(stored)} artifacts in bulk")
+        return stored
+
+    def _put_artifact(self, artifact: Artifact):
+        """Insert an artifact into memory, indexes and the journal."""
+        with self._lock:
+            # Store in memory
+            self.artifacts[artifact.artifact_id] = artifact
+
+            # Update tags index
+            self._update_tags_index(artifact.artifact_id, artifact.tags)
+
+            # Update vector index
+            self._index_embedding(artifact)
+
+            # Persist as a single journal record (artifact, tags and vector)
+            self._log_record({"op": "put", "artifact": artifact.to_dict()})
+
+    def _index_embedding(self, artifact: Artifact):
+        """Insert, overwrite or drop the artifact's row in the vector index."""
+        if artifact.embedding:
+            self.vector_index.add(
+                artifact.artifact_id,
+                artifact.embedding,
+                artifact.artifact_type.value,
+                artifact.tags
+            )
         else:
-            # Append to matrix
-            self.embeddings_matrix = np.vstack([self.embeddings_matrix, embedding_array])
-            self.artifact_id_to_index[artifact_id] = len(self.artifact_id_to_index)
+            self.vector_index.remove(artifact.artifact_id)
 
     def find_similar(
         self,
@@ -693,50 +926,24 @@ class RAGMemory:
         # Generate query embedding
         query_embedding = self._generate_embedding(query)
 
-        if not query_embedding or self.embeddings_matrix is None:
+        if not query_embedding or not len(self.vector_index):
             logger.warning("Cannot perform semantic search, falling back to keyword search")
             return self.search_by_keywords(query, artifact_type, tags, top_k)
 
-        # Calculate cosine similarity
-        query_vec = np.array(query_embedding, dtype=np.float32)
-        query_norm = np.linalg.norm(query_vec)
-
-        if query_norm == 0:
-            return []
-
-        # Normalize query vector
-        query_vec = query_vec / query_norm
-
-        # Calculate similarities
-        similarities = []
-        artifact_ids = sorted(self.artifacts.keys())
-
-        for i, artifact_id in enumerate(artifact_ids):
-            artifact = self.artifacts[artifact_id]
-
-            # Apply filters
-            if artifact_type and artifact.artifact_type != artifact_type:
-                continue
-
-            if tags and not any(tag in artifact.tags for tag in tags):
-                continue
-
-            # Get embedding vector
-            if i < len(self.embeddings_matrix):
-                artifact_vec = self.embeddings_matrix[i]
-                artifact_norm = np.linalg.norm(artifact_vec)
-
-                if artifact_norm > 0:
-                    artifact_vec = artifact_vec / artifact_norm
-                    similarity = np.dot(query_vec, artifact_vec)
-
-                    if similarity >= min_similarity:
-                        similarities.append((artifact, float(similarity)))
-
-        # Sort by similarity descending
-        similarities.sort(key=lambda x: x[1], reverse=True)
-
-        return similarities[:top_k]
+        # Single masked matrix-vector product + top-k over the normalized index
+        with self._lock:
+            matches = self.vector_index.search(
+                query_embedding,
+                top_k=top_k,
+                min_similarity=min_similarity,
+                artifact_type=artifact_type.value if artifact_type else None,
+                tags=tags
+            )
+            return [
+                (self.artifacts[artifact_id], similarity)
+                for artifact_id, similarity in matches
+                if artifact_id in self.artifacts
+            ]
 
     def search_by_keywords(
         self,
@@ -842,9 +1049,15 @@ class RAGMemory:
 
     def increment_usage(self, artifact_id: str):
         """Increment usage counter for artifact."""
-        if artifact_id in self.artifacts:
-            self.artifacts[artifact_id].usage_count += 1
-            self._save_index()
+        with self._lock:
+            if artifact_id in self.artifacts:
+                artifact = self.artifacts[artifact_id]
+                artifact.usage_count += 1
+                self._log_record({
+                    "op": "set",
+                    "artifact_id": artifact_id,
+                    "fields": {"usage_count": artifact.usage_count}
+                })
 
     def update_quality_score(self, artifact_id: str, score: float):
         """
@@ -854,9 +1067,15 @@ class RAGMemory:
             artifact_id: Artifact identifier
             score: Quality score (0.0 to 1.0)
         """
-        if artifact_id in self.artifacts:
-            self.artifacts[artifact_id].quality_score = max(0.0, min(1.0, score))
-            self._save_index()
+        with self._lock:
+            if artifact_id in self.artifacts:
+                artifact = self.artifacts[artifact_id]
+                artifact.quality_score = max(0.0, min(1.0, score))
+                self._log_record({
+                    "op": "set",
+                    "artifact_id": artifact_id,
+                    "fields": {"quality_score": artifact.quality_score}
+                })
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get memory statistics."""
@@ -926,6 +1145,20 @@ class RAGMemory:
 
     def delete_artifact(self, artifact_id: str) -> bool:
         """Delete an artifact."""
+        with self._lock:
+            if not self._remove_artifact(artifact_id):
+                return False
+
+            self._log_record({"op": "delete", "artifact_id": artifact_id})
+
+            if self.vector_index.needs_repack(self.fragmentation_threshold):
+                self._schedule_compaction()
+
+        logger.info(f"✓ Deleted artifact: {artifact_id}")
+        return True
+
+    def _remove_artifact(self, artifact_id: str) -> bool:
+        """Remove an artifact from in-memory state. Returns False if unknown."""
         if artifact_id not in self.artifacts:
             return False
 
@@ -938,16 +1171,10 @@ class RAGMemory:
                 if not self.tags_index[tag]:
                     del self.tags_index[tag]
 
-        # Remove from artifacts
+        # Remove from artifacts and vector index
         del self.artifacts[artifact_id]
+        self.vector_index.remove(artifact_id)
 
-        # TODO: Remove from embeddings matrix (requires rebuilding)
-
-        # Save changes
-        self._save_index()
-        self._save_tags_index()
-
-        logger.info(f"✓ Deleted artifact: {artifact_id}")
         return True
 
     def clear_collection(self):
@@ -964,11 +1191,13 @@ class RAGMemory:
         import numpy as np
 
         try:
+            # Drop journal so cleared artifacts are not replayed
+            self.journal.reset()
+
             # Clear in-memory structures
             self.artifacts.clear()
             self.tags_index.clear()
-            self.embeddings_matrix = np.array([])
-            self.artifact_id_list = []
+            self.vector_index.clear()
 
             # Clear artifacts directory (contains actual artifact JSON files)
             if self.artifacts_path.exists():
@@ -981,8 +1210,10 @@ class RAGMemory:
                 json.dump({"artifacts": []}, f, indent=2)
             logger.info(f"OK Reset metadata index: {self.index_path}")
 
-            # Reset embeddings.npy
+            # Reset embeddings.npy and its row map
             np.save(self.embeddings_path, np.array([]))
+            if self.embedding_rows_path.exists():
+                self.embedding_rows_path.unlink()
             logger.info(f"OK Reset embeddings: {self.embeddings_path}")
 
             # Reset tags_index.json
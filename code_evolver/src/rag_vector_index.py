@@ -0,0 +1,371 @@
+"""
+In-memory vector index for RAG memory.
+
+Keeps an L2-normalized float32 matrix of artifact embeddings together with
+per-row artifact type codes and per-tag boolean masks, so a similarity query
+is a single matrix-vector product plus an argpartition top-k instead of a
+Python loop over every artifact.
+
+Storage grows by doubling, so adding a row is amortized O(1). Deleted rows
+are tombstoned and their slots reused by later inserts; repack() squeezes the
+tombstones out once fragmentation gets too high. Rows touched since the last
+persist are tracked so the backing .npy can be updated in place.
+"""
+import logging
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class VectorIndex:
+    """
+    Normalized embedding matrix with type/tag filter masks.
+
+    Rows are addressed by artifact ID. Re-adding an existing ID overwrites its
+    row in place; removing an ID tombstones the row and puts it on the free
+    list for the next insert.
+    """
+
+    NO_TYPE = -1
+    REPACK_MIN_FREE_ROWS = 64
+
+    def __init__(self, initial_capacity: int = 64):
+        """
+        Initialize an empty index.
+
+        Args:
+            initial_capacity: Number of rows to allocate on first insert
+        """
+        self.initial_capacity = initial_capacity
+        self.dim: Optional[int] = None
+
+        self._vectors: Optional[np.ndarray] = None     # (capacity, dim) float32, normalized
+        self._type_codes: Optional[np.ndarray] = None  # (capacity,) int16, NO_TYPE = dead row
+        self._tag_masks: Dict[str, np.ndarray] = {}    # tag -> (capacity,) bool
+        self._row_tags: Dict[int, Set[str]] = {}       # row -> tags set in _tag_masks
+        self._type_to_code: Dict[str, int] = {}
+
+        self.row_ids: List[Optional[str]] = []         # row -> artifact_id (None = tombstone)
+        self.id_to_row: Dict[str, int] = {}
+        self.size = 0                                  # rows in use (live + tombstones)
+        self._free_rows: List[int] = []                # tombstoned rows available for reuse
+
+        # Change tracking for persistence
+        self.dirty_rows: Set[int] = set()
+        self.layout_changed = True                     # row layout/capacity changed: full rewrite
+
+    @property
+    def capacity(self) -> int:
+        return 0 if self._vectors is None else self._vectors.shape[0]
+
+    @property
+    def matrix(self) -> Optional[np.ndarray]:
+        """View of the normalized rows in use (including dead rows)."""
+        if self._vectors is None:
+            return None
+        return self._vectors[:self.size]
+
+    @property
+    def tombstones(self) -> np.ndarray:
+        """Boolean bitmap of tombstoned rows among the rows in use."""
+        if self._type_codes is None:
+            return np.zeros(0, dtype=bool)
+        return self._type_codes[:self.size] == self.NO_TYPE
+
+    @property
+    def fragmentation(self) -> float:
+        """Fraction of rows in use that are tombstones."""
+        return len(self._free_rows) / self.size if self.size else 0.0
+
+    def needs_repack(self, threshold: float) -> bool:
+        """Whether enough rows are tombstoned to make a repack worthwhile."""
+        return len(self._free_rows) >= self.REPACK_MIN_FREE_ROWS and self.fragmentation > threshold
+
+    def __len__(self) -> int:
+        return len(self.id_to_row)
+
+    def __contains__(self, artifact_id: str) -> bool:
+        return artifact_id in self.id_to_row
+
+    @staticmethod
+    def normalize(vector: Iterable[float]) -> Optional[np.ndarray]:
+        """Return vector as a unit-length float32 array, or None if it is zero."""
+        vec = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(vec)
+        if norm == 0 or not np.isfinite(norm):
+            return None
+        return vec / norm
+
+    def _grow(self, min_capacity: int):
+        """Grow all row arrays to at least min_capacity (doubling)."""
+        new_capacity = max(self.initial_capacity, self.capacity)
+        while new_capacity < min_capacity:
+            new_capacity *= 2
+
+        self.layout_changed = True
+        vectors = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        type_codes = np.full(new_capacity, self.NO_TYPE, dtype=np.int16)
+        if self._vectors is not None:
+            vectors[:self.size] = self._vectors[:self.size]
+            type_codes[:self.size] = self._type_codes[:self.size]
+        self._vectors = vectors
+        self._type_codes = type_codes
+
+        for tag, mask in self._tag_masks.items():
+            grown = np.zeros(new_capacity, dtype=bool)
+            grown[:self.size] = mask[:self.size]
+            self._tag_masks[tag] = grown
+
+    def _type_code(self, artifact_type: str) -> int:
+        code = self._type_to_code.get(artifact_type)
+        if code is None:
+            code = len(self._type_to_code)
+            self._type_to_code[artifact_type] = code
+        return code
+
+    def add(
+        self,
+        artifact_id: str,
+        vector: Iterable[float],
+        artifact_type: str,
+        tags: Iterable[str] = ()
+    ) -> bool:
+        """
+        Insert or overwrite the row for an artifact.
+
+        Args:
+            artifact_id: Artifact identifier
+            vector: Raw embedding (normalized here)
+            artifact_type: ArtifactType value used for type filtering
+            tags: Tags used for tag filtering
+
+        Returns:
+            True if the vector was indexed, False if it was rejected
+        """
+        vec = self.normalize(vector)
+        if vec is None:
+            return False
+
+        if self.dim is None:
+            self.dim = vec.shape[0]
+        elif vec.shape[0] != self.dim:
+            logger.warning(
+                f"Embedding dimension {vec.shape[0]} for {artifact_id} does not match index dimension {self.dim}"
+            )
+            return False
+
+        row = self.id_to_row.get(artifact_id)
+        if row is None:
+            row = self._allocate_row(artifact_id)
+
+        self._vectors[row] = vec
+        self.dirty_rows.add(row)
+        self.set_filters(artifact_id, artifact_type, tags)
+        return True
+
+    def _allocate_row(self, artifact_id: str) -> int:
+        """Reuse a tombstoned slot if possible, otherwise append a row."""
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self.row_ids[row] = artifact_id
+        else:
+            row = self.size
+            if row >= self.capacity:
+                self._grow(row + 1)
+            self.size += 1
+            self.row_ids.append(artifact_id)
+        self.id_to_row[artifact_id] = row
+        return row
+
+    def set_filters(self, artifact_id: str, artifact_type: str, tags: Iterable[str] = ()):
+        """
+        Set the type code and tag masks for an indexed artifact.
+
+        Args:
+            artifact_id: Artifact identifier (must already be indexed)
+            artifact_type: ArtifactType value
+            tags: Tags for the artifact (replaces previous tags)
+        """
+        row = self.id_to_row[artifact_id]
+        self._clear_tags(row)
+        self._type_codes[row] = self._type_code(artifact_type)
+
+        row_tags = set(tags)
+        for tag in row_tags:
+            mask = self._tag_masks.get(tag)
+            if mask is None:
+                mask = np.zeros(self.capacity, dtype=bool)
+                self._tag_masks[tag] = mask
+            mask[row] = True
+        self._row_tags[row] = row_tags
+
+    def _clear_tags(self, row: int):
+        for tag in self._row_tags.pop(row, ()):
+            self._tag_masks[tag][row] = False
+
+    def remove(self, artifact_id: str) -> bool:
+        """
+        Tombstone an artifact's row and make the slot reusable.
+
+        Returns:
+            True if the artifact was indexed
+        """
+        row = self.id_to_row.pop(artifact_id, None)
+        if row is None:
+            return False
+
+        self.row_ids[row] = None
+        self._type_codes[row] = self.NO_TYPE
+        self._clear_tags(row)
+        self._vectors[row] = 0.0
+        self._free_rows.append(row)
+        self.dirty_rows.add(row)
+        return True
+
+    def clear(self):
+        """Drop every row."""
+        self.__init__(self.initial_capacity)
+
+    def repack(self):
+        """
+        Move live rows into a contiguous prefix and shrink storage.
+
+        Row numbers change, so the next persist must rewrite the whole file.
+        """
+        live_rows = [row for row in range(self.size) if self.row_ids[row] is not None]
+
+        capacity = self.initial_capacity
+        while capacity < len(live_rows):
+            capacity *= 2
+
+        vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+        type_codes = np.full(capacity, self.NO_TYPE, dtype=np.int16)
+        vectors[:len(live_rows)] = self._vectors[live_rows]
+        type_codes[:len(live_rows)] = self._type_codes[live_rows]
+
+        tag_masks = {}
+        for tag, mask in self._tag_masks.items():
+            packed = np.zeros(capacity, dtype=bool)
+            packed[:len(live_rows)] = mask[live_rows]
+            if packed.any():
+                tag_masks[tag] = packed
+
+        self._vectors = vectors
+        self._type_codes = type_codes
+        self._tag_masks = tag_masks
+        self._row_tags = {new_row: self._row_tags.get(row, set()) for new_row, row in enumerate(live_rows)}
+        self.row_ids = [self.row_ids[row] for row in live_rows]
+        self.id_to_row = {artifact_id: row for row, artifact_id in enumerate(self.row_ids)}
+        self.size = len(live_rows)
+        self._free_rows = []
+        self.dirty_rows = set()
+        self.layout_changed = True
+
+    def restore(self, vectors: np.ndarray, row_ids: List[Optional[str]]):
+        """
+        Load persisted rows (as written by persistable_state()).
+
+        Type codes and tag masks are not persisted; callers must follow up
+        with set_filters() for every live row.
+
+        Args:
+            vectors: (capacity, dim) normalized float32 matrix
+            row_ids: Artifact ID per row in use, None for tombstones
+        """
+        if vectors.ndim != 2 or vectors.shape[0] < len(row_ids):
+            raise ValueError(f"vector file shape {vectors.shape} does not cover {len(row_ids)} rows")
+
+        self.clear()
+        self.dim = vectors.shape[1]
+        self._vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self._type_codes = np.full(vectors.shape[0], self.NO_TYPE, dtype=np.int16)
+        self.row_ids = list(row_ids)
+        self.size = len(row_ids)
+        self.id_to_row = {aid: row for row, aid in enumerate(self.row_ids) if aid is not None}
+        self._free_rows = [row for row, aid in enumerate(self.row_ids) if aid is None]
+        self.layout_changed = False
+
+    def persistable_state(self) -> Dict[str, object]:
+        """
+        Capture the changes since the last persist and reset change tracking.
+
+        Returns:
+            Dict with "full" (rewrite whole file), "vectors" (full matrix copy
+            or {row: vector} for dirty rows), "row_ids", "dim" and "capacity"
+        """
+        if self._vectors is None:
+            state = {"full": True, "vectors": None, "row_ids": [], "dim": None, "capacity": 0}
+        elif self.layout_changed:
+            state = {"full": True, "vectors": self._vectors.copy()}
+        else:
+            state = {"full": False, "vectors": {row: self._vectors[row].copy() for row in self.dirty_rows}}
+
+        state.setdefault("row_ids", list(self.row_ids))
+        state.setdefault("dim", self.dim)
+        state.setdefault("capacity", self.capacity)
+
+        self.dirty_rows = set()
+        self.layout_changed = False
+        return state
+
+    def search(
+        self,
+        query_vector: Iterable[float],
+        top_k: int = 5,
+        min_similarity: float = 0.5,
+        artifact_type: Optional[str] = None,
+        tags: Optional[List[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Cosine-similarity top-k search.
+
+        Args:
+            query_vector: Raw query embedding
+            top_k: Maximum number of results
+            min_similarity: Minimum cosine similarity
+            artifact_type: Optional ArtifactType value filter
+            tags: Optional tag filter (any match)
+
+        Returns:
+            List of (artifact_id, similarity) sorted by similarity descending
+        """
+        if self.size == 0 or top_k <= 0:
+            return []
+
+        query = self.normalize(query_vector)
+        if query is None or query.shape[0] != self.dim:
+            return []
+
+        type_codes = self._type_codes[:self.size]
+        if artifact_type is not None:
+            code = self._type_to_code.get(artifact_type)
+            if code is None:
+                return []
+            mask = type_codes == code
+        else:
+            mask = type_codes != self.NO_TYPE
+
+        if tags:
+            tag_mask = np.zeros(self.size, dtype=bool)
+            for tag in tags:
+                tag_rows = self._tag_masks.get(tag)
+                if tag_rows is not None:
+                    tag_mask |= tag_rows[:self.size]
+            mask &= tag_mask
+
+        scores = self._vectors[:self.size] @ query
+        mask &= scores >= min_similarity
+
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return []
+
+        candidate_scores = scores[candidates]
+        if candidates.size > top_k:
+            top = np.argpartition(-candidate_scores, top_k - 1)[:top_k]
+            candidates = candidates[top]
+            candidate_scores = candidate_scores[top]
+
+        order = np.argsort(-candidate_scores, kind="stable")
+        return [(self.row_ids[candidates[i]], float(candidate_scores[i])) for i in order]
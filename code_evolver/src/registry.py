@@ -3,10 +3,13 @@ File-based registry for storing node definitions, metrics, and evaluations.
 """
 import json
 import logging
+import shutil
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from .registry_index import JSONRegistryIndex, SQLiteRegistryIndex
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -14,23 +17,32 @@ logger = logging.getLogger(__name__)
 class Registry:
     """File-based registry for managing code evolution nodes."""
 
-    def __init__(self, registry_path: str = "./registry"):
+    def __init__(self, registry_path: str = "./registry", index_backend: str = "sqlite"):
         """
         Initialize registry.
 
         Args:
             registry_path: Path to registry directory
+            index_backend: "sqlite" (index.db, migrates an existing
+                index.json) or "json" (index.json)
         """
         self.registry_path = Path(registry_path)
         self.index_path = self.registry_path / "index.json"
+        self.index_backend = index_backend
         self._ensure_registry_exists()
 
     def _ensure_registry_exists(self):
         """Create registry directory structure if it doesn't exist."""
-        self.registry_path.mkdir(parents=True, exist_ok=True)
-        if not self.index_path.exists():
-            self._save_json(self.index_path, {"nodes": []})
+        if not self.registry_path.exists():
             logger.info(f"Created new registry at {self.registry_path}")
+        self.registry_path.mkdir(parents=True, exist_ok=True)
+
+        if self.index_backend == "sqlite":
+            self.index = SQLiteRegistryIndex(self.registry_path / "index.db", legacy_json=self.index_path)
+        elif self.index_backend == "json":
+            self.index = JSONRegistryIndex(self.index_path)
+        else:
+            raise ValueError(f"Unknown registry index backend: {self.index_backend}")
 
     def _save_json(self, path: Path, data: Dict[str, Any]):
         """Save data as JSON file."""
@@ -208,37 +220,76 @@ class Registry:
             tags: List of tags
             score_overall: Overall evaluation score
         """
-        index = self._load_json(self.index_path)
-        if "nodes" not in index:
-            index["nodes"] = []
-
-        # Remove existing entry for this node
-        index["nodes"] = [n for n in index["nodes"] if n.get("node_id") != node_id]
-
-        # Add updated entry
-        index["nodes"].append({
+        self.index.upsert({
             "node_id": node_id,
             "version": version,
             "tags": tags,
             "score_overall": score_overall,
             "updated_at": datetime.utcnow().isoformat() + "Z"
         })
+        logger.info(f"✓ Updated index for '{node_id}' (score: {score_overall:.2f})")
 
-        # Sort by score descending
-        index["nodes"].sort(key=lambda x: x.get("score_overall", 0), reverse=True)
+    def list_nodes(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        tag: Optional[str] = None,
+        prefix: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List nodes in the registry, highest score first.
 
-        self._save_json(self.index_path, index)
-        logger.info(f"✓ Updated index for '{node_id}' (score: {score_overall:.2f})")
+        Args:
+            limit: Maximum entries to return (None for all)
+            offset: Entries to skip (for pagination)
+            tag: Only nodes with this tag
+            prefix: Only nodes whose ID starts with this prefix
+
+        Returns:
+            List of node entries from index
+        """
+        return self.index.list(limit=limit, offset=offset, tag=tag, prefix=prefix)
 
-    def list_nodes(self) -> List[Dict[str, Any]]:
+    def top_nodes(self, k: int = 10, tag: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        List all nodes in the registry.
+        Get the k highest-scoring nodes.
+
+        Args:
+            k: Number of nodes
+            tag: Only nodes with this tag
 
         Returns:
             List of node entries from index
         """
-        index = self._load_json(self.index_path)
-        return index.get("nodes", [])
+        return self.index.list(limit=k, tag=tag)
+
+    def get_index_entry(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a node's index entry (version, tags, score).
+
+        Args:
+            node_id: Node identifier
+
+        Returns:
+            Index entry or None if the node is not indexed
+        """
+        return self.index.get(node_id)
+
+    def remove_from_index(self, node_id: str) -> bool:
+        """
+        Remove a node from the index (its directory is kept).
+
+        Args:
+            node_id: Node identifier
+
+        Returns:
+            True if the node was indexed
+        """
+        return self.index.delete(node_id)
+
+    def count_nodes(self) -> int:
+        """Number of nodes in the index."""
+        return self.index.count()
 
     def get_node_dir(self, node_id: str) -> Path:
         """
@@ -265,3 +316,20 @@ class Registry:
         artifacts_dir = self.registry_path / node_id / "artifacts"
         artifacts_dir.mkdir(parents=True, exist_ok=True)
         return artifacts_dir
+
+    def reset(self):
+        """
+        Delete every node and start an empty index.
+
+        Use this rather than removing the registry directory while a Registry
+        is open: the SQLite index keeps its connection open, and would keep
+        using the deleted database file.
+        """
+        self.close()
+        shutil.rmtree(self.registry_path, ignore_errors=True)
+        self._ensure_registry_exists()
+        logger.info(f"Reset registry at {self.registry_path}")
+
+    def close(self):
+        """Close the index backend."""
+        self.index.close()
@@ -0,0 +1,252 @@
+"""
+Index backends for the node registry.
+
+The registry index holds one entry per node (node_id, version, tags,
+score_overall, updated_at) and is listed by score, best first.
+
+- SQLiteRegistryIndex (default): registry/index.db with indexes on
+  node_id, tags and score. An update is a single transactional upsert,
+  and top-k queries read only the rows they return.
+- JSONRegistryIndex: the original registry/index.json layout, rewritten
+  in full on every update.
+
+An existing index.json is migrated into index.db the first time the
+SQLite backend opens it.
+"""
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    node_id TEXT PRIMARY KEY,
+    version TEXT,
+    score_overall REAL NOT NULL DEFAULT 0,
+    updated_at TEXT,
+    updated_seq INTEGER NOT NULL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_nodes_score ON nodes (score_overall DESC, updated_seq);
+CREATE INDEX IF NOT EXISTS idx_nodes_seq ON nodes (updated_seq);
+CREATE TABLE IF NOT EXISTS node_tags (
+    tag TEXT NOT NULL,
+    node_id TEXT NOT NULL REFERENCES nodes (node_id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, node_id)
+);
+CREATE INDEX IF NOT EXISTS idx_node_tags_node ON node_tags (node_id);
+"""
+
+
+class JSONRegistryIndex:
+    """Registry index stored as a single JSON file."""
+
+    def __init__(self, index_path: Path):
+        """
+        Initialize index.
+
+        Args:
+            index_path: Path to index.json
+        """
+        self.index_path = Path(index_path)
+        if not self.index_path.exists():
+            self._save([])
+
+    def _load(self) -> List[Dict[str, Any]]:
+        if not self.index_path.exists():
+            return []
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get("nodes", [])
+
+    def _save(self, nodes: List[Dict[str, Any]]):
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump({"nodes": nodes}, f, indent=2)
+
+    def upsert(self, entry: Dict[str, Any]):
+        """Add or replace a node's entry."""
+        # Remove existing entry for this node
+        nodes = [n for n in self._load() if n.get("node_id") != entry["node_id"]]
+        nodes.append(entry)
+
+        # Sort by score descending
+        nodes.sort(key=lambda x: x.get("score_overall", 0), reverse=True)
+        self._save(nodes)
+
+    def get(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Get a node's entry."""
+        return next((n for n in self._load() if n.get("node_id") == node_id), None)
+
+    def delete(self, node_id: str) -> bool:
+        """Remove a node's entry."""
+        nodes = self._load()
+        remaining = [n for n in nodes if n.get("node_id") != node_id]
+        self._save(remaining)
+        return len(remaining) != len(nodes)
+
+    def list(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        tag: Optional[str] = None,
+        prefix: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """List entries by score (see Registry.list_nodes)."""
+        nodes = self._load()
+        if tag is not None:
+            nodes = [n for n in nodes if tag in n.get("tags", [])]
+        if prefix is not None:
+            nodes = [n for n in nodes if n.get("node_id", "").startswith(prefix)]
+        return nodes[offset:] if limit is None else nodes[offset:offset + limit]
+
+    def count(self) -> int:
+        """Number of indexed nodes."""
+        return len(self._load())
+
+    def close(self):
+        pass
+
+
+class SQLiteRegistryIndex:
+    """Registry index stored in an embedded SQLite database."""
+
+    def __init__(self, db_path: Path, legacy_json: Optional[Path] = None):
+        """
+        Initialize index.
+
+        Args:
+            db_path: Path to index.db
+            legacy_json: index.json to migrate from (if it exists)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+
+        if legacy_json is not None and Path(legacy_json).exists():
+            self.migrate_from_json(Path(legacy_json))
+
+    def _upsert(self, entry: Dict[str, Any]):
+        """Upsert inside the caller's transaction."""
+        node_id = entry["node_id"]
+        self._conn.execute(
+            """
+            INSERT INTO nodes (node_id, version, score_overall, updated_at, updated_seq, entry)
+            VALUES (?, ?, ?, ?, (SELECT COALESCE(MAX(updated_seq), 0) + 1 FROM nodes), ?)
+            ON CONFLICT (node_id) DO UPDATE SET
+                version = excluded.version,
+                score_overall = excluded.score_overall,
+                updated_at = excluded.updated_at,
+                updated_seq = excluded.updated_seq,
+                entry = excluded.entry
+            """,
+            (
+                node_id,
+                entry.get("version"),
+                entry.get("score_overall") or 0,
+                entry.get("updated_at"),
+                json.dumps(entry)
+            )
+        )
+        self._conn.execute("DELETE FROM node_tags WHERE node_id = ?", (node_id,))
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO node_tags (tag, node_id) VALUES (?, ?)",
+            [(tag, node_id) for tag in entry.get("tags") or []]
+        )
+
+    def upsert(self, entry: Dict[str, Any]):
+        """Add or replace a node's entry (one transaction)."""
+        with self._lock, self._conn:
+            self._upsert(entry)
+
+    def get(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Get a node's entry."""
+        with self._lock:
+            row = self._conn.execute("SELECT entry FROM nodes WHERE node_id = ?", (node_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, node_id: str) -> bool:
+        """Remove a node's entry."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM nodes WHERE node_id = ?", (node_id,))
+        return cursor.rowcount > 0
+
+    def list(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        tag: Optional[str] = None,
+        prefix: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """List entries by score (see Registry.list_nodes)."""
+        sql = "SELECT n.entry FROM nodes n"
+        where = []
+        params: List[Any] = []
+
+        if tag is not None:
+            sql += " JOIN node_tags t ON t.node_id = n.node_id AND t.tag = ?"
+            params.append(tag)
+        if prefix:
+            # Range scan on the primary key instead of LIKE (no escaping needed)
+            where.append("n.node_id >= ? AND n.node_id < ?")
+            params.extend([prefix, prefix + "\U0010ffff"])
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+
+        # Equal scores keep the order they were last updated in
+        sql += " ORDER BY n.score_overall DESC, n.updated_seq LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit, offset])
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self) -> int:
+        """Number of indexed nodes."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+
+    def migrate_from_json(self, index_path: Path) -> int:
+        """
+        Import a JSON index (one-shot) and rename it to index.json.migrated.
+
+        Entries already in the database are kept.
+
+        Args:
+            index_path: Path to index.json
+
+        Returns:
+            Number of entries imported
+        """
+        with open(index_path, 'r', encoding='utf-8') as f:
+            nodes = json.load(f).get("nodes", [])
+
+        # Insert in list order so that equal scores keep their relative order
+        imported = 0
+        with self._lock, self._conn:
+            for entry in nodes:
+                node_id = entry.get("node_id")
+                if not node_id:
+                    continue
+                exists = self._conn.execute("SELECT 1 FROM nodes WHERE node_id = ?", (node_id,)).fetchone()
+                if not exists:
+                    self._upsert(entry)
+                    imported += 1
+
+        index_path.replace(index_path.with_name(index_path.name + ".migrated"))
+        logger.info(f"✓ Migrated {imported} registry index entries from {index_path.name} to {self.db_path.name}")
+        return imported
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,31 +1,148 @@
 """
 Solution Memory System - Caches solutions and strategies for reuse.
 Stores problem descriptions, strategies, and solutions for quick lookup.
-Future: Will integrate with RAG system for semantic similarity search.
+
+The solution index is held in memory together with an inverted keyword
+index (token -> solution IDs). Index changes are appended to a journal
+and folded into index.json by compact(), so storing a solution does not
+rewrite the whole index. Solution bodies are loaded from disk lazily,
+only for the results that are returned.
 """
+import heapq
 import json
 import hashlib
 import logging
+import math
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
 
+try:
+    from .rag_journal import RAGJournal
+except ImportError:
+    from rag_journal import RAGJournal
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def tokenize(text: str) -> Set[str]:
+    """Keyword set of a problem description (lowercased, whitespace-split)."""
+    return set(text.lower().split())
+
+
+class KeywordIndex:
+    """
+    Inverted index answering "which documents have Jaccard similarity >=
+    threshold with this token set" without scanning every document.
+
+    Uses prefix filtering: with the query's tokens ordered rarest first, any
+    document reaching the threshold must contain one of the first
+    q - ceil(threshold * q) + 1 of them, so only those postings are read.
+    Candidates are then checked exactly against their stored token sets.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Set[str]] = {}  # token -> document IDs
+        self.documents: Dict[str, frozenset] = {}  # document ID -> tokens
+
+    def add(self, doc_id: str, tokens: Set[str]):
+        """Add or replace a document."""
+        self.remove(doc_id)
+        tokens = frozenset(tokens)
+        self.documents[doc_id] = tokens
+        for token in tokens:
+            self.postings.setdefault(token, set()).add(doc_id)
+
+    def remove(self, doc_id: str):
+        """Remove a document (no-op if absent)."""
+        tokens = self.documents.pop(doc_id, None)
+        if not tokens:
+            return
+        for token in tokens:
+            ids = self.postings.get(token)
+            if ids is not None:
+                ids.discard(doc_id)
+                if not ids:
+                    del self.postings[token]
+
+    def search(self, tokens: Set[str], threshold: float) -> Dict[str, float]:
+        """
+        Find documents by Jaccard similarity.
+
+        Args:
+            tokens: Query tokens
+            threshold: Minimum Jaccard similarity (0.0 to 1.0)
+
+        Returns:
+            Document ID -> similarity for every document at or above threshold
+        """
+        query_size = len(tokens)
+        if query_size == 0:
+            return {}
+
+        if threshold <= 0:
+            # Everything qualifies (documents sharing no token score 0)
+            return {doc_id: self._jaccard(tokens, doc_tokens) for doc_id, doc_tokens in self.documents.items()}
+
+        # Rarest tokens first; unknown tokens have no postings at all
+        ordered = sorted(tokens, key=lambda t: len(self.postings.get(t, ())))
+        prefix_length = query_size - math.ceil(threshold * query_size - 1e-9) + 1
+
+        candidates: Set[str] = set()
+        for token in ordered[:prefix_length]:
+            candidates.update(self.postings.get(token, ()))
+
+        # A document of size d can only reach the threshold if
+        # threshold * q <= d <= q / threshold
+        min_size = threshold * query_size - 1e-9
+        max_size = query_size / threshold + 1e-9
+
+        matches = {}
+        for doc_id in candidates:
+            doc_tokens = self.documents[doc_id]
+            if not min_size <= len(doc_tokens) <= max_size:
+                continue
+            similarity = self._jaccard(tokens, doc_tokens)
+            if similarity >= threshold:
+                matches[doc_id] = similarity
+        return matches
+
+    @staticmethod
+    def _jaccard(a: Set[str], b: frozenset) -> float:
+        union = len(a | b)
+        return len(a & b) / union if union else 0.0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+
 class SolutionMemory:
     """
     In-memory and persistent storage for solutions and strategies.
     Enables reuse of known solutions for identical or similar problems.
     """
 
-    def __init__(self, memory_path: str = "./memory"):
+    def __init__(
+        self,
+        memory_path: str = "./memory",
+        embedding_client: Optional[Any] = None,
+        cache_size: int = 100,
+        compact_threshold_bytes: int = 4 * 1024 * 1024
+    ):
         """
         Initialize solution memory.
 
         Args:
             memory_path: Path to memory storage directory
+            embedding_client: Optional client with embed(text) (e.g.
+                get_embedding_client()) used to re-rank similar problems
+            cache_size: Solution bodies kept in memory
+            compact_threshold_bytes: Journal size that triggers folding it
+                into index.json
         """
         self.memory_path = Path(memory_path)
         self.memory_path.mkdir(parents=True, exist_ok=True)
@@ -34,40 +151,77 @@ class SolutionMemory:
         self.solutions_path = self.memory_path / "solutions"
         self.solutions_path.mkdir(parents=True, exist_ok=True)
 
-        # In-memory cache for fast lookup
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.embedding_client = embedding_client
+        self.cache_size = cache_size
+        self.compact_threshold_bytes = compact_threshold_bytes
+
+        # In-memory cache for fast lookup (least recently used evicted)
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        # Solution index and keyword index, kept in memory
+        self.index: Dict[str, Dict[str, Any]] = {}
+        self.keywords = KeywordIndex()
+        self.journal = RAGJournal(self.memory_path / "index_journal")
+        self._lock = threading.RLock()
 
         self._load_index()
 
     def _load_index(self):
-        """Load solution index into memory."""
-        if not self.index_path.exists():
-            self._save_index({})
-            return
-
-        try:
-            with open(self.index_path, 'r', encoding='utf-8') as f:
-                index = json.load(f)
+        """Load solution index (snapshot plus journal) into memory."""
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.index = json.load(f)
+            except Exception as e:
+                logger.error(f"Error loading index: {e}")
+                self.index = {}
+
+        for record in self.journal.replay():
+            if record.get("op") == "put":
+                self.index[record["solution_id"]] = record["entry"]
+            elif record.get("op") == "delete":
+                self.index.pop(record["solution_id"], None)
+
+        for solution_id, metadata in self.index.items():
+            self.keywords.add(solution_id, self._entry_tokens(metadata))
 
-            # Load recent solutions into cache
-            for solution_id, metadata in index.items():
-                if len(self.cache) < 100:  # Keep top 100 in memory
-                    solution = self._load_solution(solution_id)
-                    if solution:
-                        self.cache[solution_id] = solution
+        if not self.index_path.exists():
+            self._save_index(self.index)
 
-            logger.info(f"✓ Loaded {len(index)} solutions from memory")
+        logger.info(f"✓ Loaded {len(self.index)} solutions from memory")
 
-        except Exception as e:
-            logger.error(f"Error loading index: {e}")
+    @staticmethod
+    def _entry_tokens(metadata: Dict[str, Any]) -> Set[str]:
+        # Older index entries only have the (truncated) problem text
+        if "tokens" in metadata:
+            return set(metadata["tokens"])
+        return tokenize(metadata.get("problem", ""))
 
-    def _save_index(self, index: Dict[str, Any]):
-        """Save solution index to disk."""
+    def _save_index(self, index: Dict[str, Any]) -> bool:
+        """Save solution index to disk (atomically)."""
         try:
-            with open(self.index_path, 'w', encoding='utf-8') as f:
+            tmp_path = self.index_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(index, f, indent=2)
+            os.replace(tmp_path, self.index_path)
+            return True
         except Exception as e:
             logger.error(f"Error saving index: {e}")
+            return False
+
+    def compact(self):
+        """Fold the index journal into index.json."""
+        with self._lock:
+            sealed_seq = self.journal.rotate()
+            snapshot = dict(self.index)
+
+        if self._save_index(snapshot):
+            self.journal.drop_through(sealed_seq)
+
+    def _log_index_change(self, record: Dict[str, Any]):
+        self.journal.append(record)
+        if self.journal.pending_bytes >= self.compact_threshold_bytes:
+            self.compact()
 
     def _load_solution(self, solution_id: str) -> Optional[Dict[str, Any]]:
         """Load a solution from disk."""
@@ -83,6 +237,26 @@ class SolutionMemory:
             logger.error(f"Error loading solution {solution_id}: {e}")
             return None
 
+    def _get_solution(self, solution_id: str) -> Optional[Dict[str, Any]]:
+        """Get a solution from the cache, loading it from disk on a miss."""
+        with self._lock:
+            solution = self.cache.get(solution_id)
+            if solution is not None:
+                self.cache.move_to_end(solution_id)
+                return solution
+
+        solution = self._load_solution(solution_id)
+        if solution is not None:
+            self._cache_put(solution_id, solution)
+        return solution
+
+    def _cache_put(self, solution_id: str, solution: Dict[str, Any]):
+        with self._lock:
+            self.cache[solution_id] = solution
+            self.cache.move_to_end(solution_id)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
     def _save_solution(self, solution_id: str, solution: Dict[str, Any]):
         """Save a solution to disk."""
         solution_file = self.solutions_path / f"{solution_id}.json"
@@ -155,7 +329,7 @@ class SolutionMemory:
         self._save_solution(solution_id, solution)
 
         # Update cache
-        self.cache[solution_id] = solution
+        self._cache_put(solution_id, solution)
 
         # Update index
         self._update_index(solution_id, solution)
@@ -165,16 +339,10 @@ class SolutionMemory:
 
     def _update_index(self, solution_id: str, solution: Dict[str, Any]):
         """Update the index with solution metadata."""
-        # Load current index
-        if self.index_path.exists():
-            with open(self.index_path, 'r', encoding='utf-8') as f:
-                index = json.load(f)
-        else:
-            index = {}
-
-        # Add/update entry
-        index[solution_id] = {
+        tokens = tokenize(solution["problem"])
+        entry = {
             "problem": solution["problem"][:100],
+            "tokens": sorted(tokens),
             "node_id": solution["node_id"],
             "tags": solution["tags"],
             "score": solution.get("evaluation", {}).get("score_overall", 0),
@@ -182,8 +350,10 @@ class SolutionMemory:
             "reuse_count": solution.get("reuse_count", 0)
         }
 
-        # Save index
-        self._save_index(index)
+        with self._lock:
+            self.index[solution_id] = entry
+            self.keywords.add(solution_id, tokens)
+            self._log_index_change({"op": "put", "solution_id": solution_id, "entry": entry})
 
     def find_exact(self, problem_description: str) -> Optional[Dict[str, Any]]:
         """
@@ -207,7 +377,7 @@ class SolutionMemory:
         solution = self._load_solution(solution_id)
         if solution:
             logger.info(f"✓ Found exact match on disk: {solution_id}")
-            self.cache[solution_id] = solution
+            self._cache_put(solution_id, solution)
             self._increment_reuse(solution_id)
             return solution
 
@@ -215,12 +385,18 @@ class SolutionMemory:
 
     def _increment_reuse(self, solution_id: str):
         """Increment reuse counter for a solution."""
-        solution = self.cache.get(solution_id) or self._load_solution(solution_id)
+        solution = self._get_solution(solution_id)
         if solution:
             solution["reuse_count"] = solution.get("reuse_count", 0) + 1
             solution["updated_at"] = datetime.utcnow().isoformat() + "Z"
             self._save_solution(solution_id, solution)
-            self.cache[solution_id] = solution
+            self._cache_put(solution_id, solution)
+
+            with self._lock:
+                entry = self.index.get(solution_id)
+                if entry is not None:
+                    entry["reuse_count"] = solution["reuse_count"]
+                    self._log_index_change({"op": "put", "solution_id": solution_id, "entry": entry})
 
     def find_by_tags(self, tags: List[str], min_score: float = 0.7) -> List[Dict[str, Any]]:
         """
@@ -233,27 +409,15 @@ class SolutionMemory:
         Returns:
             List of matching solutions
         """
-        matches = []
-
-        # Load index
-        if not self.index_path.exists():
-            return matches
-
-        with open(self.index_path, 'r', encoding='utf-8') as f:
-            index = json.load(f)
+        search_tags = set(tags)
 
-        # Find matches
-        for solution_id, metadata in index.items():
-            solution_tags = set(metadata.get("tags", []))
-            search_tags = set(tags)
+        with self._lock:
+            matching_ids = [
+                solution_id for solution_id, metadata in self.index.items()
+                if search_tags & set(metadata.get("tags", [])) and metadata.get("score", 0) >= min_score
+            ]
 
-            # Check for tag overlap
-            if solution_tags & search_tags:  # Intersection
-                score = metadata.get("score", 0)
-                if score >= min_score:
-                    solution = self._load_solution(solution_id)
-                    if solution:
-                        matches.append(solution)
+        matches = [s for s in (self._get_solution(sid) for sid in matching_ids) if s]
 
         # Sort by score
         matches.sort(key=lambda x: x.get("evaluation", {}).get("score_overall", 0), reverse=True)
@@ -261,56 +425,87 @@ class SolutionMemory:
         logger.info(f"✓ Found {len(matches)} solutions matching tags: {tags}")
         return matches
 
-    def find_similar(self, problem_description: str, threshold: float = 0.8) -> List[Dict[str, Any]]:
+    def _embed(self, text: str) -> Optional[List[float]]:
+        try:
+            return self.embedding_client.embed(text)
+        except Exception as e:
+            logger.warning(f"Embedding failed, using keyword similarity only: {e}")
+            return None
+
+    @staticmethod
+    def _cosine(a: List[float], b: List[float]) -> float:
+        dot = sum(x * y for x, y in zip(a, b))
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return dot / norm if norm else 0.0
+
+    def find_similar(
+        self,
+        problem_description: str,
+        threshold: float = 0.8,
+        limit: Optional[int] = None,
+        rerank_candidates: int = 50
+    ) -> List[Dict[str, Any]]:
         """
-        Find similar problems (placeholder for future RAG implementation).
+        Find similar problems.
+
+        Candidates come from the inverted keyword index (Jaccard similarity
+        of the problem keywords >= threshold). With an embedding client,
+        the best rerank_candidates of them are re-ranked by embedding
+        similarity of the problem text.
 
         Args:
             problem_description: Problem description
-            threshold: Similarity threshold (0.0 to 1.0)
+            threshold: Keyword similarity threshold (0.0 to 1.0)
+            limit: Maximum solutions to return (None for all matches)
+            rerank_candidates: Candidates re-ranked by embedding similarity
 
         Returns:
-            List of similar solutions
-
-        Note:
-            Current implementation uses simple keyword matching.
-            Future: Will use embeddings and vector similarity.
+            List of similar solutions, most similar first, each with
+            "similarity" (and "semantic_similarity" when re-ranked)
         """
-        # Simple keyword-based similarity for now
-        keywords = set(problem_description.lower().split())
-
-        matches = []
-
-        # Load index
-        if not self.index_path.exists():
-            return matches
-
-        with open(self.index_path, 'r', encoding='utf-8') as f:
-            index = json.load(f)
-
-        # Find similar problems
-        for solution_id, metadata in index.items():
-            problem = metadata.get("problem", "").lower()
-            problem_keywords = set(problem.split())
-
-            # Calculate simple similarity (Jaccard index)
-            intersection = keywords & problem_keywords
-            union = keywords | problem_keywords
-
-            if len(union) > 0:
-                similarity = len(intersection) / len(union)
+        with self._lock:
+            matches = self.keywords.search(tokenize(problem_description), threshold)
 
-                if similarity >= threshold:
-                    solution = self._load_solution(solution_id)
-                    if solution:
-                        solution["similarity"] = similarity
-                        matches.append(solution)
+        def keyword_rank(item):
+            return (item[1], self.index.get(item[0], {}).get("score", 0))
 
-        # Sort by similarity
-        matches.sort(key=lambda x: x.get("similarity", 0), reverse=True)
-
-        logger.info(f"✓ Found {len(matches)} similar solutions")
-        return matches
+        if limit is None:
+            ranked = sorted(matches.items(), key=keyword_rank, reverse=True)
+        else:
+            ranked = heapq.nlargest(
+                max(limit, rerank_candidates) if self.embedding_client else limit,
+                matches.items(),
+                key=keyword_rank
+            )
+
+        semantic: Dict[str, float] = {}
+        if self.embedding_client is not None and ranked:
+            query_embedding = self._embed(problem_description)
+            if query_embedding is not None:
+                head = ranked[:rerank_candidates]
+                for solution_id, _ in head:
+                    solution = self._get_solution(solution_id)
+                    embedding = self._embed(solution["problem"]) if solution else None
+                    if embedding is not None:
+                        semantic[solution_id] = self._cosine(query_embedding, embedding)
+                head.sort(key=lambda item: semantic.get(item[0], -1.0), reverse=True)
+                ranked = head + ranked[rerank_candidates:]
+
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        # Load solution bodies only for the results
+        results = []
+        for solution_id, similarity in ranked:
+            solution = self._get_solution(solution_id)
+            if solution:
+                result = dict(solution, similarity=similarity)
+                if solution_id in semantic:
+                    result["semantic_similarity"] = semantic[solution_id]
+                results.append(result)
+
+        logger.info(f"✓ Found {len(results)} similar solutions")
+        return results
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -319,11 +514,8 @@ class SolutionMemory:
         Returns:
             Statistics dictionary
         """
-        if not self.index_path.exists():
-            return {"total_solutions": 0}
-
-        with open(self.index_path, 'r', encoding='utf-8') as f:
-            index = json.load(f)
+        with self._lock:
+            index = dict(self.index)
 
         total_reuses = sum(m.get("reuse_count", 0) for m in index.values())
         avg_score = sum(m.get("score", 0) for m in index.values()) / len(index) if index else 0
@@ -354,24 +546,19 @@ class SolutionMemory:
         Args:
             min_score: Minimum score to keep
         """
-        if not self.index_path.exists():
-            return
-
-        with open(self.index_path, 'r', encoding='utf-8') as f:
-            index = json.load(f)
+        with self._lock:
+            removed_ids = [sid for sid, metadata in self.index.items() if metadata.get("score", 0) < min_score]
 
-        removed = 0
-        new_index = {}
+            for solution_id in removed_ids:
+                del self.index[solution_id]
+                self.keywords.remove(solution_id)
+                self.cache.pop(solution_id, None)
+                self.journal.append({"op": "delete", "solution_id": solution_id})
 
-        for solution_id, metadata in index.items():
-            if metadata.get("score", 0) >= min_score:
-                new_index[solution_id] = metadata
-            else:
                 # Remove solution file
                 solution_file = self.solutions_path / f"{solution_id}.json"
                 if solution_file.exists():
                     solution_file.unlink()
-                removed += 1
 
-        self._save_index(new_index)
-        logger.info(f"✓ Pruned {removed} low-quality solutions")
+        self.compact()
+        logger.info(f"✓ Pruned {len(removed_ids)} low-quality solutions")
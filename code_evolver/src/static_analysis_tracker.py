@@ -3,15 +3,37 @@ Static Analysis Result Tracker
 
 Captures and stores static analysis results for code quality tracking,
 RAG retrieval, and optimizer feedback loops.
+
+Validators are executed inside Python (a validator script's __main__ runs
+with sys.argv set and stdout captured) instead of one subprocess per
+validator:
+
+- auto-fixers run first, one after another, because they may rewrite the
+  file the other checks read
+- the read-only checks then run concurrently in a process pool
+- results are cached by (validator, validator script hash, file content
+  hash), so an unchanged file is not analyzed again
+- analyze_files() analyzes many files with the same pool
 """
 
+import hashlib
+import io
 import json
-import subprocess
+import logging
+import os
+import sys
+import threading
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass, asdict
 import time
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ValidatorResult:
@@ -23,6 +45,7 @@ class ValidatorResult:
     execution_time_ms: float
     auto_fixed: bool = False
     fix_applied: str = ""
+    cached: bool = False
 
 
 @dataclass
@@ -96,6 +119,134 @@ class StaticAnalysisReport:
         )
 
 
+@lru_cache(maxsize=64)
+def _compile_validator(script_path: str, mtime_ns: int):
+    with open(script_path, 'r', encoding='utf-8') as f:
+        return compile(f.read(), script_path, 'exec')
+
+
+def run_validator_script(script_path: str, args: Sequence[str]) -> Tuple[int, str, float]:
+    """
+    Run a validator script's __main__ in this interpreter.
+
+    Not thread-safe (sys.argv and stdout are process-wide); pool workers run
+    one validator at a time.
+
+    Args:
+        script_path: Validator script
+        args: Command-line arguments
+
+    Returns:
+        (exit code, captured stdout, execution time in ms)
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = [script_path] + list(args)
+    exit_code = 0
+    start_time = time.time()
+
+    try:
+        code = _compile_validator(script_path, os.stat(script_path).st_mtime_ns)
+    except OSError:
+        # Same exit code as `python missing_script.py`
+        sys.argv = saved_argv
+        return 2, "", (time.time() - start_time) * 1000
+
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            exec(code, {'__name__': '__main__', '__file__': script_path})
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            stderr.write(str(e.code))
+            exit_code = 1
+    except Exception:
+        stderr.write(traceback.format_exc())
+        exit_code = 1
+    finally:
+        sys.argv = saved_argv
+
+    return exit_code, stdout.getvalue(), (time.time() - start_time) * 1000
+
+
+def _run_validator_chain(jobs: Sequence[Tuple[str, Sequence[str]]]) -> List[Tuple[int, str, float]]:
+    """Run validators one after another (pool entry point)."""
+    return [run_validator_script(script_path, args) for script_path, args in jobs]
+
+
+def _content_hash(path: str) -> Optional[str]:
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class ValidatorResultCache:
+    """Validator results keyed by (validator, validator version, content hash)."""
+
+    def __init__(self, cache_path: Optional[str] = None, max_entries: int = 10000):
+        """
+        Initialize cache.
+
+        Args:
+            cache_path: Optional JSON file to persist the cache in
+            max_entries: Maximum cached results (oldest are dropped)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_entries = max_entries
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_path and self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load static analysis cache: {e}")
+
+    @staticmethod
+    def key(validator_name: str, validator_version: str, content_hash: str) -> str:
+        return f"{validator_name}|{validator_version}|{content_hash}"
+
+    def get(self, key: str) -> Optional[ValidatorResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return ValidatorResult(**{**entry, 'cached': True})
+
+    def put(self, key: str, result: ValidatorResult):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = {**asdict(result), 'cached': False}
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._dirty = True
+
+    def save(self):
+        """Write the cache to cache_path (if set and changed)."""
+        if not self.cache_path or not self._dirty:
+            return
+        with self._lock:
+            data = json.dumps(self._entries)
+            self._dirty = False
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.cache_path)
+
+
 class StaticAnalysisTracker:
     """Tracks static analysis results and stores them in registry and RAG."""
 
@@ -145,14 +296,90 @@ class StaticAnalysisTracker:
         },
     ]
 
-    def __init__(self, tools_dir: str = "tools/executable"):
+    def __init__(
+        self,
+        tools_dir: str = "tools/executable",
+        max_workers: Optional[int] = None,
+        cache_path: Optional[str] = None
+    ):
         """
         Initialize tracker.
 
         Args:
             tools_dir: Directory containing validator scripts
+            max_workers: Processes for concurrent checks (default: CPU count,
+                at most the number of validators; 1 runs everything inline)
+            cache_path: Optional JSON file persisting the result cache
         """
         self.tools_dir = Path(tools_dir)
+        self.max_workers = max_workers or min(os.cpu_count() or 1, len(self.VALIDATORS))
+        self.cache = ValidatorResultCache(cache_path)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._versions: Dict[str, Tuple[int, str]] = {}
+
+    def _script_path(self, validator: Dict[str, Any]) -> str:
+        return str(self.tools_dir / validator['script'])
+
+    def validator_version(self, validator: Dict[str, Any]) -> str:
+        """Hash of the validator script (changes whenever the script changes)."""
+        script_path = self._script_path(validator)
+        try:
+            mtime_ns = os.stat(script_path).st_mtime_ns
+        except OSError:
+            return "missing"
+
+        cached = self._versions.get(script_path)
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, _content_hash(script_path) or "missing")
+            self._versions[script_path] = cached
+        return cached[1]
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def close(self):
+        """Shut down the validator process pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self.cache.save()
+
+    def _validator_args(self, validator: Dict[str, Any], code_file: str, auto_fix: bool) -> List[str]:
+        args = [code_file]
+
+        # Add --fix flag if auto-fix is enabled and available
+        if auto_fix and validator['auto_fix']:
+            args.append('--fix')
+        return args
+
+    def _make_result(
+        self,
+        validator: Dict[str, Any],
+        run: Tuple[int, str, float],
+        auto_fix: bool
+    ) -> ValidatorResult:
+        exit_code, stdout, execution_time = run
+
+        # Check if auto-fix was applied
+        auto_fixed = 'FIXED' in stdout if auto_fix else False
+
+        return ValidatorResult(
+            validator_name=validator['name'],
+            passed=exit_code == 0,
+            exit_code=exit_code,
+            output=stdout.strip(),
+            execution_time_ms=execution_time,
+            auto_fixed=auto_fixed,
+            fix_applied=stdout.strip() if auto_fixed else ""
+        )
+
+    def _cache_key(self, validator: Dict[str, Any], content_hash: Optional[str], auto_fix: bool) -> Optional[str]:
+        if content_hash is None:
+            return None
+        name = validator['name'] + ('|fix' if auto_fix and validator['auto_fix'] else '')
+        return ValidatorResultCache.key(name, self.validator_version(validator), content_hash)
 
     def run_validator(
         self,
@@ -161,7 +388,7 @@ class StaticAnalysisTracker:
         auto_fix: bool = True
     ) -> ValidatorResult:
         """
-        Run a single validator.
+        Run a single validator (using the result cache).
 
         Args:
             validator: Validator configuration
@@ -171,33 +398,151 @@ class StaticAnalysisTracker:
         Returns:
             ValidatorResult
         """
-        script_path = self.tools_dir / validator['script']
-
-        # Build command
-        cmd = ['python', str(script_path), code_file]
+        key = self._cache_key(validator, _content_hash(code_file), auto_fix)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            return cached
+
+        run = run_validator_script(
+            self._script_path(validator),
+            self._validator_args(validator, code_file, auto_fix)
+        )
+        result = self._make_result(validator, run, auto_fix)
+
+        # A result that rewrote the file is not reusable for that content
+        if key and not result.auto_fixed:
+            self.cache.put(key, result)
+        return result
+
+    def _run_jobs(self, chains: List[List[Tuple[str, List[str]]]]) -> List[List[Tuple[int, str, float]]]:
+        """Run validator chains (concurrently when there is more than one)."""
+        if len(chains) <= 1 or self.max_workers <= 1:
+            return [_run_validator_chain(chain) for chain in chains]
+
+        try:
+            pool = self._get_pool()
+            return list(pool.map(_run_validator_chain, chains))
+        except Exception as e:
+            logger.warning(f"Validator process pool failed, running inline: {e}")
+            self._pool = None
+            return [_run_validator_chain(chain) for chain in chains]
+
+    def _run_fixers(
+        self,
+        code_files: List[str],
+        fixers: List[Dict[str, Any]],
+        results: List[Dict[str, ValidatorResult]]
+    ):
+        """Run auto-fixers in order per file (files in parallel)."""
+        chains = []
+        pending = []
+
+        for index, code_file in enumerate(code_files):
+            content_hash = _content_hash(code_file)
+            remaining = list(fixers)
+
+            # Skip leading fixers whose (unchanged) result is cached
+            while remaining:
+                key = self._cache_key(remaining[0], content_hash, True)
+                cached = self.cache.get(key) if key else None
+                if cached is None:
+                    break
+                results[index][cached.validator_name] = cached
+                remaining.pop(0)
+
+            if remaining:
+                chains.append([
+                    (self._script_path(v), self._validator_args(v, code_file, True))
+                    for v in remaining
+                ])
+                pending.append((index, remaining, content_hash))
+
+        for (index, remaining, content_hash), runs in zip(pending, self._run_jobs(chains)):
+            for validator, run in zip(remaining, runs):
+                result = self._make_result(validator, run, True)
+                results[index][result.validator_name] = result
+
+                # Cache results until a fixer changes the content
+                if content_hash is not None and not result.auto_fixed:
+                    self.cache.put(self._cache_key(validator, content_hash, True), result)
+                else:
+                    content_hash = None
+
+    def _run_checks(
+        self,
+        code_files: List[str],
+        checks: List[Dict[str, Any]],
+        auto_fix: bool,
+        results: List[Dict[str, ValidatorResult]]
+    ):
+        """Run read-only validators concurrently, skipping cached results."""
+        chains = []
+        pending = []
+
+        for index, code_file in enumerate(code_files):
+            content_hash = _content_hash(code_file)
+            for validator in checks:
+                key = self._cache_key(validator, content_hash, auto_fix)
+                cached = self.cache.get(key) if key else None
+                if cached is not None:
+                    results[index][cached.validator_name] = cached
+                    continue
+                chains.append([(self._script_path(validator), self._validator_args(validator, code_file, auto_fix))])
+                pending.append((index, validator, key))
+
+        for (index, validator, key), runs in zip(pending, self._run_jobs(chains)):
+            result = self._make_result(validator, runs[0], auto_fix)
+            results[index][result.validator_name] = result
+            if key:
+                self.cache.put(key, result)
+
+    def analyze_files(
+        self,
+        files: Sequence[Tuple[str, str]],
+        auto_fix: bool = True
+    ) -> List[StaticAnalysisReport]:
+        """
+        Run all validators on several code files using one process pool.
 
-        # Add --fix flag if auto-fix is enabled and available
-        if auto_fix and validator['auto_fix']:
-            cmd.append('--fix')
+        Args:
+            files: (code_file, node_id) pairs
+            auto_fix: Apply auto-fixes where available
 
-        # Run validator
+        Returns:
+            StaticAnalysisReport per file, in input order
+        """
         start_time = time.time()
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        execution_time = (time.time() - start_time) * 1000  # Convert to ms
-
-        # Check if auto-fix was applied
-        auto_fixed = 'FIXED' in result.stdout if auto_fix else False
+        code_files = [code_file for code_file, _ in files]
+        results: List[Dict[str, ValidatorResult]] = [{} for _ in files]
 
-        return ValidatorResult(
-            validator_name=validator['name'],
-            passed=result.returncode == 0,
-            exit_code=result.returncode,
-            output=result.stdout.strip(),
-            execution_time_ms=execution_time,
-            auto_fixed=auto_fixed,
-            fix_applied=result.stdout.strip() if auto_fixed else ""
+        # Sort validators by priority (higher first)
+        sorted_validators = sorted(
+            self.VALIDATORS,
+            key=lambda v: v['priority'],
+            reverse=True
         )
 
+        # Fixers rewrite files, so they finish before the checks read them
+        fixers = [v for v in sorted_validators if auto_fix and v['auto_fix']]
+        checks = [v for v in sorted_validators if v not in fixers]
+
+        if fixers:
+            self._run_fixers(code_files, fixers, results)
+        self._run_checks(code_files, checks, auto_fix, results)
+        self.cache.save()
+
+        total_time = (time.time() - start_time) * 1000
+
+        return [
+            self._build_report(
+                node_id,
+                code_file,
+                [results[index][v['name']] for v in sorted_validators],
+                total_time
+            )
+            for index, (code_file, node_id) in enumerate(files)
+        ]
+
     def analyze_file(
         self,
         code_file: str,
@@ -215,21 +560,16 @@ class StaticAnalysisTracker:
         Returns:
             StaticAnalysisReport with all results
         """
-        start_time = time.time()
-        results = []
-
-        # Sort validators by priority (higher first)
-        sorted_validators = sorted(
-            self.VALIDATORS,
-            key=lambda v: v['priority'],
-            reverse=True
-        )
-
-        # Run each validator
-        for validator in sorted_validators:
-            result = self.run_validator(validator, code_file, auto_fix)
-            results.append(result)
+        return self.analyze_files([(code_file, node_id)], auto_fix)[0]
 
+    def _build_report(
+        self,
+        node_id: str,
+        code_file: str,
+        results: List[ValidatorResult],
+        total_time: float
+    ) -> StaticAnalysisReport:
+        """Score validator results into a report."""
         # Calculate category scores
         category_scores = self._calculate_category_scores(results)
 
@@ -246,8 +586,6 @@ class StaticAnalysisTracker:
             category_scores['usage'] * 0.2
         )
 
-        total_time = (time.time() - start_time) * 1000
-
         return StaticAnalysisReport(
             node_id=node_id,
             file_path=code_file,
@@ -0,0 +1,339 @@
+"""
+Mergeable streaming statistics for latency baselines.
+
+- StreamingStats: Welford mean/variance, min/max and a DDSketch for
+  quantiles. add() is O(1); two instances (e.g. from different worker
+  processes) merge exactly for count/mean/variance and within the sketch's
+  relative accuracy for quantiles.
+- WindowedStats: sliding window over the most recent samples built from a
+  ring of StreamingStats blocks, so old samples age out without keeping
+  them individually.
+
+Both serialize to plain JSON-compatible dicts (to_dict / from_dict).
+"""
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+class DDSketch:
+    """
+    Quantile sketch with bounded relative error (DDSketch).
+
+    Values are counted in logarithmic buckets of ratio gamma = (1+a)/(1-a),
+    so any returned quantile is within a relative error `a` of a value of
+    that rank. The number of buckets grows with the logarithm of the value
+    range, not with the number of samples.
+    """
+
+    # Values closer to zero than this are counted in the zero bucket
+    MIN_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Initialize sketch.
+
+        Args:
+            relative_accuracy: Relative error bound of quantiles (0 < a < 1)
+        """
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1):
+        """Add a value."""
+        if value > self.MIN_VALUE:
+            index = self._index(value)
+            self.positive[index] = self.positive.get(index, 0) + count
+        elif value < -self.MIN_VALUE:
+            index = self._index(-value)
+            self.negative[index] = self.negative.get(index, 0) + count
+        else:
+            self.zero_count += count
+        self.count += count
+
+    def merge(self, other: "DDSketch"):
+        """Add all values of another sketch with the same accuracy."""
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for index, count in other.positive.items():
+            self.positive[index] = self.positive.get(index, 0) + count
+        for index, count in other.negative.items():
+            self.negative[index] = self.negative.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Get the value at quantile q.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Approximate quantile value or None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return -self._value(index)
+
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._value(index)
+
+        return self._value(max(self.positive)) if self.positive else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "positive": {str(k): v for k, v in self.positive.items()},
+            "negative": {str(k): v for k, v in self.negative.items()},
+            "zero_count": self.zero_count
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "DDSketch":
+        sketch = DDSketch(data.get("relative_accuracy", 0.01))
+        sketch.positive = {int(k): int(v) for k, v in data.get("positive", {}).items()}
+        sketch.negative = {int(k): int(v) for k, v in data.get("negative", {}).items()}
+        sketch.zero_count = int(data.get("zero_count", 0))
+        sketch.count = sum(sketch.positive.values()) + sum(sketch.negative.values()) + sketch.zero_count
+        return sketch
+
+
+class StreamingStats:
+    """Count, mean, variance, min/max and quantiles of a stream of values."""
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Initialize statistics.
+
+        Args:
+            relative_accuracy: Relative error bound of quantiles
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sketch = DDSketch(relative_accuracy)
+
+    def add(self, value: float):
+        """Add a value (Welford update)."""
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.sketch.add(value)
+
+    def merge(self, other: "StreamingStats"):
+        """Combine another instance into this one (Chan et al. parallel update)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.mean, self.m2 = other.mean, other.m2
+        else:
+            total = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / total
+            self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count += other.count
+
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    def variance(self, ddof: int = 0) -> float:
+        """Variance (ddof=0 population, ddof=1 sample)."""
+        if self.count <= ddof:
+            return 0.0
+        return max(self.m2, 0.0) / (self.count - ddof)
+
+    def std(self, ddof: int = 0) -> float:
+        """Standard deviation (ddof=0 population, ddof=1 sample)."""
+        return math.sqrt(self.variance(ddof))
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate quantile, clamped to the observed min/max."""
+        value = self.sketch.quantile(q)
+        if value is None:
+            return None
+        return min(max(value, self.min), self.max)
+
+    def copy(self) -> "StreamingStats":
+        clone = StreamingStats(self.sketch.relative_accuracy)
+        clone.merge(self)
+        return clone
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min,
+            "max": self.max,
+            "sketch": self.sketch.to_dict()
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "StreamingStats":
+        stats = StreamingStats()
+        stats.count = int(data.get("count", 0))
+        stats.mean = float(data.get("mean", 0.0))
+        stats.m2 = float(data.get("m2", 0.0))
+        stats.min = data.get("min")
+        stats.max = data.get("max")
+        stats.sketch = DDSketch.from_dict(data.get("sketch", {}))
+        return stats
+
+
+class WindowedStats:
+    """
+    Streaming statistics over roughly the last `window` values.
+
+    Values go into a current block of window/blocks values; full blocks are
+    kept in a ring of `blocks` blocks and the oldest one is dropped. The
+    window therefore covers between window and window + window/blocks
+    values. Closed blocks are pre-merged once per block, so mean/std reads
+    stay O(1).
+    """
+
+    def __init__(self, window: int = 1000, blocks: int = 10, relative_accuracy: float = 0.01):
+        """
+        Initialize windowed statistics.
+
+        Args:
+            window: Approximate number of most recent values covered
+            blocks: Number of blocks the window is split into
+            relative_accuracy: Relative error bound of quantiles
+        """
+        self.window = max(1, window)
+        self.blocks = max(1, min(blocks, self.window))
+        self.block_size = max(1, self.window // self.blocks)
+        self.relative_accuracy = relative_accuracy
+
+        self._closed: Deque[StreamingStats] = deque()
+        self._current = StreamingStats(relative_accuracy)
+        self._closed_total: Optional[StreamingStats] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float):
+        """Add a value."""
+        self._current.add(value)
+        if self._current.count >= self.block_size:
+            self._close_block(self._current)
+            self._current = StreamingStats(self.relative_accuracy)
+
+    def _close_block(self, block: StreamingStats):
+        self._closed.append(block)
+        while len(self._closed) > self.blocks:
+            self._closed.popleft()
+        self._closed_total = None
+
+    def merge(self, other: "WindowedStats"):
+        """
+        Fold another window (e.g. from another worker) into this one.
+
+        The other window's values are added as one closed block, which then
+        ages out like any other block.
+        """
+        summary = other.summary()
+        if summary.count:
+            self._close_block(summary)
+
+    def summary(self) -> StreamingStats:
+        """Statistics over the whole window as a single StreamingStats."""
+        if self._closed_total is None:
+            total = StreamingStats(self.relative_accuracy)
+            for block in self._closed:
+                total.merge(block)
+            self._closed_total = total
+        merged = self._closed_total.copy()
+        merged.merge(self._current)
+        return merged
+
+    def _totals(self):
+        """Count, mean and m2 over the window without copying sketches."""
+        if self._closed_total is None:
+            self.summary()
+        a, b = self._closed_total, self._current
+        count = a.count + b.count
+        if count == 0:
+            return 0, 0.0, 0.0
+        if a.count == 0:
+            return b.count, b.mean, b.m2
+        if b.count == 0:
+            return a.count, a.mean, a.m2
+        delta = b.mean - a.mean
+        mean = a.mean + delta * b.count / count
+        m2 = a.m2 + b.m2 + delta * delta * a.count * b.count / count
+        return count, mean, m2
+
+    @property
+    def count(self) -> int:
+        return self._totals()[0]
+
+    @property
+    def mean(self) -> float:
+        return self._totals()[1]
+
+    def std(self, ddof: int = 0) -> float:
+        """Standard deviation over the window (ddof=0 population, ddof=1 sample)."""
+        count, _, m2 = self._totals()
+        if count <= ddof:
+            return 0.0
+        return math.sqrt(max(m2, 0.0) / (count - ddof))
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate quantile over the window."""
+        return self.summary().quantile(q)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "window": self.window,
+            "blocks": self.blocks,
+            "relative_accuracy": self.relative_accuracy,
+            "closed": [block.to_dict() for block in self._closed],
+            "current": self._current.to_dict()
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "WindowedStats":
+        stats = WindowedStats(
+            window=data.get("window", 1000),
+            blocks=data.get("blocks", 10),
+            relative_accuracy=data.get("relative_accuracy", 0.01)
+        )
+        for block in data.get("closed", []):
+            stats._close_block(StreamingStats.from_dict(block))
+        stats._current = StreamingStats.from_dict(data.get("current", {}))
+        return stats
@@ -10,12 +10,13 @@ at the outermost level, catching exceptions in and out.
 import os
 import logging
 import time
-import statistics
 from typing import Any, Callable, Dict, Optional, List
 from datetime import datetime
 from collections import deque
 from enum import Enum
 
+from .streaming_stats import WindowedStats
+
 logger = logging.getLogger(__name__)
 
 
@@ -248,8 +249,8 @@ class PerfCatcherInterceptor(ToolInterceptor):
         self.min_samples = int(os.getenv('PERFCATCHER_MIN_SAMPLES', '10'))
         self.buffer_duration = float(os.getenv('PERFCATCHER_BUFFER_DURATION', '30'))  # seconds
 
-        # Performance tracking per tool
-        self.performance_data: Dict[str, deque] = {}
+        # Performance tracking per tool (rolling window of ~window_size samples)
+        self.performance_data: Dict[str, WindowedStats] = {}
 
         # Rolling buffer for offline optimization
         # Stores full request details with timestamps
@@ -311,12 +312,12 @@ class PerfCatcherInterceptor(ToolInterceptor):
             result_summary=str(result)[:200] if result else None
         )
 
-        # Initialize deque for this tool if needed
+        # Initialize stats for this tool if needed
         if tool_name not in self.performance_data:
-            self.performance_data[tool_name] = deque(maxlen=self.window_size)
+            self.performance_data[tool_name] = WindowedStats(window=self.window_size)
 
         perf_data = self.performance_data[tool_name]
-        perf_data.append(execution_time_ms)
+        perf_data.add(execution_time_ms)
 
         # Check for variance if we have enough samples
         if len(perf_data) >= self.min_samples:
@@ -332,7 +333,7 @@ class PerfCatcherInterceptor(ToolInterceptor):
         self,
         tool_name: str,
         current_time_ms: float,
-        perf_data: deque,
+        perf_data: WindowedStats,
         context: Dict[str, Any]
     ) -> Optional[float]:
         """
@@ -348,8 +349,8 @@ class PerfCatcherInterceptor(ToolInterceptor):
             Variance value if threshold exceeded, None otherwise
         """
         # Calculate baseline statistics
-        mean_time = statistics.mean(perf_data)
-        stdev_time = statistics.stdev(perf_data) if len(perf_data) > 1 else 0
+        mean_time = perf_data.mean
+        stdev_time = perf_data.std(ddof=1)
 
         # Calculate variance from mean
         variance = abs(current_time_ms - mean_time) / mean_time if mean_time > 0 else 0
@@ -444,22 +445,44 @@ class PerfCatcherInterceptor(ToolInterceptor):
         if tool_name not in self.performance_data:
             return None
 
-        perf_data = list(self.performance_data[tool_name])
-        if not perf_data:
+        perf_data = self.performance_data[tool_name].summary()
+        if not perf_data.count:
             return None
 
         return {
             'tool_name': tool_name,
-            'sample_count': len(perf_data),
-            'mean_ms': statistics.mean(perf_data),
-            'median_ms': statistics.median(perf_data),
-            'stdev_ms': statistics.stdev(perf_data) if len(perf_data) > 1 else 0,
-            'min_ms': min(perf_data),
-            'max_ms': max(perf_data),
-            'p95_ms': statistics.quantiles(perf_data, n=20)[18] if len(perf_data) >= 20 else max(perf_data),
-            'p99_ms': statistics.quantiles(perf_data, n=100)[98] if len(perf_data) >= 100 else max(perf_data)
+            'sample_count': perf_data.count,
+            'mean_ms': perf_data.mean,
+            'median_ms': perf_data.quantile(0.50),
+            'stdev_ms': perf_data.std(ddof=1),
+            'min_ms': perf_data.min,
+            'max_ms': perf_data.max,
+            'p95_ms': perf_data.quantile(0.95),
+            'p99_ms': perf_data.quantile(0.99)
         }
 
+    def export_stats(self) -> Dict[str, Any]:
+        """
+        Serialize per-tool statistics (mergeable, JSON-compatible).
+
+        Returns:
+            Dict mapping tool name to WindowedStats.to_dict()
+        """
+        return {name: stats.to_dict() for name, stats in self.performance_data.items()}
+
+    def merge_stats(self, data: Dict[str, Any]):
+        """
+        Merge statistics exported by another process (see export_stats).
+
+        Args:
+            data: Dict mapping tool name to WindowedStats.to_dict()
+        """
+        for tool_name, entry in data.items():
+            other = WindowedStats.from_dict(entry)
+            if tool_name not in self.performance_data:
+                self.performance_data[tool_name] = WindowedStats(window=self.window_size)
+            self.performance_data[tool_name].merge(other)
+
     def set_tool_threshold(self, tool_name: str, threshold: float):
         """
         Set a custom performance threshold for a specific tool.
@@ -6,8 +6,9 @@ Future: Will integrate with RAG for semantic search.
 import json
 import logging
 import hashlib
+import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime
 from enum import Enum
 from rich.console import Console
@@ -17,6 +18,11 @@ from .openapi_tool import OpenAPITool
 # logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Manifest of YAML tool files (path -> mtime, size, hash, parsed definition)
+# so unchanged files are not re-parsed on every start
+MANIFEST_FILENAME = ".yaml_manifest.json"
+MANIFEST_VERSION = 1
+
 # Configure console with ASCII-safe output for Windows compatibility
 console = Console(legacy_windows=True, no_color=False)
 
@@ -468,6 +474,7 @@ class ToolsManager:
         self.tools_path.mkdir(parents=True, exist_ok=True)
 
         self.index_path = self.tools_path / "index.json"
+        self.manifest_path = self.tools_path / MANIFEST_FILENAME
         self.config_manager = config_manager
         self.ollama_client = ollama_client
         self.rag_memory = rag_memory
@@ -549,10 +556,84 @@ class ToolsManager:
         # YAML files are the source of truth and are loaded directly
         pass
 
-    def _load_tools_from_yaml_files(self):
-        """Load tools from YAML files in the tools/ directory."""
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the YAML manifest written by the previous start.
+
+        Returns:
+            Mapping of YAML path (relative to tools_path) to its entry
+        """
+        if not self.manifest_path.exists():
+            return {}
+
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return {}
+            return data.get("files", {})
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable tool manifest: {e}")
+            return {}
+
+    def _save_manifest(self, files: Dict[str, Dict[str, Any]]):
+        """
+        Persist the YAML manifest (atomic replace).
+
+        Args:
+            files: Mapping of relative YAML path to entry
+        """
+        try:
+            temp_path = self.manifest_path.with_suffix(".json.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": MANIFEST_VERSION, "files": files}, f, separators=(",", ":"))
+            os.replace(temp_path, self.manifest_path)
+        except Exception as e:
+            logger.warning(f"Could not save tool manifest: {e}")
+
+    def _read_yaml_tool(
+        self,
+        yaml_file: Path,
+        manifest: Dict[str, Dict[str, Any]],
+        new_manifest: Dict[str, Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Get a YAML tool definition and its hash, parsing only if the file changed.
+
+        A file is considered unchanged when its mtime and size match the
+        manifest entry; the pre-parsed definition is then reused.
+
+        Args:
+            yaml_file: Path to the YAML file
+            manifest: Entries from the previous start
+            new_manifest: Entries for this start (updated in place)
+
+        Returns:
+            Tuple of (tool definition, definition hash)
+        """
         import yaml
 
+        rel_path = yaml_file.relative_to(self.tools_path).as_posix()
+        stat = yaml_file.stat()
+
+        entry = manifest.get(rel_path)
+        if not (entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size):
+            with open(yaml_file, 'r', encoding='utf-8') as f:
+                tool_def = yaml.safe_load(f)
+
+            # Calculate hash of tool definition for change detection
+            entry = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": calculate_tool_hash(tool_def),
+                "definition": tool_def
+            }
+
+        new_manifest[rel_path] = entry
+        return entry["definition"], entry["hash"]
+
+    def _load_tools_from_yaml_files(self):
+        """Load tools from YAML files in the tools/ directory."""
         # Scan for YAML files in tools subdirectories
         yaml_files = list(self.tools_path.glob("**/*.yaml"))
 
@@ -564,43 +645,48 @@ class ToolsManager:
         logger.info(f"Loading {len(yaml_files)} tool(s) from YAML files...")
         tool_count = 0
 
+        # RAG entries are collected and stored in one batch (one embedding
+        # request per chunk instead of one per tool)
+        rag_batch: List[Dict[str, Any]] = []
+
+        manifest = self._load_manifest()
+        new_manifest: Dict[str, Dict[str, Any]] = {}
+
         for yaml_file in yaml_files:
             try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    tool_def = yaml.safe_load(f)
+                # Unchanged files come from the manifest snapshot; only
+                # changed ones are re-parsed and re-hashed
+                tool_def, new_hash = self._read_yaml_tool(yaml_file, manifest, new_manifest)
 
-                    # Generate tool_id from filename (without extension)
-                    tool_id = yaml_file.stem
+                # Generate tool_id from filename (without extension)
+                tool_id = yaml_file.stem
 
-                    # Calculate hash of tool definition for change detection
-                    new_hash = calculate_tool_hash(tool_def)
+                # Check if tool exists and handle versioning
+                version = tool_def.get("version", "1.0.0")
+                breaking_changes = tool_def.get("breaking_changes", [])
 
-                    # Check if tool exists and handle versioning
-                    version = tool_def.get("version", "1.0.0")
-                    breaking_changes = tool_def.get("breaking_changes", [])
-
-                    if tool_id in self.tools:
+                if tool_id in self.tools:
+                    existing_tool = self.tools[tool_id]
+                    old_hash = existing_tool.definition_hash
+
+                    # If hash changed, this is an update
+                    if old_hash and old_hash != new_hash:
+                        # Determine change type from YAML or auto-detect
+                        change_type = tool_def.get("change_type", "patch")
+                        version = bump_version(existing_tool.version, change_type)
+
+                        console.print(f"  [yellow]> Updated {tool_id} v{existing_tool.version} -> v{version} ({change_type})[/yellow]")
+
+                        if change_type == "major" and breaking_changes:
+                            console.print(f"    [red]! Breaking changes:[/red]")
+                            for change in breaking_changes:
+                                console.print(f"      - {change}")
+                    else:
+                        # No changes, skip reload but ensure it's in RAG
+                        logger.debug(f"Tool {tool_id} unchanged, ensuring RAG entry exists")
                         existing_tool = self.tools[tool_id]
-                        old_hash = existing_tool.definition_hash
-
-                        # If hash changed, this is an update
-                        if old_hash and old_hash != new_hash:
-                            # Determine change type from YAML or auto-detect
-                            change_type = tool_def.get("change_type", "patch")
-                            version = bump_version(existing_tool.version, change_type)
-
-                            console.print(f"  [yellow]> Updated {tool_id} v{existing_tool.version} -> v{version} ({change_type})[/yellow]")
-
-                            if change_type == "major" and breaking_changes:
-                                console.print(f"    [red]! Breaking changes:[/red]")
-                                for change in breaking_changes:
-                                    console.print(f"      - {change}")
-                        else:
-                            # No changes, skip reload but ensure it's in RAG
-                            logger.debug(f"Tool {tool_id} unchanged, ensuring RAG entry exists")
-                            existing_tool = self.tools[tool_id]
-                            self._store_yaml_tool_in_rag(existing_tool, tool_def, str(yaml_file))
-                            continue
+                        self._store_yaml_tool_in_rag(existing_tool, tool_def, str(yaml_file), rag_batch)
+                        continue
 
                 # Parse tool type
                 tool_type_str = tool_def.get("type", "custom")
@@ -643,7 +729,7 @@ class ToolsManager:
                     logger.info(f"OK Loaded LLM tool from YAML: {tool_id} ({tool_count}/{len(yaml_files)})")
 
                     # Store YAML tool in RAG for semantic search
-                    self._store_yaml_tool_in_rag(tool, tool_def, str(yaml_file))
+                    self._store_yaml_tool_in_rag(tool, tool_def, str(yaml_file), rag_batch)
 
                 # Handle Executable tools
                 elif tool_type == ToolType.EXECUTABLE:
@@ -676,7 +762,7 @@ class ToolsManager:
                     logger.info(f"OK Loaded executable tool from YAML: {tool_id} ({tool_count}/{len(yaml_files)})")
 
                     # Store YAML tool in RAG for semantic search
-                    self._store_yaml_tool_in_rag(tool, tool_def, str(yaml_file))
+                    self._store_yaml_tool_in_rag(tool, tool_def, str(yaml_file), rag_batch)
 
                 # Handle MCP tools
                 elif tool_type == ToolType.MCP:
@@ -712,7 +798,7 @@ class ToolsManager:
                     logger.info(f"✓ Loaded MCP tool from YAML: {tool_id}")
 
                     # Store YAML tool in RAG for semantic search
-                    self._store_yaml_tool_in_rag(tool, tool_def, str(yaml_file))
+                    self._store_yaml_tool_in_rag(tool, tool_def, str(yaml_file), rag_batch)
 
                     # Register MCP server configuration for later connection
                     self._register_mcp_server_config(mcp_config)
@@ -739,7 +825,7 @@ class ToolsManager:
                     logger.info(f"OK Loaded {tool_type.value} tool from YAML: {tool_id} ({tool_count}/{len(yaml_files)})")
 
                     # Store YAML tool in RAG for semantic search
-                    self._store_yaml_tool_in_rag(tool, tool_def, str(yaml_file))
+                    self._store_yaml_tool_in_rag(tool, tool_def, str(yaml_file), rag_batch)
 
             except Exception as e:
                 # Sanitize error message to handle unicode characters on Windows
@@ -753,12 +839,15 @@ class ToolsManager:
 
         logger.info(f"OK Loaded {len(yaml_files)} tool(s) from YAML files")
 
+        self._flush_rag_batch(rag_batch)
+        self._save_manifest(new_manifest)
+
         # Save index after loading tools from YAML
         self._save_index()
 
         # Log RAG storage summary
         if self.rag_memory:
-            logger.info(f"OK Stored {len(yaml_files)} YAML tool(s) in RAG memory for semantic search")
+            logger.info(f"OK Stored {len(rag_batch)} new or changed YAML tool(s) in RAG memory for semantic search")
 
     def _load_tools_from_rag(self):
         """Load tools stored in RAG memory."""
@@ -926,7 +1015,13 @@ class ToolsManager:
             self.tools[tool_id] = tool
             logger.info(f"OK Loaded tool from config: {tool_id}")
 
-    def _store_yaml_tool_in_rag(self, tool: Tool, tool_def: dict, yaml_path: str):
+    def _store_yaml_tool_in_rag(
+        self,
+        tool: Tool,
+        tool_def: dict,
+        yaml_path: str,
+        batch: Optional[List[Dict[str, Any]]] = None
+    ):
         """
         Store a YAML-defined tool in RAG memory at load time.
 
@@ -934,10 +1029,18 @@ class ToolsManager:
             tool: The Tool object
             tool_def: The YAML definition dictionary
             yaml_path: Path to the YAML file
+            batch: If given, the artifact is appended here and stored later by
+                _flush_rag_batch() instead of immediately
         """
         if not self.rag_memory:
             return
 
+        # Already indexed (with embedding) from this exact definition
+        existing = self._get_rag_tool_artifact(tool.tool_id)
+        if existing and existing.embedding and existing.metadata.get("definition_hash") == tool.definition_hash:
+            logger.debug(f"YAML tool {tool.tool_id} unchanged in RAG, skipping re-index")
+            return
+
         try:
             from .rag_memory import ArtifactType
             import yaml
@@ -992,9 +1095,7 @@ class ToolsManager:
             category = path_parts[-2] if len(path_parts) >= 2 else "other"
 
             # Store in RAG with comprehensive metadata
-            # NOTE: auto_embed=False to avoid slow initialization (126+ tools × 500ms/embed = 60s+)
-            # Tools are looked up by tool_id or tags, not semantic search during init
-            self.rag_memory.store_artifact(
+            artifact = dict(
                 artifact_id=f"tool_{tool.tool_id}",
                 artifact_type=ArtifactType.PATTERN,
                 name=tool.name,
@@ -1015,10 +1116,15 @@ class ToolsManager:
                     "input_schema": tool_def.get("input_schema"),
                     "output_schema": tool_def.get("output_schema"),
                     "examples": tool_def.get("examples")
-                },
-                auto_embed=True  # Enable embeddings for Qdrant storage
+                }
             )
 
+            if batch is not None:
+                batch.append(artifact)
+                return
+
+            self.rag_memory.store_artifact(**artifact, auto_embed=True)  # Enable embeddings for Qdrant storage
+
             logger.debug(f"Stored YAML tool in RAG: {tool.tool_id} (category: {category})")
 
         except Exception as e:
@@ -1032,7 +1138,12 @@ class ToolsManager:
         try:
             from .rag_memory import ArtifactType
 
+            batch = []
             for tool_id, tool in self.tools.items():
+                # YAML tools are indexed (with richer content) at load time
+                if tool.metadata.get("from_yaml"):
+                    continue
+
                 # Create a comprehensive description for embedding
                 tool_content = f"""Tool: {tool.name}
 Type: {tool.tool_type.value}
@@ -1041,9 +1152,13 @@ Tags: {', '.join(tool.tags)}
 
 {tool.to_prompt_format()}"""
 
+                # Skip tools whose indexed entry is already up to date
+                existing = self._get_rag_tool_artifact(tool_id)
+                if existing and existing.embedding and existing.content == tool_content:
+                    continue
+
                 # Store in RAG with type PATTERN (representing a reusable tool pattern)
-                # NOTE: auto_embed=False for fast initialization - tools looked up by ID/tags
-                self.rag_memory.store_artifact(
+                batch.append(dict(
                     artifact_id=f"tool_{tool_id}",
                     artifact_type=ArtifactType.PATTERN,
                     name=tool.name,
@@ -1054,15 +1169,45 @@ Tags: {', '.join(tool.tags)}
                         "tool_id": tool_id,
                         "tool_type": tool.tool_type.value,
                         "is_tool": True
-                    },
-                    auto_embed=True  # Enable embeddings for Qdrant
-                )
+                    }
+                ))
 
-            logger.info(f"OK Indexed {len(self.tools)} tools in RAG memory")
+            self._flush_rag_batch(batch)
+            logger.info(f"OK Indexed {len(batch)} new or changed tool(s) in RAG memory ({len(self.tools)} total)")
 
         except Exception as e:
             logger.error(f"Error indexing tools in RAG: {e}")
 
+    def _get_rag_tool_artifact(self, tool_id: str) -> Optional[Any]:
+        """Get the RAG artifact stored for a tool, if any."""
+        try:
+            return self.rag_memory.get_artifact(f"tool_{tool_id}")
+        except Exception:
+            return None
+
+    def _flush_rag_batch(self, batch: List[Dict[str, Any]]):
+        """
+        Store collected tool artifacts in RAG memory with embeddings.
+
+        Uses the backend's store_artifacts_bulk() (batched embedding requests,
+        single index write) when available, otherwise stores one by one.
+
+        Args:
+            batch: store_artifact() keyword arguments, one dict per tool
+        """
+        if not self.rag_memory or not batch:
+            return
+
+        try:
+            if hasattr(self.rag_memory, "store_artifacts_bulk"):
+                self.rag_memory.store_artifacts_bulk(batch, auto_embed=True)
+            else:
+                for artifact in batch:
+                    self.rag_memory.store_artifact(**artifact, auto_embed=True)
+            logger.debug(f"Stored {len(batch)} tool(s) in RAG")
+        except Exception as e:
+            logger.warning(f"Could not store {len(batch)} tool(s) in RAG: {e}")
+
     def _register_mcp_server_config(self, mcp_config: Dict[str, Any]):
         """
         Register MCP server configuration from YAML file.
@@ -111,11 +111,11 @@ class VersionReplacementManager:
             Tuple of (replacement_version, replacement_id) or None if no replacement found
         """
         # Get all versions of this artifact
-        all_nodes = self.registry.list_nodes()
+        base_id = artifact_id.split("_v")[0]  # Remove version suffix if present
+        all_nodes = self.registry.list_nodes(prefix=base_id)
 
         # Filter to get all versions of this artifact
         artifact_versions = []
-        base_id = artifact_id.split("_v")[0]  # Remove version suffix if present
 
         for node in all_nodes:
             node_id = node.get("node_id", "")
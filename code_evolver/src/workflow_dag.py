@@ -0,0 +1,353 @@
+"""
+Dependency graph and parallel executor for workflow steps.
+
+WorkflowDAG derives each step's dependencies from:
+- explicit depends_on lists
+- "steps.<step_id>..." references in input_mapping (including nested
+  dicts and lists)
+- "{steps.<step_id>...}" references in templates (prompt_template and
+  any other string field of the step)
+
+DAGExecutor runs steps as soon as their dependencies have finished, with a
+global worker limit and per-kind limits (e.g. at most 2 concurrent LLM
+calls). When a step fails, every step downstream of it is skipped; with
+fail_fast, all steps not yet started are cancelled. After a run,
+timing_report() gives per-step start/end offsets and the critical path
+(the chain of dependent steps that determined the wall time).
+"""
+import logging
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# "steps.<step_id>" anywhere in a string
+STEP_REFERENCE = re.compile(r'\bsteps\.([A-Za-z0-9_\-]+)')
+
+# Step kinds used for per-kind concurrency limits
+STEP_KINDS = {
+    "llm_call": "llm",
+    "LLM_CALL": "llm",
+    "python_tool": "python",
+    "PYTHON_TOOL": "python",
+    "executable": "python",
+}
+
+DEFAULT_CONCURRENCY_LIMITS = {"llm": 2, "python": 4}
+
+
+def step_id_of(step: Dict[str, Any], index: int) -> str:
+    """Step ID with the same positional fallback the runners use."""
+    return step.get("step_id", f"step_{index + 1}")
+
+
+def step_kind(step: Dict[str, Any]) -> str:
+    """Concurrency kind of a step ('llm', 'python' or 'other')."""
+    step_type = step.get("type", step.get("step_type", ""))
+    return STEP_KINDS.get(step_type, "other")
+
+
+def _collect_references(value: Any, found: Set[str]):
+    if isinstance(value, str):
+        found.update(STEP_REFERENCE.findall(value))
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_references(item, found)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _collect_references(item, found)
+
+
+class WorkflowDAG:
+    """Dependency graph of a workflow's steps."""
+
+    def __init__(self, steps: List[Dict[str, Any]]):
+        """
+        Build the graph.
+
+        Args:
+            steps: Workflow steps (in declaration order)
+
+        Raises:
+            ValueError: On duplicate step IDs or dependency cycles
+        """
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self.order: List[str] = []
+
+        for index, step in enumerate(steps):
+            step_id = step_id_of(step, index)
+            if step_id in self.steps:
+                raise ValueError(f"Duplicate step_id: {step_id}")
+            self.steps[step_id] = step
+            self.order.append(step_id)
+
+        self.dependencies: Dict[str, Set[str]] = {
+            step_id: self._find_dependencies(step_id, step)
+            for step_id, step in self.steps.items()
+        }
+        self.dependents: Dict[str, Set[str]] = {step_id: set() for step_id in self.order}
+        for step_id, deps in self.dependencies.items():
+            for dep in deps:
+                self.dependents[dep].add(step_id)
+
+        self.topological_order = self._topological_sort()
+
+    def _find_dependencies(self, step_id: str, step: Dict[str, Any]) -> Set[str]:
+        found: Set[str] = set(step.get("depends_on", []))
+        for key, value in step.items():
+            if key not in ("step_id", "description"):
+                _collect_references(value, found)
+
+        unknown = found - set(self.steps) - {step_id}
+        if unknown:
+            logger.warning(f"Step {step_id} references unknown steps: {sorted(unknown)}")
+
+        return {dep for dep in found if dep in self.steps and dep != step_id}
+
+    def _topological_sort(self) -> List[str]:
+        """Kahn's algorithm, keeping declaration order among ready steps."""
+        remaining = {step_id: len(deps) for step_id, deps in self.dependencies.items()}
+        ready = [step_id for step_id in self.order if remaining[step_id] == 0]
+        position = {step_id: i for i, step_id in enumerate(self.order)}
+        result = []
+
+        while ready:
+            step_id = ready.pop(0)
+            result.append(step_id)
+            for dependent in sorted(self.dependents[step_id], key=position.get):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+            ready.sort(key=position.get)
+
+        if len(result) != len(self.order):
+            cyclic = sorted(step_id for step_id, count in remaining.items() if count > 0)
+            raise ValueError(f"Dependency cycle between steps: {cyclic}")
+
+        return result
+
+    def downstream(self, step_id: str) -> Set[str]:
+        """All steps that depend on a step, directly or transitively."""
+        result: Set[str] = set()
+        stack = [step_id]
+        while stack:
+            for dependent in self.dependents[stack.pop()]:
+                if dependent not in result:
+                    result.add(dependent)
+                    stack.append(dependent)
+        return result
+
+    def critical_path(self, durations: Dict[str, float]) -> List[str]:
+        """
+        Longest chain of dependent steps by duration.
+
+        Args:
+            durations: Step durations (missing steps count as 0)
+
+        Returns:
+            Step IDs along the critical path, first to last
+        """
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+
+        for step_id in self.topological_order:
+            best = max(self.dependencies[step_id], key=lambda d: finish[d], default=None)
+            finish[step_id] = durations.get(step_id, 0.0) + (finish[best] if best else 0.0)
+            previous[step_id] = best
+
+        if not finish:
+            return []
+
+        step_id = max(self.order, key=lambda s: finish[s])
+        path = []
+        while step_id is not None:
+            path.append(step_id)
+            step_id = previous[step_id]
+        return list(reversed(path))
+
+
+class DAGExecutor:
+    """
+    Runs a WorkflowDAG's steps concurrently as their dependencies complete.
+    """
+
+    def __init__(
+        self,
+        dag: WorkflowDAG,
+        max_workers: int = 4,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        fail_fast: bool = False
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            dag: Workflow graph
+            max_workers: Maximum steps running at once
+            concurrency_limits: Maximum running steps per kind (see step_kind)
+            fail_fast: Cancel all steps not yet started after the first failure
+        """
+        self.dag = dag
+        self.max_workers = max(1, max_workers)
+        self.concurrency_limits = dict(
+            DEFAULT_CONCURRENCY_LIMITS if concurrency_limits is None else concurrency_limits
+        )
+        self.fail_fast = fail_fast
+
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.wall_time = 0.0
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Stop starting new steps (running steps finish)."""
+        self._cancel.set()
+
+    def _limit_reached(self, kind: str, running_kinds: Dict[str, int]) -> bool:
+        limit = self.concurrency_limits.get(kind)
+        return limit is not None and running_kinds.get(kind, 0) >= max(1, limit)
+
+    def _mark(self, step_ids, status: str, error: str):
+        for step_id in step_ids:
+            if step_id not in self.records:
+                self.records[step_id] = {
+                    "status": status,
+                    "result": {"success": False, "error": error, status: True}
+                }
+
+    def run(
+        self,
+        execute: Callable[[str, Dict[str, Any]], Dict[str, Any]],
+        on_start: Optional[Callable[[str], None]] = None,
+        on_finish: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute all steps.
+
+        Args:
+            execute: Called as execute(step_id, step) and returns the step
+                result dict; a result with success False, or an exception,
+                fails the step
+            on_start: Called when a step starts
+            on_finish: Called with (step_id, record) when a step ends
+
+        Returns:
+            Records per step ID: status (completed, failed, skipped or
+            cancelled), result, and start/end offsets in seconds for steps
+            that ran
+        """
+        dag = self.dag
+        waiting = {step_id: set(deps) for step_id, deps in dag.dependencies.items()}
+        position = {step_id: i for i, step_id in enumerate(dag.order)}
+        ready = [step_id for step_id in dag.order if not waiting[step_id]]
+        running: Dict[Future, str] = {}
+        running_kinds: Dict[str, int] = {}
+        started = time.perf_counter()
+
+        def run_step(step_id: str) -> Dict[str, Any]:
+            return execute(step_id, dag.steps[step_id])
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="workflow-step") as pool:
+            while ready or running:
+                if self._cancel.is_set() and ready:
+                    self._mark(ready, "cancelled", "Workflow cancelled")
+                    ready = []
+
+                # Start every ready step its kind's limit allows
+                for step_id in list(ready):
+                    if len(running) >= self.max_workers:
+                        break
+                    kind = step_kind(dag.steps[step_id])
+                    if self._limit_reached(kind, running_kinds):
+                        continue
+
+                    ready.remove(step_id)
+                    running_kinds[kind] = running_kinds.get(kind, 0) + 1
+                    self.records[step_id] = {"status": "running", "start": time.perf_counter() - started}
+                    if on_start:
+                        on_start(step_id)
+                    running[pool.submit(run_step, step_id)] = step_id
+
+                if not running:
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    step_id = running.pop(future)
+                    kind = step_kind(dag.steps[step_id])
+                    running_kinds[kind] -= 1
+
+                    record = self.records[step_id]
+                    record["end"] = time.perf_counter() - started
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Step {step_id} failed: {e}")
+                        result = {"success": False, "error": str(e)}
+                    record["result"] = result
+
+                    if isinstance(result, dict) and result.get("success") is False:
+                        record["status"] = "failed"
+                        self._mark(
+                            sorted(dag.downstream(step_id), key=position.get),
+                            "skipped",
+                            f"Upstream step '{step_id}' failed"
+                        )
+                        ready = [s for s in ready if s not in self.records]
+                        if self.fail_fast:
+                            self.cancel()
+                    else:
+                        record["status"] = "completed"
+                        for dependent in dag.dependents[step_id]:
+                            waiting[dependent].discard(step_id)
+                            if not waiting[dependent] and dependent not in self.records:
+                                ready.append(dependent)
+                        ready.sort(key=position.get)
+
+                    if on_finish:
+                        on_finish(step_id, record)
+
+        # Steps that never became ready (their upstream was cancelled)
+        self._mark(dag.order, "cancelled", "Workflow cancelled")
+        self.wall_time = time.perf_counter() - started
+        return self.records
+
+    def timing_report(self) -> Dict[str, Any]:
+        """
+        Per-step timing and the critical path of the last run.
+
+        Returns:
+            Dict with wall_time_ms, busy_time_ms (sum of step durations),
+            parallelism (busy / wall), critical_path, critical_path_ms and
+            per-step start_ms/end_ms/duration_ms/status
+        """
+        durations = {
+            step_id: record["end"] - record["start"]
+            for step_id, record in self.records.items()
+            if "end" in record
+        }
+        path = self.dag.critical_path(durations)
+        busy = sum(durations.values())
+
+        steps = {}
+        for step_id in self.dag.order:
+            record = self.records.get(step_id, {})
+            entry = {"status": record.get("status", "pending")}
+            if step_id in durations:
+                entry.update({
+                    "start_ms": round(record["start"] * 1000, 1),
+                    "end_ms": round(record["end"] * 1000, 1),
+                    "duration_ms": round(durations[step_id] * 1000, 1)
+                })
+            steps[step_id] = entry
+
+        return {
+            "wall_time_ms": round(self.wall_time * 1000, 1),
+            "busy_time_ms": round(busy * 1000, 1),
+            "parallelism": round(busy / self.wall_time, 2) if self.wall_time > 0 else 0.0,
+            "critical_path": path,
+            "critical_path_ms": round(sum(durations.get(s, 0.0) for s in path) * 1000, 1),
+            "steps": steps
+        }
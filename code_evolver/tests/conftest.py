@@ -17,6 +17,17 @@ from src.bugcatcher import BugCatcher, ExceptionSeverity
 from src.fix_template_store import FixTemplateStore
 
 
+@pytest.fixture(autouse=True)
+def bugcatcher_log_in_tmp_path(tmp_path, monkeypatch):
+    """Write BugCatcher's file log under tmp_path, not the working directory."""
+    original_init = BugCatcher.__init__
+
+    def init(self, *args, log_file=str(tmp_path / "bugcatcher.log"), **kwargs):
+        original_init(self, *args, log_file=log_file, **kwargs)
+
+    monkeypatch.setattr(BugCatcher, "__init__", init)
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
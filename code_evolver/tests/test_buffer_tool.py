@@ -0,0 +1,181 @@
+"""
+Tests for the buffer tool's memory-mapped ring segment.
+"""
+import importlib.util
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+BUFFER_TOOL = Path(__file__).parent.parent / "tools" / "executable" / "buffer.py"
+
+
+@pytest.fixture
+def buffer_module(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    spec = importlib.util.spec_from_file_location("buffer_tool_under_test", BUFFER_TOOL)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "_BUFFER_DIR", tmp_path)
+    return module
+
+
+def make_buffer(module, buffer_id="test", **kwargs):
+    kwargs.setdefault("flush_strategy", "manual")
+    return module.Buffer(buffer_id=buffer_id, **kwargs)
+
+
+def test_write_and_flush_hands_over_items(buffer_module):
+    buffer = make_buffer(buffer_module, pass_through_tool="sink",
+                         pass_through_input={"collection": "usage"})
+    received = []
+    buffer._call_pass_through_tool = lambda raw, count: received.append(
+        json.loads(buffer._build_pass_through_input(raw, count))) or "ok"
+
+    items = [{"id": i, "name": f"item {i}"} for i in range(5)] + ["text", 3.5, None]
+    for item in items:
+        assert buffer.write(item)["flushed"] is False
+
+    assert buffer.items == items
+    result = buffer.flush()
+
+    assert result["flushed"] is True
+    assert result["flushed_count"] == len(items)
+    assert received[0]["buffered_items"] == items
+    assert received[0]["collection"] == "usage"
+    assert received[0]["buffer_metadata"]["count"] == len(items)
+    assert buffer.items == []
+    assert buffer.total_flushed == len(items)
+
+
+def test_failed_flush_keeps_items(buffer_module):
+    buffer = make_buffer(buffer_module, pass_through_tool="sink")
+
+    def fail(raw, count):
+        raise RuntimeError("sink down")
+
+    buffer._call_pass_through_tool = fail
+    buffer.write({"a": 1})
+    buffer.write({"a": 2})
+
+    result = buffer.flush()
+
+    assert result["flushed"] is False
+    assert "sink down" in result["error"]
+    assert buffer.items == [{"a": 1}, {"a": 2}]
+
+
+def test_ring_wraps_around(buffer_module):
+    buffer = make_buffer(buffer_module, capacity_bytes=256)
+    payload = "x" * 40
+
+    written = []
+    for i in range(30):
+        item = {"i": i, "p": payload}
+        result = buffer.write(item)
+        if "error" in result:
+            # Ring full: drop the oldest items by flushing, then retry
+            buffer.flush()
+            written.clear()
+            assert "error" not in buffer.write(item)
+        written.append(item)
+        assert buffer.items == written
+
+
+@pytest.mark.parametrize("capacity", [64, 62])  # room for a wrap marker / too little for one
+def test_partial_release_wraps_records_past_the_end(buffer_module, tmp_path, capacity):
+    ring = buffer_module.RingSegment(tmp_path / f"wrap{capacity}.ring", capacity)
+    records = [json.dumps(f"r{i}" + "x" * 12).encode() for i in range(5)]  # 16 bytes each
+    record_size = ring.LENGTH.size + 16
+
+    with ring.lock():
+        for record in records[:3]:
+            assert ring.append(record)
+        assert not ring.append(records[3])  # tail at 60, head at 0: full
+
+    # Release only the first record: head moves off 0 and is not reset
+    ring.release(record_size, 1)
+
+    with ring.lock():
+        assert ring.append(records[3])  # wraps past capacity
+        assert not ring.append(records[4])
+        _, head, tail, count, _, _ = ring._read_header()
+    assert head == record_size and tail > capacity and count == 3
+    assert ring.items() == [f"r{i}" + "x" * 12 for i in (1, 2, 3)]
+
+    # Release up to the wrapped record, then the rest
+    ring.release(2 * record_size, 1)
+    with ring.lock():
+        assert ring.append(records[4])
+    assert ring.items() == [f"r{i}" + "x" * 12 for i in (2, 3, 4)]
+
+    raw, count, end = ring.read_batch()
+    ring.release(end, count)
+    assert ring.items() == []
+    ring.close()
+
+
+def test_full_ring_auto_flushes_or_rejects(buffer_module):
+    batched = make_buffer(buffer_module, "batched", flush_strategy="batched",
+                          max_size=1000, flush_interval_seconds=3600, capacity_bytes=128)
+    for i in range(20):
+        assert "error" not in batched.write({"i": i})
+    assert batched.total_flushed > 0
+    assert batched.count + batched.total_flushed == 20
+
+    manual = make_buffer(buffer_module, "manual", capacity_bytes=64)
+    results = [manual.write({"i": i}) for i in range(20)]
+    assert any(r.get("error") == "Buffer full" for r in results)
+    assert manual.total_flushed == 0
+
+
+def test_buffer_persists_across_instances(buffer_module):
+    buffer = buffer_module.get_or_create_buffer(
+        "persisted", flush_strategy="manual", max_size=7
+    )
+    buffer.write({"k": "v"})
+    buffer.ring.close()
+    buffer_module._buffers.clear()
+
+    reloaded = buffer_module.get_or_create_buffer("persisted")
+
+    assert reloaded is not buffer
+    assert reloaded.max_size == 7
+    assert reloaded.flush_strategy == "manual"
+    assert reloaded.items == [{"k": "v"}]
+
+
+def test_legacy_pickle_state_is_migrated(buffer_module, tmp_path):
+    import pickle
+
+    with open(tmp_path / "legacy.pkl", "wb") as f:
+        pickle.dump({"items": [1, 2, 3], "max_size": 9, "flush_strategy": "manual"}, f)
+
+    buffer = buffer_module.Buffer.load_from_disk("legacy")
+
+    assert buffer.items == [1, 2, 3]
+    assert buffer.max_size == 9
+    assert not (tmp_path / "legacy.pkl").exists()
+
+
+def test_concurrent_producers_share_one_ring(buffer_module):
+    first = make_buffer(buffer_module, "shared")
+    second = make_buffer(buffer_module, "shared")  # separate mapping and file handle
+
+    def produce(buffer, producer):
+        for i in range(200):
+            assert "error" not in buffer.write({"producer": producer, "i": i})
+
+    threads = [threading.Thread(target=produce, args=(b, n))
+               for n, b in enumerate([first, second, first, second])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    items = first.items
+    assert len(items) == 800
+    assert second.count == 800
+    for producer in range(4):
+        assert [item["i"] for item in items if item["producer"] == producer] == list(range(200))
@@ -1,6 +1,7 @@
 """
 Tests for BugCatcher global exception monitoring.
 """
+import os
 import pytest
 import time
 from src.bugcatcher import (
@@ -319,6 +320,104 @@ class TestLokiBackend:
         # Batch should be cleared or still have 3 items
         assert len(backend._batch) <= 3
 
+    class FakeSession:
+        """Records Loki requests; fails while `down` is set."""
+
+        def __init__(self, delay=0.0):
+            self.delay = delay
+            self.down = False
+            self.requests = []
+
+        def post(self, url, data=None, timeout=None, headers=None):
+            import gzip
+            import json
+            import requests
+
+            time.sleep(self.delay)
+            if self.down:
+                raise requests.exceptions.ConnectionError("Loki is down")
+            self.requests.append((headers, json.loads(gzip.decompress(data))))
+
+            class Response:
+                status_code = 204
+                text = ""
+            return Response()
+
+    def test_push_never_blocks_on_slow_loki(self):
+        """Test that push returns immediately while the shipper sends."""
+        from src.bugcatcher import LokiBackend
+
+        backend = LokiBackend(batch_size=5, flush_interval=0.05)
+        backend._session = session = self.FakeSession(delay=0.2)
+
+        start = time.time()
+        for i in range(50):
+            backend.push(f"log{i}", {"level": "info"})
+        assert time.time() - start < 0.1
+
+        backend.close(timeout=10)
+        sent = [v[1] for _, p in session.requests for s in p["streams"] for v in s["values"]]
+        assert sent == [f"log{i}" for i in range(50)]
+
+    def test_entries_grouped_into_streams_and_gzipped(self):
+        """Test that repeated label sets share one stream."""
+        from src.bugcatcher import LokiBackend
+
+        backend = LokiBackend(batch_size=100, flush_interval=10)
+        backend._session = session = self.FakeSession()
+
+        for i in range(6):
+            backend.push(f"log{i}", {"job": "bugcatcher", "level": ["error", "info"][i % 2]})
+        backend.flush(timeout=5)
+
+        headers, payload = session.requests[0]
+        assert headers["Content-Encoding"] == "gzip"
+        assert len(session.requests) == 1
+        assert sorted(s["stream"]["level"] for s in payload["streams"]) == ["error", "info"]
+        assert [v[1] for v in payload["streams"][0]["values"]] == ["log0", "log2", "log4"]
+        backend.close()
+
+    def test_spools_while_down_and_replays(self, tmp_path):
+        """Test that failed batches go to disk and are sent once Loki is back."""
+        from src.bugcatcher import LokiBackend
+
+        backend = LokiBackend(batch_size=3, flush_interval=10, spool_dir=str(tmp_path / "spool"))
+        backend._session = session = self.FakeSession()
+        session.down = True
+
+        for i in range(5):
+            backend.push(f"log{i}", {"level": "error"})
+        backend.flush(timeout=5)
+
+        stats = backend.get_stats()
+        assert stats["spool_segments"] >= 1
+        assert stats["queued_entries"] + stats["spooled_entries"] == 5
+        assert stats["backing_off"]
+
+        session.down = False
+        backend._retry_at = 0
+        backend.flush(timeout=5)
+        backend.close()
+
+        sent = [v[1] for _, p in session.requests for s in p["streams"] for v in s["values"]]
+        assert sent == [f"log{i}" for i in range(5)]
+        assert backend.get_stats()["spool_segments"] == 0
+
+    def test_spool_is_size_capped(self, tmp_path):
+        """Test that the oldest spool segments are dropped beyond the cap."""
+        from src.bugcatcher import LokiBackend
+
+        backend = LokiBackend(spool_dir=str(tmp_path / "spool"), spool_max_mb=0.01)
+        noise = os.urandom(3000).hex()
+
+        for i in range(10):
+            backend._spill([({"level": "error"}, str(i), noise + str(i))])
+
+        stats = backend.get_stats()
+        assert stats["spool_bytes"] <= 0.01 * 1024 * 1024
+        assert 0 < stats["spool_segments"] < 10
+        assert stats["dropped_entries"] == 10 - stats["spool_segments"]
+
 
 class TestBugCatcherOutputTracking:
     """Test BugCatcher output tracking functionality."""
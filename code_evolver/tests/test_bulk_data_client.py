@@ -0,0 +1,119 @@
+"""
+Tests for the in-process bulk data client.
+Tests in-process dispatch, write-behind batching, backpressure and flushing
+against a stand-in bulk_data_store tool.
+"""
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bulk_data_client import BulkDataClient
+from src.database_storage import DatabaseStorage
+
+
+FAKE_TOOL = '''
+import threading
+
+CALLS = []
+GATE = threading.Event()
+GATE.set()
+
+
+class BulkDataStore:
+    @staticmethod
+    def store_batch(batch_operation, records):
+        GATE.wait()
+        CALLS.append((batch_operation, list(records)))
+        return {"success": True, "count": len(records), "failed": 0}
+
+    @staticmethod
+    def query_logs(filters=None, limit=100, offset=0):
+        return {"success": True, "data": [{"limit": limit}]}
+'''
+
+
+class TestBulkDataClient(unittest.TestCase):
+    """Test suite for BulkDataClient."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        tool_dir = Path(self.test_dir) / "executable"
+        tool_dir.mkdir()
+        (tool_dir / "bulk_data_store.py").write_text(FAKE_TOOL, encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _client(self, **kwargs):
+        return BulkDataClient(Path(self.test_dir), flush_interval=0.05, **kwargs)
+
+    def test_in_process_call(self):
+        """Test that synchronous operations run without a subprocess."""
+        client = self._client()
+
+        self.assertIsNotNone(client.store)
+        self.assertEqual(client.call("query_logs", limit=5)["data"], [{"limit": 5}])
+
+    def test_write_behind_batches(self):
+        """Test that queued records are written in per-operation batches."""
+        client = self._client(batch_size=100)
+        calls = client.store.store_batch.__globals__["CALLS"]
+
+        for i in range(10):
+            self.assertTrue(client.submit("store_log", tool_id="t", log_level="info", message=str(i)))
+        client.submit("store_perf_data", tool_id="t", metric_name="latency", metric_value=1.0)
+        self.assertTrue(client.flush(timeout=5))
+
+        logs = [r for op, records in calls if op == "store_log" for r in records]
+        self.assertEqual([r["message"] for r in logs], [str(i) for i in range(10)])
+        self.assertTrue(all("created_at" in r for r in logs))
+        self.assertLess(len(calls), 11)
+
+        stats = client.get_stats()
+        self.assertEqual(stats["written"], 11)
+        self.assertEqual(stats["failed"], 0)
+
+    def test_backpressure_drops_when_full(self):
+        """Test that a full queue blocks for put_timeout and then drops."""
+        client = self._client(batch_size=1, max_queue=1, put_timeout=0.05)
+        gate = client.store.store_batch.__globals__["GATE"]
+        gate.clear()
+        try:
+            results = [client.submit("store_log", tool_id="t", log_level="info", message=str(i)) for i in range(4)]
+        finally:
+            gate.set()
+
+        self.assertIn(False, results)
+        self.assertTrue(client.flush(timeout=5))
+        self.assertEqual(client.get_stats()["dropped"], results.count(False))
+
+    def test_close_flushes(self):
+        """Test that close() writes pending records and rejects new ones."""
+        client = self._client()
+        calls = client.store.store_batch.__globals__["CALLS"]
+
+        client.submit("store_bug", bug_id="b1", tool_id="t", severity="high", message="boom")
+        client.close()
+
+        self.assertEqual(calls[-1][0], "store_bug")
+        self.assertFalse(client.submit("store_log", tool_id="t", log_level="info", message="late"))
+
+    def test_database_storage_uses_queue(self):
+        """Test that DatabaseStorage writes go through the write-behind queue."""
+        storage = DatabaseStorage(tools_path=Path(self.test_dir))
+        storage.enabled = True
+        storage.client = self._client()
+
+        self.assertTrue(storage.store_log("t", "info", "hello"))
+        self.assertTrue(storage.store_ancestry("p", "c", "mutation"))
+        self.assertTrue(storage.flush(timeout=5))
+        self.assertEqual(storage.client.get_stats()["written"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
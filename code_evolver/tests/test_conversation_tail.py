@@ -0,0 +1,150 @@
+"""
+Tests for the in-memory conversation tail and incremental context sizing.
+"""
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import QdrantClient
+
+from src.conversation.context_manager import ContextMemoryManager, estimate_message_tokens
+from src.conversation.conversation_storage import ConversationStorage, ConversationTail
+from src.conversation.conversation_tool import ConversationTool
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    storage = ConversationStorage(vector_size=4, tail_size=5)
+    storage.qdrant = QdrantClient(":memory:")
+    monkeypatch.setattr(storage, "_generate_embedding", lambda text: [1.0, 0.0, 0.0, float(len(text))])
+    return storage
+
+
+def test_tail_tracks_running_token_total():
+    tail = ConversationTail(max_messages=3)
+    messages = [{"role": "user", "content": "x" * (40 * i)} for i in range(5)]
+
+    for message in messages:
+        tail.append(message)
+
+    kept, tokens = tail.snapshot()
+    assert kept == messages[-3:]
+    assert tokens == [estimate_message_tokens(m) for m in messages[-3:]]
+    assert tail.total_tokens == sum(tokens)
+    assert tail.evicted == 2 and tail.total_messages == 5 and not tail.complete
+
+    assert tail.take_overflow() == messages[:2]
+    assert tail.take_overflow() == []
+
+    tail.drop_oldest(2)
+    assert tail.snapshot()[0] == messages[-1:]
+    assert tail.total_tokens == tokens[-1]
+    assert tail.take_overflow() == []  # Summarized by the caller
+
+
+def test_recent_messages_served_without_qdrant(storage, monkeypatch):
+    conversation_id = storage.create_conversation("topic")
+    for i in range(4):
+        storage.add_message(conversation_id, "user", f"message {i}")
+
+    monkeypatch.setattr(storage.qdrant, "scroll", lambda *a, **k: pytest.fail("scrolled Qdrant"))
+
+    assert [m["content"] for m in storage.get_conversation_messages(conversation_id)] == [
+        f"message {i}" for i in range(4)
+    ]
+    assert [m["content"] for m in storage.get_conversation_messages(conversation_id, limit=2)] == [
+        "message 2", "message 3"
+    ]
+
+
+def test_cold_start_and_evicted_history_read_qdrant(storage):
+    conversation_id = storage.create_conversation("topic")
+    for i in range(8):
+        storage.add_message(conversation_id, "user", f"message {i}")
+
+    # Older than the tail: falls back to Qdrant, newest last
+    history = storage.get_conversation_messages(conversation_id)
+    assert [m["content"] for m in history] == [f"message {i}" for i in range(8)]
+
+    # Another process: tail is warmed from Qdrant once
+    other = ConversationStorage(vector_size=4, tail_size=5)
+    other.qdrant = storage.qdrant
+    tail = other.get_tail(conversation_id)
+
+    assert [m["content"] for m in tail.snapshot()[0]] == [f"message {i}" for i in range(3, 8)]
+    assert tail.total_messages == 8
+
+
+def test_optimize_context_uses_precomputed_tokens():
+    manager = ContextMemoryManager("llama3")
+    messages = [{"role": "user", "content": "x" * 400} for _ in range(3)]
+
+    estimated = manager.optimize_context(messages)
+    precomputed = manager.optimize_context(messages, message_tokens=[estimate_message_tokens(m) for m in messages])
+
+    assert precomputed == estimated
+    assert manager.should_summarize(messages, total_tokens=10 ** 6)
+    assert not manager.should_summarize(messages)
+
+
+def test_summarization_keeps_every_message(storage, monkeypatch):
+    conversation_id = storage.create_conversation("topic")
+    for i in range(10):
+        storage.add_message(conversation_id, "user", f"m{i}")
+
+    summarized = []
+
+    class RecordingSummarizer:
+        def summarize_messages(self, messages, previous_summary=None, topic=None):
+            summarized.extend(m["content"] for m in messages)
+            return {"summary": "summary", "time_taken": 0.0, "message_count": len(messages)}
+
+    class NoRelatedContext:
+        def get_related_context(self, **kwargs):
+            return []
+
+    tool = ConversationTool.__new__(ConversationTool)
+    tool.storage = storage
+    tool.context_manager = ContextMemoryManager("llama3")
+    tool.summarizer = RecordingSummarizer()
+    tool.embedder = NoRelatedContext()
+    tool.current_conversation_id = conversation_id
+    tool.current_summary = None
+    monkeypatch.setattr(tool.context_manager, "should_summarize", lambda *a, **k: True)
+
+    tool.prepare_context_for_response("next")
+
+    kept = [m["content"] for m in storage.get_tail(conversation_id).snapshot()[0]]
+    # m0..m4 were evicted from the tail, m5..m6 split off for summarizing
+    assert summarized + kept == [f"m{i}" for i in range(10)]
+    assert kept == ["m7", "m8", "m9"]
+
+
+def test_evicted_messages_summarized_below_threshold(storage, monkeypatch):
+    conversation_id = storage.create_conversation("topic")
+    for i in range(7):
+        storage.add_message(conversation_id, "user", f"m{i}")
+
+    summarized = []
+
+    class RecordingSummarizer:
+        def summarize_messages(self, messages, previous_summary=None, topic=None):
+            summarized.extend(m["content"] for m in messages)
+            return {"summary": "summary", "time_taken": 0.0, "message_count": len(messages)}
+
+    tool = ConversationTool.__new__(ConversationTool)
+    tool.storage = storage
+    tool.context_manager = ContextMemoryManager("llama3")
+    tool.summarizer = RecordingSummarizer()
+    tool.embedder = type("NoRelatedContext", (), {"get_related_context": lambda self, **k: []})()
+    tool.current_conversation_id = conversation_id
+    tool.current_summary = None
+
+    result = tool.prepare_context_for_response("next")
+
+    assert summarized == ["m0", "m1"]
+    assert tool.current_summary == "summary"
+    assert [m["content"] for m in result["messages"]] == [f"m{i}" for i in range(2, 7)]
+
+    tool.prepare_context_for_response("again")
+    assert summarized == ["m0", "m1"]
@@ -2,6 +2,7 @@
 Tests for the hybrid debug store (LMDB + DuckDB)
 """
 
+import json
 import pytest
 import tempfile
 import shutil
@@ -388,5 +389,73 @@ class TestDebugStore:
         assert result[0] == 50  # 5 threads * 10 records each
 
 
+    def _write_many(self, store, count, context_id="batch_tool"):
+        return [
+            store.write_record(
+                context_type="tool",
+                context_id=context_id,
+                context_name="Batch Tool",
+                request_data={"i": i},
+                response_data={"ok": True},
+                duration_ms=i,
+                memory_mb=1.5,
+                metadata={"n": i}
+            )
+            for i in range(count)
+        ]
+
+    def test_get_records_multi_get(self, store):
+        """Test fetching several records in one transaction"""
+        ids = self._write_many(store, 5)
+
+        records = store.get_records([ids[3], "missing", ids[0]])
+        assert [r.id for r in records] == [ids[3], ids[0]]
+        assert records[0].request_data == {"i": 3}
+
+        assert len(store.get_records_by_context("tool", "batch_tool", limit=None)) == 5
+        assert len(store.get_records_by_context("tool", "batch_tool", limit=2)) == 2
+
+    @pytest.mark.parametrize("use_arrow", [True, False])
+    def test_batched_sync(self, store, monkeypatch, use_arrow):
+        """Test sync in several batches, with and without pyarrow"""
+        import debug_store
+        if use_arrow and not debug_store.PYARROW_AVAILABLE:
+            pytest.skip("pyarrow not installed")
+        monkeypatch.setattr(debug_store, "PYARROW_AVAILABLE", use_arrow)
+
+        ids = self._write_many(store, 25)
+
+        assert store.sync_to_duckdb(batch_size=10) == 25
+        assert store.get_stats()["pending_sync"] == 0
+        assert store.sync_to_duckdb(batch_size=10) == 0
+
+        row = store.query_analytics(
+            "SELECT request_data, metadata, duration_ms, typeof(timestamp) FROM records WHERE id = ?",
+            [ids[7]]
+        ).fetchone()
+        assert json.loads(row[0]) == {"i": 7}
+        assert json.loads(row[1]) == {"n": 7}
+        assert row[2] == 7.0
+        assert row[3] == "TIMESTAMP"
+
+    def test_compact_synced_prunes_only_synced_records(self, store):
+        """Test age-based compaction of LMDB records already in DuckDB"""
+        synced_ids = self._write_many(store, 3)
+        store.sync_to_duckdb()
+        pending_ids = self._write_many(store, 2, context_id="pending_tool")
+
+        # Nothing is old enough yet
+        assert store.compact_synced(max_age_seconds=3600) == 0
+
+        assert store.compact_synced(max_age_seconds=0, batch_size=2) == 3
+        assert store.get_records(synced_ids) == []
+        assert store.get_records_by_context("tool", "batch_tool") == []
+        assert len(store.get_records(pending_ids)) == 2
+        assert store.get_stats()["lmdb_records"] == 2
+
+        # Pruned records are still available for analytics
+        assert store.query_analytics("SELECT COUNT(*) FROM records").fetchone()[0] == 3
+        assert store.sync_to_duckdb() == 2
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,105 @@
+"""
+Tests for the chunked, content-addressed document store tool.
+"""
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+DOCUMENT_STORE = Path(__file__).parent.parent / "tools" / "executable" / "document_store.py"
+
+
+@pytest.fixture(scope="module")
+def store_module():
+    spec = importlib.util.spec_from_file_location("document_store_under_test", DOCUMENT_STORE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def store(store_module, tmp_path, monkeypatch):
+    monkeypatch.setattr(store_module, "CHUNK_CHARS", 16)
+    return store_module.DocumentStore(root=tmp_path / "store", legacy_file=tmp_path / "missing.json")
+
+
+def test_store_and_retrieve_round_trip(store):
+    content = "Grüße, 世界! " * 20
+
+    stored = store.store("doc", content, {"filename": "a.txt"})
+    result = store.retrieve("doc")
+
+    assert stored["metadata"]["size"] == len(content)
+    assert result["content"] == content
+    assert result["length"] == len(content)
+    assert result["metadata"] == {"filename": "a.txt", "size": len(content)}
+    assert store.exists("doc")["exists"] is True
+    assert store.exists("other")["exists"] is False
+
+
+def test_range_reads_only_touch_overlapping_chunks(store, store_module, monkeypatch):
+    content = "".join(chr(ord("a") + i % 26) for i in range(200))
+    store.store("doc", content)
+
+    for offset, length in [(0, 5), (14, 4), (16, 16), (150, 100), (199, 1), (250, 3)]:
+        assert store.retrieve("doc", offset, length)["content"] == content[offset:offset + length]
+
+    opened = []
+    real_open = open
+    monkeypatch.setattr("builtins.open", lambda path, *a, **k: opened.append(str(path)) or real_open(path, *a, **k))
+    store.retrieve("doc", 33, 10)
+
+    assert len([path for path in opened if "blobs" in path]) == 1
+
+
+def test_identical_chunks_are_stored_once(store):
+    content = "x" * 64 + "tail"
+    store.store("a", content)
+    store.store("b", content, {"copy": True})
+
+    assert len(list(store.blob_dir.glob("*/*"))) == 2  # one "x" * 16 chunk and the tail
+
+
+def test_update_metadata_keeps_content(store):
+    store.store("doc", "some content", {"filename": "a.txt"})
+
+    result = store.update_metadata("doc", {"extracted": True})
+
+    assert result["metadata"] == {"filename": "a.txt", "size": 12, "extracted": True}
+    assert store.retrieve("doc")["content"] == "some content"
+    assert store.retrieve("doc", include_content=False) == {
+        "success": True,
+        "operation": "retrieve",
+        "document_id": "doc",
+        "metadata": {"filename": "a.txt", "size": 12, "extracted": True},
+        "length": 12
+    }
+    assert store.update_metadata("missing", {})["success"] is False
+
+
+def test_delete_list_and_gc(store):
+    store.store("keep", "k" * 40)
+    store.store("drop", "d" * 40)
+
+    assert store.delete("drop")["success"] is True
+    assert store.retrieve("drop")["success"] is False
+    assert [d["document_id"] for d in store.list_documents()["documents"]] == ["keep"]
+    assert store.gc()["removed_chunks"] == 2
+    assert store.retrieve("keep")["content"] == "k" * 40
+
+    store.clear()
+    assert store.list_documents()["count"] == 0
+
+
+def test_legacy_json_store_is_migrated(store_module, tmp_path):
+    legacy = tmp_path / "document_store.json"
+    legacy.write_text(json.dumps({
+        "old": {"content": "legacy text", "metadata": {"size": 11}, "stored_at": "2024-01-01T00:00:00"}
+    }))
+
+    store = store_module.DocumentStore(root=tmp_path / "store", legacy_file=legacy)
+
+    assert store.retrieve("old")["content"] == "legacy text"
+    assert store.list_documents()["documents"][0]["stored_at"] == "2024-01-01T00:00:00"
+    assert not legacy.exists()
@@ -0,0 +1,124 @@
+"""
+Tests for the persistent embedding cache.
+Tests key normalization, LRU/disk hits, persistence across instances and
+recovery from a torn tail.
+"""
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.embedding_cache import EmbeddingCache, text_key
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    """Test suite for EmbeddingCache."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = EmbeddingCache(cache_path=self.test_dir, lru_size=2)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_text_key_normalizes_whitespace(self):
+        """Test that whitespace-only differences share a key."""
+        self.assertEqual(text_key("hello   world\n"), text_key(" hello world"))
+        self.assertNotEqual(text_key("hello world"), text_key("hello there"))
+
+    def test_put_and_get(self):
+        """Test memory hits, misses and per-model separation."""
+        self.cache.put("m1", "alpha", [1.0, 2.0])
+
+        self.assertEqual(self.cache.get("m1", "alpha"), [1.0, 2.0])
+        self.assertIsNone(self.cache.get("m2", "alpha"))
+        self.assertIsNone(self.cache.get("m1", "beta"))
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["stores"], 1)
+
+    def test_disk_hit_after_lru_eviction(self):
+        """Test that entries evicted from the LRU are read from disk."""
+        for i in range(4):
+            self.cache.put("m", f"text {i}", [float(i), 0.5])
+
+        self.assertEqual(self.cache.get("m", "text 0"), [0.0, 0.5])
+        self.assertEqual(self.cache.get_stats()["disk_hits"], 1)
+
+    def test_persistence(self):
+        """Test that a new instance sees vectors written by the previous one."""
+        self.cache.put_many("m", ["a", "b", "c"], [[1.0, 0.0], None, [0.0, 1.0]])
+        self.cache.close()
+
+        reopened = EmbeddingCache(cache_path=self.test_dir)
+        self.assertEqual(reopened.get_many("m", ["a", "b", "c"]), [[1.0, 0.0], None, [0.0, 1.0]])
+        self.assertEqual(reopened.get_stats()["disk_hits"], 2)
+        reopened.close()
+
+    def test_dimension_mismatch_not_cached(self):
+        """Test that vectors of a different dimension are rejected."""
+        self.cache.put("m", "a", [1.0, 2.0])
+        self.cache.put("m", "b", [1.0, 2.0, 3.0])
+
+        self.assertIsNone(self.cache.get("m", "b"))
+
+    def test_torn_tail_trimmed(self):
+        """Test that a crash mid-write leaves a readable cache."""
+        self.cache.put_many("m", ["a", "b"], [[1.0, 1.0], [2.0, 2.0]])
+        self.cache.close()
+
+        store_dir = next(Path(self.test_dir).iterdir())
+        with open(store_dir / "vectors.f32", "ab") as f:
+            f.write(b"\x00\x00")  # partial row without a key
+        with open(store_dir / "keys.txt", "ab") as f:
+            f.write(b"deadbeef")  # torn key line
+
+        reopened = EmbeddingCache(cache_path=self.test_dir)
+        self.assertEqual(reopened.get("m", "b"), [2.0, 2.0])
+        reopened.put("m", "c", [3.0, 3.0])
+        reopened.close()
+
+        again = EmbeddingCache(cache_path=self.test_dir)
+        self.assertEqual(again.get_many("m", ["a", "b", "c"]), [[1.0, 1.0], [2.0, 2.0], [3.0, 3.0]])
+        again.close()
+
+    def test_shared_directory_rows_stay_aligned(self):
+        """Test that two caches appending to one directory keep keys on their rows."""
+        other = EmbeddingCache(cache_path=self.test_dir, lru_size=0)
+        reader = EmbeddingCache(cache_path=self.test_dir, lru_size=0)
+
+        self.cache.put("m", "x", [1.0, 0.0])
+        other.put("m", "y", [0.0, 1.0])
+        self.cache.put("m", "z", [0.5, 0.5])
+        other.put("m", "w", [0.25, 0.75])
+
+        for cache in (self.cache, other, reader):
+            self.assertEqual(
+                cache.get_many("m", ["x", "y", "z", "w"]),
+                [[1.0, 0.0], [0.0, 1.0], [0.5, 0.5], [0.25, 0.75]]
+            )
+        other.close()
+        reader.close()
+
+    def test_open_does_not_truncate(self):
+        """Test that opening a store leaves another writer's tail in place."""
+        self.cache.put("m", "a", [1.0, 1.0])
+        store_dir = next(Path(self.test_dir).iterdir())
+        with open(store_dir / "vectors.f32", "ab") as f:
+            f.write(b"\x00\x00")  # another process mid-append
+
+        reopened = EmbeddingCache(cache_path=self.test_dir)
+        self.assertEqual(reopened.get("m", "a"), [1.0, 1.0])
+        self.assertEqual((store_dir / "vectors.f32").stat().st_size, 10)
+        reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Tests for the batched embedding client.
+Tests request batching, micro-batch coalescing of concurrent callers and
+error handling.
+"""
+import unittest
+import tempfile
+import shutil
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.embedding_cache import EmbeddingCache
+from src.embedding_client import EmbeddingClient, get_embedding_client
+
+
+def _fake_post(calls):
+    """Build a session.post replacement that embeds each input as [len(text)]."""
+    lock = threading.Lock()
+
+    def post(url, json=None, timeout=None):
+        with lock:
+            calls.append(list(json["input"]))
+        response = MagicMock()
+        response.json.return_value = {"embeddings": [[float(len(t)), 1.0] for t in json["input"]]}
+        return response
+
+    return post
+
+
+class TestEmbeddingClient(unittest.TestCase):
+    """Test suite for EmbeddingClient."""
+
+    def setUp(self):
+        self.calls = []
+        self.client = EmbeddingClient("http://localhost:11434/", "test-model", max_batch_size=4, linger_ms=50)
+        self.client.session.post = _fake_post(self.calls)
+
+    def test_embed_many_chunks_requests(self):
+        """Test that embed_many sends one request per max_batch_size texts."""
+        texts = [f"text {i}" * (i + 1) for i in range(10)]
+        embeddings = self.client.embed_many(texts)
+
+        self.assertEqual(len(self.calls), 3)
+        self.assertEqual([len(c) for c in self.calls], [4, 4, 2])
+        self.assertEqual([e[0] for e in embeddings], [float(len(t)) for t in texts])
+        self.assertEqual(self.client.get_stats(), {"requests_sent": 3, "texts_embedded": 10})
+
+    def test_embed_coalesces_concurrent_callers(self):
+        """Test that concurrent embed() calls share requests."""
+        texts = [f"t{i}" * (i + 1) for i in range(8)]
+        results = {}
+
+        def worker(text):
+            results[text] = self.client.embed(text)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in texts]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for text in texts:
+            self.assertEqual(results[text][0], float(len(text)))
+        self.assertLess(len(self.calls), len(texts))
+        self.assertTrue(all(len(c) <= 4 for c in self.calls))
+
+    def test_failed_request_returns_none(self):
+        """Test that a failed request yields None for each input."""
+        self.client.session.post = MagicMock(side_effect=ConnectionError("down"))
+
+        self.assertEqual(self.client.embed_many(["a", "b"]), [None, None])
+        self.assertIsNone(self.client.embed("a"))
+
+    def test_mismatched_response_returns_none(self):
+        """Test that a response with the wrong number of vectors is rejected."""
+        response = MagicMock()
+        response.json.return_value = {"embeddings": [[1.0]]}
+        self.client.session.post = MagicMock(return_value=response)
+
+        self.assertEqual(self.client.embed_many(["a", "b"]), [None, None])
+
+    def test_cache_skips_repeated_texts(self):
+        """Test that cached and duplicate texts are not sent again."""
+        test_dir = tempfile.mkdtemp()
+        try:
+            self.client.cache = EmbeddingCache(cache_path=test_dir)
+
+            first = self.client.embed_many(["a", "bb", "a"])
+            self.assertEqual(self.calls, [["a", "bb"]])
+            self.assertEqual(first[0], first[2])
+
+            second = self.client.embed_many(["bb", "ccc"])
+            self.assertEqual(self.calls[-1], ["ccc"])
+            self.assertEqual(second[0], first[1])
+
+            self.assertEqual(self.client.embed("a"), first[0])
+            self.assertEqual(len(self.calls), 2)
+            self.assertGreater(self.client.get_stats()["cache"]["hit_rate"], 0)
+            self.client.cache.close()
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+    def test_shared_client_per_endpoint_and_model(self):
+        """Test get_embedding_client returns one client per endpoint/model."""
+        a = get_embedding_client("http://host:1/", "m")
+        b = get_embedding_client("http://host:1", "m")
+        c = get_embedding_client("http://host:1", "other")
+
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -266,5 +266,85 @@ class TestFilesystemManagerEdgeCases(unittest.TestCase):
         manager.validate_extension(path)
 
 
+class TestFilesystemManagerUsageLedger(unittest.TestCase):
+    """Test incremental quota accounting and list pagination."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = FilesystemManager(
+            base_path=self.temp_dir,
+            max_file_size_mb=1,
+            max_total_size_mb=1,
+            background_reconcile=False
+        )
+        self.scope = "ledger_tool"
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        if Path(self.temp_dir).exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_ledger_tracks_mutations_without_rescanning(self):
+        """Test that every mutation keeps the ledger equal to a full scan."""
+        self.manager.write(self.scope, "a.txt", "x" * 100)
+
+        with patch.object(self.manager, "scan_total_size", side_effect=AssertionError("rescanned")):
+            self.manager.write(self.scope, "a.txt", "y" * 40)
+            self.manager.append(self.scope, "a.txt", "z" * 10)
+            self.manager.write(self.scope, "dir/b.txt", "b" * 30)
+            self.manager.copy(self.scope, "dir/b.txt", "dir/c.txt")
+            self.manager.move(self.scope, "dir/c.txt", "a.txt")
+            self.manager.write(self.scope, "dir/sub/d.txt", "d" * 5)
+            total = self.manager.get_total_size(self.scope)
+
+        self.assertEqual(total, 65)
+        self.assertEqual(total, self.manager.scan_total_size(self.scope))
+
+        self.manager.delete(self.scope, "dir", recursive=True)
+        self.assertEqual(self.manager.get_total_size(self.scope), 30)
+
+    def test_quota_enforced_from_ledger(self):
+        """Test that the total size limit still applies."""
+        chunk = "x" * (400 * 1024)
+        self.assertEqual(self.manager.write(self.scope, "1.txt", chunk)["status"], "success")
+        self.assertEqual(self.manager.write(self.scope, "2.txt", chunk)["status"], "success")
+
+        result = self.manager.write(self.scope, "3.txt", chunk)
+        self.assertEqual(result["status"], "error")
+        self.assertIn("exceed limit", result["message"])
+
+        # Overwriting a file only counts the size difference
+        self.assertEqual(self.manager.write(self.scope, "2.txt", chunk)["status"], "success")
+
+    def test_stale_ledger_is_reconciled(self):
+        """Test that out-of-band changes are picked up by a rescan."""
+        self.manager.write(self.scope, "a.txt", "x" * 10)
+        (self.manager.get_scope_path(self.scope) / "external.txt").write_text("e" * 20)
+
+        self.assertEqual(self.manager.get_total_size(self.scope), 10)
+
+        self.manager.reconcile_interval_seconds = 0
+        self.assertEqual(self.manager.get_total_size(self.scope), 30)
+
+    def test_list_files_pagination(self):
+        """Test cursor-based pagination of list results."""
+        for i in range(7):
+            self.manager.write(self.scope, f"file{i}.txt", str(i))
+
+        pages = []
+        cursor = None
+        while True:
+            result = self.manager.list_files(self.scope, pattern="*.txt", limit=3, cursor=cursor)
+            pages.append([f["name"] for f in result["files"]])
+            cursor = result.get("next_cursor")
+            if cursor is None:
+                break
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(sum(pages, []), [f"file{i}.txt" for i in range(7)])
+        self.assertNotIn("next_cursor", self.manager.list_files(self.scope, pattern="*.txt"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,132 @@
+"""
+Tests for the InteractionLogger cache.
+Tests the exact-hash fast path, per-tool vector partitions and loading
+partitions from previously stored interactions.
+"""
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.interaction_logger import InteractionLogger
+from src.rag_memory import Artifact
+
+
+class FakeRAG:
+    """Minimal in-memory RAG store embedding text as a bag of characters."""
+
+    def __init__(self):
+        self.artifacts = {}
+        self.embed_calls = []
+
+    def _generate_embedding(self, text):
+        self.embed_calls.append(text)
+        vector = [0.0] * 26
+        for ch in text.lower():
+            if 'a' <= ch <= 'z':
+                vector[ord(ch) - ord('a')] += 1.0
+        return vector
+
+    def store_artifact(self, artifact_id, artifact_type, name, description, content,
+                       tags, metadata=None, auto_embed=True):
+        embedding = self._generate_embedding(content) if auto_embed else None
+        artifact = Artifact(artifact_id, artifact_type, name, description, content,
+                            tags, metadata, embedding=embedding)
+        self.artifacts[artifact_id] = artifact
+        return artifact
+
+    def find_by_tags(self, tags, artifact_type=None, match_all=False, limit=None):
+        return [a for a in self.artifacts.values() if all(t in a.tags for t in tags)]
+
+    def get_artifact(self, artifact_id):
+        return self.artifacts.get(artifact_id)
+
+    def update_quality_score(self, artifact_id, score):
+        self.artifacts[artifact_id].quality_score = score
+
+    def find_similar(self, *args, **kwargs):
+        raise AssertionError("whole-memory search should not be used")
+
+
+class TestInteractionLogger(unittest.TestCase):
+    """Test suite for InteractionLogger caching."""
+
+    def setUp(self):
+        self.rag = FakeRAG()
+        self.logger = InteractionLogger(rag_memory=self.rag, ollama_client=MagicMock())
+
+    def test_exact_match_skips_embedding_and_comparator(self):
+        """Test that an identical input is reused without embedding or LLM calls."""
+        self.logger.log_interaction("translate", {"text": "hello", "lang": "fr"},
+                                    output_data="bonjour", quality_score=0.9)
+        self.logger.compare_prompts_semantically = MagicMock()
+        embeds_before = len(self.rag.embed_calls)
+
+        result = self.logger.get_cached_result("translate", {"lang": "fr", "text": "hello"})
+
+        self.assertEqual(result['decision'], 'reuse')
+        self.assertTrue(result['cached']['exact_match'])
+        self.assertEqual(len(self.rag.embed_calls), embeds_before)
+        self.logger.compare_prompts_semantically.assert_not_called()
+
+    def test_exact_match_respects_filters(self):
+        """Test that failed or non-cacheable exact matches are not reused."""
+        self.logger.log_interaction("tool", "same input", success=False, quality_score=0.9)
+        self.logger.log_interaction("creative", "same input", quality_score=0.9, cacheable_output=False)
+
+        self.assertEqual(self.logger.find_similar_interactions("tool", "same input"), [])
+        self.assertEqual(self.logger.find_similar_interactions("creative", "same input"), [])
+
+    def test_similarity_search_is_partitioned_by_tool(self):
+        """Test that similar inputs of other tools are never returned."""
+        self.logger.log_interaction("a", "summarize this report", quality_score=0.9)
+        self.logger.log_interaction("b", "summarize this report please", quality_score=0.9)
+
+        results = self.logger.find_similar_interactions("a", "summarize this report please",
+                                                        similarity_threshold=0.5)
+
+        self.assertEqual([r['tool_id'] for r in results], ["a"])
+        self.assertFalse(results[0]['exact_match'])
+        self.assertIsNotNone(results[0]['artifact'])
+
+    def test_unknown_tool_needs_no_embedding(self):
+        """Test that a tool with no logged interactions returns without embedding."""
+        self.assertEqual(self.logger.find_similar_interactions("never_used", "x"), [])
+        self.assertEqual(self.rag.embed_calls, [])
+
+    def test_partition_loaded_from_existing_rag(self):
+        """Test that a new logger picks up interactions already stored in RAG."""
+        self.logger.log_interaction("tool", {"q": 1}, quality_score=0.9)
+
+        fresh = InteractionLogger(rag_memory=self.rag, ollama_client=MagicMock())
+        results = fresh.find_similar_interactions("tool", {"q": 1})
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0]['exact_match'])
+
+    def test_exact_match_prefers_best_quality(self):
+        """Test that the exact layer returns the best match, whatever the load order."""
+        self.logger.log_interaction("tool", "input", output_data="good", quality_score=0.95)
+        self.logger.log_interaction("tool", "input", output_data="poor", quality_score=0.75)
+
+        # RAG returns interactions best first; a fresh logger loads them in that order
+        fresh = InteractionLogger(rag_memory=self.rag, ollama_client=MagicMock())
+        for logger in (self.logger, fresh):
+            result = logger.find_similar_interactions("tool", "input")
+            self.assertEqual(result[0]['quality_score'], 0.95)
+
+    def test_quality_update_reaches_cache(self):
+        """Test that updating quality changes cache filtering."""
+        interaction = self.logger.log_interaction("tool", "input", quality_score=0.2)
+        self.assertIsNone(self.logger.get_cached_result("tool", "input"))
+
+        self.logger.update_interaction_quality(interaction['interaction_id'], 0.9)
+
+        self.assertEqual(self.logger.get_cached_result("tool", "input")['decision'], 'reuse')
+
+
+if __name__ == '__main__':
+    unittest.main()
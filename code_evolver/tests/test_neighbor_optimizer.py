@@ -0,0 +1,111 @@
+"""
+Tests for NeighborOptimizer neighbor search.
+Compares the indexed search against a pairwise reference implementation.
+"""
+import numpy as np
+import pytest
+
+from src.neighbor_optimizer import NeighborOptimizer
+from src.rag_cluster_optimizer import ArtifactVariant, PerformanceMetrics
+from src.system_optimizer import ClusterInfo
+
+PARAMS = ["text", "lang", "mode", "limit", "verbose"]
+OUTPUTS = ["str", "text", "int", "number", "float", "dict"]
+CONSTRAINTS = ["timeout", "memory", "pure"]
+
+
+def _reference_neighbors(optimizer, variant, cluster, k, min_performance):
+    """Pairwise search as done before the index existed."""
+    current_interface = optimizer.extract_interface(variant)
+    current_fitness = variant.performance.fitness_score()
+    neighbors = []
+    for candidate in cluster.variants:
+        if candidate.variant_id == variant.variant_id:
+            continue
+        fitness = candidate.performance.fitness_score()
+        if fitness < min_performance:
+            continue
+        interface = optimizer.extract_interface(candidate)
+        if not current_interface.matches(interface):
+            continue
+        interface_sim = current_interface.similarity_score(interface)
+        embedding_sim = variant.similarity_to(candidate)
+        combined = 0.4 * embedding_sim + 0.4 * interface_sim + 0.2 * (fitness / (current_fitness + 1e-6))
+        neighbors.append((1.0 - combined, candidate.variant_id))
+    neighbors.sort(key=lambda n: n[0])
+    return neighbors[:k]
+
+
+@pytest.fixture
+def optimizer():
+    # Only the neighbor-search state is needed; SystemOptimizer.__init__
+    # wires up RAG and version management that these tests do not touch
+    optimizer = NeighborOptimizer.__new__(NeighborOptimizer)
+    optimizer.tool_interfaces = {}
+    optimizer.neighbor_indexes = {}
+    return optimizer
+
+
+@pytest.fixture
+def cluster():
+    rng = np.random.default_rng(5)
+    variants = []
+    for i in range(300):
+        params = {p: "str" for p in rng.choice(PARAMS, size=rng.integers(1, 4), replace=False)}
+        metadata = {
+            "parameters": params,
+            "output_type": str(rng.choice(OUTPUTS)),
+            "constraints": {c: True for c in rng.choice(CONSTRAINTS, size=rng.integers(0, 3), replace=False)}
+        }
+        if i % 7 == 0:
+            # Interface parsed from content instead of metadata
+            metadata = {"output_type": "str"}
+        variants.append(ArtifactVariant(
+            variant_id=f"v{i}",
+            artifact_id="tool",
+            version="1.0.0",
+            content=f"def run({', '.join(params)}):\n    pass\n",
+            embedding=None if i % 11 == 0 else rng.standard_normal(8),
+            performance=PerformanceMetrics(
+                latency_ms=float(rng.uniform(10, 900)),
+                success_rate=float(rng.uniform(0.5, 1.0)),
+                test_coverage=float(rng.uniform(0, 1))
+            ),
+            metadata=metadata
+        ))
+    return ClusterInfo("c1", variants[0], variants, 0.5, len(variants), len(variants))
+
+
+def test_matches_pairwise_reference(optimizer, cluster):
+    for variant in cluster.variants[:40]:
+        min_performance = variant.performance.fitness_score() * 0.8
+        expected = _reference_neighbors(optimizer, variant, cluster, 10, min_performance)
+
+        neighbors = optimizer.find_nearest_neighbors(variant, cluster, k=10, min_performance=min_performance)
+
+        assert [n.variant.variant_id for n in neighbors] == [vid for _, vid in expected]
+        assert [n.distance for n in neighbors] == pytest.approx([d for d, _ in expected])
+
+
+def test_query_variant_outside_cluster(optimizer, cluster):
+    outsider = ArtifactVariant(
+        variant_id="new", artifact_id="tool", version="1.0.1", content="",
+        embedding=np.ones(8), metadata={"parameters": {"text": "str", "lang": "str"}, "output_type": "text"}
+    )
+
+    neighbors = optimizer.find_nearest_neighbors(outsider, cluster, k=5, min_performance=0.0)
+    expected = _reference_neighbors(optimizer, outsider, cluster, 5, 0.0)
+
+    assert [n.variant.variant_id for n in neighbors] == [vid for _, vid in expected]
+
+
+def test_index_rebuilt_when_cluster_changes(optimizer, cluster):
+    variant = cluster.variants[1]
+    optimizer.find_nearest_neighbors(variant, cluster, min_performance=0.0)
+    first_index = optimizer.get_neighbor_index(cluster)
+
+    cluster.variants = cluster.variants[:100]
+
+    assert optimizer.get_neighbor_index(cluster) is not first_index
+    neighbors = optimizer.find_nearest_neighbors(variant, cluster, min_performance=0.0)
+    assert all(int(n.variant.variant_id[1:]) < 100 for n in neighbors)
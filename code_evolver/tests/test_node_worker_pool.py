@@ -0,0 +1,139 @@
+"""
+Tests for the warm node worker pool.
+Tests output capture, exit codes, timeouts, worker reuse and recycling.
+"""
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.node_worker_pool import NodeWorkerPool
+from src.node_runner import NodeRunner
+
+
+ECHO_NODE = """import sys, json
+data = json.load(sys.stdin)
+print(json.dumps({"echo": data}))
+print("note", file=sys.stderr)
+"""
+
+EXIT_NODE = """import sys
+sys.exit(int(sys.stdin.read()))
+"""
+
+SLEEP_NODE = """import time
+time.sleep(10)
+"""
+
+RAISE_NODE = """raise ValueError("boom")
+"""
+
+LEAKY_NODE = """import os, sys
+sys.stdout.write(sys.stdin.buffer.read().decode("utf-8"))
+os.environ["LEAKY_NODE_VAR"] = "1"
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+"""
+
+STATE_NODE = """import os
+print(os.getcwd())
+print(os.environ.get("LEAKY_NODE_VAR"))
+"""
+
+
+class TestNodeWorkerPool(unittest.TestCase):
+    """Test suite for NodeWorkerPool."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.pool = NodeWorkerPool(size=1, max_runs_per_worker=3, warm_runtime=False, prefork=False)
+
+    def tearDown(self):
+        self.pool.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _node(self, name, code):
+        path = Path(self.test_dir) / name / "main.py"
+        path.parent.mkdir()
+        path.write_text(code, encoding="utf-8")
+        return path
+
+    def test_output_captured(self):
+        """Test that stdout/stderr are captured per run and the worker is reused."""
+        node = self._node("echo", ECHO_NODE)
+
+        first = self.pool.run(node, '{"x": 1}', 10000)
+        second = self.pool.run(node, '{"x": 2}', 10000)
+
+        self.assertEqual(first["exit_code"], 0)
+        self.assertEqual(first["stdout"], '{"echo": {"x": 1}}\n')
+        self.assertEqual(first["stderr"], "note\n")
+        self.assertEqual(second["stdout"], '{"echo": {"x": 2}}\n')
+        self.assertEqual(self.pool.get_stats()["workers_started"], 1)
+
+    def test_exit_codes(self):
+        """Test sys.exit codes and uncaught exceptions."""
+        self.assertEqual(self.pool.run(self._node("exit", EXIT_NODE), "4", 10000)["exit_code"], 4)
+
+        result = self.pool.run(self._node("raise", RAISE_NODE), "", 10000)
+        self.assertEqual(result["exit_code"], 1)
+        self.assertIn("ValueError: boom", result["stderr"])
+
+    def test_process_state_restored_between_runs(self):
+        """Test that cwd and environment changes do not leak into the next node."""
+        leaky = self.pool.run(self._node("leaky", LEAKY_NODE), "bytes in", 10000)
+        self.assertEqual(leaky["exit_code"], 0)
+        self.assertEqual(leaky["stdout"], "bytes in")
+
+        state = self.pool.run(self._node("state", STATE_NODE), "", 10000)
+        cwd, leaked = state["stdout"].splitlines()
+        self.assertNotEqual(Path(cwd).resolve(), (Path(self.test_dir) / "leaky").resolve())
+        self.assertEqual(leaked, "None")
+
+    def test_timeout_replaces_worker(self):
+        """Test that a timed-out node kills its worker and the pool recovers."""
+        result = self.pool.run(self._node("sleep", SLEEP_NODE), "", 300)
+        self.assertEqual(result["exit_code"], -1)
+        self.assertIn("timed out", result["stderr"])
+
+        echo = self.pool.run(self._node("echo", ECHO_NODE), "{}", 10000)
+        self.assertEqual(echo["exit_code"], 0)
+        self.assertEqual(self.pool.get_stats()["workers_started"], 2)
+
+    def test_recycle_after_max_runs(self):
+        """Test that workers are replaced after max_runs_per_worker runs."""
+        node = self._node("echo", ECHO_NODE)
+        for _ in range(4):
+            self.assertEqual(self.pool.run(node, "{}", 10000)["exit_code"], 0)
+
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["workers_recycled"], 1)
+        self.assertEqual(stats["workers_started"], 2)
+
+    def test_node_runner_pool_and_subprocess_agree(self):
+        """Test that NodeRunner gives the same result with and without the pool."""
+        pooled = NodeRunner(nodes_dir=self.test_dir, use_worker_pool=True)
+        plain = NodeRunner(nodes_dir=self.test_dir, use_worker_pool=False)
+        pooled.save_code("echo", ECHO_NODE)
+
+        import src.node_runner as node_runner
+        original = node_runner.get_node_worker_pool
+        node_runner.get_node_worker_pool = lambda: self.pool
+        try:
+            stdout_a, stderr_a, metrics_a = pooled.run_node("echo", {"k": "v"}, timeout_ms=10000)
+        finally:
+            node_runner.get_node_worker_pool = original
+        stdout_b, stderr_b, metrics_b = plain.run_node("echo", {"k": "v"}, timeout_ms=10000)
+
+        self.assertEqual(stdout_a, stdout_b)
+        self.assertEqual(stderr_a, stderr_b)
+        self.assertEqual(metrics_a["exit_code"], metrics_b["exit_code"])
+        # Only the node's own memory, not the warm worker's footprint
+        self.assertLess(abs(metrics_a["memory_mb_peak"] - metrics_b["memory_mb_peak"]), 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests for OllamaClient transport.
+Tests session pooling per endpoint and NDJSON streaming.
+"""
+import json
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ollama_client import OllamaClient, get_ollama_session
+
+
+def _stream_response(chunks):
+    """Build a fake streaming response yielding NDJSON lines."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_lines.return_value = [json.dumps(c).encode("utf-8") for c in chunks]
+    return response
+
+
+class TestOllamaClient(unittest.TestCase):
+    """Test suite for OllamaClient transport."""
+
+    def setUp(self):
+        self.client = OllamaClient("http://ollama-test:11434")
+        self.client.calculate_timeout = MagicMock(return_value=30)
+        self.session = MagicMock()
+        patcher = patch.object(OllamaClient, "_session", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_generate_uses_pooled_session(self):
+        """Test that non-streaming generate posts through the shared session."""
+        self.session.post.return_value.json.return_value = {"response": "hello"}
+
+        self.assertEqual(self.client.generate("m", "prompt"), "hello")
+        _, kwargs = self.session.post.call_args
+        self.assertFalse(kwargs["json"]["stream"])
+
+    def test_generate_stream_yields_tokens(self):
+        """Test that generate_stream yields each chunk's text and stops at done."""
+        self.session.post.return_value = _stream_response([
+            {"response": "he", "done": False},
+            {"response": "llo", "done": False},
+            {"response": "", "done": True, "eval_count": 2},
+            {"response": "ignored", "done": False},
+        ])
+
+        tokens = list(self.client.generate_stream("m", "prompt"))
+
+        self.assertEqual(tokens, ["he", "llo"])
+        _, kwargs = self.session.post.call_args
+        self.assertTrue(kwargs["stream"])
+        self.assertTrue(kwargs["json"]["stream"])
+
+    def test_generate_stream_records_time_to_first_token(self):
+        """Test that streamed generate joins tokens and records TTFT metadata."""
+        self.session.post.return_value = _stream_response([
+            {"response": "a"}, {"response": "b"}, {"done": True, "total_duration": 5000000}
+        ])
+
+        with patch("src.ollama_client.ProfileContext") as profile_context:
+            self.assertEqual(self.client.generate("m", "prompt", stream=True), "ab")
+
+        metadata = profile_context.call_args.kwargs["metadata"]
+        self.assertIn("time_to_first_token_ms", metadata)
+        self.assertEqual(metadata["total_duration_ms"], 5.0)
+
+    def test_stream_error_chunk_stops_generation(self):
+        """Test that an error chunk mid-stream ends the stream and generate returns ''."""
+        self.session.post.return_value = _stream_response([{"response": "a"}, {"error": "model unloaded"}])
+
+        self.assertEqual(list(self.client.generate_stream("m", "prompt")), ["a"])
+        self.assertEqual(self.client.generate("m", "prompt", stream=True), "")
+
+
+class TestOllamaSession(unittest.TestCase):
+    """Test suite for shared endpoint sessions."""
+
+    def test_one_session_per_endpoint(self):
+        """Test that sessions are shared per endpoint."""
+        a = get_ollama_session("http://host-a:11434/")
+        b = get_ollama_session("http://host-a:11434")
+        c = get_ollama_session("http://host-b:11434")
+
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+
+
+if __name__ == '__main__':
+    unittest.main()
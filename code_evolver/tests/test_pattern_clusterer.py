@@ -0,0 +1,117 @@
+"""
+Tests for PatternClusterer similarity clustering
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from src.pattern_clusterer import PatternClusterer
+
+
+class FakeArtifact:
+    def __init__(self, i, embedding=None):
+        self.description = f"translate to lang{i}"
+        self.content = ""
+        self.embedding = embedding
+
+
+def _reference_average_linkage(embeddings, threshold):
+    """Brute-force average linkage: recompute every pair each iteration."""
+    unit = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    clusters = {i: [i] for i in range(len(unit))}
+    while True:
+        best, pair = threshold, None
+        for a, b in itertools.combinations(sorted(clusters), 2):
+            sim = (unit[clusters[a]] @ unit[clusters[b]].T).mean()
+            if sim > best:
+                best, pair = sim, (a, b)
+        if pair is None:
+            return sorted(sorted(m) for m in clusters.values())
+        clusters[pair[0]].extend(clusters.pop(pair[1]))
+
+
+@pytest.fixture
+def grouped_embeddings():
+    rng = np.random.default_rng(7)
+    centers = rng.standard_normal((6, 16))
+    labels = rng.integers(0, 6, 60)
+    return centers[labels] + 0.35 * rng.standard_normal((60, 16))
+
+
+def test_matches_reference_average_linkage(grouped_embeddings):
+    clusterer = PatternClusterer(None, min_cluster_size=1, similarity_threshold=0.6)
+    unit = clusterer._normalize_rows(grouped_embeddings)
+
+    result = sorted(sorted(m) for m in clusterer._average_linkage(unit))
+
+    assert result == _reference_average_linkage(grouped_embeddings, 0.6)
+
+
+def test_cluster_scores_and_centroids(grouped_embeddings):
+    clusterer = PatternClusterer(None, min_cluster_size=3, similarity_threshold=0.6)
+    artifacts = [FakeArtifact(i) for i in range(len(grouped_embeddings))]
+
+    clusters = clusterer._simple_similarity_clustering(grouped_embeddings, artifacts)
+
+    assert clusters
+    unit = grouped_embeddings / np.linalg.norm(grouped_embeddings, axis=1, keepdims=True)
+    for cluster in clusters:
+        indices = [artifacts.index(a) for a in cluster.artifacts]
+        assert cluster.cluster_id == min(indices)
+        assert len(indices) >= 3
+        pair_sims = [unit[i] @ unit[j] for i, j in itertools.combinations(indices, 2)]
+        assert cluster.similarity_score == pytest.approx(np.mean(pair_sims))
+        np.testing.assert_allclose(cluster.centroid, grouped_embeddings[indices].mean(axis=0))
+
+
+def test_zero_vectors_not_merged():
+    clusterer = PatternClusterer(None, min_cluster_size=1, similarity_threshold=0.5)
+    embeddings = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 0.1]])
+
+    clusters = clusterer._simple_similarity_clustering(embeddings, [FakeArtifact(i) for i in range(3)])
+
+    assert sorted(len(c.artifacts) for c in clusters) == [1, 2]
+
+
+def test_bucketed_clustering_keeps_tight_groups():
+    rng = np.random.default_rng(3)
+    centers = rng.standard_normal((20, 32))
+    labels = np.repeat(np.arange(20), 25)
+    embeddings = centers[labels] + 0.05 * rng.standard_normal((500, 32))
+    clusterer = PatternClusterer(None, min_cluster_size=3, similarity_threshold=0.8, max_bucket_size=100)
+
+    assert len(clusterer._bucket_indices(clusterer._normalize_rows(embeddings))) > 1
+
+    clusters = clusterer._simple_similarity_clustering(
+        embeddings, [FakeArtifact(i) for i in range(len(embeddings))]
+    )
+
+    # Buckets can split a group, but never merge two groups
+    assert len(clusters) >= 20
+    for cluster in clusters:
+        groups = {labels[int(a.description.rsplit("lang", 1)[1])] for a in cluster.artifacts}
+        assert len(groups) == 1
+
+
+def test_anisotropic_embeddings_buckets_stay_bounded():
+    rng = np.random.default_rng(11)
+    # Nearly all embeddings point the same way
+    embeddings = np.ones((1000, 16)) + 0.01 * rng.standard_normal((1000, 16))
+    embeddings[:10] = 50 * rng.standard_normal((10, 16))
+    clusterer = PatternClusterer(None, max_bucket_size=100)
+
+    buckets = clusterer._bucket_indices(clusterer._normalize_rows(embeddings))
+
+    assert max(len(bucket) for bucket in buckets) <= 100
+    assert sorted(np.concatenate(buckets).tolist()) == list(range(1000))
+
+
+def test_identical_embeddings_are_split():
+    clusterer = PatternClusterer(None, max_bucket_size=30)
+
+    buckets = clusterer._bucket_indices(np.ones((100, 4)) / 2)
+
+    assert max(len(bucket) for bucket in buckets) <= 30
+    assert sum(len(bucket) for bucket in buckets) == 100
@@ -386,6 +386,175 @@ def validate_email(email: str) -> bool:
         self.assertEqual(len(stats["highest_quality"]), 2)
         self.assertEqual(stats["highest_quality"][0]["id"], "stats_2")
 
+    def _store_embedded(self, artifact_id, vector, artifact_type=ArtifactType.FUNCTION, tags=None):
+        """Store an artifact with a fixed embedding vector."""
+        self.rag._generate_embedding = lambda text: vector
+        return self.rag.store_artifact(
+            artifact_id=artifact_id,
+            artifact_type=artifact_type,
+            name=artifact_id,
+            description="Test",
+            content="code",
+            tags=tags or ["test"]
+        )
+
+    def test_find_similar_vectorized(self):
+        """Test semantic search ranking, filters and top-k."""
+        self._store_embedded("b_close", [1.0, 0.1, 0.0])
+        self._store_embedded("a_far", [0.0, 1.0, 0.0])
+        self._store_embedded("c_exact", [2.0, 0.0, 0.0], tags=["special"])
+        self._store_embedded("d_plan", [1.0, 0.0, 0.0], artifact_type=ArtifactType.PLAN)
+
+        self.rag._generate_embedding = lambda text: [1.0, 0.0, 0.0]
+
+        results = self.rag.find_similar("query", top_k=2, min_similarity=0.5)
+        self.assertEqual(len(results), 2)
+        self.assertEqual({a.artifact_id for a, _ in results}, {"c_exact", "d_plan"})
+        self.assertAlmostEqual(results[0][1], 1.0, places=5)
+
+        results = self.rag.find_similar("query", artifact_type=ArtifactType.FUNCTION, top_k=5)
+        self.assertEqual([a.artifact_id for a, _ in results], ["c_exact", "b_close"])
+
+        results = self.rag.find_similar("query", tags=["special"], top_k=5)
+        self.assertEqual([a.artifact_id for a, _ in results], ["c_exact"])
+
+    def test_find_similar_after_update_and_delete(self):
+        """Test that re-stored and deleted artifacts use the right rows."""
+        self._store_embedded("first", [1.0, 0.0])
+        self._store_embedded("second", [0.0, 1.0])
+        self._store_embedded("first", [0.0, 1.0])
+        self.rag.delete_artifact("second")
+
+        self.rag._generate_embedding = lambda text: [0.0, 1.0]
+        results = self.rag.find_similar("query", min_similarity=0.9)
+        self.assertEqual([a.artifact_id for a, _ in results], ["first"])
+
+        # Rows are rebuilt correctly after reload
+        rag2 = RAGMemory(memory_path=self.test_dir, ollama_client=None)
+        rag2._generate_embedding = lambda text: [0.0, 1.0]
+        results = rag2.find_similar("query", min_similarity=0.9)
+        self.assertEqual([a.artifact_id for a, _ in results], ["first"])
+
+    def test_embedding_slot_reuse(self):
+        """Test that deleted embedding rows are tombstoned and reused."""
+        self._store_embedded("one", [1.0, 0.0])
+        self._store_embedded("two", [0.0, 1.0])
+        self.rag.delete_artifact("one")
+
+        index = self.rag.vector_index
+        self.assertEqual(index.tombstones.tolist(), [True, False])
+
+        self._store_embedded("three", [1.0, 1.0])
+        self.assertEqual(index.size, 2)
+        self.assertEqual(index.id_to_row["three"], 0)
+        self.assertFalse(index.tombstones.any())
+
+    def test_embedding_rows_persisted(self):
+        """Test that the id -> row map survives compaction and reload."""
+        self._store_embedded("one", [1.0, 0.0])
+        self._store_embedded("two", [0.0, 1.0])
+        self.rag.compact()
+
+        # Reuse a slot after the snapshot: written in place, then replayed
+        self.rag.delete_artifact("one")
+        self._store_embedded("three", [0.6, 0.8])
+        self.rag.compact()
+
+        self.assertTrue((Path(self.test_dir) / "embedding_rows.json").exists())
+        rag2 = RAGMemory(memory_path=self.test_dir, ollama_client=None)
+        self.assertEqual(rag2.artifact_id_to_index, self.rag.artifact_id_to_index)
+
+        rag2._generate_embedding = lambda text: [0.6, 0.8]
+        results = rag2.find_similar("query", min_similarity=0.99)
+        self.assertEqual([a.artifact_id for a, _ in results], ["three"])
+
+    def test_embedding_repack(self):
+        """Test that compaction repacks once fragmentation passes the threshold."""
+        self.rag.vector_index.REPACK_MIN_FREE_ROWS = 1
+        for i in range(4):
+            self._store_embedded(f"row_{i}", [1.0, float(i)])
+        for i in range(3):
+            self.rag.delete_artifact(f"row_{i}")
+
+        self.rag.close()
+
+        self.assertEqual(self.rag.vector_index.size, 1)
+        self.assertEqual(self.rag.artifact_id_to_index, {"row_3": 0})
+
+        rag2 = RAGMemory(memory_path=self.test_dir, ollama_client=None)
+        self.assertEqual(rag2.artifact_id_to_index, {"row_3": 0})
+        self.assertEqual(rag2.vector_index.size, 1)
+
+    def test_journal_replay(self):
+        """Test that updates and deletes are replayed from the journal."""
+        for i in range(3):
+            self.rag.store_artifact(
+                artifact_id=f"journal_{i}",
+                artifact_type=ArtifactType.FUNCTION,
+                name=f"Journal {i}",
+                description="Test",
+                content="code",
+                tags=["journal"],
+                auto_embed=False
+            )
+        self.rag.increment_usage("journal_0")
+        self.rag.update_quality_score("journal_1", 0.7)
+        self.rag.delete_artifact("journal_2")
+
+        # Nothing was compacted, so the snapshot files were not written
+        self.assertFalse((Path(self.test_dir) / "index.json").exists())
+
+        rag2 = RAGMemory(memory_path=self.test_dir, ollama_client=None)
+        self.assertEqual(sorted(rag2.artifacts), ["journal_0", "journal_1"])
+        self.assertEqual(rag2.get_artifact("journal_0").usage_count, 1)
+        self.assertEqual(rag2.get_artifact("journal_1").quality_score, 0.7)
+        self.assertEqual(sorted(rag2.tags_index["journal"]), ["journal_0", "journal_1"])
+
+    def test_journal_compaction(self):
+        """Test that compaction writes a snapshot and drops the journal."""
+        self.rag.store_artifact(
+            artifact_id="compact_test",
+            artifact_type=ArtifactType.PLAN,
+            name="Compact Test",
+            description="Test",
+            content="content",
+            tags=["compact"],
+            auto_embed=False
+        )
+        self.rag.compact()
+
+        self.assertTrue((Path(self.test_dir) / "index.json").exists())
+        self.assertEqual(self.rag.journal.pending_bytes, 0)
+        self.assertEqual(list((Path(self.test_dir) / "journal").iterdir()), [])
+
+        # Writes after compaction go to a new segment and survive reload
+        self.rag.increment_usage("compact_test")
+        rag2 = RAGMemory(memory_path=self.test_dir, ollama_client=None)
+        self.assertEqual(rag2.get_artifact("compact_test").usage_count, 1)
+
+    def test_journal_torn_record(self):
+        """Test that a partially written journal line is skipped on load."""
+        self.rag.store_artifact(
+            artifact_id="torn_test",
+            artifact_type=ArtifactType.PLAN,
+            name="Torn Test",
+            description="Test",
+            content="content",
+            tags=["torn"],
+            auto_embed=False
+        )
+        segment = sorted((Path(self.test_dir) / "journal").iterdir())[-1]
+        with open(segment, "a", encoding="utf-8") as f:
+            f.write('{"op": "put", "artifact": {"artifact_id"')
+
+        rag2 = RAGMemory(memory_path=self.test_dir, ollama_client=None)
+        self.assertIn("torn_test", rag2.artifacts)
+
+        # New writes must not be glued onto the torn line
+        rag2.increment_usage("torn_test")
+        rag3 = RAGMemory(memory_path=self.test_dir, ollama_client=None)
+        self.assertEqual(rag3.get_artifact("torn_test").usage_count, 1)
+
 
 class TestArtifact(unittest.TestCase):
     """Test Artifact class."""
@@ -0,0 +1,83 @@
+"""
+Tests for the registry index backends.
+"""
+import json
+
+import pytest
+
+from src.registry import Registry
+
+
+@pytest.fixture(params=["sqlite", "json"])
+def registry(request, tmp_path):
+    registry = Registry(str(tmp_path / "registry"), index_backend=request.param)
+    yield registry
+    registry.index.close()
+
+
+def test_upsert_keeps_one_entry_per_node_sorted_by_score(registry):
+    registry.update_index("a_v1", "1.0.0", ["text"], 0.5)
+    registry.update_index("b_v1", "1.0.0", ["text", "fast"], 0.9)
+    registry.update_index("c_v1", "1.0.0", [], 0.5)
+    registry.update_index("a_v1", "1.1.0", ["text"], 0.7)
+
+    nodes = registry.list_nodes()
+
+    assert [n["node_id"] for n in nodes] == ["b_v1", "a_v1", "c_v1"]
+    assert nodes[1]["version"] == "1.1.0"
+    assert registry.count_nodes() == 3
+    assert registry.get_index_entry("b_v1")["tags"] == ["text", "fast"]
+    assert registry.get_index_entry("missing") is None
+
+
+def test_pagination_tags_and_prefix(registry):
+    for i in range(7):
+        registry.update_index(f"node_{i}", "1.0.0", ["even" if i % 2 == 0 else "odd"], i / 10)
+    registry.update_index("other", "1.0.0", ["even"], 1.0)
+
+    pages = [registry.list_nodes(limit=3, offset=offset) for offset in (0, 3, 6)]
+    assert [n["node_id"] for page in pages for n in page] == ["other"] + [f"node_{i}" for i in range(6, -1, -1)]
+
+    assert [n["node_id"] for n in registry.top_nodes(2, tag="even")] == ["other", "node_6"]
+    assert [n["node_id"] for n in registry.list_nodes(tag="odd")] == ["node_5", "node_3", "node_1"]
+    assert len(registry.list_nodes(prefix="node_")) == 7
+
+    assert registry.remove_from_index("other") is True
+    assert registry.top_nodes(1)[0]["node_id"] == "node_6"
+
+
+def test_json_index_is_migrated_once(tmp_path):
+    registry_path = tmp_path / "registry"
+    legacy = Registry(str(registry_path), index_backend="json")
+    legacy.update_index("low", "1.0.0", ["x"], 0.1)
+    legacy.update_index("tie_a", "1.0.0", ["y"], 0.5)
+    legacy.update_index("tie_b", "1.0.0", ["y"], 0.5)
+    expected = legacy.list_nodes()
+
+    registry = Registry(str(registry_path))
+
+    assert registry.list_nodes() == expected
+    assert [n["node_id"] for n in registry.list_nodes(tag="y")] == ["tie_a", "tie_b"]
+    assert not (registry_path / "index.json").exists()
+    assert json.loads((registry_path / "index.json.migrated").read_text())["nodes"] == expected
+
+    # Reopening does not migrate again
+    registry.update_index("low", "1.0.1", ["x"], 0.2)
+    registry.index.close()
+    reopened = Registry(str(registry_path))
+    assert reopened.get_index_entry("low")["version"] == "1.0.1"
+    reopened.index.close()
+
+
+def test_reset_clears_open_registry(registry):
+    registry.create_node("a", "A")
+    registry.update_index("a", "1.0.0", [], 0.5)
+
+    registry.reset()
+    registry.update_index("b", "1.0.0", [], 0.5)
+
+    assert [n["node_id"] for n in registry.list_nodes()] == ["b"]
+    assert registry.get_node("a") is None
+    reopened = Registry(str(registry.registry_path), index_backend=registry.index_backend)
+    assert [n["node_id"] for n in reopened.list_nodes()] == ["b"]
+    reopened.close()
@@ -0,0 +1,97 @@
+"""
+Tests for SolutionMemory's in-memory keyword index and lazy solution loading.
+"""
+import random
+
+import pytest
+
+from src.solution_memory import KeywordIndex, SolutionMemory, tokenize
+
+WORDS = ["parse", "csv", "json", "file", "sort", "list", "merge", "http", "fetch",
+         "url", "compress", "text", "count", "words", "reverse", "string", "numbers"]
+
+
+def brute_force(index, query, threshold):
+    result = {}
+    for doc_id, tokens in index.documents.items():
+        union = len(query | tokens)
+        similarity = len(query & tokens) / union if union else 0.0
+        if similarity >= threshold:
+            result[doc_id] = similarity
+    return result
+
+
+def test_keyword_index_matches_brute_force_jaccard():
+    rng = random.Random(7)
+    index = KeywordIndex()
+    for i in range(500):
+        index.add(f"doc{i}", set(rng.sample(WORDS, rng.randint(1, 8))))
+    index.remove("doc3")
+
+    for _ in range(50):
+        query = set(rng.sample(WORDS, rng.randint(1, 8)))
+        for threshold in (0.0, 0.3, 0.5, 0.8, 1.0):
+            assert index.search(query, threshold) == brute_force(index, query, threshold)
+
+
+def test_find_similar_and_reload(tmp_path):
+    memory = SolutionMemory(str(tmp_path / "memory"))
+    memory.store_solution("parse a csv file into json", "s", "code1", "n1", evaluation={"score_overall": 0.9})
+    memory.store_solution("parse a csv file into yaml", "s", "code2", "n2")
+    memory.store_solution("fetch a url over http", "s", "code3", "n3")
+
+    results = memory.find_similar("parse a csv file into json", threshold=0.5)
+
+    assert [r["node_id"] for r in results] == ["n1", "n2"]
+    assert results[0]["similarity"] == 1.0
+    assert memory.find_similar("parse a csv file into json", threshold=0.5, limit=1)[0]["node_id"] == "n1"
+
+    # Index is rebuilt from index.json plus the journal
+    reloaded = SolutionMemory(str(tmp_path / "memory"))
+    assert [r["node_id"] for r in reloaded.find_similar("fetch a url over http")] == ["n3"]
+    assert reloaded.get_statistics()["total_solutions"] == 3
+
+
+def test_solution_bodies_load_lazily(tmp_path, monkeypatch):
+    memory = SolutionMemory(str(tmp_path / "memory"), compact_threshold_bytes=1)
+    for i in range(20):
+        memory.store_solution(f"sort list of numbers variant {i}", "s", f"code{i}", f"n{i}")
+
+    reloaded = SolutionMemory(str(tmp_path / "memory"))
+    assert len(reloaded.cache) == 0
+
+    loaded = []
+    real_load = reloaded._load_solution
+    monkeypatch.setattr(reloaded, "_load_solution", lambda sid: loaded.append(sid) or real_load(sid))
+
+    results = reloaded.find_similar("sort list of numbers variant 7", threshold=0.5, limit=3)
+
+    assert results[0]["node_id"] == "n7"
+    assert len(loaded) == 3
+
+
+def test_embedding_rerank(tmp_path):
+    class FakeEmbedder:
+        def embed(self, text):
+            return [1.0, 0.0] if "yaml" in text else [0.0, 1.0]
+
+    memory = SolutionMemory(str(tmp_path / "memory"), embedding_client=FakeEmbedder())
+    memory.store_solution("convert csv file to json", "s", "c", "json")
+    memory.store_solution("convert csv file to yaml", "s", "c", "yaml")
+
+    results = memory.find_similar("convert a csv file to yaml", threshold=0.5, limit=2)
+
+    assert [r["node_id"] for r in results] == ["yaml", "json"]
+    assert results[0]["semantic_similarity"] == pytest.approx(1.0)
+
+
+def test_prune_removes_from_index(tmp_path):
+    memory = SolutionMemory(str(tmp_path / "memory"))
+    memory.store_solution("count words in text", "s", "c", "good", evaluation={"score_overall": 0.9})
+    memory.store_solution("count words in a text", "s", "c", "bad", evaluation={"score_overall": 0.1})
+
+    memory.prune_low_quality(min_score=0.3)
+
+    assert [r["node_id"] for r in memory.find_similar("count words in text", threshold=0.5)] == ["good"]
+    assert SolutionMemory(str(tmp_path / "memory")).get_statistics()["total_solutions"] == 1
+    assert tokenize("Count  Words") == {"count", "words"}
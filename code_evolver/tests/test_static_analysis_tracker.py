@@ -0,0 +1,141 @@
+"""
+Tests for concurrent, cached validator execution in StaticAnalysisTracker.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.static_analysis_tracker import StaticAnalysisTracker
+
+TOOLS_DIR = Path(__file__).parent.parent / "tools" / "executable"
+
+GOOD_CODE = '''import json
+import sys
+
+
+def main():
+    data = json.load(sys.stdin)
+    print(json.dumps({"result": data}))
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+MISORDERED_IMPORT = '''import json
+import sys
+from pathlib import Path
+from node_runtime import call_tool
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+def main():
+    data = json.load(sys.stdin)
+    print(json.dumps({"result": call_tool("x", data)}))
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = StaticAnalysisTracker(tools_dir=str(TOOLS_DIR), max_workers=2,
+                                    cache_path=str(tmp_path / "cache.json"))
+    yield tracker
+    tracker.close()
+
+
+def summary(report):
+    return [(r.validator_name, r.passed, r.exit_code, r.output) for r in report.results]
+
+
+def test_results_match_subprocess_validators(tracker, tmp_path):
+    code_file = tmp_path / "main.py"
+    code_file.write_text(GOOD_CODE)
+
+    report = tracker.analyze_file(str(code_file), "node", auto_fix=False)
+
+    expected = []
+    for validator in sorted(tracker.VALIDATORS, key=lambda v: v["priority"], reverse=True):
+        proc = subprocess.run([sys.executable, str(TOOLS_DIR / validator["script"]), str(code_file)],
+                              capture_output=True, text=True)
+        expected.append((validator["name"], proc.returncode == 0, proc.returncode, proc.stdout.strip()))
+
+    assert summary(report) == expected
+
+
+def test_unchanged_content_is_served_from_cache(tracker, tmp_path):
+    code_file = tmp_path / "main.py"
+    code_file.write_text(GOOD_CODE)
+
+    first = tracker.analyze_file(str(code_file), "node")
+    second = tracker.analyze_file(str(code_file), "node")
+
+    assert not any(r.cached for r in first.results)
+    assert all(r.cached for r in second.results)
+    assert summary(first) == summary(second)
+
+    # A new tracker reuses the persisted cache
+    tracker.close()
+    reloaded = StaticAnalysisTracker(tools_dir=str(TOOLS_DIR), max_workers=1,
+                                     cache_path=str(tmp_path / "cache.json"))
+    assert all(r.cached for r in reloaded.analyze_file(str(code_file), "node").results)
+
+
+def test_content_change_invalidates_cache(tracker, tmp_path):
+    code_file = tmp_path / "main.py"
+    code_file.write_text(GOOD_CODE)
+    tracker.analyze_file(str(code_file), "node")
+
+    code_file.write_text("def main(:\n")
+    report = tracker.analyze_file(str(code_file), "node")
+
+    syntax = next(r for r in report.results if r.validator_name == "Python Syntax")
+    assert not syntax.cached
+    assert not syntax.passed
+
+
+def test_fixer_runs_before_checks(tracker, tmp_path):
+    code_file = tmp_path / "main.py"
+    code_file.write_text(MISORDERED_IMPORT)
+
+    report = tracker.analyze_file(str(code_file), "node", auto_fix=True)
+    results = {r.validator_name: r for r in report.results}
+
+    assert results["Node Runtime Import"].auto_fixed
+    assert report.auto_fixes_applied == 1
+    # Checks saw the fixed file
+    assert results["Python Syntax"].passed
+    source = code_file.read_text()
+    assert source.index("sys.path.insert") < source.index("from node_runtime import")
+
+    # Checks on the fixed content are cached; the fixer reruns once, finds
+    # nothing to fix, and is cached from then on
+    again = tracker.analyze_file(str(code_file), "node", auto_fix=True)
+    assert [r.validator_name for r in again.results if not r.cached] == ["Node Runtime Import"]
+    assert again.auto_fixes_applied == 0
+    assert all(r.cached for r in tracker.analyze_file(str(code_file), "node").results)
+
+
+def test_analyze_files_bulk(tracker, tmp_path):
+    files = []
+    for i in range(3):
+        code_file = tmp_path / f"tool_{i}.py"
+        code_file.write_text(GOOD_CODE if i != 1 else "def broken(:\n")
+        files.append((str(code_file), f"node_{i}"))
+
+    reports = tracker.analyze_files(files, auto_fix=False)
+
+    assert [r.node_id for r in reports] == ["node_0", "node_1", "node_2"]
+    assert [r.results[0].passed for r in reports] == [True, False, True]
+    assert reports[0].overall_score > reports[1].overall_score
+    assert [r.validator_name for r in reports[2].results] == [r.validator_name for r in reports[0].results]
+    # Identical content in tool_0 and tool_2 shares cache entries
+    assert all(r.cached for r in tracker.analyze_files(files[2:], auto_fix=False)[0].results)
@@ -0,0 +1,129 @@
+"""
+Tests for batched, concurrent consumer dispatch in the stream processor tool.
+"""
+import importlib.util
+import json
+import random
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+STREAM_PROCESSOR = Path(__file__).parent.parent / "tools" / "executable" / "stream_processor.py"
+
+
+@pytest.fixture(scope="module")
+def stream_module():
+    spec = importlib.util.spec_from_file_location("stream_processor_under_test", STREAM_PROCESSOR)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_processor(module, events=50, consumer_delay=0.0, jitter=False, **kwargs):
+    """Processor fed by a subprocess printing `events` events, with a fake consumer."""
+    processor = module.StreamProcessor(
+        producer="fake", producer_input={}, consumer="sink", **kwargs
+    )
+
+    script = (
+        "import json\n"
+        f"for i in range({events}):\n"
+        "    print(json.dumps({'event_type': 'data', 'sequence': i, 'data': {'n': i}}), flush=True)\n"
+    )
+    processor._start_producer = lambda: subprocess.Popen(
+        [sys.executable, "-c", script], stdout=subprocess.PIPE, text=True, bufsize=1
+    )
+
+    processor.arrivals = []
+    processor.calls = []
+    processor.active = 0
+    processor.peak_active = 0
+    lock = threading.Lock()
+    rng = random.Random(5)
+
+    def consumer(data):
+        with lock:
+            processor.arrivals.append(data)
+            processor.active += 1
+            processor.peak_active = max(processor.peak_active, processor.active)
+        time.sleep(consumer_delay * (rng.random() if jitter else 1))
+        with lock:
+            processor.calls.append(data)
+            processor.active -= 1
+        return True
+
+    processor.call_consumer = consumer
+    return processor
+
+
+def test_sequential_defaults_call_consumer_per_event(stream_module, capsys):
+    processor = make_processor(stream_module, events=20, filter_expr="data['n'] % 2 == 0",
+                               transform_expr="data['n']")
+    processor.run()
+
+    summary = json.loads(capsys.readouterr().out)
+    assert processor.calls == list(range(0, 20, 2))
+    assert processor.peak_active == 1
+    assert summary["processed_events"] == 10
+    assert summary["total_events"] == 20
+    assert summary["shutdown_reason"] == "stream_ended"
+    assert summary["stages"]["deliver"]["count"] == 10
+
+
+def test_micro_batches_respect_batch_size(stream_module, capsys):
+    processor = make_processor(stream_module, events=95, transform_expr="data['n']",
+                               batch_size=10, batch_linger_ms=200)
+    processor.run()
+
+    assert all(isinstance(batch, list) and len(batch) <= 10 for batch in processor.calls)
+    assert sorted(n for batch in processor.calls for n in batch) == list(range(95))
+    assert processor.batches < 95
+    assert processor.processed_events == 95
+
+
+def test_ordered_consumer_sees_events_in_order(stream_module, capsys):
+    processor = make_processor(stream_module, events=40, consumer_delay=0.02, jitter=True,
+                               transform_expr="data['n']", sequential=False, workers=4,
+                               ordered=True, batch_size=3, batch_linger_ms=5)
+    processor.run()
+
+    assert [n for batch in processor.arrivals for n in batch] == list(range(40))
+    assert processor.peak_active == 1
+    assert processor.processed_events == 40
+    assert "ignoring workers=4" in capsys.readouterr().err
+
+
+def test_unordered_calls_run_concurrently(stream_module, capsys):
+    processor = make_processor(stream_module, events=40, consumer_delay=0.02, jitter=True,
+                               transform_expr="data['n']", sequential=False, workers=4)
+    processor.run()
+
+    assert processor.peak_active > 1
+    assert sorted(processor.calls) == list(range(40))
+    assert processor.processed_events == 40
+
+
+def test_max_items_is_exact_with_concurrency(stream_module, capsys):
+    processor = make_processor(stream_module, events=200, consumer_delay=0.01,
+                               sequential=False, workers=4, batch_size=3, batch_linger_ms=20,
+                               max_items=25)
+    processor.run()
+
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["shutdown_reason"] == "max_items_reached"
+    assert summary["processed_events"] == 25
+    assert sum(len(batch) for batch in processor.calls) == 25
+
+
+def test_backpressure_pauses_reader(stream_module, capsys):
+    processor = make_processor(stream_module, events=30, consumer_delay=0.01, queue_size=2)
+    processor.run()
+
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["processed_events"] == 30
+    assert summary["backpressure_seconds"] > 0
+    assert summary["max_lag_ms"] >= summary["avg_lag_ms"] > 0
@@ -0,0 +1,109 @@
+"""
+Tests for mergeable streaming statistics and drift baselines built on them.
+"""
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.streaming_stats import DDSketch, StreamingStats, WindowedStats
+
+
+@pytest.fixture
+def latencies():
+    return np.random.default_rng(11).lognormal(mean=3.0, sigma=0.8, size=5000)
+
+
+def test_mean_and_std_match_numpy(latencies):
+    stats = StreamingStats()
+    for value in latencies:
+        stats.add(value)
+
+    assert stats.count == len(latencies)
+    assert stats.mean == pytest.approx(np.mean(latencies))
+    assert stats.std() == pytest.approx(np.std(latencies))
+    assert stats.std(ddof=1) == pytest.approx(np.std(latencies, ddof=1))
+    assert (stats.min, stats.max) == (latencies.min(), latencies.max())
+
+
+def test_quantiles_within_relative_accuracy(latencies):
+    stats = StreamingStats(relative_accuracy=0.01)
+    for value in latencies:
+        stats.add(value)
+
+    for q in (0.5, 0.95, 0.99):
+        exact = np.quantile(latencies, q, method="lower")
+        assert stats.quantile(q) == pytest.approx(exact, rel=0.011)
+
+
+def test_merge_equals_single_stream(latencies):
+    whole = StreamingStats()
+    parts = [StreamingStats() for _ in range(3)]
+    for i, value in enumerate(latencies):
+        whole.add(value)
+        parts[i % 3].add(value)
+
+    merged = StreamingStats()
+    for part in parts:
+        merged.merge(part)
+
+    assert merged.count == whole.count
+    assert merged.mean == pytest.approx(whole.mean)
+    assert merged.std() == pytest.approx(whole.std())
+    assert merged.quantile(0.95) == whole.quantile(0.95)
+
+
+def test_sketch_handles_zero_and_negative_values():
+    sketch = DDSketch()
+    for value in (-5.0, 0.0, 0.0, 3.0, 10.0):
+        sketch.add(value)
+
+    assert sketch.quantile(0.0) == pytest.approx(-5.0, rel=0.01)
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.quantile(1.0) == pytest.approx(10.0, rel=0.01)
+
+
+def test_window_forgets_old_values():
+    window = WindowedStats(window=100, blocks=10)
+    for _ in range(1000):
+        window.add(1000.0)
+    for _ in range(200):
+        window.add(10.0)
+
+    assert 100 <= window.count <= 110
+    assert window.mean == pytest.approx(10.0)
+    assert window.std() == pytest.approx(0.0)
+
+
+def test_window_round_trips_through_json(latencies):
+    window = WindowedStats(window=1000)
+    for value in latencies[:1234]:
+        window.add(value)
+
+    restored = WindowedStats.from_dict(json.loads(json.dumps(window.to_dict())))
+
+    assert restored.count == window.count
+    assert restored.mean == pytest.approx(window.mean)
+    assert restored.quantile(0.99) == window.quantile(0.99)
+
+
+def test_drift_baselines_survive_restart_and_merge(tmp_path):
+    from drift_detector import DriftDetector
+
+    path = tmp_path / "baselines.json"
+    first = DriftDetector(telemetry_tracker=None, baseline_path=path)
+    for _ in range(50):
+        first.record_measurement("tool", 100.0)
+    first.save_baselines()
+
+    second = DriftDetector(telemetry_tracker=None, baseline_path=path)
+    assert second.get_baseline_stats("tool")["sample_count"] == 50
+
+    second.load_baselines(path)
+    stats = second.get_baseline_stats("tool")
+    assert stats["sample_count"] == 100
+    assert stats["p50_duration_ms"] == pytest.approx(100.0)
@@ -0,0 +1,106 @@
+"""
+Tests for incremental YAML tool loading in ToolsManager.
+Tests that unchanged YAML files are served from the manifest snapshot and
+are not re-indexed in RAG, while changed files are re-parsed.
+"""
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import yaml
+
+from src.rag_memory import Artifact
+from src.tools_manager import ToolsManager, MANIFEST_FILENAME
+
+
+TOOL_YAML = """name: Summarizer
+type: llm
+description: {description}
+tags: [text]
+llm:
+  tier: fast
+"""
+
+
+class FakeRAG:
+    """Minimal RAG memory recording bulk stores."""
+
+    def __init__(self):
+        self.artifacts = {}
+        self.stored = []
+
+    def get_artifact(self, artifact_id):
+        return self.artifacts.get(artifact_id)
+
+    def store_artifacts_bulk(self, artifacts, auto_embed=True):
+        for spec in artifacts:
+            self.stored.append(spec["artifact_id"])
+            self.artifacts[spec["artifact_id"]] = Artifact(**spec, embedding=[1.0, 0.0])
+
+    def find_by_tags(self, tags, **kwargs):
+        return []
+
+
+class TestToolManifest(unittest.TestCase):
+    """Test suite for the YAML tool manifest."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.yaml_path = Path(self.test_dir) / "llm" / "summarizer.yaml"
+        self.yaml_path.parent.mkdir()
+        self.yaml_path.write_text(TOOL_YAML.format(description="Summarizes text"), encoding="utf-8")
+        self.rag = FakeRAG()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _load(self):
+        manager = ToolsManager(tools_path=self.test_dir, rag_memory=self.rag)
+        manager._loading_complete.wait(30)
+        return manager
+
+    def test_manifest_written(self):
+        """Test that the first load writes a manifest entry per YAML file."""
+        manager = self._load()
+
+        self.assertIn("summarizer", manager.tools)
+        self.assertTrue((Path(self.test_dir) / MANIFEST_FILENAME).exists())
+        self.assertEqual(self.rag.stored, ["tool_summarizer"])
+
+    def test_unchanged_file_not_reparsed(self):
+        """Test that an unchanged file is loaded without parsing or re-indexing."""
+        first = self._load()
+
+        with patch.object(yaml, "safe_load", side_effect=AssertionError("re-parsed")):
+            second = self._load()
+
+        self.assertEqual(second.tools["summarizer"].description, "Summarizes text")
+        self.assertEqual(
+            second.tools["summarizer"].definition_hash,
+            first.tools["summarizer"].definition_hash
+        )
+        self.assertEqual(self.rag.stored, ["tool_summarizer"])
+
+    def test_changed_file_reparsed(self):
+        """Test that editing a YAML file re-parses and re-indexes it."""
+        self._load()
+
+        self.yaml_path.write_text(TOOL_YAML.format(description="Summarizes long text"), encoding="utf-8")
+        stat = self.yaml_path.stat()
+        os.utime(self.yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        manager = self._load()
+
+        self.assertEqual(manager.tools["summarizer"].description, "Summarizes long text")
+        self.assertEqual(self.rag.stored, ["tool_summarizer", "tool_summarizer"])
+
+
+if __name__ == '__main__':
+    unittest.main()
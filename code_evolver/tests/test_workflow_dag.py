@@ -0,0 +1,139 @@
+"""
+Tests for workflow dependency analysis and parallel step execution.
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.workflow_dag import DAGExecutor, WorkflowDAG
+
+
+def llm(step_id, **extra):
+    return {"step_id": step_id, "type": "llm_call", **extra}
+
+
+def python(step_id, **extra):
+    return {"step_id": step_id, "type": "python_tool", **extra}
+
+
+FAN_OUT = [
+    python("fetch", input_mapping={"url": "inputs.url"}),
+    llm("summary", input_mapping={"text": "steps.fetch.output"}),
+    llm("keywords", input_mapping={"text": "steps.fetch.output"}),
+    llm("title", prompt_template="Title for {steps.fetch.output}"),
+    python("combine", input_mapping={
+        "parts": ["steps.summary.output", "steps.keywords.output"],
+        "meta": {"title": "steps.title.output"}
+    }),
+]
+
+
+class Recorder:
+    """Fake step execution that records concurrency."""
+
+    def __init__(self, delay=0.05, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.started = []
+
+    def __call__(self, step_id, step):
+        kind = step["type"]
+        with self.lock:
+            self.started.append(step_id)
+            self.active[kind] = self.active.get(kind, 0) + 1
+            self.peak[kind] = max(self.peak.get(kind, 0), self.active[kind])
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[kind] -= 1
+        if step_id in self.fail:
+            return {"success": False, "error": "boom"}
+        return {"success": True, "output": step_id}
+
+
+def test_dependencies_from_mappings_and_templates():
+    dag = WorkflowDAG(FAN_OUT + [python("audit", depends_on=["combine"])])
+
+    assert dag.dependencies["fetch"] == set()
+    assert dag.dependencies["title"] == {"fetch"}
+    assert dag.dependencies["combine"] == {"summary", "keywords", "title"}
+    assert dag.dependencies["audit"] == {"combine"}
+    assert dag.topological_order == ["fetch", "summary", "keywords", "title", "combine", "audit"]
+    assert dag.downstream("summary") == {"combine", "audit"}
+
+
+def test_cycles_and_duplicates_are_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        WorkflowDAG([python("a", input_mapping={"x": "steps.b.output"}),
+                     python("b", input_mapping={"x": "steps.a.output"})])
+    with pytest.raises(ValueError, match="Duplicate"):
+        WorkflowDAG([python("a"), python("a")])
+
+
+def test_independent_steps_overlap_within_kind_limits():
+    recorder = Recorder()
+    executor = DAGExecutor(WorkflowDAG(FAN_OUT), max_workers=8, concurrency_limits={"llm": 2})
+
+    records = executor.run(recorder)
+
+    assert all(r["status"] == "completed" for r in records.values())
+    assert recorder.peak["llm_call"] == 2
+    assert recorder.started[0] == "fetch" and recorder.started[-1] == "combine"
+    # fetch -> (2 LLM steps, then 1) -> combine: 4 rounds instead of 5 sequential steps
+    assert executor.wall_time < 5 * recorder.delay
+
+
+def test_failure_skips_downstream_and_fail_fast_cancels():
+    steps = FAN_OUT + [python("independent")]
+
+    executor = DAGExecutor(WorkflowDAG(steps), max_workers=1)
+    records = executor.run(Recorder(delay=0, fail={"keywords"}))
+
+    assert records["keywords"]["status"] == "failed"
+    assert records["combine"]["status"] == "skipped"
+    assert "keywords" in records["combine"]["result"]["error"]
+    assert records["summary"]["status"] == "completed"
+    assert records["independent"]["status"] == "completed"
+
+    executor = DAGExecutor(WorkflowDAG(steps), max_workers=1, fail_fast=True)
+    records = executor.run(Recorder(delay=0, fail={"fetch"}))
+
+    assert records["fetch"]["status"] == "failed"
+    assert records["independent"]["status"] == "cancelled"
+    assert records["combine"]["status"] == "skipped"
+
+
+def test_exception_counts_as_failure():
+    def execute(step_id, step):
+        raise RuntimeError("crashed")
+
+    records = DAGExecutor(WorkflowDAG(FAN_OUT[:2])).run(execute)
+
+    assert records["fetch"]["status"] == "failed"
+    assert records["fetch"]["result"]["error"] == "crashed"
+    assert records["summary"]["status"] == "skipped"
+
+
+def test_critical_path_report():
+    delays = {"fetch": 0.02, "summary": 0.08, "keywords": 0.01, "title": 0.01, "combine": 0.02}
+
+    def execute(step_id, step):
+        time.sleep(delays[step_id])
+        return {"success": True}
+
+    executor = DAGExecutor(WorkflowDAG(FAN_OUT), max_workers=4, concurrency_limits={})
+    executor.run(execute)
+    report = executor.timing_report()
+
+    assert report["critical_path"] == ["fetch", "summary", "combine"]
+    assert report["critical_path_ms"] >= 120
+    assert report["critical_path_ms"] <= report["wall_time_ms"] + 1
+    assert report["parallelism"] > 1
+    assert set(report["steps"]) == set(delays)
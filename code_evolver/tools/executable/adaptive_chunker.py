@@ -297,11 +297,10 @@ def adaptive_chunk(
         metadata["tier"] = tier
         metadata["context_window"] = chunker.context_window
 
-        # Update document with chunking metadata
+        # Update document with chunking metadata (content is unchanged)
         update_params = {
-            "operation": "store",
+            "operation": "update_metadata",
             "document_id": document_id,
-            "content": content,
             "metadata": metadata
         }
 
@@ -4,27 +4,238 @@ Buffer Tool
 
 Buffers data to smooth fast traffic. Batches items and flushes based on
 size, time, or manual trigger.
+
+Each buffer_id is backed by a bounded, memory-mapped ring segment
+(temp/buffers/<buffer_id>.ring):
+
+    header  magic, version, capacity, head, tail, count, total_flushed,
+            last_flush_time
+    data    records of <uint32 length><JSON bytes>, wrapping at the end
+
+A write appends one record under an exclusive file lock, so concurrent
+producer processes can share a buffer and a write costs O(item size)
+instead of re-pickling the whole buffer. A flush holds a separate flush
+lock while the pass-through tool runs; producers keep appending meanwhile,
+and the flushed records are only released once the tool has succeeded.
+Records are handed to the pass-through tool as their stored JSON bytes,
+without decoding and re-encoding each item.
+
+Buffer configuration is kept next to the segment in <buffer_id>.json.
 """
 
 import json
+import mmap
+import struct
 import sys
 import time
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import threading
 import pickle
 
+try:
+    import fcntl
+except ImportError:  # Windows: locking is per process only
+    fcntl = None
+
 # Persistent buffer storage directory
 _BUFFER_DIR = Path("./temp/buffers")
 _BUFFER_DIR.mkdir(parents=True, exist_ok=True)
 
+# Default size of a buffer's data region
+DEFAULT_CAPACITY_BYTES = 4 * 1024 * 1024
+
 # Global buffer storage (persists across calls within same process)
-_buffers: Dict[str, Dict[str, Any]] = {}
+_buffers: Dict[str, 'Buffer'] = {}
 _buffers_lock = threading.Lock()
 
 
+class RingSegment:
+    """Memory-mapped ring of length-prefixed records shared between processes."""
+
+    MAGIC = b"CEBUFFR1"
+    VERSION = 1
+    HEADER = struct.Struct("<8sIQQQQQd")  # magic, version, capacity, head, tail, count, total_flushed, last_flush_time
+    HEADER_SIZE = 64
+    LENGTH = struct.Struct("<I")
+    WRAP = 0xFFFFFFFF  # Marks the unused end of the data region
+
+    def __init__(self, path: Path, capacity_bytes: int = DEFAULT_CAPACITY_BYTES):
+        """
+        Open (or create) a ring segment.
+
+        Args:
+            path: Segment file
+            capacity_bytes: Size of the data region for a new segment (an
+                existing segment keeps its capacity)
+        """
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._flush_thread_lock = threading.Lock()
+
+        new_file = not path.exists() or path.stat().st_size < self.HEADER_SIZE
+        self._file = open(path, "a+b")
+        self._file.seek(0)
+
+        with self._file_lock(self._file):
+            if new_file and os.fstat(self._file.fileno()).st_size < self.HEADER_SIZE:
+                self._file.truncate(self.HEADER_SIZE + capacity_bytes)
+                self._mm = mmap.mmap(self._file.fileno(), 0)
+                self._write_header(0, 0, 0, 0, time.time(), capacity=capacity_bytes)
+            else:
+                self._mm = mmap.mmap(self._file.fileno(), 0)
+                magic, version, *_ = self.HEADER.unpack_from(self._mm, 0)
+                if magic != self.MAGIC or version != self.VERSION:
+                    raise ValueError(f"{path} is not a buffer segment")
+
+        self.capacity = self._read_header()[0]
+        self._flush_file = open(path.with_suffix(".flush.lock"), "a+b")
+
+    @staticmethod
+    @contextmanager
+    def _file_lock(handle):
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    @contextmanager
+    def lock(self):
+        """Exclusive access to the ring (across threads and processes)."""
+        with self._thread_lock:
+            with self._file_lock(self._file):
+                yield
+
+    @contextmanager
+    def flush_lock(self):
+        """Serialize flushers without blocking producers."""
+        with self._flush_thread_lock:
+            with self._file_lock(self._flush_file):
+                yield
+
+    def _read_header(self) -> Tuple[int, int, int, int, int, float]:
+        """(capacity, head, tail, count, total_flushed, last_flush_time)"""
+        return self.HEADER.unpack_from(self._mm, 0)[2:]
+
+    def _write_header(self, head: int, tail: int, count: int, total_flushed: int,
+                      last_flush_time: float, capacity: Optional[int] = None):
+        self.HEADER.pack_into(
+            self._mm, 0, self.MAGIC, self.VERSION,
+            capacity if capacity is not None else self.capacity,
+            head, tail, count, total_flushed, last_flush_time
+        )
+
+    def state(self) -> Dict[str, Any]:
+        """Header fields (call with the lock held for a consistent view)."""
+        capacity, head, tail, count, total_flushed, last_flush_time = self._read_header()
+        return {
+            "capacity": capacity,
+            "used": tail - head,
+            "count": count,
+            "total_flushed": total_flushed,
+            "last_flush_time": last_flush_time
+        }
+
+    def append(self, payload: bytes) -> bool:
+        """
+        Append a record (lock must be held).
+
+        Returns:
+            False if the ring has no room for the record
+        """
+        _, head, tail, count, total_flushed, last_flush_time = self._read_header()
+        need = self.LENGTH.size + len(payload)
+
+        pos = tail % self.capacity
+        pad = self.capacity - pos if self.capacity - pos < need else 0
+        if (tail - head) + pad + need > self.capacity:
+            return False
+
+        if pad:
+            if pad >= self.LENGTH.size:
+                self.LENGTH.pack_into(self._mm, self.HEADER_SIZE + pos, self.WRAP)
+            tail += pad
+            pos = 0
+
+        offset = self.HEADER_SIZE + pos
+        self.LENGTH.pack_into(self._mm, offset, len(payload))
+        self._mm[offset + self.LENGTH.size:offset + need] = payload
+
+        self._write_header(head, tail + need, count + 1, total_flushed, last_flush_time)
+        return True
+
+    def _record_spans(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """Byte spans (within the mmap) of the records between two offsets."""
+        spans = []
+        offset = start
+        while offset < end:
+            pos = offset % self.capacity
+            remaining = self.capacity - pos
+            if remaining < self.LENGTH.size:
+                offset += remaining
+                continue
+            (length,) = self.LENGTH.unpack_from(self._mm, self.HEADER_SIZE + pos)
+            if length == self.WRAP:
+                offset += remaining
+                continue
+            data_start = self.HEADER_SIZE + pos + self.LENGTH.size
+            spans.append((data_start, data_start + length))
+            offset += self.LENGTH.size + length
+        return spans
+
+    def read_batch(self) -> Tuple[bytes, int, int]:
+        """
+        Read all buffered records as one JSON array, without decoding them.
+
+        Returns:
+            (JSON array bytes, record count, tail offset to release up to)
+        """
+        with self.lock():
+            _, head, tail, _, _, _ = self._read_header()
+            spans = self._record_spans(head, tail)
+            view = memoryview(self._mm)
+            try:
+                records = [view[a:b] for a, b in spans]
+                raw = b"[" + b",".join(records) + b"]"
+                records.clear()
+            finally:
+                view.release()
+            return raw, len(spans), tail
+
+    def release(self, end: int, released: int):
+        """Drop records up to an offset returned by read_batch()."""
+        with self.lock():
+            _, head, tail, count, total_flushed, _ = self._read_header()
+            head = end
+            count = max(0, count - released)
+            if head == tail:
+                head = tail = 0  # Empty: restart at the beginning
+            self._write_header(head, tail, count, total_flushed + released, time.time())
+
+    def clear(self) -> int:
+        """Drop all records; returns the number dropped."""
+        with self.lock():
+            _, _, _, count, total_flushed, last_flush_time = self._read_header()
+            self._write_header(0, 0, 0, total_flushed, last_flush_time)
+            return count
+
+    def items(self) -> List[Any]:
+        """Decode all buffered records."""
+        raw, _, _ = self.read_batch()
+        return json.loads(raw)
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+        self._flush_file.close()
+
+
 class Buffer:
     """Buffer for smoothing fast data traffic."""
 
@@ -35,7 +246,8 @@ class Buffer:
         flush_interval_seconds: float = 5.0,
         flush_strategy: str = "batched",
         pass_through_tool: Optional[str] = None,
-        pass_through_input: Optional[Dict] = None
+        pass_through_input: Optional[Dict] = None,
+        capacity_bytes: int = DEFAULT_CAPACITY_BYTES
     ):
         self.buffer_id = buffer_id
         self.max_size = max_size
@@ -44,132 +256,174 @@ class Buffer:
         self.pass_through_tool = pass_through_tool
         self.pass_through_input = pass_through_input or {}
 
-        self.items: List[Any] = []
-        self.last_flush_time = time.time()
-        self.total_flushed = 0
+        self.ring = RingSegment(_BUFFER_DIR / f"{buffer_id}.ring", capacity_bytes)
 
-    def save_to_disk(self):
-        """Save buffer state to disk."""
-        state_file = _BUFFER_DIR / f"{self.buffer_id}.pkl"
-        state = {
-            'items': self.items,
-            'last_flush_time': self.last_flush_time,
-            'total_flushed': self.total_flushed,
+    @property
+    def items(self) -> List[Any]:
+        """Snapshot of buffered items."""
+        return self.ring.items()
+
+    @property
+    def count(self) -> int:
+        with self.ring.lock():
+            return self.ring.state()["count"]
+
+    @property
+    def last_flush_time(self) -> float:
+        with self.ring.lock():
+            return self.ring.state()["last_flush_time"]
+
+    @property
+    def total_flushed(self) -> int:
+        with self.ring.lock():
+            return self.ring.state()["total_flushed"]
+
+    def config(self) -> Dict[str, Any]:
+        return {
             'max_size': self.max_size,
             'flush_interval_seconds': self.flush_interval_seconds,
             'flush_strategy': self.flush_strategy,
             'pass_through_tool': self.pass_through_tool,
             'pass_through_input': self.pass_through_input
         }
-        with open(state_file, 'wb') as f:
-            pickle.dump(state, f)
+
+    def save_to_disk(self):
+        """Save buffer configuration (items live in the ring segment)."""
+        config_file = _BUFFER_DIR / f"{self.buffer_id}.json"
+        tmp_file = config_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(self.config(), f)
+        os.replace(tmp_file, config_file)
 
     @classmethod
     def load_from_disk(cls, buffer_id: str) -> Optional['Buffer']:
-        """Load buffer state from disk."""
-        state_file = _BUFFER_DIR / f"{buffer_id}.pkl"
-        if not state_file.exists():
-            return None
+        """Load buffer configuration from disk (migrating a legacy pickle state)."""
+        config_file = _BUFFER_DIR / f"{buffer_id}.json"
+        legacy_file = _BUFFER_DIR / f"{buffer_id}.pkl"
 
         try:
-            with open(state_file, 'rb') as f:
-                state = pickle.load(f)
-
-            buffer = cls(
-                buffer_id=buffer_id,
-                max_size=state.get('max_size', 100),
-                flush_interval_seconds=state.get('flush_interval_seconds', 5.0),
-                flush_strategy=state.get('flush_strategy', 'batched'),
-                pass_through_tool=state.get('pass_through_tool'),
-                pass_through_input=state.get('pass_through_input', {})
-            )
-            buffer.items = state.get('items', [])
-            buffer.last_flush_time = state.get('last_flush_time', time.time())
-            buffer.total_flushed = state.get('total_flushed', 0)
-
-            return buffer
+            if config_file.exists():
+                with open(config_file, 'r') as f:
+                    state = json.load(f)
+                return cls(buffer_id=buffer_id, **state)
+
+            if legacy_file.exists():
+                with open(legacy_file, 'rb') as f:
+                    state = pickle.load(f)
+
+                buffer = cls(
+                    buffer_id=buffer_id,
+                    max_size=state.get('max_size', 100),
+                    flush_interval_seconds=state.get('flush_interval_seconds', 5.0),
+                    flush_strategy=state.get('flush_strategy', 'batched'),
+                    pass_through_tool=state.get('pass_through_tool'),
+                    pass_through_input=state.get('pass_through_input', {})
+                )
+                with buffer.ring.lock():
+                    for item in state.get('items', []):
+                        buffer.ring.append(buffer._encode(item))
+                buffer.save_to_disk()
+                legacy_file.unlink()
+                return buffer
+
         except Exception as e:
             print(f"Warning: Failed to load buffer state: {e}", file=sys.stderr)
-            return None
 
-    def should_auto_flush(self) -> bool:
+        return None
+
+    @staticmethod
+    def _encode(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+
+    def should_auto_flush(self, count: Optional[int] = None) -> bool:
         """Check if buffer should auto-flush."""
         if self.flush_strategy == "manual":
             return False
 
+        if count is None:
+            count = self.count
+
         if self.flush_strategy == "immediate":
-            return len(self.items) > 0
+            return count > 0
 
         # Batched strategy
         # Flush if size limit reached
-        if len(self.items) >= self.max_size:
+        if count >= self.max_size:
             return True
 
         # Flush if time interval exceeded
         time_since_flush = time.time() - self.last_flush_time
-        if time_since_flush >= self.flush_interval_seconds and len(self.items) > 0:
+        if time_since_flush >= self.flush_interval_seconds and count > 0:
             return True
 
         return False
 
     def write(self, data: Any) -> Dict[str, Any]:
         """Write item to buffer."""
-        self.items.append(data)
+        payload = self._encode(data)
 
-        # Check if should auto-flush
-        if self.should_auto_flush():
-            result = self.flush()
-            # Save state after flush
-            self.save_to_disk()
-            return result
+        with self.ring.lock():
+            appended = self.ring.append(payload)
+            count = self.ring.state()["count"]
 
-        # Save state after write
-        self.save_to_disk()
+        if not appended and self.flush_strategy != "manual":
+            # Ring full: make room by flushing, then retry once
+            self.flush()
+            with self.ring.lock():
+                appended = self.ring.append(payload)
+                count = self.ring.state()["count"]
+
+        if not appended:
+            return {
+                "operation": "write",
+                "buffer_id": self.buffer_id,
+                "buffered_count": count,
+                "flushed": False,
+                "error": "Buffer full",
+                "message": f"Buffer full ({self.ring.capacity} bytes), item not buffered"
+            }
+
+        # Check if should auto-flush
+        if self.should_auto_flush(count):
+            return self.flush()
 
         return {
             "operation": "write",
             "buffer_id": self.buffer_id,
-            "buffered_count": len(self.items),
+            "buffered_count": count,
             "flushed": False,
-            "message": f"Item buffered ({len(self.items)}/{self.max_size})"
+            "message": f"Item buffered ({count}/{self.max_size})"
         }
 
     def flush(self) -> Dict[str, Any]:
         """Flush buffer to pass_through_tool."""
-        if len(self.items) == 0:
-            return {
-                "operation": "flush",
-                "buffer_id": self.buffer_id,
-                "flushed": False,
-                "flushed_count": 0,
-                "message": "Buffer empty, nothing to flush"
-            }
+        with self.ring.flush_lock():
+            raw_items, flushed_count, end = self.ring.read_batch()
 
-        flushed_count = len(self.items)
-        items_to_flush = self.items.copy()
-        self.items.clear()
-        self.last_flush_time = time.time()
-        self.total_flushed += flushed_count
-
-        # Call pass_through_tool if specified
-        pass_through_result = None
-        if self.pass_through_tool:
-            try:
-                pass_through_result = self._call_pass_through_tool(items_to_flush)
-            except Exception as e:
-                # Restore items to buffer if pass_through fails
-                self.items = items_to_flush + self.items
-                self.save_to_disk()  # Save restored state
+            if flushed_count == 0:
                 return {
                     "operation": "flush",
                     "buffer_id": self.buffer_id,
                     "flushed": False,
-                    "error": f"Pass-through tool failed: {str(e)}",
-                    "message": f"Failed to flush {flushed_count} items"
+                    "flushed_count": 0,
+                    "message": "Buffer empty, nothing to flush"
                 }
 
-        # Save state after successful flush
-        self.save_to_disk()
+            # Call pass_through_tool if specified; records stay buffered if it fails
+            pass_through_result = None
+            if self.pass_through_tool:
+                try:
+                    pass_through_result = self._call_pass_through_tool(raw_items, flushed_count)
+                except Exception as e:
+                    return {
+                        "operation": "flush",
+                        "buffer_id": self.buffer_id,
+                        "flushed": False,
+                        "error": f"Pass-through tool failed: {str(e)}",
+                        "message": f"Failed to flush {flushed_count} items"
+                    }
+
+            self.ring.release(end, flushed_count)
 
         return {
             "operation": "flush",
@@ -181,26 +435,25 @@ class Buffer:
                        (f" to {self.pass_through_tool}" if self.pass_through_tool else "")
         }
 
-    def _call_pass_through_tool(self, items: List[Any]) -> Any:
-        """Call pass_through_tool with buffered items."""
+    def _build_pass_through_input(self, raw_items: bytes, count: int) -> str:
+        """Splice the stored JSON array of items into the pass-through input."""
+        extra = {k: v for k, v in self.pass_through_input.items() if k != "buffered_items"}
+        extra["buffer_metadata"] = {
+            "buffer_id": self.buffer_id,
+            "count": count,
+            "flushed_at": datetime.utcnow().isoformat() + "Z"
+        }
+        return '{"buffered_items": ' + raw_items.decode("utf-8") + ", " + json.dumps(extra)[1:]
+
+    def _call_pass_through_tool(self, raw_items: bytes, count: int) -> Any:
+        """Call pass_through_tool with buffered items (a JSON array)."""
         sys.path.insert(0, '.')
         from node_runtime import call_tool
 
-        # Prepare input for pass_through_tool
-        tool_input = {
-            **self.pass_through_input,
-            "buffered_items": items,
-            "buffer_metadata": {
-                "buffer_id": self.buffer_id,
-                "count": len(items),
-                "flushed_at": datetime.utcnow().isoformat() + "Z"
-            }
-        }
-
         # Call the tool
         result = call_tool(
             self.pass_through_tool,
-            json.dumps(tool_input),
+            self._build_pass_through_input(raw_items, count),
             disable_tracking=True  # Don't track buffer internal operations
         )
 
@@ -212,29 +465,31 @@ class Buffer:
 
     def status(self) -> Dict[str, Any]:
         """Get buffer status."""
-        time_since_flush = time.time() - self.last_flush_time
+        with self.ring.lock():
+            state = self.ring.state()
+        count = state["count"]
+        time_since_flush = time.time() - state["last_flush_time"]
 
         return {
             "operation": "status",
             "buffer_id": self.buffer_id,
-            "buffered_count": len(self.items),
+            "buffered_count": count,
             "max_size": self.max_size,
             "flush_interval_seconds": self.flush_interval_seconds,
             "flush_strategy": self.flush_strategy,
             "time_since_last_flush": round(time_since_flush, 2),
-            "total_flushed": self.total_flushed,
+            "total_flushed": state["total_flushed"],
+            "bytes_used": state["used"],
+            "capacity_bytes": state["capacity"],
             "pass_through_tool": self.pass_through_tool,
-            "message": f"Buffer: {len(self.items)}/{self.max_size} items " +
+            "message": f"Buffer: {count}/{self.max_size} items " +
                        f"({round(time_since_flush, 1)}s since last flush)"
         }
 
     def clear(self) -> Dict[str, Any]:
         """Clear buffer without flushing."""
-        cleared_count = len(self.items)
-        self.items.clear()
-
-        # Save state after clear
-        self.save_to_disk()
+        with self.ring.flush_lock():
+            cleared_count = self.ring.clear()
 
         return {
             "operation": "clear",
@@ -251,7 +506,8 @@ def get_or_create_buffer(
     flush_interval_seconds: float = 5.0,
     flush_strategy: str = "batched",
     pass_through_tool: Optional[str] = None,
-    pass_through_input: Optional[Dict] = None
+    pass_through_input: Optional[Dict] = None,
+    capacity_bytes: int = DEFAULT_CAPACITY_BYTES
 ) -> Buffer:
     """Get existing buffer or create new one."""
     with _buffers_lock:
@@ -267,13 +523,17 @@ def get_or_create_buffer(
                     flush_interval_seconds=flush_interval_seconds,
                     flush_strategy=flush_strategy,
                     pass_through_tool=pass_through_tool,
-                    pass_through_input=pass_through_input
+                    pass_through_input=pass_through_input,
+                    capacity_bytes=capacity_bytes
                 )
+                buffer.save_to_disk()
 
             _buffers[buffer_id] = buffer
         else:
             buffer = _buffers[buffer_id]
 
+        config_before = buffer.config()
+
         # Update configuration if provided (and not default values)
         if max_size != 100:  # Not default
             buffer.max_size = max_size
@@ -286,6 +546,10 @@ def get_or_create_buffer(
         if pass_through_input:
             buffer.pass_through_input = pass_through_input
 
+        # Configuration is only rewritten when it changes
+        if buffer.config() != config_before:
+            buffer.save_to_disk()
+
         return buffer
 
 
@@ -313,6 +577,7 @@ def main():
         flush_strategy = input_data.get("flush_strategy", "batched")
         pass_through_tool = input_data.get("pass_through_tool")
         pass_through_input = input_data.get("pass_through_input", {})
+        capacity_bytes = input_data.get("capacity_bytes", DEFAULT_CAPACITY_BYTES)
 
         # Get or create buffer
         buffer = get_or_create_buffer(
@@ -321,7 +586,8 @@ def main():
             flush_interval_seconds=flush_interval_seconds,
             flush_strategy=flush_strategy,
             pass_through_tool=pass_through_tool,
-            pass_through_input=pass_through_input
+            pass_through_input=pass_through_input,
+            capacity_bytes=capacity_bytes
         )
 
         # Execute operation
@@ -141,31 +141,36 @@ class BulkDataStore:
         return {"success": True, "data": results, "count": len(results)}
 
     @staticmethod
-    def store_log(tool_id: str, log_level: str, message: str, details: Optional[Dict] = None) -> Dict[str, Any]:
-        """Store a detailed log message."""
-        data = {
+    def log_row(
+        tool_id: str,
+        log_level: str,
+        message: str,
+        details: Optional[Dict] = None,
+        created_at: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build a tool_logs row."""
+        return {
             "tool_id": tool_id,
             "log_level": log_level.lower(),
             "message": message,
             "details": json.dumps(details) if details else None,
-            "created_at": datetime.now(timezone.utc)
+            "created_at": created_at or datetime.now(timezone.utc)
         }
 
-        rows = PostgresClient.insert("tool_logs", data)
-        return {"success": True, "count": rows}
-
     @staticmethod
-    def store_bug(
+    def bug_row(
         bug_id: str,
         tool_id: str,
         severity: str,
         message: str,
         stack_trace: Optional[str] = None,
         details: Optional[Dict] = None,
-        resolved: bool = False
+        resolved: bool = False,
+        created_at: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Store a bug report with full history."""
-        data = {
+        """Build a tool_bugs row."""
+        now = datetime.now(timezone.utc)
+        return {
             "bug_id": bug_id,
             "tool_id": tool_id,
             "severity": severity.lower(),
@@ -173,11 +178,100 @@ class BulkDataStore:
             "stack_trace": stack_trace,
             "details": json.dumps(details) if details else None,
             "resolved": resolved,
-            "created_at": datetime.now(timezone.utc)
+            "created_at": created_at or now,
+            "resolved_at": now if resolved else None
         }
 
-        if resolved:
-            data["resolved_at"] = datetime.now(timezone.utc)
+    @staticmethod
+    def ancestry_row(
+        parent_tool_id: str,
+        child_tool_id: str,
+        relationship_type: str,
+        details: Optional[Dict] = None,
+        created_at: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build a tool_ancestry row."""
+        return {
+            "parent_tool_id": parent_tool_id,
+            "child_tool_id": child_tool_id,
+            "relationship_type": relationship_type,
+            "details": json.dumps(details) if details else None,
+            "created_at": created_at or datetime.now(timezone.utc)
+        }
+
+    @staticmethod
+    def perf_row(
+        tool_id: str,
+        metric_name: str,
+        metric_value: float,
+        unit: str = "",
+        details: Optional[Dict] = None,
+        created_at: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build a tool_performance row."""
+        return {
+            "tool_id": tool_id,
+            "metric_name": metric_name,
+            "metric_value": metric_value,
+            "unit": unit,
+            "details": json.dumps(details) if details else None,
+            "created_at": created_at or datetime.now(timezone.utc)
+        }
+
+    @staticmethod
+    def store_batch(batch_operation: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Store many records of one write operation with batched inserts.
+
+        Args:
+            batch_operation: store_log, store_bug, store_ancestry or store_perf_data
+            records: Keyword arguments of the matching store_* call, one per record
+
+        Returns:
+            Result dict; rows that fail when the batch is retried one by one
+            are reported in "failed"
+        """
+        table, build_row = BATCH_OPERATIONS[batch_operation]
+        rows = [build_row(**record) for record in records]
+        # Duplicate bug_ids must not abort the whole batch
+        skip_duplicates = table == "tool_bugs"
+
+        try:
+            count = PostgresClient.insert_many(table, rows, on_conflict_do_nothing=skip_duplicates)
+            return {"success": True, "count": count, "failed": 0}
+        except Exception as e:
+            logger.warning(f"Batch insert into {table} failed, retrying row by row: {e}")
+
+        count = 0
+        failed = 0
+        for row in rows:
+            try:
+                count += PostgresClient.insert(table, row)
+            except Exception as e:
+                failed += 1
+                logger.error(f"Failed to insert into {table}: {e}")
+        return {"success": failed == 0, "count": count, "failed": failed}
+
+    @staticmethod
+    def store_log(tool_id: str, log_level: str, message: str, details: Optional[Dict] = None) -> Dict[str, Any]:
+        """Store a detailed log message."""
+        data = BulkDataStore.log_row(tool_id, log_level, message, details)
+
+        rows = PostgresClient.insert("tool_logs", data)
+        return {"success": True, "count": rows}
+
+    @staticmethod
+    def store_bug(
+        bug_id: str,
+        tool_id: str,
+        severity: str,
+        message: str,
+        stack_trace: Optional[str] = None,
+        details: Optional[Dict] = None,
+        resolved: bool = False
+    ) -> Dict[str, Any]:
+        """Store a bug report with full history."""
+        data = BulkDataStore.bug_row(bug_id, tool_id, severity, message, stack_trace, details, resolved)
 
         rows = PostgresClient.insert("tool_bugs", data)
         return {"success": True, "count": rows}
@@ -190,13 +284,7 @@ class BulkDataStore:
         details: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """Store tool ancestry/lineage information."""
-        data = {
-            "parent_tool_id": parent_tool_id,
-            "child_tool_id": child_tool_id,
-            "relationship_type": relationship_type,
-            "details": json.dumps(details) if details else None,
-            "created_at": datetime.now(timezone.utc)
-        }
+        data = BulkDataStore.ancestry_row(parent_tool_id, child_tool_id, relationship_type, details)
 
         rows = PostgresClient.insert("tool_ancestry", data)
         return {"success": True, "count": rows}
@@ -210,14 +298,7 @@ class BulkDataStore:
         details: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """Store performance data."""
-        data = {
-            "tool_id": tool_id,
-            "metric_name": metric_name,
-            "metric_value": metric_value,
-            "unit": unit,
-            "details": json.dumps(details) if details else None,
-            "created_at": datetime.now(timezone.utc)
-        }
+        data = BulkDataStore.perf_row(tool_id, metric_name, metric_value, unit, details)
 
         rows = PostgresClient.insert("tool_performance", data)
         return {"success": True, "count": rows}
@@ -350,6 +431,15 @@ class BulkDataStore:
         }
 
 
+# Write operations that can be batched: operation -> (table, row builder)
+BATCH_OPERATIONS = {
+    "store_log": ("tool_logs", BulkDataStore.log_row),
+    "store_bug": ("tool_bugs", BulkDataStore.bug_row),
+    "store_ancestry": ("tool_ancestry", BulkDataStore.ancestry_row),
+    "store_perf_data": ("tool_performance", BulkDataStore.perf_row),
+}
+
+
 def main():
     """Main entry point for the tool."""
     try:
@@ -396,6 +486,12 @@ def main():
                 input_data.get("details")
             )
 
+        elif operation == "store_batch":
+            result = BulkDataStore.store_batch(
+                input_data["batch_operation"],
+                input_data["records"]
+            )
+
         elif operation == "store_tool":
             result = BulkDataStore.store_tool(
                 input_data["tool_id"],
@@ -1,49 +1,187 @@
 #!/usr/bin/env python3
 """
-Document Store - In-memory document management for summarization workflows.
+Document Store - Document management for summarization workflows.
 
-Provides persistent in-memory storage for documents with metadata.
+Provides persistent storage for documents with metadata.
 Shared across all tools in the summarization workflow.
+
+Layout (under ~/.code_evolver/document_store/):
+
+    blobs/<aa>/<sha256>    content chunks of up to CHUNK_CHARS characters,
+                           content-addressed (identical chunks are stored
+                           once and never rewritten)
+    docs/<sha1(id)>.json   one small record per document: metadata,
+                           length and the list of chunk hashes
+
+Nothing is loaded at startup: each operation reads only the record (and,
+for content, the chunks) of the document it touches, so its cost does not
+depend on how many documents are stored. Range reads (offset/length)
+read only the chunks that overlap the range. Every file is written to a
+temporary name and renamed into place, so readers never see a partial
+document.
 """
 
+import hashlib
 import json
+import os
+import shutil
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
-# Global in-memory store (persists across invocations in same process)
-# For true persistence, we use a JSON file
-STORE_FILE = Path.home() / ".code_evolver" / "document_store.json"
+STORE_DIR = Path.home() / ".code_evolver" / "document_store"
 
+# Single JSON file used by earlier versions (migrated on first use)
+STORE_FILE = Path.home() / ".code_evolver" / "document_store.json"
 
-class DocumentStore:
-    """In-memory document store with disk persistence."""
+# Characters per content chunk
+CHUNK_CHARS = 64 * 1024
 
-    def __init__(self):
-        """Initialize the document store."""
-        self.documents: Dict[str, Dict[str, Any]] = {}
-        self.load_from_disk()
 
-    def load_from_disk(self):
-        """Load documents from disk if available."""
+class DocumentStore:
+    """Chunked, content-addressed document store with a per-document index."""
+
+    def __init__(self, root: Optional[Path] = None, legacy_file: Optional[Path] = None):
+        """
+        Initialize the document store.
+
+        Args:
+            root: Store directory (default: ~/.code_evolver/document_store)
+            legacy_file: Monolithic JSON store to migrate (default: STORE_FILE)
+        """
+        self.root = Path(root) if root is not None else STORE_DIR
+        self.blob_dir = self.root / "blobs"
+        self.doc_dir = self.root / "docs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.doc_dir.mkdir(parents=True, exist_ok=True)
+
+        self.migrate_legacy(legacy_file if legacy_file is not None else STORE_FILE)
+
+    # ------------------------------------------------------------------
+    # Storage primitives
+    # ------------------------------------------------------------------
+
+    def _atomic_write(self, path: Path, data: bytes):
+        """Write a file via a temporary file and rename."""
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _record_path(self, document_id: str) -> Path:
+        digest = hashlib.sha1(document_id.encode('utf-8')).hexdigest()
+        return self.doc_dir / f"{digest}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / digest
+
+    def _read_record(self, document_id: str) -> Optional[Dict[str, Any]]:
         try:
-            if STORE_FILE.exists():
-                with open(STORE_FILE, 'r', encoding='utf-8') as f:
-                    self.documents = json.load(f)
-        except Exception as e:
-            # Start with empty store if load fails
-            self.documents = {}
+            with open(self._record_path(document_id), 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return record if record.get("document_id") == document_id else None
+
+    def _write_blobs(self, content: str) -> List[str]:
+        """Store content chunks, skipping chunks that already exist."""
+        digests = []
+        for start in range(0, len(content), CHUNK_CHARS):
+            data = content[start:start + CHUNK_CHARS].encode('utf-8')
+            digest = hashlib.sha256(data).hexdigest()
+            path = self._blob_path(digest)
+            if not path.exists():
+                path.parent.mkdir(exist_ok=True)
+                self._atomic_write(path, data)
+            digests.append(digest)
+        return digests
+
+    def _read_content(self, record: Dict[str, Any], offset: int = 0, length: Optional[int] = None) -> str:
+        """Read a document's content (or a character range of it)."""
+        chunk_chars = record.get("chunk_chars", CHUNK_CHARS)
+        end = record["length"] if length is None else min(record["length"], offset + length)
+        if offset >= end:
+            return ""
+
+        first = offset // chunk_chars
+        last = (end - 1) // chunk_chars
+        parts = []
+        for digest in record["chunks"][first:last + 1]:
+            with open(self._blob_path(digest), 'rb') as f:
+                parts.append(f.read().decode('utf-8'))
+
+        base = first * chunk_chars
+        return "".join(parts)[offset - base:end - base]
+
+    def _write_record(self, document_id: str, content: Optional[str], metadata: Dict[str, Any],
+                      previous: Optional[Dict[str, Any]] = None,
+                      stored_at: Optional[str] = None) -> Dict[str, Any]:
+        if content is not None:
+            chunks = self._write_blobs(content)
+            length = len(content)
+        else:
+            chunks = previous["chunks"]
+            length = previous["length"]
 
-    def save_to_disk(self):
-        """Persist documents to disk."""
+        record = {
+            "document_id": document_id,
+            "metadata": metadata,
+            "stored_at": stored_at or datetime.now().isoformat(),
+            "length": length,
+            "chunk_chars": CHUNK_CHARS if content is not None else previous.get("chunk_chars", CHUNK_CHARS),
+            "chunks": chunks
+        }
+        self._atomic_write(
+            self._record_path(document_id),
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+        )
+        return record
+
+    def _iter_records(self):
+        for path in sorted(self.doc_dir.glob("*.json")):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    yield json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+
+    def migrate_legacy(self, legacy_file: Path):
+        """Import documents from the old single-file store (once)."""
         try:
-            STORE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(STORE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.documents, f, indent=2, ensure_ascii=False)
+            if not legacy_file.exists():
+                return
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                documents = json.load(f)
+
+            for document_id, doc in documents.items():
+                if self._read_record(document_id) is None:
+                    self._write_record(
+                        document_id, doc.get("content", ""), doc.get("metadata", {}),
+                        stored_at=doc.get("stored_at")
+                    )
+
+            legacy_file.rename(legacy_file.with_suffix(".json.migrated"))
         except Exception as e:
-            # Non-fatal error, just log it
-            print(f"Warning: Could not persist to disk: {e}", file=sys.stderr)
+            print(f"Warning: Could not migrate {legacy_file}: {e}", file=sys.stderr)
+
+    def collect_garbage(self) -> int:
+        """Delete chunks no document refers to; returns the number deleted."""
+        referenced = set()
+        for record in self._iter_records():
+            referenced.update(record.get("chunks", []))
+
+        removed = 0
+        for path in self.blob_dir.glob("*/*"):
+            if path.name not in referenced and not path.name.startswith("."):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    # ------------------------------------------------------------------
+    # Operations
+    # ------------------------------------------------------------------
 
     def store(self, document_id: str, content: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Store a document with metadata."""
@@ -59,50 +197,88 @@ class DocumentStore:
                 "error": "content is required"
             }
 
-        # Create document entry
-        doc = {
-            "content": content,
-            "metadata": metadata or {},
-            "stored_at": datetime.now().isoformat()
-        }
+        metadata = dict(metadata or {})
 
         # Add size to metadata
-        doc["metadata"]["size"] = len(content)
+        metadata["size"] = len(content)
 
-        self.documents[document_id] = doc
-        self.save_to_disk()
+        self._write_record(document_id, content, metadata)
 
         return {
             "success": True,
             "operation": "store",
             "document_id": document_id,
             "message": f"Document '{document_id}' stored successfully",
-            "metadata": doc["metadata"]
+            "metadata": metadata
         }
 
-    def retrieve(self, document_id: str) -> Dict[str, Any]:
-        """Retrieve a document by ID."""
+    def update_metadata(self, document_id: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Merge metadata into a stored document without resending its content."""
         if not document_id:
             return {
                 "success": False,
                 "error": "document_id is required"
             }
 
-        if document_id not in self.documents:
+        record = self._read_record(document_id)
+        if record is None:
             return {
                 "success": False,
                 "error": f"Document '{document_id}' not found"
             }
 
-        doc = self.documents[document_id]
+        merged = {**record["metadata"], **(metadata or {})}
+        merged["size"] = record["length"]
+        self._write_record(document_id, None, merged, previous=record, stored_at=record.get("stored_at"))
+
         return {
+            "success": True,
+            "operation": "update_metadata",
+            "document_id": document_id,
+            "message": f"Document '{document_id}' metadata updated",
+            "metadata": merged
+        }
+
+    def retrieve(self, document_id: str, offset: int = 0, length: Optional[int] = None,
+                 include_content: bool = True) -> Dict[str, Any]:
+        """
+        Retrieve a document by ID.
+
+        Args:
+            document_id: Document to read
+            offset: First character to return
+            length: Number of characters to return (None = to the end)
+            include_content: False returns only metadata and length
+        """
+        if not document_id:
+            return {
+                "success": False,
+                "error": "document_id is required"
+            }
+
+        record = self._read_record(document_id)
+        if record is None:
+            return {
+                "success": False,
+                "error": f"Document '{document_id}' not found"
+            }
+
+        result = {
             "success": True,
             "operation": "retrieve",
             "document_id": document_id,
-            "content": doc["content"],
-            "metadata": doc["metadata"]
+            "metadata": record["metadata"],
+            "length": record["length"]
         }
 
+        if include_content:
+            offset = max(0, int(offset or 0))
+            result["content"] = self._read_content(record, offset, length)
+            if offset or length is not None:
+                result["offset"] = offset
+
+        return result
+
     def exists(self, document_id: str) -> Dict[str, Any]:
         """Check if a document exists."""
         if not document_id:
@@ -111,7 +287,7 @@ class DocumentStore:
                 "error": "document_id is required"
             }
 
-        exists = document_id in self.documents
+        exists = self._read_record(document_id) is not None
         return {
             "success": True,
             "operation": "exists",
@@ -120,21 +296,20 @@ class DocumentStore:
         }
 
     def delete(self, document_id: str) -> Dict[str, Any]:
-        """Delete a document by ID."""
+        """Delete a document by ID (its chunks are removed by collect_garbage)."""
         if not document_id:
             return {
                 "success": False,
                 "error": "document_id is required"
             }
 
-        if document_id not in self.documents:
+        if self._read_record(document_id) is None:
             return {
                 "success": False,
                 "error": f"Document '{document_id}' not found"
             }
 
-        del self.documents[document_id]
-        self.save_to_disk()
+        self._record_path(document_id).unlink(missing_ok=True)
 
         return {
             "success": True,
@@ -144,14 +319,14 @@ class DocumentStore:
         }
 
     def list_documents(self) -> Dict[str, Any]:
-        """List all stored documents."""
+        """List all stored documents (reads only the index records)."""
         docs = []
-        for doc_id, doc in self.documents.items():
+        for record in self._iter_records():
             docs.append({
-                "document_id": doc_id,
-                "metadata": doc["metadata"],
-                "stored_at": doc.get("stored_at"),
-                "content_length": len(doc["content"])
+                "document_id": record["document_id"],
+                "metadata": record["metadata"],
+                "stored_at": record.get("stored_at"),
+                "content_length": record["length"]
             })
 
         return {
@@ -163,14 +338,26 @@ class DocumentStore:
 
     def clear(self) -> Dict[str, Any]:
         """Clear all documents from the store."""
-        count = len(self.documents)
-        self.documents = {}
-        self.save_to_disk()
+        records = list(self.doc_dir.glob("*.json"))
+        for path in records:
+            path.unlink(missing_ok=True)
+        shutil.rmtree(self.blob_dir, ignore_errors=True)
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
 
         return {
             "success": True,
             "operation": "clear",
-            "message": f"Cleared {count} document(s) from store"
+            "message": f"Cleared {len(records)} document(s) from store"
+        }
+
+    def gc(self) -> Dict[str, Any]:
+        """Remove unreferenced content chunks."""
+        removed = self.collect_garbage()
+        return {
+            "success": True,
+            "operation": "gc",
+            "removed_chunks": removed,
+            "message": f"Removed {removed} unreferenced chunk(s)"
         }
 
 
@@ -201,9 +388,19 @@ def main():
             metadata = params.get("metadata")
             result = store.store(document_id, content, metadata)
 
+        elif operation == "update_metadata":
+            document_id = params.get("document_id")
+            metadata = params.get("metadata")
+            result = store.update_metadata(document_id, metadata)
+
         elif operation == "retrieve":
             document_id = params.get("document_id")
-            result = store.retrieve(document_id)
+            result = store.retrieve(
+                document_id,
+                offset=params.get("offset", 0),
+                length=params.get("length"),
+                include_content=params.get("include_content", True)
+            )
 
         elif operation == "exists":
             document_id = params.get("document_id")
@@ -219,6 +416,9 @@ def main():
         elif operation == "clear":
             result = store.clear()
 
+        elif operation == "gc":
+            result = store.gc()
+
         else:
             result = {
                 "success": False,
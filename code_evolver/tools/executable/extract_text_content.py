@@ -176,11 +176,10 @@ def extract_text_content(
             "sentence_count": extracted["sentence_count"]
         }
 
-        # Update document with extraction metadata
+        # Update document with extraction metadata (content is unchanged)
         update_params = {
-            "operation": "store",
+            "operation": "update_metadata",
             "document_id": document_id,
-            "content": content,
             "metadata": metadata
         }
 
@@ -7,16 +7,34 @@ Provides isolated file storage for each tool with security controls:
 - Extension filtering
 - Size limits
 - Automatic directory management
+
+Storage used per scope is tracked in a usage ledger
+(base_path/.usage/<scope>.json) that every mutation updates with its size
+delta, so quota checks do not walk the whole scope. The ledger is
+reconciled with a full rescan when it is missing or older than
+reconcile_interval_seconds (in a background thread by default).
 """
+import bisect
 import json
 import os
 import shutil
 import sys
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import glob
 
+try:
+    import fcntl
+except ImportError:  # Windows: ledger updates are only serialized per process
+    fcntl = None
+
+# Directory under base_path holding the per-scope usage ledgers
+LEDGER_DIR_NAME = ".usage"
+
 
 class FilesystemManager:
     """
@@ -33,7 +51,9 @@ class FilesystemManager:
         max_total_size_mb: int = 1000,
         allowed_extensions: Optional[List[str]] = None,
         allow_absolute_paths: bool = False,
-        allow_parent_traversal: bool = False
+        allow_parent_traversal: bool = False,
+        reconcile_interval_seconds: float = 3600,
+        background_reconcile: bool = True
     ):
         """
         Initialize Filesystem Manager.
@@ -45,6 +65,10 @@ class FilesystemManager:
             allowed_extensions: List of allowed file extensions (None = all allowed)
             allow_absolute_paths: Allow absolute paths (dangerous)
             allow_parent_traversal: Allow .. in paths (dangerous)
+            reconcile_interval_seconds: Rescan a scope when its usage ledger
+                is older than this
+            background_reconcile: Rescan stale ledgers in a background thread
+                (False rescans inline, e.g. for short-lived processes)
         """
         self.base_path = Path(base_path).resolve()
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
@@ -55,9 +79,23 @@ class FilesystemManager:
         ]
         self.allow_absolute_paths = allow_absolute_paths
         self.allow_parent_traversal = allow_parent_traversal
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self.background_reconcile = background_reconcile
 
         # Ensure base path exists
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.ledger_path = self.base_path / LEDGER_DIR_NAME
+        self.ledger_path.mkdir(exist_ok=True)
+
+        self._ledger_thread_lock = threading.Lock()
+        self._reconciling = set()
+
+    def _scope_name(self, scope: str) -> str:
+        """Sanitize a scope name."""
+        scope = scope.replace('/', '_').replace('\\', '_').replace('..', '_')
+        if scope == LEDGER_DIR_NAME:
+            scope = '_' + scope
+        return scope
 
     def get_scope_path(self, scope: str) -> Path:
         """
@@ -70,8 +108,7 @@ class FilesystemManager:
             Path to tool's scope directory
         """
         # Sanitize scope name
-        scope = scope.replace('/', '_').replace('\\', '_').replace('..', '_')
-        scope_path = self.base_path / scope
+        scope_path = self.base_path / self._scope_name(scope)
         scope_path.mkdir(parents=True, exist_ok=True)
         return scope_path
 
@@ -148,9 +185,9 @@ class FilesystemManager:
                 f"File size {size_mb:.1f}MB exceeds limit of {max_mb:.0f}MB"
             )
 
-    def get_total_size(self, scope: str) -> int:
+    def scan_total_size(self, scope: str) -> int:
         """
-        Get total storage used by a tool scope.
+        Measure storage used by a tool scope by walking all of its files.
 
         Args:
             scope: Tool scope name
@@ -158,10 +195,12 @@ class FilesystemManager:
         Returns:
             Total size in bytes
         """
-        scope_path = self.get_scope_path(scope)
+        return self._tree_size(self.get_scope_path(scope))
+
+    def _tree_size(self, path: Path) -> int:
         total = 0
 
-        for root, dirs, files in os.walk(scope_path):
+        for root, dirs, files in os.walk(path):
             for file in files:
                 file_path = Path(root) / file
                 try:
@@ -171,6 +210,128 @@ class FilesystemManager:
 
         return total
 
+    @contextmanager
+    def _ledger_lock(self, scope: str):
+        """Serialize ledger updates across threads and processes."""
+        with self._ledger_thread_lock:
+            lock_file = open(self.ledger_path / f"{self._scope_name(scope)}.lock", 'a+b')
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                lock_file.close()
+
+    def _read_ledger(self, scope: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.ledger_path / f"{self._scope_name(scope)}.json", 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_ledger(self, scope: str, ledger: Dict[str, Any]):
+        path = self.ledger_path / f"{self._scope_name(scope)}.json"
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(ledger, f)
+        os.replace(tmp, path)
+
+    def reconcile(self, scope: str) -> int:
+        """
+        Rescan a scope and correct its usage ledger.
+
+        Mutations recorded while the scan runs are carried over, so the
+        ledger stays usable concurrently.
+
+        Args:
+            scope: Tool scope name
+
+        Returns:
+            Reconciled total size in bytes
+        """
+        with self._ledger_lock(scope):
+            before = self._read_ledger(scope)
+
+        scanned = self.scan_total_size(scope)
+
+        with self._ledger_lock(scope):
+            current = self._read_ledger(scope)
+            total = scanned
+            if before is not None and current is not None:
+                total += current['bytes'] - before['bytes']
+            ledger = {
+                'bytes': max(0, total),
+                'seq': (current or {}).get('seq', 0),
+                'reconciled_at': time.time()
+            }
+            self._write_ledger(scope, ledger)
+            return ledger['bytes']
+
+    def _reconcile_in_background(self, scope: str):
+        with self._ledger_thread_lock:
+            if scope in self._reconciling:
+                return
+            self._reconciling.add(scope)
+
+        def run():
+            try:
+                self.reconcile(scope)
+            except Exception as e:
+                print(f"Warning: Could not reconcile usage of scope {scope}: {e}", file=sys.stderr)
+            finally:
+                with self._ledger_thread_lock:
+                    self._reconciling.discard(scope)
+
+        threading.Thread(target=run, name=f"fs-reconcile-{scope}", daemon=True).start()
+
+    def record_usage(self, scope: str, delta: int) -> None:
+        """
+        Apply a size change to a scope's usage ledger.
+
+        Args:
+            scope: Tool scope name
+            delta: Bytes added (negative for removed)
+        """
+        if not delta:
+            return
+
+        with self._ledger_lock(scope):
+            ledger = self._read_ledger(scope)
+            if ledger is None:
+                return  # The next get_total_size() scans and includes this change
+            ledger['bytes'] = max(0, ledger['bytes'] + delta)
+            ledger['seq'] = ledger.get('seq', 0) + 1
+            self._write_ledger(scope, ledger)
+
+    def get_total_size(self, scope: str) -> int:
+        """
+        Get total storage used by a tool scope.
+
+        Args:
+            scope: Tool scope name
+
+        Returns:
+            Total size in bytes (from the usage ledger)
+        """
+        ledger = self._read_ledger(scope)
+        if ledger is None:
+            return self.reconcile(scope)
+
+        if time.time() - ledger.get('reconciled_at', 0) >= self.reconcile_interval_seconds:
+            if not self.background_reconcile:
+                return self.reconcile(scope)
+            self._reconcile_in_background(scope)
+
+        return ledger['bytes']
+
+    def _file_size(self, path: Path) -> int:
+        try:
+            return path.stat().st_size if path.is_file() else 0
+        except OSError:
+            return 0
+
     def validate_total_size(self, scope: str, additional_size: int = 0) -> None:
         """
         Validate total storage size for scope.
@@ -272,8 +433,9 @@ class FilesystemManager:
             content_bytes = content.encode(encoding)
             self.validate_file_size(len(content_bytes))
 
-            # Validate total size
-            self.validate_total_size(scope, len(content_bytes))
+            # Validate total size (an overwritten file frees its old size)
+            old_size = self._file_size(full_path)
+            self.validate_total_size(scope, len(content_bytes) - old_size)
 
             # Create parent directories
             if create_parents:
@@ -281,6 +443,7 @@ class FilesystemManager:
 
             # Write file
             full_path.write_text(content, encoding=encoding)
+            self.record_usage(scope, self._file_size(full_path) - old_size)
 
             return {
                 'status': 'success',
@@ -337,6 +500,7 @@ class FilesystemManager:
             # Append to file
             with open(full_path, 'a', encoding=encoding) as f:
                 f.write(content)
+            self.record_usage(scope, self._file_size(full_path) - current_size)
 
             return {
                 'status': 'success',
@@ -386,19 +550,27 @@ class FilesystemManager:
         scope: str,
         path: str = "",
         pattern: str = "*",
-        recursive: bool = False
+        recursive: bool = False,
+        limit: int = 0,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         List files in directory.
 
+        Entries are sorted by path. With a limit, only one page is returned
+        (and only that page is stat'ed); pass the returned next_cursor to get
+        the following page.
+
         Args:
             scope: Tool scope name
             path: Directory path within scope
             pattern: File pattern (e.g., '*.json')
             recursive: List recursively
+            limit: Maximum entries to return (0 = all)
+            cursor: next_cursor from the previous page
 
         Returns:
-            Result dictionary with files list
+            Result dictionary with files list (and next_cursor if more remain)
         """
         try:
             full_path = self.resolve_path(scope, path)
@@ -428,9 +600,13 @@ class FilesystemManager:
                 search_pattern = str(full_path / pattern)
                 matches = glob.glob(search_pattern)
 
-            for match in matches:
-                match_path = Path(match)
-                rel_path = match_path.relative_to(scope_path)
+            rel_paths = sorted(str(Path(match).relative_to(scope_path)) for match in matches)
+            start = bisect.bisect_right(rel_paths, cursor) if cursor else 0
+            end = start + limit if limit > 0 else len(rel_paths)
+            page = rel_paths[start:end]
+
+            for rel_path in page:
+                match_path = scope_path / rel_path
 
                 file_info = {
                     'path': str(rel_path),
@@ -447,12 +623,15 @@ class FilesystemManager:
 
                 files.append(file_info)
 
-            return {
+            result = {
                 'status': 'success',
                 'message': f'Found {len(files)} items',
                 'files': files,
                 'path': str(full_path.relative_to(scope_path))
             }
+            if end < len(rel_paths):
+                result['next_cursor'] = page[-1]
+            return result
 
         except Exception as e:
             return {
@@ -488,14 +667,18 @@ class FilesystemManager:
                 }
 
             if full_path.is_file():
+                size = self._file_size(full_path)
                 full_path.unlink()
+                self.record_usage(scope, -size)
                 return {
                     'status': 'success',
                     'message': f'Deleted file: {path}'
                 }
             elif full_path.is_dir():
                 if recursive:
+                    size = self._tree_size(full_path)
                     shutil.rmtree(full_path)
+                    self.record_usage(scope, -size)
                     return {
                         'status': 'success',
                         'message': f'Deleted directory recursively: {path}'
@@ -702,7 +885,8 @@ class FilesystemManager:
             # Validate size
             src_size = src_path.stat().st_size
             self.validate_file_size(src_size)
-            self.validate_total_size(scope, src_size)
+            old_size = self._file_size(dst_path)
+            self.validate_total_size(scope, src_size - old_size)
 
             # Create parent directories
             if create_parents:
@@ -710,6 +894,7 @@ class FilesystemManager:
 
             # Copy file
             shutil.copy2(src_path, dst_path)
+            self.record_usage(scope, self._file_size(dst_path) - old_size)
 
             return {
                 'status': 'success',
@@ -761,8 +946,10 @@ class FilesystemManager:
             if create_parents:
                 dst_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Move file
+            # Move file (an overwritten destination file frees its size)
+            old_size = self._file_size(dst_path)
             shutil.move(str(src_path), str(dst_path))
+            self.record_usage(scope, -old_size)
 
             return {
                 'status': 'success',
@@ -813,8 +1000,9 @@ def main():
         }))
         sys.exit(1)
 
-    # Create manager (with config from environment or defaults)
-    manager = FilesystemManager()
+    # Create manager (with config from environment or defaults); a stale
+    # usage ledger is rescanned inline since this process exits right away
+    manager = FilesystemManager(background_reconcile=False)
 
     # Execute operation
     result = None
@@ -841,7 +1029,9 @@ def main():
     elif operation == 'list':
         pattern = input_data.get('pattern', '*')
         recursive = input_data.get('recursive', False)
-        result = manager.list_files(scope, path, pattern, recursive)
+        limit = input_data.get('limit', 0)
+        cursor = input_data.get('cursor')
+        result = manager.list_files(scope, path, pattern, recursive, limit, cursor)
 
     elif operation == 'delete':
         recursive = input_data.get('recursive', False)
@@ -857,6 +1047,19 @@ def main():
     elif operation == 'metadata':
         result = manager.metadata(scope, path)
 
+    elif operation == 'usage':
+        if input_data.get('reconcile', False):
+            total = manager.reconcile(scope)
+        else:
+            total = manager.get_total_size(scope)
+        result = {
+            'status': 'success',
+            'message': f'Scope uses {total} bytes',
+            'size': total,
+            'size_mb': total / (1024 * 1024),
+            'limit_mb': manager.max_total_size_bytes / (1024 * 1024)
+        }
+
     elif operation == 'copy':
         dest_path = input_data.get('dest_path')
         if not dest_path:
@@ -270,17 +270,17 @@ def incremental_summarize(
                 "error": "No chunks found for document"
             }
 
-        # Get original document for metadata
+        # Get original document length (without reading its content)
         original_params = {
             "operation": "retrieve",
-            "document_id": document_id
+            "document_id": document_id,
+            "include_content": False
         }
 
         try:
             original_result_json = call_tool("document_store", json.dumps(original_params))
             original_result = json.loads(original_result_json)
-            original_content = original_result.get("content", "")
-            original_length = len(original_content)
+            original_length = original_result.get("length", 0)
         except Exception:
             original_length = 0
 
@@ -9,7 +9,7 @@ import os
 from pathlib import Path
 import psycopg2
 from psycopg2 import pool, sql
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from typing import Dict, Any, List, Optional, Tuple
 from contextlib import contextmanager
 import logging
@@ -129,6 +129,10 @@ class PostgresClient:
         conn = conn_pool.getconn()
         try:
             yield conn
+        except Exception:
+            # Don't hand an aborted transaction back to the pool
+            conn.rollback()
+            raise
         finally:
             conn_pool.putconn(conn)
 
@@ -194,7 +198,37 @@ class PostgresClient:
             sql.SQL(', ').join(sql.Placeholder() * len(values))
         )
 
-        return cls.execute(query.as_string(cls.get_pool().getconn()), values)
+        return cls.execute(query, values)
+
+    @classmethod
+    def insert_many(cls, table: str, rows: List[Dict[str, Any]], on_conflict_do_nothing: bool = False) -> int:
+        """
+        Insert many records with a single multi-row INSERT per page.
+
+        Args:
+            table: Table name
+            rows: Records with identical keys (column: value pairs)
+            on_conflict_do_nothing: Skip rows that violate a unique constraint
+
+        Returns:
+            Number of rows submitted
+        """
+        if not rows:
+            return 0
+
+        columns = list(rows[0].keys())
+        query = sql.SQL("INSERT INTO {} ({}) VALUES %s{}").format(
+            sql.Identifier(table),
+            sql.SQL(', ').join(map(sql.Identifier, columns)),
+            sql.SQL(" ON CONFLICT DO NOTHING" if on_conflict_do_nothing else "")
+        )
+        values = [tuple(row.get(column) for column in columns) for row in rows]
+
+        with cls.get_connection() as conn:
+            with conn.cursor() as cur:
+                execute_values(cur, query.as_string(conn), values, page_size=500)
+                conn.commit()
+                return len(rows)
 
     @classmethod
     def update(cls, table: str, data: Dict[str, Any], where: Dict[str, Any]) -> int:
@@ -226,7 +260,7 @@ class PostgresClient:
         )
 
         params = list(data.values()) + list(where.values())
-        return cls.execute(query.as_string(cls.get_pool().getconn()), params)
+        return cls.execute(query, params)
 
     @classmethod
     def delete(cls, table: str, where: Dict[str, Any]) -> int:
@@ -250,7 +284,7 @@ class PostgresClient:
             where_clause
         )
 
-        return cls.execute(query.as_string(cls.get_pool().getconn()), list(where.values()))
+        return cls.execute(query, list(where.values()))
 
 
 def main():
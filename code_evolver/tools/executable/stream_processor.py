@@ -3,15 +3,59 @@
 Stream Processor
 
 Connects a stream producer to a consumer tool with filtering and transformation.
+
+Pipeline:
+
+    reader thread    producer stdout -> parse -> filter -> transform
+                     -> bounded queue (a full queue stops reading, so the
+                        producer blocks on its pipe: backpressure)
+    dispatcher       queue -> batches of up to batch_size items, waiting at
+                     most batch_linger_ms to fill one -> at most
+                     max_in_flight batches outstanding
+    consumer pool    ordered: one sink thread calling the consumer in event
+                     order; unordered: `workers` threads calling it
+                     concurrently, results accounted as they complete
+
+Each stage keeps throughput counters; the summary also reports lag (time
+from reading an event to its consumer result being delivered) and the time
+the reader spent blocked on backpressure.
 """
 
 import json
 import sys
 import subprocess
+import threading
 import time
 import signal
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Tuple
+
+# Marks the end of the producer's stream in the event queue
+_END = object()
+
+
+class StageCounter:
+    """Throughput counter for one pipeline stage."""
+
+    def __init__(self):
+        self.count = 0
+        self.first_time: Optional[float] = None
+        self.last_time: Optional[float] = None
+
+    def add(self, n: int = 1):
+        now = time.time()
+        if self.first_time is None:
+            self.first_time = now
+        self.last_time = now
+        self.count += n
+
+    def to_dict(self, duration: float) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "per_second": round(self.count / duration, 2) if duration > 0 else 0.0
+        }
 
 
 class StreamProcessor:
@@ -26,8 +70,36 @@ class StreamProcessor:
         transform_expr: Optional[str] = None,
         sequential: bool = True,
         max_items: int = 0,
-        timeout_seconds: int = 0
+        timeout_seconds: int = 0,
+        batch_size: int = 1,
+        batch_linger_ms: int = 0,
+        workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        ordered: Optional[bool] = None,
+        queue_size: int = 1000
     ):
+        """
+        Initialize stream processor.
+
+        Args:
+            producer: Producer tool name (tools/executable/<producer>.py)
+            producer_input: Input for the producer
+            consumer: Consumer tool name
+            filter_expr: Optional filter expression
+            transform_expr: Optional transform expression
+            sequential: Default for workers (1) and ordered (True) when
+                those are not given
+            max_items: Stop after this many processed events (0 = unlimited)
+            timeout_seconds: Stop after this many seconds (0 = unlimited)
+            batch_size: Events per consumer call; above 1 the consumer
+                receives a JSON array
+            batch_linger_ms: Max time to wait for a batch to fill
+            workers: Concurrent consumer calls in unordered mode (default 1
+                if sequential, else 4)
+            max_in_flight: Max outstanding batches (default: workers)
+            ordered: Call the consumer in event order, one call at a time
+            queue_size: Events buffered between reader and dispatcher
+        """
         self.producer = producer
         self.producer_input = producer_input
         self.consumer = consumer
@@ -37,6 +109,21 @@ class StreamProcessor:
         self.max_items = max_items
         self.timeout_seconds = timeout_seconds
 
+        self.batch_size = max(1, batch_size)
+        self.batch_linger = max(0, batch_linger_ms) / 1000.0
+        self.workers = max(1, workers if workers is not None else (1 if sequential else 4))
+        self.max_in_flight = max(1, max_in_flight if max_in_flight is not None else self.workers)
+        self.ordered = sequential if ordered is None else ordered
+        if self.ordered:
+            # Concurrent calls could reach the consumer in any order
+            if self.workers > 1:
+                print(
+                    f"Ordered delivery calls the consumer one batch at a time; ignoring workers={self.workers} "
+                    "(set ordered: false for concurrent calls)",
+                    file=sys.stderr
+                )
+            self.workers = 1
+
         # Statistics
         self.total_events = 0
         self.filtered_events = 0
@@ -44,8 +131,31 @@ class StreamProcessor:
         self.failed_events = 0
         self.start_time = time.time()
 
+        self.stages = {
+            "read": StageCounter(),
+            "filter": StageCounter(),
+            "dispatch": StageCounter(),
+            "consume": StageCounter(),
+            "deliver": StageCounter()
+        }
+        self.batches = 0
+        self.completed_batches = 0
+        self.backpressure_seconds = 0.0
+        self.consumer_seconds = 0.0
+        self.lag_total = 0.0
+        self.lag_max = 0.0
+        self.peak_in_flight = 0
+
         self.running = True
 
+        # Pipeline state
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, queue_size))
+        self._cond = threading.Condition()
+        self._in_flight_batches = 0
+        self._in_flight_items = 0
+        self._stop_reason: Optional[str] = None
+        self._call_tool: Optional[Callable] = None
+
     def evaluate_filter(self, event: Dict[str, Any]) -> bool:
         """Evaluate filter expression against event."""
         if not self.filter_expr:
@@ -95,18 +205,23 @@ class StreamProcessor:
             print(f"Transform error: {e}", file=sys.stderr)
             return event
 
-    def call_consumer(self, data: Any) -> bool:
-        """Call consumer tool with data."""
-        try:
-            # Import node_runtime to call tools
-            sys.path.insert(0, '.')
+    def _get_call_tool(self) -> Callable:
+        """Resolve node_runtime.call_tool once per processor."""
+        if self._call_tool is None:
+            if '.' not in sys.path:
+                sys.path.insert(0, '.')
             from node_runtime import call_tool
+            self._call_tool = call_tool
+        return self._call_tool
 
+    def call_consumer(self, data: Any) -> bool:
+        """Call consumer tool with data (an item, or a list for batches)."""
+        try:
             # Prepare consumer input
             consumer_input = json.dumps(data)
 
             # Call consumer tool
-            result = call_tool(self.consumer, consumer_input)
+            result = self._get_call_tool()(self.consumer, consumer_input)
 
             print(f"Consumer result: {result[:200]}", file=sys.stderr)
             return True
@@ -129,30 +244,48 @@ class StreamProcessor:
 
         return None
 
-    def process_stream(self):
-        """Process stream from producer."""
+    def _start_producer(self) -> subprocess.Popen:
+        """Start the producer process and send it its input."""
+        # Assume tools are in tools/executable/ directory
+        producer_script = f"tools/executable/{self.producer}.py"
+
+        producer_proc = subprocess.Popen(
+            ["python", producer_script],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=None,  # Producer logs go to our stderr (an unread pipe could fill up)
+            text=True,
+            bufsize=1  # Line buffered
+        )
+
+        producer_proc.stdin.write(json.dumps(self.producer_input))
+        producer_proc.stdin.close()
+        return producer_proc
+
+    def _enqueue(self, item: Any) -> bool:
+        """Put an item on the event queue, blocking while it is full."""
         try:
-            # Prepare producer command
-            # Assume tools are in tools/executable/ directory
-            producer_script = f"tools/executable/{self.producer}.py"
-
-            # Start producer process
-            producer_proc = subprocess.Popen(
-                ["python", producer_script],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1  # Line buffered
-            )
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
 
-            # Send producer input
-            producer_input_json = json.dumps(self.producer_input)
-            producer_proc.stdin.write(producer_input_json)
-            producer_proc.stdin.close()
+        blocked_since = time.time()
+        try:
+            while self.running:
+                try:
+                    self._queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            self.backpressure_seconds += time.time() - blocked_since
 
-            # Process stream output
-            for line in producer_proc.stdout:
+    def _read_producer(self, stream):
+        """Reader stage: parse, filter and transform producer events."""
+        try:
+            for line in stream:
                 if not self.running:
                     break
 
@@ -163,38 +296,197 @@ class StreamProcessor:
                 try:
                     # Parse event
                     event = json.loads(line)
-                    self.total_events += 1
+                except json.JSONDecodeError:
+                    print(f"Invalid JSON from producer: {line}", file=sys.stderr)
+                    continue
 
+                self.total_events += 1
+                self.stages["read"].add()
+
+                try:
                     # Check filter
                     if not self.evaluate_filter(event):
                         continue
 
                     self.filtered_events += 1
+                    self.stages["filter"].add()
 
                     # Transform data
                     transformed_data = self.evaluate_transform(event)
-
-                    # Call consumer
-                    success = self.call_consumer(transformed_data)
-
-                    if success:
-                        self.processed_events += 1
-                    else:
+                except Exception as e:
+                    print(f"Error processing event: {e}", file=sys.stderr)
+                    with self._cond:
                         self.failed_events += 1
+                    continue
 
-                    # Check limits
-                    limit_reason = self.check_limits()
-                    if limit_reason:
-                        self.shutdown(limit_reason)
-                        break
+                if not self._enqueue((time.time(), transformed_data)):
+                    break
 
-                except json.JSONDecodeError as e:
-                    print(f"Invalid JSON from producer: {line}", file=sys.stderr)
+        except Exception as e:
+            if self.running:
+                print(f"Error reading producer output: {e}", file=sys.stderr)
+        finally:
+            self._enqueue(_END)
+
+    def _next_batch_items(self, carry: List[Tuple[float, Any]]) -> Tuple[List[Tuple[float, Any]], bool]:
+        """
+        Collect up to batch_size items (waiting at most batch_linger to fill).
+
+        Returns:
+            (items, stream_ended)
+        """
+        batch = carry
+        if not batch:
+            try:
+                item = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                return [], False
+            if item is _END:
+                return [], True
+            batch = [item]
+
+        deadline = time.time() + self.batch_linger
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.time()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _END:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    def _dispatch_loop(self, executor: ThreadPoolExecutor):
+        """Dispatcher stage: batch queued items and submit them to the consumer pool."""
+        carry: List[Tuple[float, Any]] = []
+        ended = False
+
+        while True:
+            reason = self._stop_reason or self.check_limits()
+            if reason:
+                with self._cond:
+                    self._stop_reason = self._stop_reason or reason
+                return
+
+            if not carry and ended:
+                return
+
+            if not carry:
+                carry, ended = self._next_batch_items([])
+                if not carry:
                     continue
+            elif len(carry) < self.batch_size and not ended:
+                carry, ended = self._next_batch_items(carry)
 
-                except Exception as e:
-                    print(f"Error processing event: {e}", file=sys.stderr)
-                    self.failed_events += 1
+            with self._cond:
+                # Bounded in-flight window
+                if self._in_flight_batches >= self.max_in_flight:
+                    self._cond.wait(0.1)
+                    continue
+
+                # Never dispatch more than max_items can still use
+                allowed = len(carry)
+                if self.max_items > 0:
+                    allowed = min(allowed, self.max_items - self.processed_events - self._in_flight_items)
+                    if allowed <= 0:
+                        self._cond.wait(0.1)
+                        continue
+
+                batch, carry = carry[:allowed], carry[allowed:]
+                self._in_flight_batches += 1
+                self._in_flight_items += len(batch)
+                self.peak_in_flight = max(self.peak_in_flight, self._in_flight_batches)
+
+            self.batches += 1
+            self.stages["dispatch"].add(len(batch))
+            future = executor.submit(self._run_batch, batch)
+            future.add_done_callback(lambda f, items=batch: self._on_batch_done(items, f))
+
+    def _run_batch(self, batch: List[Tuple[float, Any]]) -> Tuple[bool, float]:
+        """
+        Consumer stage: one consumer call per batch.
+
+        Returns:
+            (success, seconds spent in the consumer)
+        """
+        started = time.time()
+        data = [item for _, item in batch] if self.batch_size > 1 else batch[0][1]
+        success = self.call_consumer(data)
+        return success, time.time() - started
+
+    def _on_batch_done(self, batch: List[Tuple[float, Any]], future):
+        """Record a finished batch (in event order when ordered)."""
+        try:
+            success, elapsed = future.result()
+        except Exception as e:
+            print(f"Consumer error: {e}", file=sys.stderr)
+            success, elapsed = False, 0.0
+
+        with self._cond:
+            self._in_flight_batches -= 1
+            self._in_flight_items -= len(batch)
+            self.completed_batches += 1
+            self.consumer_seconds += elapsed
+            self.stages["consume"].add(len(batch))
+            self._deliver(batch, success)
+            self._cond.notify_all()
+
+    def _deliver(self, batch: List[Tuple[float, Any]], success: bool):
+        """Delivery stage: account a batch's result (called with the lock held)."""
+        now = time.time()
+        for read_time, _ in batch:
+            lag = now - read_time
+            self.lag_total += lag
+            self.lag_max = max(self.lag_max, lag)
+
+        if success:
+            self.processed_events += len(batch)
+        else:
+            self.failed_events += len(batch)
+        self.stages["deliver"].add(len(batch))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-stage throughput, lag and backpressure counters."""
+        duration = time.time() - self.start_time
+        delivered = self.stages["deliver"].count
+
+        return {
+            "stages": {name: counter.to_dict(duration) for name, counter in self.stages.items()},
+            "batches": self.batches,
+            "queued": self._queue.qsize(),
+            "in_flight": self._in_flight_batches,
+            "peak_in_flight": self.peak_in_flight,
+            "avg_consumer_ms": round(1000 * self.consumer_seconds / self.completed_batches, 2) if self.completed_batches else 0.0,
+            "avg_lag_ms": round(1000 * self.lag_total / delivered, 2) if delivered else 0.0,
+            "max_lag_ms": round(1000 * self.lag_max, 2),
+            "backpressure_seconds": round(self.backpressure_seconds, 3)
+        }
+
+    def process_stream(self):
+        """Process stream from producer."""
+        producer_proc = None
+        try:
+            producer_proc = self._start_producer()
+
+            reader = threading.Thread(
+                target=self._read_producer,
+                args=(producer_proc.stdout,),
+                name="stream-reader",
+                daemon=True
+            )
+            reader.start()
+
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="stream-consumer") as executor:
+                self._dispatch_loop(executor)
+                # Leaving the block waits for batches still in flight
+
+            if self._stop_reason:
+                self.running = False
+                producer_proc.kill()
+                self.shutdown(self._stop_reason)
+                return
 
             # Wait for producer to finish
             producer_proc.wait(timeout=5)
@@ -205,6 +497,8 @@ class StreamProcessor:
 
         except Exception as e:
             print(f"Stream processing error: {e}", file=sys.stderr)
+            if producer_proc is not None and producer_proc.poll() is None:
+                producer_proc.kill()
             self.shutdown("error")
 
     def shutdown(self, reason: str):
@@ -219,7 +513,8 @@ class StreamProcessor:
             "processed_events": self.processed_events,
             "failed_events": self.failed_events,
             "duration_seconds": round(duration, 2),
-            "shutdown_reason": reason
+            "shutdown_reason": reason,
+            **self.get_stats()
         }
 
         print(json.dumps(summary, indent=2))
@@ -293,7 +588,13 @@ def main():
             transform_expr=input_data.get("transform"),
             sequential=input_data.get("sequential", True),
             max_items=input_data.get("max_items", 0),
-            timeout_seconds=input_data.get("timeout_seconds", 0)
+            timeout_seconds=input_data.get("timeout_seconds", 0),
+            batch_size=input_data.get("batch_size", 1),
+            batch_linger_ms=input_data.get("batch_linger_ms", 0),
+            workers=input_data.get("workers"),
+            max_in_flight=input_data.get("max_in_flight"),
+            ordered=input_data.get("ordered"),
+            queue_size=input_data.get("queue_size", 1000)
         )
 
         # Run processor
@@ -3,11 +3,16 @@ Old Dailly Gazette - A plausible-looking local news site
 with a 'Fit My Likes' feature that makes stories progressively weirder
 """
 
-from flask import Flask, render_template, jsonify, send_from_directory
+from flask import Flask, render_template, jsonify, send_from_directory, request, make_response
+from werkzeug.http import is_resource_modified
 from pathlib import Path
+import hashlib
 import json
+import os
 import re
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 import random
 import markdown
 
@@ -73,117 +78,227 @@ def parse_story_markdown(md_content: str) -> dict:
         "raw_content": clean_content
     }
 
-def get_all_stories() -> list:
-    """Load all story sequences from the stories directory."""
-    stories = []
-
-    if not STORIES_DIR.exists():
-        return stories
-
-    # Group stories by base name (story_01, story_02, etc)
-    story_groups = {}
-
-    for md_file in STORIES_DIR.glob("*.md"):
-        # Parse filename: story_01_v00.md -> story_01, version 00
-        match = re.match(r'story_(\d+)_v(\d+)\.md', md_file.name)
-        if match:
+# Random bylines, picked per story
+BYLINES = [
+    "Emily Weatherby, Community Correspondent",
+    "James Thornton, Local Affairs",
+    "Margaret Fletcher, Senior Reporter",
+    "Oliver Pritchard, Village News",
+    "Sarah Montague, Chief Reporter",
+    "Henry Blackwell, Rural Correspondent"
+]
+
+# How often (seconds) requests check the stories directory for changes
+STORY_INDEX_POLL_SECONDS = float(os.environ.get("STORY_INDEX_POLL_SECONDS", "2"))
+
+STORY_FILE = re.compile(r'story_(\d+)_v(\d+)\.md$')
+
+
+def _etag(files) -> str:
+    """ETag for a set of story files (changes when any of them changes)."""
+    return hashlib.sha1(repr(sorted(files)).encode('utf-8')).hexdigest()
+
+
+def _last_modified(files) -> datetime:
+    newest = max((f[-2] for f in files), default=0)
+    return datetime.fromtimestamp(newest // 1_000_000_000, timezone.utc)
+
+
+class StoryIndex:
+    """
+    Parsed stories, kept in memory and rebuilt only when files change.
+
+    At most every poll_interval seconds a request stats the stories
+    directory; when any story file was added, removed or modified, the
+    index is rebuilt, re-parsing only the changed files. Lookups by
+    story id and story number are dict lookups.
+    """
+
+    def __init__(self, stories_dir: Path, poll_interval: float = STORY_INDEX_POLL_SECONDS):
+        self.stories_dir = stories_dir
+        self.poll_interval = poll_interval
+
+        self.stories: list = []
+        self.by_id: dict = {}
+        self.by_num: dict = {}
+        self.etag = ""
+        self.last_modified = datetime.fromtimestamp(0, timezone.utc)
+
+        self._signature = None
+        self._parsed: dict = {}  # filename -> ((mtime_ns, size), parsed story)
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _scan(self) -> tuple:
+        """(filename, mtime_ns, size) of every story file, sorted."""
+        if not self.stories_dir.exists():
+            return ()
+
+        entries = []
+        with os.scandir(self.stories_dir) as it:
+            for entry in it:
+                if STORY_FILE.match(entry.name):
+                    stat = entry.stat()
+                    entries.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(entries))
+
+    def refresh(self, force: bool = False):
+        """Rebuild the index if story files changed (checked at most every poll_interval)."""
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.poll_interval:
+            return
+
+        with self._lock:
+            if not force and now - self._checked_at < self.poll_interval:
+                return
+            signature = self._scan()
+            self._checked_at = time.monotonic()
+            if signature != self._signature:
+                self._rebuild(signature)
+
+    def _rebuild(self, signature: tuple):
+        # Group stories by base name (story_01, story_02, etc)
+        story_groups = {}
+        parsed_files = {}
+
+        for filename, mtime_ns, size in signature:
+            # Parse filename: story_01_v00.md -> story_01, version 00
+            match = STORY_FILE.match(filename)
             story_num = match.group(1)
             version = int(match.group(2))
 
-            if story_num not in story_groups:
-                story_groups[story_num] = {}
+            # Only re-parse files that changed
+            cached = self._parsed.get(filename)
+            if cached is None or cached[0] != (mtime_ns, size):
+                content = (self.stories_dir / filename).read_text(encoding='utf-8')
+                cached = ((mtime_ns, size), parse_story_markdown(content))
+            parsed_files[filename] = cached
 
-            # Read and parse the story
-            content = md_file.read_text(encoding='utf-8')
-            parsed = parse_story_markdown(content)
+            story_groups.setdefault(story_num, []).append((version, filename, mtime_ns, size))
 
-            story_groups[story_num][version] = {
-                "filename": md_file.name,
-                "version": version,
-                **parsed
+        stories = []
+        for story_num, files in sorted(story_groups.items()):
+            versions = {
+                version: {"filename": filename, "version": version, **parsed_files[filename][1]}
+                for version, filename, _, _ in sorted(files)
             }
 
-    # Convert to list format
-    for story_num, versions in sorted(story_groups.items()):
-        if versions:  # Only include if has versions
             # Get version 0 for the list view
             base_story = versions.get(0, list(versions.values())[0])
 
-            # Generate random recent date
-            days_ago = random.randint(0, 14)
+            # Recent date and byline, stable for a given story
+            rng = random.Random(story_num)
+            days_ago = rng.randint(0, 14)
             pub_date = (datetime.now() - timedelta(days=days_ago)).strftime("%d %B %Y")
 
-            # Random byline
-            bylines = [
-                "Emily Weatherby, Community Correspondent",
-                "James Thornton, Local Affairs",
-                "Margaret Fletcher, Senior Reporter",
-                "Oliver Pritchard, Village News",
-                "Sarah Montague, Chief Reporter",
-                "Henry Blackwell, Rural Correspondent"
-            ]
-
             stories.append({
                 "id": f"story_{story_num}",
                 "story_num": story_num,
                 "headline": base_story["headline"],
                 "lure": base_story["lure"],
-                "byline": random.choice(bylines),
+                "byline": rng.choice(BYLINES),
                 "date": pub_date,
                 "max_version": max(versions.keys()),
-                "versions": versions
+                "versions": versions,
+                "etag": _etag(files),
+                "last_modified": _last_modified(files)
             })
 
-    return stories
+        # Swap in the new index
+        self.stories = stories
+        self.by_id = {s["id"]: s for s in stories}
+        self.by_num = {s["story_num"]: s for s in stories}
+        self.etag = _etag(signature)
+        self.last_modified = _last_modified(signature)
+        self._parsed = parsed_files
+        self._signature = signature
+
+
+story_index = StoryIndex(STORIES_DIR)
+
+
+def get_all_stories() -> list:
+    """Load all story sequences from the stories directory."""
+    story_index.refresh()
+    return story_index.stories
+
+
+def conditional_response(etag: str, last_modified: datetime, render):
+    """
+    Respond 304 if the client's cached copy is current, else render.
+
+    Args:
+        etag: Entity tag of the resource
+        last_modified: Last modification time of the resource
+        render: Produces the response body (only called when needed)
+    """
+    if is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = make_response(render())
+    else:
+        response = make_response("", 304)
+
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    # Caches may store it but must revalidate
+    response.cache_control.no_cache = True
+    return response
+
 
 @app.route('/')
 def index():
     """Homepage with list of stories."""
-    stories = get_all_stories()
-    return render_template('index.html', stories=stories)
+    story_index.refresh()
+    stories = story_index.stories
+    return conditional_response(
+        story_index.etag,
+        story_index.last_modified,
+        lambda: render_template('index.html', stories=stories)
+    )
 
 @app.route('/story/<story_id>')
 def story(story_id):
     """View a single story."""
-    stories = get_all_stories()
-
-    # Find the story
-    story_data = None
-    for s in stories:
-        if s['id'] == story_id:
-            story_data = s
-            break
+    story_index.refresh()
+    story_data = story_index.by_id.get(story_id)
 
     if not story_data:
         return "Story not found", 404
 
-    return render_template('story.html', story=story_data)
+    return conditional_response(
+        story_data['etag'],
+        story_data['last_modified'],
+        lambda: render_template('story.html', story=story_data)
+    )
 
 @app.route('/api/story/<story_num>/version/<int:version>')
 def get_story_version(story_num, version):
     """API endpoint to get a specific version of a story."""
-    stories = get_all_stories()
-
-    for s in stories:
-        if s['story_num'] == story_num:
-            if version in s['versions']:
-                return jsonify({
-                    "success": True,
-                    "version": version,
-                    "max_version": s['max_version'],
-                    "headline": s['versions'][version]['headline'],
-                    "content": s['versions'][version]['content']
-                })
-            else:
-                return jsonify({
-                    "success": False,
-                    "error": "Version not found"
-                }), 404
-
-    return jsonify({
-        "success": False,
-        "error": "Story not found"
-    }), 404
+    story_index.refresh()
+    s = story_index.by_num.get(story_num)
+
+    if not s:
+        return jsonify({
+            "success": False,
+            "error": "Story not found"
+        }), 404
+
+    if version not in s['versions']:
+        return jsonify({
+            "success": False,
+            "error": "Version not found"
+        }), 404
+
+    return conditional_response(
+        f"{s['etag']}-v{version}",
+        s['last_modified'],
+        lambda: jsonify({
+            "success": True,
+            "version": version,
+            "max_version": s['max_version'],
+            "headline": s['versions'][version]['headline'],
+            "content": s['versions'][version]['content']
+        })
+    )
 
 if __name__ == '__main__':
     app.run(debug=True, port=5050)